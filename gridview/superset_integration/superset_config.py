@@ -140,6 +140,8 @@ FAB_ADD_SECURITY_PERMISSION_MENU_VIEW = False
 
 # Results backend configuration for sync operation
 RESULTS_BACKEND_USE_MSGPACK = False
+# Store results as Arrow IPC, converting to JSON only for the rows that are requested
+RESULTS_BACKEND_USE_ARROW = True
 RESULTS_BACKEND = None  # Use default cache backend
 
 # ------------------------------
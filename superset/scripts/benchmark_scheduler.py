@@ -0,0 +1,133 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure the duration of a reports scheduler tick with many report schedules, stored in
+an in-memory SQLite database.
+
+    python scripts/benchmark_scheduler.py --schedules 10000 --ticks 10
+"""
+
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import click
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from superset.extensions import db
+
+CRONTABS = [
+    "* * * * *",
+    "*/5 * * * *",
+    "0 * * * *",
+    "30 */2 * * *",
+    "0 9 * * *",
+    "0 9 * * 1-5",
+    "0 8 * * 1",
+    "0 0 1 * *",
+]
+TIMEZONES = ["UTC", "America/New_York", "Europe/Paris", "Asia/Kolkata"]
+
+
+def legacy_tick(triggered_at: datetime) -> int:
+    """
+    Evaluate the cron window of every active schedule, like the scheduler used to.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.reports.models import ReportSchedule
+    from superset.tasks.cron_util import cron_schedule_window
+
+    count = 0
+    for schedule in db.session.query(ReportSchedule).filter(
+        ReportSchedule.active.is_(True)
+    ):
+        count += len(
+            list(
+                cron_schedule_window(triggered_at, schedule.crontab, schedule.timezone)
+            )
+        )
+    return count
+
+
+@click.command()
+@click.option("--schedules", default=10_000, help="Number of report schedules")
+@click.option("--ticks", default=10, help="Number of scheduler ticks to run")
+@click.option("--seed", default=42, help="Random seed")
+def main(schedules: int, ticks: int, seed: int) -> None:
+    # models can only be imported once the app is initialized
+    # pylint: disable=import-outside-toplevel
+    from superset.reports.models import ReportSchedule, ReportScheduleType
+    from superset.tasks.scheduler import execute, scheduler
+
+    random.seed(seed)
+    engine = create_engine("sqlite://")
+    ReportSchedule.metadata.create_all(engine)  # pylint: disable=no-member
+    session = sessionmaker(bind=engine)()
+    session.remove = lambda: None
+    session.bulk_insert_mappings(
+        ReportSchedule,
+        [
+            {
+                "type": ReportScheduleType.REPORT,
+                "name": f"report_{i}",
+                "crontab": random.choice(CRONTABS),  # noqa: S311
+                "timezone": random.choice(TIMEZONES),  # noqa: S311
+                "active": True,
+            }
+            for i in range(schedules)
+        ],
+    )
+    session.commit()
+    print(f"Created {schedules} report schedules")
+
+    start_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with (
+        patch.object(db, "session", session),
+        patch("superset.tasks.scheduler.is_feature_enabled", return_value=True),
+        patch.object(execute, "apply_async") as apply_async,
+    ):
+        print("\nLegacy (every active schedule):\n")
+        for tick in range(ticks):
+            start = time.time()
+            count = legacy_tick(start_at + timedelta(minutes=tick))
+            print(f"tick {tick}: {time.time() - start:.3f} s, {count} executions")
+
+        print("\nIndexed (due schedules only):\n")
+        for tick in range(ticks):
+            apply_async.reset_mock()
+            with patch(
+                "superset.tasks.scheduler.datetime",
+                wraps=datetime,
+                **{"now.return_value": start_at + timedelta(minutes=tick)},
+            ):
+                start = time.time()
+                scheduler()
+            print(
+                f"tick {tick}: {time.time() - start:.3f} s, "
+                f"{apply_async.call_count} executions"
+            )
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
@@ -0,0 +1,94 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure the throughput of CSV uploads into local SQLite and DuckDB databases.
+
+    python scripts/benchmark_upload.py --rows 1000000 --streaming
+"""
+
+import importlib.util
+import io
+import tempfile
+import time
+from pathlib import Path
+
+import click
+from flask import current_app
+from werkzeug.datastructures import FileStorage
+
+
+def generate_csv(rows: int) -> bytes:
+    """
+    Generate a CSV file with a mix of column types.
+    """
+    buffer = io.StringIO()
+    buffer.write("id,name,value,ds\n")
+    for i in range(rows):
+        buffer.write(f"{i},name_{i % 1000},{i * 0.5},2024-01-{i % 28 + 1:02d}\n")
+    return buffer.getvalue().encode("utf-8")
+
+
+def benchmark(uri: str, data: bytes, streaming: bool) -> float:
+    """
+    Upload the CSV into a new table, returning the duration in seconds.
+    """
+    # models can only be imported once the app is initialized
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.database.uploaders.csv_reader import CSVReader
+    from superset.models.core import Database
+
+    current_app.config["CSV_UPLOAD_STREAMING"] = streaming
+    database = Database(database_name="benchmark_upload", sqlalchemy_uri=uri)
+    reader = CSVReader({"already_exists": "replace", "column_dates": ["ds"]})
+    file = FileStorage(stream=io.BytesIO(data), filename="benchmark.csv")
+
+    start = time.time()
+    reader.read(file, database, "benchmark_upload", None)
+    return time.time() - start
+
+
+@click.command()
+@click.option("--rows", default=100_000, help="Number of rows in the CSV file")
+@click.option(
+    "--streaming/--no-streaming",
+    default=False,
+    help="Upload the file chunk by chunk (CSV_UPLOAD_STREAMING)",
+)
+def main(rows: int, streaming: bool) -> None:
+    data = generate_csv(rows)
+    print(f"Generated {rows} rows ({len(data) / 1024 / 1024:.1f} MiB)")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        targets = {"sqlite": f"sqlite:///{Path(tmpdir) / 'benchmark.db'}"}
+        if importlib.util.find_spec("duckdb_engine"):
+            targets["duckdb"] = f"duckdb:///{Path(tmpdir) / 'benchmark.duckdb'}"
+        else:
+            print("duckdb-engine is not installed, skipping DuckDB")
+
+        print("\nResults:\n")
+        for name, uri in targets.items():
+            duration = benchmark(uri, data, streaming)
+            print(f"{name}: {duration:.2f} s ({rows / duration:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
@@ -84,6 +84,7 @@ from superset.extensions import event_logger
 from superset.models.slice import Slice
 from superset.tasks.thumbnails import cache_chart_thumbnail
 from superset.tasks.utils import get_current_user
+from superset.thumbnails.digest import batch_digests
 from superset.utils import json
 from superset.utils.screenshots import (
     ChartScreenshot,
@@ -263,6 +264,13 @@ class ChartRestApi(BaseSupersetModelRestApi):
 
     allowed_rel_fields = {"owners", "created_by", "changed_by"}
 
+    def get_list_headless(self, **kwargs: Any) -> Response:
+        """
+        Compute the thumbnail digests of the listed charts at once, if requested.
+        """
+        with batch_digests(Slice):
+            return super().get_list_headless(**kwargs)
+
     @expose("/<id_or_uuid>", methods=["GET"])
     @protect()
     @safe
@@ -34,6 +34,7 @@ from flask_babel import gettext as __
 
 from superset.common.chart_data import ChartDataResultFormat
 from superset.extensions import event_logger
+from superset.utils.arrow import df_to_arrow
 from superset.utils.core import (
     extract_dataframe_dtypes,
     get_column_names,
@@ -337,10 +338,12 @@ def apply_client_processing(  # noqa: C901
             # do not try to process empty data
             continue
 
-        if query["result_format"] == ChartDataResultFormat.JSON:
+        if query["result_format"] in ChartDataResultFormat.json_like():
             df = pd.DataFrame.from_dict(data)
         elif query["result_format"] == ChartDataResultFormat.CSV:
             df = pd.read_csv(StringIO(data))
+        elif query["result_format"] == ChartDataResultFormat.ARROW:
+            df = data.to_pandas()
 
         # convert all columns to verbose (label) name
         if datasource:
@@ -378,6 +381,10 @@ def apply_client_processing(  # noqa: C901
 
         if query["result_format"] == ChartDataResultFormat.JSON:
             query["data"] = processed_df.to_dict()
+        elif query["result_format"] == ChartDataResultFormat.JSON_COLUMNAR:
+            query["data"] = processed_df.to_dict(orient="list")
+        elif query["result_format"] == ChartDataResultFormat.ARROW:
+            query["data"] = df_to_arrow(processed_df)
         elif query["result_format"] == ChartDataResultFormat.CSV:
             buf = StringIO()
             processed_df.to_csv(buf, index=show_default_index)
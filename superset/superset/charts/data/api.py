@@ -20,6 +20,7 @@ import contextlib
 import logging
 from typing import Any, TYPE_CHECKING
 
+import pyarrow as pa
 from flask import current_app as app, g, make_response, request, Response
 from flask_appbuilder.api import expose, protect
 from flask_babel import gettext as _
@@ -30,7 +31,13 @@ from superset.async_events.async_query_manager import AsyncQueryTokenException
 from superset.charts.api import ChartRestApi
 from superset.charts.client_processing import apply_client_processing
 from superset.charts.data.query_context_cache_loader import QueryContextCacheLoader
-from superset.charts.schemas import ChartDataQueryContextSchema
+from superset.charts.data.response_cache import (
+    delete_response,
+    get_response_cache_key,
+    load_response,
+    store_response,
+)
+from superset.charts.schemas import ChartDataBatchSchema, ChartDataQueryContextSchema
 from superset.commands.chart.data.create_async_job_command import (
     CreateAsyncChartDataJobCommand,
 )
@@ -40,11 +47,16 @@ from superset.commands.chart.exceptions import (
     ChartDataQueryFailedError,
 )
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.query_context_batch import prefetch_merged_query_results
 from superset.connectors.sqla.models import BaseDatasource
 from superset.daos.exceptions import DatasourceNotFound
-from superset.exceptions import QueryObjectValidationError
+from superset.exceptions import (
+    QueryObjectValidationError,
+    SupersetSecurityException,
+)
 from superset.extensions import event_logger
 from superset.models.sql_lab import Query
+from superset.sqllab.utils import ARROW_STREAM_MIMETYPE, write_arrow_payload
 from superset.utils import json
 from superset.utils.core import (
     create_zip,
@@ -54,6 +66,7 @@ from superset.utils.core import (
 from superset.utils.decorators import logs_context
 from superset.views.base import CsvResponse, generate_download_headers, XlsxResponse
 from superset.views.base_api import statsd_metrics
+from superset.views.utils import override_form_data
 
 if TYPE_CHECKING:
     from superset.common.query_context import QueryContext
@@ -62,7 +75,7 @@ logger = logging.getLogger(__name__)
 
 
 class ChartDataRestApi(ChartRestApi):
-    include_route_methods = {"get_data", "data", "data_from_cache"}
+    include_route_methods = {"get_data", "data", "data_batch", "data_from_cache"}
 
     @expose("/<int:pk>/data/", methods=("GET",))
     @protect()
@@ -140,7 +153,7 @@ class ChartDataRestApi(ChartRestApi):
 
         # override saved query context
         json_body["result_format"] = request.args.get(
-            "format", ChartDataResultFormat.JSON
+            "format", self._get_default_result_format()
         )
         json_body["result_type"] = request.args.get("type", ChartDataResultType.FULL)
         json_body["force"] = request.args.get("force")
@@ -163,7 +176,7 @@ class ChartDataRestApi(ChartRestApi):
         # TODO: support CSV, SQL query and other non-JSON types
         if (
             is_feature_enabled("GLOBAL_ASYNC_QUERIES")
-            and query_context.result_format == ChartDataResultFormat.JSON
+            and query_context.result_format in ChartDataResultFormat.json_like()
             and query_context.result_type == ChartDataResultType.FULL
         ):
             return self._run_async(json_body, command)
@@ -193,7 +206,9 @@ class ChartDataRestApi(ChartRestApi):
           summary: Return payload data response for the given query
           description: >-
             Takes a query context constructed in the client and returns payload data
-            response for the given query.
+            response for the given query. JSON results are returned as an Arrow IPC
+            stream when the `Accept` header prefers
+            `application/vnd.apache.arrow.stream`.
           requestBody:
             description: >-
               A query context consists of a datasource from which to fetch data
@@ -233,6 +248,11 @@ class ChartDataRestApi(ChartRestApi):
         if json_body is None:
             return self.response_400(message=_("Request is not JSON"))
 
+        if json_body.get("result_format", ChartDataResultFormat.JSON) == (
+            ChartDataResultFormat.JSON
+        ):
+            json_body["result_format"] = self._get_default_result_format()
+
         try:
             query_context = self._create_query_context_from_form(json_body)
             command = ChartDataCommand(query_context)
@@ -251,7 +271,7 @@ class ChartDataRestApi(ChartRestApi):
         # TODO: support CSV, SQL query and other non-JSON types
         if (
             is_feature_enabled("GLOBAL_ASYNC_QUERIES")
-            and query_context.result_format == ChartDataResultFormat.JSON
+            and query_context.result_format in ChartDataResultFormat.json_like()
             and query_context.result_type == ChartDataResultType.FULL
         ):
             return self._run_async(json_body, command)
@@ -261,6 +281,95 @@ class ChartDataRestApi(ChartRestApi):
             command, form_data=form_data, datasource=query_context.datasource
         )
 
+    @expose("/data/batch", methods=("POST",))
+    @protect()
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.data_batch",
+        log_to_statsd=False,
+    )
+    def data_batch(self) -> Response:
+        """
+        Take the query contexts of many charts and return the data of each one
+        ---
+        post:
+          summary: Return the data of many charts at once
+          description: >-
+            Takes the query contexts of many charts, e.g. of all the charts of a
+            dashboard, and returns the JSON data response of each one. The queries of
+            charts on the same dataset which only differ in their metrics are merged
+            into a single query. Queries always run synchronously.
+          requestBody:
+            required: true
+            content:
+              application/json:
+                schema:
+                  $ref: "#/components/schemas/ChartDataBatchSchema"
+          responses:
+            200:
+              description: >-
+                The data response of each query context, in the order of the request
+              content:
+                application/json:
+                  schema:
+                    $ref: "#/components/schemas/ChartDataBatchResponseSchema"
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        if not request.is_json:
+            return self.response_400(message=_("Request is not JSON"))
+        try:
+            query_contexts_json = ChartDataBatchSchema().load(request.json)[
+                "query_contexts"
+            ]
+        except ValidationError as error:
+            return self.response_400(message=error.messages)
+
+        max_size = app.config["CHART_DATA_BATCH_MAX_SIZE"]
+        if len(query_contexts_json) > max_size:
+            return self.response_400(
+                message=_(
+                    "A batch can't have more than %(max_size)s query contexts",
+                    max_size=max_size,
+                )
+            )
+
+        # the datasources are loaded once for all the query contexts of the batch
+        schema = ChartDataQueryContextSchema(datasources={})
+        results: list[dict[str, Any]] = []
+        commands: dict[int, ChartDataCommand] = {}
+        for idx, json_body in enumerate(query_contexts_json):
+            # templates read the form data of each chart, like in `/chart/data`
+            with override_form_data(json_body):
+                command_or_error = self._create_batch_command(schema, json_body)
+            if isinstance(command_or_error, ChartDataCommand):
+                results.append({})
+                commands[idx] = command_or_error
+            else:
+                results.append(command_or_error)
+
+        prefetch_merged_query_results(
+            [command.query_context for command in commands.values()],
+            [query_contexts_json[idx] for idx in commands],
+        )
+        for idx, command in commands.items():
+            with override_form_data(query_contexts_json[idx]):
+                results[idx] = self._get_batch_data_result(command)
+
+        with event_logger.log_context(f"{self.__class__.__name__}.json_dumps"):
+            response_data = json.dumps(
+                {"results": results},
+                default=json.json_int_dttm_ser,
+                ignore_nan=True,
+            )
+        resp = make_response(response_data, 200)
+        resp.headers["Content-Type"] = "application/json; charset=utf-8"
+        return resp
+
     @expose("/data/<cache_key>", methods=("GET",))
     @protect()
     @statsd_metrics
@@ -393,7 +502,10 @@ class ChartDataRestApi(ChartRestApi):
                 mimetype="application/zip",
             )
 
-        if result_format == ChartDataResultFormat.JSON:
+        if result_format == ChartDataResultFormat.ARROW:
+            return self._send_arrow_response(result["queries"])
+
+        if result_format in ChartDataResultFormat.json_like():
             queries = result["queries"]
             if security_manager.is_guest_user():
                 for query in queries:
@@ -410,6 +522,114 @@ class ChartDataRestApi(ChartRestApi):
 
         return self.response_400(message=f"Unsupported result_format: {result_format}")
 
+    @staticmethod
+    def _get_default_result_format() -> ChartDataResultFormat:
+        """
+        Return the result format negotiated with the `Accept` header of the request,
+        which is JSON unless an Arrow IPC stream is preferred.
+        """
+        if (
+            request.accept_mimetypes.best_match(
+                ["application/json", ARROW_STREAM_MIMETYPE]
+            )
+            == ARROW_STREAM_MIMETYPE
+        ):
+            return ChartDataResultFormat.ARROW
+        return ChartDataResultFormat.JSON
+
+    def _send_arrow_response(self, queries: list[dict[str, Any]]) -> Response:
+        """
+        Send the results of the queries as Arrow IPC streams, each holding the data
+        of a query as its table and the rest of the payload as schema metadata. The
+        streams of many queries are bundled as a zip file.
+        """
+        streams = []
+        with event_logger.log_context(f"{self.__class__.__name__}.arrow_dumps"):
+            for query in queries:
+                if security_manager.is_guest_user():
+                    query.pop("query", None)
+                # failed queries have no data
+                table = query.pop("data", None)
+                streams.append(
+                    write_arrow_payload(
+                        pa.table({}) if table is None else table,
+                        query,
+                    )
+                )
+
+        if len(streams) == 1:
+            return Response(streams[0], status=200, mimetype=ARROW_STREAM_MIMETYPE)
+
+        files = {
+            f"query_{idx + 1}.{ChartDataResultFormat.ARROW}": stream
+            for idx, stream in enumerate(streams)
+        }
+        return Response(
+            create_zip(files),
+            headers=generate_download_headers("zip"),
+            mimetype="application/zip",
+        )
+
+    def _create_batch_command(
+        self,
+        schema: ChartDataQueryContextSchema,
+        json_body: dict[str, Any],
+    ) -> ChartDataCommand | dict[str, Any]:
+        """
+        Create the command of a chart of a batch, or return the error of its request.
+        """
+        try:
+            query_context = schema.load(json_body)
+            command = ChartDataCommand(query_context)
+            command.validate()
+        except DatasourceNotFound:
+            return {"status": 404, "message": _("Not found")}
+        except QueryObjectValidationError as error:
+            return {"status": 400, "message": error.message}
+        except ValidationError as error:
+            return {
+                "status": 400,
+                "message": _(
+                    "Request is incorrect: %(error)s", error=error.normalized_messages()
+                ),
+            }
+        except SupersetSecurityException as error:
+            return {"status": 403, "message": error.message}
+
+        if query_context.result_format not in ChartDataResultFormat.json_like():
+            return {
+                "status": 400,
+                "message": f"Unsupported result_format: {query_context.result_format}",
+            }
+
+        return command
+
+    def _get_batch_data_result(self, command: ChartDataCommand) -> dict[str, Any]:
+        """
+        Run the command of a chart of a batch, returning its data or error.
+        """
+        try:
+            result = command.run()
+        except ChartDataCacheLoadError as exc:
+            return {"status": 422, "message": exc.message}
+        except ChartDataQueryFailedError as exc:
+            return {"status": 400, "message": exc.message}
+
+        # post-process the data like `_send_chart_response`, eg, for pivot tables
+        query_context = command.query_context
+        if query_context.result_type == ChartDataResultType.POST_PROCESSED:
+            result = apply_client_processing(
+                result,
+                query_context.form_data,
+                query_context.datasource,
+            )
+
+        queries = result["queries"]
+        if security_manager.is_guest_user():
+            for query in queries:
+                query.pop("query", None)
+        return {"status": 200, "result": queries}
+
     @event_logger.log_this
     def _get_data_response(
         self,
@@ -418,6 +638,13 @@ class ChartDataRestApi(ChartRestApi):
         form_data: dict[str, Any] | None = None,
         datasource: BaseDatasource | Query | None = None,
     ) -> Response:
+        query_context = command.query_context
+        response_cache_key = get_response_cache_key(query_context)
+        if response_cache_key and query_context.force:
+            delete_response(response_cache_key)
+        elif response_cache_key and (response := load_response(response_cache_key)):
+            return response.make_conditional(request)
+
         try:
             result = command.run(force_cached=force_cached)
         except ChartDataCacheLoadError as exc:
@@ -425,7 +652,16 @@ class ChartDataRestApi(ChartRestApi):
         except ChartDataQueryFailedError as exc:
             return self.response_400(message=exc.message)
 
-        return self._send_chart_response(result, form_data, datasource)
+        response = self._send_chart_response(result, form_data, datasource)
+        if response_cache_key:
+            store_response(
+                response_cache_key,
+                response,
+                result["queries"],
+                datasource_uid=query_context.datasource.uid,
+            )
+            return response.make_conditional(request)
+        return response
 
     # pylint: disable=invalid-name
     def _load_query_context_form_from_cache(self, cache_key: str) -> dict[str, Any]:
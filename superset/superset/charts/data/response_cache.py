@@ -0,0 +1,207 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Cache of the encoded chart data responses.
+
+Responses built from cached data are stored in the data cache, next to the data
+itself and keyed by the data cache keys of the queries plus the result type and
+format, so that identical requests are answered with the same bytes without building
+the payload nor serializing it again. A response never outlives the data it was built
+from, and carries an ETag so that clients can revalidate it with `If-None-Match`.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+from datetime import datetime
+from typing import Any, TYPE_CHECKING
+
+from flask import current_app as app, request, Response
+
+from superset import security_manager
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.db_query_status import QueryStatus
+from superset.extensions import cache_manager
+from superset.utils.cache import generate_cache_key, set_and_log_cache
+
+if TYPE_CHECKING:
+    from superset.common.query_context import QueryContext
+
+logger = logging.getLogger(__name__)
+
+
+def _get_brotli() -> Any:
+    """
+    Return the brotli module, which is only installed along with flask-compress:
+    `brotli` on CPython, or `brotlicffi` on PyPy.
+    """
+    # pylint: disable=import-outside-toplevel
+    try:
+        import brotli
+    except ImportError:
+        import brotlicffi as brotli
+
+    return brotli
+
+
+def _brotli_compress(data: bytes) -> bytes:
+    return _get_brotli().compress(data)
+
+
+def _brotli_decompress(data: bytes) -> bytes:
+    return _get_brotli().decompress(data)
+
+
+COMPRESSORS = {"br": _brotli_compress, "gzip": gzip.compress}
+DECOMPRESSORS = {"br": _brotli_decompress, "gzip": gzip.decompress}
+
+
+def get_response_cache_key(query_context: QueryContext) -> str | None:
+    """
+    Return the key of the cached response of a query context, or `None` if its
+    response can't be cached.
+    """
+    if (
+        not app.config["CHART_DATA_RESPONSE_CACHE"]
+        or query_context.result_type != ChartDataResultType.FULL
+        or query_context.result_format
+        not in ChartDataResultFormat.json_like() | {ChartDataResultFormat.ARROW}
+    ):
+        return None
+
+    cache_keys = [
+        query_context.query_cache_key(query_obj) for query_obj in query_context.queries
+    ]
+    if not cache_keys or not all(cache_keys):
+        return None
+
+    return generate_cache_key(
+        {
+            "cache_keys": cache_keys,
+            "result_type": query_context.result_type,
+            "result_format": query_context.result_format,
+            # the SQL of the queries is left out of the responses of guest users
+            "is_guest_user": security_manager.is_guest_user(),
+        },
+        key_prefix="chart_data_response_",
+    )
+
+
+def load_response(cache_key: str) -> Response | None:
+    """
+    Return the cached response of a query context, if any. Precompressed bodies are
+    sent as is to the clients accepting their encoding.
+    """
+    if not (entry := cache_manager.data_cache.get(cache_key)):
+        return None
+
+    body, encoding = entry["body"], entry["encoding"]
+    response = Response(status=200, content_type=entry["content_type"])
+    if encoding and request.accept_encodings[encoding]:
+        response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+    elif encoding:
+        body = DECOMPRESSORS[encoding](body)
+    response.set_data(body)
+    response.headers.update(entry["headers"])
+    response.set_etag(entry["etag"])
+    return response
+
+
+def store_response(
+    cache_key: str,
+    response: Response,
+    queries: list[dict[str, Any]],
+    datasource_uid: str | None = None,
+) -> None:
+    """
+    Cache the response of a query context if it was built from cached data, for as
+    long as that data stays in the cache, and add its ETag.
+
+    :param cache_key: The key of the cached response
+    :param response: The response
+    :param queries: The payloads of the queries of the response
+    :param datasource_uid: The uid of the datasource, to invalidate the response
+        along with the data
+    """
+    if response.status_code != 200 or response.direct_passthrough:
+        return
+    if (timeout := _get_timeout(queries)) is None:
+        return
+
+    response.add_etag()
+    body = response.get_data()
+    encoding = app.config["CHART_DATA_RESPONSE_CACHE_ENCODING"]
+    if encoding:
+        body = COMPRESSORS[encoding](body)
+
+    set_and_log_cache(
+        cache_manager.data_cache,
+        cache_key,
+        {
+            "body": body,
+            "encoding": encoding,
+            "content_type": response.content_type,
+            "headers": {
+                key: value
+                for key, value in response.headers.items()
+                if key == "Content-Disposition"
+            },
+            "etag": response.get_etag()[0],
+        },
+        cache_timeout=timeout,
+        datasource_uid=datasource_uid,
+    )
+
+
+def delete_response(cache_key: str) -> None:
+    """
+    Delete the cached response of a query context, e.g. when its data is refreshed.
+    """
+    cache_manager.data_cache.delete(cache_key)
+
+
+def _get_timeout(queries: list[dict[str, Any]]) -> int | None:
+    """
+    Return the time left before the data of the queries expires, or `None` if any of
+    them wasn't served from the cache.
+    """
+    now = datetime.utcnow()
+    timeouts = []
+    for query in queries:
+        if (
+            not query.get("is_cached")
+            or query.get("status") == QueryStatus.FAILED
+            or not query.get("cached_dttm")
+        ):
+            return None
+
+        timeout = query.get("cache_timeout")
+        if timeout is None:
+            timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
+        if timeout == 0:
+            # the data never expires
+            continue
+
+        age = now - datetime.fromisoformat(query["cached_dttm"])
+        timeouts.append(int(timeout - age.total_seconds()))
+
+    if not timeouts:
+        return 0
+    timeout = min(timeouts)
+    return timeout if timeout > 0 else None
@@ -40,6 +40,7 @@ from superset.utils.core import (
 if TYPE_CHECKING:
     from superset.common.query_context import QueryContext
     from superset.common.query_context_factory import QueryContextFactory
+    from superset.connectors.sqla.models import BaseDatasource
 
 
 def get_time_grain_choices() -> Any:
@@ -1379,6 +1380,7 @@ class ChartDataQueryObjectSchema(Schema):
 
 class ChartDataQueryContextSchema(Schema):
     query_context_factory: QueryContextFactory | None = None
+    datasources: dict[tuple[DatasourceType, int], BaseDatasource] | None
     datasource = fields.Nested(ChartDataDatasourceSchema)
     queries = fields.List(fields.Nested(ChartDataQueryObjectSchema))
     custom_cache_timeout = fields.Integer(
@@ -1400,10 +1402,26 @@ class ChartDataQueryContextSchema(Schema):
 
     form_data = fields.Raw(allow_none=True, required=False)
 
+    def __init__(
+        self,
+        *args: Any,
+        datasources: dict[tuple[DatasourceType, int], BaseDatasource] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        :param datasources: Datasources shared by the query contexts loaded by the
+            schema, e.g. by the charts of a batch
+        """
+        super().__init__(*args, **kwargs)
+        self.datasources = datasources
+
     # pylint: disable=unused-argument
     @post_load
     def make_query_context(self, data: dict[str, Any], **kwargs: Any) -> QueryContext:
-        query_context = self.get_query_context_factory().create(**data)
+        query_context = self.get_query_context_factory().create(
+            **data,
+            datasources=self.datasources,
+        )
         return query_context
 
     def get_query_context_factory(self) -> QueryContextFactory:
@@ -1530,6 +1548,44 @@ class ChartDataResponseSchema(Schema):
     )
 
 
+class ChartDataBatchSchema(Schema):
+    query_contexts = fields.List(
+        fields.Dict(),
+        required=True,
+        validate=Length(min=1),
+        metadata={
+            "description": "The query contexts of the charts, each following the "
+            "`ChartDataQueryContextSchema`."
+        },
+    )
+
+
+class ChartDataBatchResponseResult(Schema):
+    status = fields.Integer(
+        metadata={"description": "The HTTP status of the chart data response"},
+    )
+    result = fields.List(
+        fields.Nested(ChartDataResponseResult),
+        metadata={
+            "description": "A list of results for each corresponding query of the "
+            "query context, when successful."
+        },
+    )
+    message = fields.String(
+        metadata={"description": "The error message, when unsuccessful"},
+    )
+
+
+class ChartDataBatchResponseSchema(Schema):
+    results = fields.List(
+        fields.Nested(ChartDataBatchResponseResult),
+        metadata={
+            "description": "A list of responses for each corresponding query context "
+            "in the request."
+        },
+    )
+
+
 class ChartDataAsyncResponseSchema(Schema):
     channel_id = fields.String(
         metadata={"description": "Unique session async channel ID"},
@@ -1668,6 +1724,8 @@ CHART_SCHEMAS = (
     ChartCacheWarmUpResponseSchema,
     ChartDataQueryContextSchema,
     ChartDataResponseSchema,
+    ChartDataBatchSchema,
+    ChartDataBatchResponseSchema,
     ChartDataAsyncResponseSchema,
     # TODO: These should optimally be included in the QueryContext schema as an `anyOf`
     #  in ChartDataPostProcessingOperation.options, but since `anyOf` is not
@@ -29,6 +29,12 @@ from superset.commands.database.exceptions import (
 )
 from superset.connectors.sqla.models import SqlaTable
 from superset.daos.database import DatabaseDAO
+from superset.databases.name_index import (
+    get_cache_key,
+    get_names,
+    is_name_index_enabled,
+    search_names,
+)
 from superset.exceptions import SupersetException
 from superset.extensions import db, security_manager
 from superset.models.core import Database
@@ -40,108 +46,179 @@ logger = logging.getLogger(__name__)
 class TablesDatabaseCommand(BaseCommand):
     _model: Database
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         db_id: int,
         catalog_name: str | None,
         schema_name: str,
         force: bool,
+        search: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
     ):
         self._db_id = db_id
         self._catalog_name = catalog_name
         self._schema_name = schema_name
         self._force = force
+        self._search = search
+        self._page = page or 0
+        self._page_size = page_size
 
     def run(self) -> dict[str, Any]:
         self.validate()
         self._catalog_name = self._catalog_name or self._model.get_default_catalog()
         try:
+            table_names, view_names = self._get_table_and_view_names()
+
             tables = security_manager.get_datasources_accessible_by_user(
                 database=self._model,
                 catalog=self._catalog_name,
                 schema=self._schema_name,
-                datasource_names=sorted(
-                    # get_all_table_names_in_schema may return raw (unserialized) cached
-                    # results, so we wrap them as DatasourceName objects here instead of
-                    # directly in the method to ensure consistency.
-                    DatasourceName(*datasource_name)
-                    for datasource_name in self._model.get_all_table_names_in_schema(
-                        catalog=self._catalog_name,
-                        schema=self._schema_name,
-                        force=self._force,
-                        cache=self._model.table_cache_enabled,
-                        cache_timeout=self._model.table_cache_timeout,
-                    )
-                ),
+                datasource_names=[
+                    DatasourceName(table, self._schema_name, self._catalog_name)
+                    for table in table_names
+                ],
             )
 
             views = security_manager.get_datasources_accessible_by_user(
                 database=self._model,
                 catalog=self._catalog_name,
                 schema=self._schema_name,
-                datasource_names=sorted(
-                    # get_all_view_names_in_schema may return raw (unserialized) cached
-                    # results, so we wrap them as DatasourceName objects here instead of
-                    # directly in the method to ensure consistency.
-                    DatasourceName(*datasource_name)
-                    for datasource_name in self._model.get_all_view_names_in_schema(
-                        catalog=self._catalog_name,
-                        schema=self._schema_name,
-                        force=self._force,
-                        cache=self._model.table_cache_enabled,
-                        cache_timeout=self._model.table_cache_timeout,
-                    )
-                ),
+                datasource_names=[
+                    DatasourceName(view, self._schema_name, self._catalog_name)
+                    for view in view_names
+                ],
             )
 
-            extra_dict_by_name = {
-                table.name: table.extra_dict
-                for table in (
-                    db.session.query(SqlaTable)
-                    .filter(
-                        SqlaTable.database_id == self._model.id,
-                        SqlaTable.catalog == self._catalog_name,
-                        SqlaTable.schema == self._schema_name,
-                    )
-                    .options(
-                        load_only(
-                            SqlaTable.catalog,
-                            SqlaTable.schema,
-                            SqlaTable.table_name,
-                            SqlaTable.extra,
-                        ),
-                        lazyload(SqlaTable.columns),
-                        lazyload(SqlaTable.metrics),
-                    )
-                ).all()
-            }
-
-            options = sorted(
-                [
-                    {
-                        "value": table.table,
-                        "type": "table",
-                        "extra": extra_dict_by_name.get(table.table, None),
-                    }
-                    for table in tables
-                ]
-                + [
-                    {
-                        "value": view.table,
-                        "type": "view",
-                    }
-                    for view in views
-                ],
-                key=lambda item: item["value"],
+            options: list[dict[str, Any]] = sorted(
+                [{"value": table.table, "type": "table"} for table in tables]
+                + [{"value": view.table, "type": "view"} for view in views],
+                key=self._sort_key,
             )
+            count = len(options)
+            if self._page_size:
+                start = self._page * self._page_size
+                options = options[start : start + self._page_size]
 
-            payload = {"count": len(tables) + len(views), "result": options}
+            extra_dict_by_name = self._get_extra_dict_by_name(
+                [option["value"] for option in options if option["type"] == "table"]
+            )
+            for option in options:
+                if option["type"] == "table":
+                    option["extra"] = extra_dict_by_name.get(option["value"], None)
+
+            payload = {"count": count, "result": options}
             return payload
         except SupersetException:
             raise
         except Exception as ex:
             raise DatabaseTablesUnexpectedError(str(ex)) from ex
 
+    def _get_table_and_view_names(self) -> tuple[list[str], list[str]]:
+        """
+        Return the sorted names of the tables and views of the schema, matching the
+        search if any.
+        """
+        if is_name_index_enabled(self._model):
+            entry = get_names(
+                self._model,
+                self._catalog_name,
+                self._schema_name,
+                force=self._force,
+            )
+            cache_key = get_cache_key(
+                self._model.id,
+                self._catalog_name,
+                self._schema_name,
+            )
+            if not self._search:
+                return entry["tables"], entry["views"]
+            return (
+                search_names(
+                    entry["tables"],
+                    self._search,
+                    f"{cache_key}:tables",
+                    entry["dttm"],
+                ),
+                search_names(
+                    entry["views"],
+                    self._search,
+                    f"{cache_key}:views",
+                    entry["dttm"],
+                ),
+            )
+
+        # get_all_table_names_in_schema and get_all_view_names_in_schema may return raw
+        # (unserialized) cached results, so only the first item of each name is used
+        table_names = sorted(
+            name[0]
+            for name in self._model.get_all_table_names_in_schema(
+                catalog=self._catalog_name,
+                schema=self._schema_name,
+                force=self._force,
+                cache=self._model.table_cache_enabled,
+                cache_timeout=self._model.table_cache_timeout,
+            )
+        )
+        view_names = sorted(
+            name[0]
+            for name in self._model.get_all_view_names_in_schema(
+                catalog=self._catalog_name,
+                schema=self._schema_name,
+                force=self._force,
+                cache=self._model.table_cache_enabled,
+                cache_timeout=self._model.table_cache_timeout,
+            )
+        )
+        if not self._search:
+            return table_names, view_names
+        return (
+            search_names(table_names, self._search),
+            search_names(view_names, self._search),
+        )
+
+    def _sort_key(self, option: dict[str, Any]) -> tuple[bool, str]:
+        """
+        Sort options by name, with the names starting with the search first.
+        """
+        value = option["value"]
+        if not self._search:
+            return False, value
+        return not value.lower().startswith(self._search.lower()), value
+
+    def _get_extra_dict_by_name(self, table_names: list[str]) -> dict[str, Any]:
+        """
+        Return the extra of the datasets of the tables, by table name. When paging,
+        only the datasets of the tables in the page are loaded.
+        """
+        filters = [
+            SqlaTable.database_id == self._model.id,
+            SqlaTable.catalog == self._catalog_name,
+            SqlaTable.schema == self._schema_name,
+        ]
+        if self._page_size:
+            if not table_names:
+                return {}
+            filters.append(SqlaTable.table_name.in_(table_names))
+
+        return {
+            table.name: table.extra_dict
+            for table in (
+                db.session.query(SqlaTable)
+                .filter(*filters)
+                .options(
+                    load_only(
+                        SqlaTable.catalog,
+                        SqlaTable.schema,
+                        SqlaTable.table_name,
+                        SqlaTable.extra,
+                    ),
+                    lazyload(SqlaTable.columns),
+                    lazyload(SqlaTable.metrics),
+                )
+            ).all()
+        }
+
     def validate(self) -> None:
         self._model = cast(Database, DatabaseDAO.find_by_id(self._db_id))
         if not self._model:
@@ -15,7 +15,11 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+import os
+import time
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
 from functools import partial
 from typing import Any, Optional, TypedDict
 
@@ -83,6 +87,49 @@ class BaseDataReader:
     @abstractmethod
     def file_metadata(self, file: FileStorage) -> FileMetadata: ...
 
+    def file_to_dataframe_chunks(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read the file as a sequence of DataFrames, which are uploaded one at a time.
+        Readers that can stream the file override this, by default the whole file is
+        read into a single DataFrame.
+        """
+        yield self.file_to_dataframe(file)
+
+    @staticmethod
+    def _limit_chunks(
+        chunk_iterator: Iterable[pd.DataFrame],
+        max_rows: Optional[int],
+    ) -> Iterator[pd.DataFrame]:
+        """Yield chunks until `max_rows` rows have been read"""
+        total_rows = 0
+        for chunk in chunk_iterator:
+            # Check if adding this chunk would exceed the row limit
+            if max_rows is not None and total_rows + len(chunk) > max_rows:
+                # Only take the needed rows from this chunk
+                remaining_rows = max_rows - total_rows
+                yield chunk.iloc[:remaining_rows]
+                break
+
+            yield chunk
+            total_rows += len(chunk)
+
+            # Break if we've reached the desired number of rows
+            if max_rows is not None and total_rows >= max_rows:
+                break
+
+    @staticmethod
+    def _continue_index(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Number the rows of chunks read without an index column continuously, like a
+        single DataFrame would be.
+        """
+        offset = 0
+        for chunk in chunks:
+            if isinstance(chunk.index, pd.RangeIndex):
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+
     def read(
         self,
         file: FileStorage,
@@ -91,12 +138,48 @@ class BaseDataReader:
         schema_name: Optional[str],
     ) -> None:
         self._dataframe_to_database(
-            self.file_to_dataframe(file), database, table_name, schema_name
+            self._log_progress(self.file_to_dataframe_chunks(file), file, table_name),
+            database,
+            table_name,
+            schema_name,
         )
 
+    @staticmethod
+    def _log_progress(
+        chunks: Iterable[pd.DataFrame],
+        file: FileStorage,
+        table_name: str,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Log the number of rows read, and how much of the file was consumed, as chunks
+        are uploaded.
+        """
+        try:
+            size = file.stream.seek(0, os.SEEK_END)
+            file.stream.seek(0)
+        except (AttributeError, OSError):
+            size = 0
+
+        start = time.monotonic()
+        rows = 0
+        for chunk in chunks:
+            rows += len(chunk)
+            progress = ""
+            with suppress(AttributeError, OSError):
+                if size:
+                    progress = f", {100 * file.stream.tell() / size:.0f}% of the file"
+            logger.info(
+                "Uploading %s: %i rows read in %.1fs%s",
+                table_name,
+                rows,
+                time.monotonic() - start,
+                progress,
+            )
+            yield chunk
+
     def _dataframe_to_database(
         self,
-        df: pd.DataFrame,
+        df: pd.DataFrame | Iterable[pd.DataFrame],
         database: Database,
         table_name: str,
         schema_name: Optional[str],
@@ -104,7 +187,7 @@ class BaseDataReader:
         """
         Upload DataFrame to database
 
-        :param df:
+        :param df: a DataFrame, or a sequence of DataFrames appended to the same table
         :throws DatabaseUploadFailed: if there is an error uploading the DataFrame
         """
         try:
@@ -118,12 +201,22 @@ class BaseDataReader:
                 "dataframe_index"
             ):
                 to_sql_kwargs["index_label"] = self._options.get("index_label")
-            database.db_engine_spec.df_to_sql(
-                database,
-                data_table,
-                df,
-                to_sql_kwargs=to_sql_kwargs,
-            )
+            if isinstance(df, pd.DataFrame):
+                database.db_engine_spec.df_to_sql(
+                    database,
+                    data_table,
+                    df,
+                    to_sql_kwargs=to_sql_kwargs,
+                )
+            else:
+                database.db_engine_spec.df_chunks_to_sql(
+                    database,
+                    data_table,
+                    df,
+                    to_sql_kwargs=to_sql_kwargs,
+                )
+        except DatabaseUploadFailed:
+            raise
         except ValueError as ex:
             raise DatabaseUploadFailed(
                 message=_(
@@ -14,11 +14,14 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import itertools
 import logging
+from collections.abc import Iterator
 from importlib import util
 from typing import Any, Optional
 
 import pandas as pd
+import pyarrow as pa
 from flask import current_app
 from flask_babel import lazy_gettext as _
 from werkzeug.datastructures import FileStorage
@@ -155,29 +158,13 @@ class CSVReader(BaseDataReader):
 
         try:
             if "chunksize" in kwargs:
-                chunks = []
-                total_rows = 0
-                max_rows = kwargs.get("nrows")
                 chunk_iterator = pd.read_csv(
                     filepath_or_buffer=file.stream,
                     **kwargs,
                 )
-
-                for chunk in chunk_iterator:
-                    # Check if adding this chunk would exceed the row limit
-                    if max_rows is not None and total_rows + len(chunk) > max_rows:
-                        # Only take the needed rows from this chunk
-                        remaining_rows = max_rows - total_rows
-                        chunk = chunk.iloc[:remaining_rows]
-                        chunks.append(chunk)
-                        break
-
-                    chunks.append(chunk)
-                    total_rows += len(chunk)
-
-                    # Break if we've reached the desired number of rows
-                    if max_rows is not None and total_rows >= max_rows:
-                        break
+                chunks = list(
+                    CSVReader._limit_chunks(chunk_iterator, kwargs.get("nrows"))
+                )
 
                 if chunks:
                     result = pd.concat(chunks, ignore_index=False)
@@ -220,6 +207,34 @@ class CSVReader(BaseDataReader):
         except Exception as ex:
             raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
 
+    @staticmethod
+    def _read_csv_chunks(
+        file: FileStorage,
+        kwargs: dict[str, Any],
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV file in chunks of `chunksize` rows, without concatenating them.
+
+        Since chunks may already be uploaded when an error is found, the encoding is
+        detected before reading instead of retrying on decoding errors.
+        """
+        kwargs = {**kwargs, "engine": "c", "low_memory": False}
+        if kwargs.get("encoding", DEFAULT_ENCODING) == DEFAULT_ENCODING:
+            kwargs["encoding"] = CSVReader._detect_encoding(file)
+
+        try:
+            chunk_iterator = pd.read_csv(filepath_or_buffer=file.stream, **kwargs)
+            yield from CSVReader._limit_chunks(chunk_iterator, kwargs.get("nrows"))
+        except (
+            UnicodeDecodeError,
+            pd.errors.ParserError,
+            pd.errors.EmptyDataError,
+            ValueError,
+        ) as ex:
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+
     def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame:
         """
         Read CSV file into a DataFrame
@@ -232,7 +247,138 @@ class CSVReader(BaseDataReader):
 
         use_chunking = rows_to_read is None or rows_to_read > chunk_size * 2
 
-        kwargs = {
+        kwargs = self._get_read_csv_kwargs()
+        if use_chunking:
+            kwargs["chunksize"] = chunk_size
+            kwargs["iterator"] = True
+
+        return self._read_csv(file, kwargs)
+
+    def file_to_dataframe_chunks(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read CSV file as a sequence of DataFrames when `CSV_UPLOAD_STREAMING` is
+        enabled, so that the whole file is never held in memory.
+
+        With the `CSV_UPLOAD_PYARROW_ENGINE` feature flag the file is parsed by the
+        pyarrow streaming reader in blocks of `CSV_UPLOAD_STREAMING_BLOCK_SIZE` bytes,
+        otherwise by pandas in chunks of `READ_CSV_CHUNK_SIZE` rows.
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        if not current_app.config["CSV_UPLOAD_STREAMING"]:
+            yield self.file_to_dataframe(file)
+            return
+
+        # pyarrow has no equivalent to `skipinitialspace`
+        if is_feature_enabled("CSV_UPLOAD_PYARROW_ENGINE") and not self._options.get(
+            "skip_initial_space"
+        ):
+            yield from self._read_csv_batches(file)
+            return
+
+        kwargs = self._get_read_csv_kwargs()
+        kwargs["chunksize"] = current_app.config.get("READ_CSV_CHUNK_SIZE", 1000)
+        yield from self._read_csv_chunks(file, kwargs)
+
+    def _read_csv_batches(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV file with the pyarrow streaming reader, converting each record batch
+        to a DataFrame with the reader options applied.
+
+        Column types are inferred from the first block, so later rows that can't be
+        converted to them fail the upload instead of changing the type mid-table.
+        """
+        # pylint: disable=import-outside-toplevel
+        from pyarrow import csv
+
+        encoding = self._options.get("encoding", DEFAULT_ENCODING)
+        if encoding == DEFAULT_ENCODING:
+            encoding = self._detect_encoding(file)
+
+        column_dates = self._options.get("column_dates") or []
+        column_data_types = self._options.get("column_data_types") or {}
+        null_values = self._options.get("null_values")
+        read_options = csv.ReadOptions(
+            encoding=encoding,
+            skip_rows=self._options.get("skip_rows", 0)
+            + self._options.get("header_row", 0),
+            block_size=current_app.config["CSV_UPLOAD_STREAMING_BLOCK_SIZE"],
+        )
+        parse_options = csv.ParseOptions(
+            delimiter=self._options.get("delimiter", ","),
+            ignore_empty_lines=self._options.get("skip_blank_lines", False),
+        )
+        convert_options = csv.ConvertOptions(
+            decimal_point=self._options.get("decimal_character", "."),
+            include_columns=self._options.get("columns_read") or None,
+            # dates and columns with explicit types are converted by pandas, which
+            # supports `dayfirst` and pandas dtypes
+            column_types={
+                column: pa.string() for column in [*column_dates, *column_data_types]
+            },
+            **(
+                {"null_values": null_values, "strings_can_be_null": True}
+                if null_values
+                else {}
+            ),
+        )
+
+        def convert(batch: pa.RecordBatch | pa.Table) -> pd.DataFrame:
+            df = batch.to_pandas()
+            for column in column_dates:
+                df[column] = pd.to_datetime(
+                    df[column],
+                    dayfirst=self._options.get("day_first", False),
+                )
+            if column_data_types:
+                df = df.astype(column_data_types)
+            if index_column := self._options.get("index_column"):
+                df = df.set_index(index_column)
+            return df
+
+        def open_csv() -> csv.CSVStreamingReader:
+            file.stream.seek(0)
+            return csv.open_csv(
+                file.stream,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options,
+            )
+
+        try:
+            reader = open_csv()
+            # like pandas, only parse the columns in `column_dates` as dates, and read
+            # columns that are empty in the first block as strings, since a null type
+            # can't hold the values of later blocks
+            if string_columns := [
+                field.name
+                for field in reader.schema
+                if pa.types.is_null(field.type)
+                or (pa.types.is_temporal(field.type) and field.name not in column_dates)
+            ]:
+                convert_options.column_types = {
+                    **convert_options.column_types,
+                    **{column: pa.string() for column in string_columns},
+                }
+                reader = open_csv()
+            batches = (convert(batch) for batch in reader)
+            if (first := next(batches, None)) is not None:
+                batches = itertools.chain([first], batches)
+            else:
+                # a file without rows still creates the table
+                batches = iter([convert(reader.schema.empty_table())])
+            yield from self._limit_chunks(
+                self._continue_index(batches),
+                self._options.get("rows_to_read"),
+            )
+        except (pa.ArrowInvalid, UnicodeDecodeError, ValueError, KeyError) as ex:
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+
+    def _get_read_csv_kwargs(self) -> dict[str, Any]:
+        return {
             "encoding": self._options.get("encoding", DEFAULT_ENCODING),
             "header": self._options.get("header_row", 0),
             "decimal": self._options.get("decimal_character", "."),
@@ -249,7 +395,7 @@ class CSVReader(BaseDataReader):
                 if self._options.get("null_values")  # None if an empty list
                 else None
             ),
-            "nrows": rows_to_read,
+            "nrows": self._options.get("rows_to_read"),
             "parse_dates": self._options.get("column_dates"),
             "sep": self._options.get("delimiter", ","),
             "skip_blank_lines": self._options.get("skip_blank_lines", False),
@@ -263,12 +409,6 @@ class CSVReader(BaseDataReader):
             "cache_dates": True,
         }
 
-        if use_chunking:
-            kwargs["chunksize"] = chunk_size
-            kwargs["iterator"] = True
-
-        return self._read_csv(file, kwargs)
-
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         """
         Get metadata from a CSV file
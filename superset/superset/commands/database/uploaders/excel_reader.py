@@ -14,11 +14,16 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import itertools
 import logging
-from typing import Optional
+from collections.abc import Iterator
+from contextlib import closing
+from typing import Any, Optional
 
 import pandas as pd
+from flask import current_app
 from flask_babel import lazy_gettext as _
+from pandas.io.parsers import TextParser
 from werkzeug.datastructures import FileStorage
 
 from superset.commands.database.exceptions import DatabaseUploadFailed
@@ -93,6 +98,105 @@ class ExcelReader(BaseDataReader):
         except Exception as ex:
             raise DatabaseUploadFailed(_("Error reading Excel file")) from ex
 
+    def file_to_dataframe_chunks(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read an xlsx file as a sequence of DataFrames of `READ_CSV_CHUNK_SIZE` rows when
+        `EXCEL_UPLOAD_STREAMING` is enabled, so that the whole sheet is never held in
+        memory. Other Excel formats are read into a single DataFrame.
+
+        :return: iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        if not current_app.config["EXCEL_UPLOAD_STREAMING"] or not (
+            file.filename or ""
+        ).lower().endswith((".xlsx", ".xlsm")):
+            yield self.file_to_dataframe(file)
+            return
+
+        yield from self._limit_chunks(
+            self._continue_index(self._read_excel_chunks(file)),
+            self._options.get("rows_to_read"),
+        )
+
+    def _read_excel_chunks(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read the rows of a sheet with openpyxl in read-only mode, parsing each chunk of
+        rows with the same parser, and options, as `pd.read_excel`.
+        """
+        # pylint: disable=import-outside-toplevel
+        from openpyxl import load_workbook
+
+        chunk_size = current_app.config.get("READ_CSV_CHUNK_SIZE", 1000)
+        parser_kwargs: dict[str, Any] = {
+            "header": 0,
+            "index_col": self._options.get("index_column"),
+            "keep_default_na": not self._options.get("null_values"),
+            "decimal": self._options.get("decimal_character", "."),
+            "na_values": self._options.get("null_values")
+            if self._options.get("null_values")  # None if an empty list
+            else None,
+            "parse_dates": self._options.get("column_dates"),
+            "usecols": self._options.get("columns_read") or None,
+            "skip_blank_lines": False,
+        }
+
+        try:
+            with closing(
+                load_workbook(file.stream, read_only=True, data_only=True)
+            ) as workbook:
+                sheet_name = self._options.get("sheet_name", 0)
+                sheet = (
+                    workbook.worksheets[sheet_name]
+                    if isinstance(sheet_name, int)
+                    else workbook[sheet_name]
+                )
+                # like pandas, empty cells are read as empty strings
+                rows = (
+                    ["" if value is None else value for value in row]
+                    for row in itertools.islice(
+                        sheet.iter_rows(values_only=True),
+                        self._options.get("skip_rows", 0)
+                        + self._options.get("header_row", 0),
+                        None,
+                    )
+                )
+                if not (header := next(rows, None)):
+                    yield pd.DataFrame()
+                    return
+
+                # like pandas, ignore the trailing empty rows read-only sheets can have
+                chunk: list[list[Any]] = []
+                empty_rows: list[list[Any]] = []
+                empty = True
+                for row in rows:
+                    if all(value == "" for value in row):
+                        empty_rows.append(row)
+                        continue
+                    chunk.extend(empty_rows)
+                    empty_rows.clear()
+                    chunk.append(row)
+                    if len(chunk) >= chunk_size:
+                        yield TextParser([header, *chunk], **parser_kwargs).read()
+                        chunk = []
+                        empty = False
+                if chunk or empty:
+                    # a sheet without rows still creates the table
+                    yield TextParser([header, *chunk], **parser_kwargs).read()
+        except DatabaseUploadFailed:
+            raise
+        except (
+            pd.errors.ParserError,
+            pd.errors.EmptyDataError,
+            IndexError,
+            KeyError,
+            ValueError,
+        ) as ex:
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+        except Exception as ex:
+            raise DatabaseUploadFailed(_("Error reading Excel file")) from ex
+
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         try:
             excel_file = pd.ExcelFile(file)
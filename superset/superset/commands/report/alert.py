@@ -23,7 +23,6 @@ from typing import Any
 from uuid import UUID
 
 import numpy as np
-import pandas as pd
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app as app
 from flask_babel import lazy_gettext as _
@@ -59,6 +58,7 @@ class AlertCommand(BaseCommand):
         self._report_schedule = report_schedule
         self._execution_id = execution_id
         self._result: float | None = None
+        self.query_duration_ms: float | None = None
 
     def run(self) -> bool:
         """
@@ -90,12 +90,12 @@ class AlertCommand(BaseCommand):
         except (KeyError, json.JSONDecodeError) as ex:
             raise AlertValidatorConfigError() from ex
 
-    def _validate_not_null(self, rows: np.recarray[Any, Any]) -> None:
+    def _validate_not_null(self, rows: list[tuple[Any, ...]]) -> None:
         self._validate_result(rows)
-        self._result = rows[0][1]
+        self._result = rows[0][0]
 
     @staticmethod
-    def _validate_result(rows: np.recarray[Any, Any]) -> None:
+    def _validate_result(rows: list[tuple[Any, ...]]) -> None:
         # check if query return more than one row
         if len(rows) > 1:
             raise AlertQueryMultipleRowsError(
@@ -105,24 +105,23 @@ class AlertCommand(BaseCommand):
                 )
             )
         # check if query returned more than one column
-        if len(rows[0]) > 2:
+        if len(rows[0]) > 1:
             raise AlertQueryMultipleColumnsError(
-                # len is subtracted by 1 to discard pandas index column
                 _(
                     "Alert query returned more than one column. "
                     "%(num_cols)s columns returned",
-                    num_cols=(len(rows[0]) - 1),
+                    num_cols=len(rows[0]),
                 )
             )
 
-    def _validate_operator(self, rows: np.recarray[Any, Any]) -> None:
+    def _validate_operator(self, rows: list[tuple[Any, ...]]) -> None:
         self._validate_result(rows)
-        if rows[0][1] in (0, None, np.nan):
+        if rows[0][0] in (0, None, np.nan):
             self._result = 0.0
             return
         try:
             # Check if it's float or if we can convert it
-            self._result = float(rows[0][1])
+            self._result = float(rows[0][0])
             return
         except (AssertionError, TypeError, ValueError) as ex:
             raise AlertQueryInvalidTypeError() from ex
@@ -146,11 +145,14 @@ class AlertCommand(BaseCommand):
         }
 
     @logs_context(context_func=_get_alert_metadata_from_object)
-    def _execute_query(self) -> pd.DataFrame:
+    def _execute_query(self) -> list[tuple[Any, ...]]:
         """
         Executes the actual alert SQL query template
 
-        :return: A pandas dataframe
+        Alert queries return at most `ALERT_SQL_LIMIT` rows, so they are fetched as
+        tuples instead of being loaded into a dataframe.
+
+        :return: The rows returned by the query
         :raises AlertQueryError: SQL query is not valid
         :raises AlertQueryTimeout: The SQL query received a celery soft timeout
         """
@@ -177,14 +179,19 @@ class AlertCommand(BaseCommand):
             user = security_manager.find_user(username)
             with override_user(user):
                 start = default_timer()
-                df = self._report_schedule.database.get_df(sql=limited_rendered_sql)
+                _, rows = self._report_schedule.database.get_rows(
+                    sql=limited_rendered_sql,
+                    nullpool=not app.config["ALERT_REPORTS_QUERY_POOL_CONNECTIONS"],
+                )
                 stop = default_timer()
+                self.query_duration_ms = (stop - start) * 1000.0
+                app.config["STATS_LOGGER"].timing("reports.alert.query", stop - start)
                 logger.info(
                     "Query for %s took %.2f ms",
                     self._report_schedule.name,
-                    (stop - start) * 1000.0,
+                    self.query_duration_ms,
                 )
-                return df
+                return rows
         except SoftTimeLimitExceeded as ex:
             logger.warning("A timeout occurred while executing the alert query: %s", ex)
             raise AlertQueryTimeout() from ex
@@ -198,23 +205,22 @@ class AlertCommand(BaseCommand):
 
     def validate(self) -> None:
         """
-        Validate the query result as a Pandas DataFrame
+        Validate the query result
         """
         # When there are transient errors when executing queries, users will get
         # notified with the error stacktrace which can be avoided by retrying
-        df = retry_call(
+        rows = retry_call(
             self._execute_query,
             exception=AlertQueryError,
             max_tries=app.config["ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES"],
         )
 
-        if df.empty and self._is_validator_not_null:
+        if not rows and self._is_validator_not_null:
             self._result = None
             return
-        if df.empty and self._is_validator_operator:
+        if not rows and self._is_validator_operator:
             self._result = 0.0
             return
-        rows = df.to_records()
         if self._is_validator_not_null:
             self._validate_not_null(rows)
             return
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Optional, Union
 from uuid import UUID
@@ -22,9 +23,13 @@ from uuid import UUID
 import pandas as pd
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app as app
+from flask_appbuilder.security.sqla.models import User
 
 from superset import db, security_manager
+from superset.charts.client_processing import apply_client_processing
+from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.commands.base import BaseCommand
+from superset.commands.chart.data.get_data_command import ChartDataCommand
 from superset.commands.dashboard.permalink.create import CreateDashboardPermalinkCommand
 from superset.commands.exceptions import CommandException, UpdateFailedError
 from superset.commands.report.alert import AlertCommand
@@ -53,7 +58,11 @@ from superset.daos.report import (
 from superset.dashboards.permalink.types import DashboardPermalinkState
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorsException, SupersetException
-from superset.extensions import feature_flag_manager, machine_auth_provider_factory
+from superset.extensions import (
+    cache_manager,
+    feature_flag_manager,
+    machine_auth_provider_factory,
+)
 from superset.reports.models import (
     ReportDataFormat,
     ReportExecutionLog,
@@ -73,9 +82,19 @@ from superset.reports.notifications.exceptions import (
 )
 from superset.tasks.utils import get_executor
 from superset.utils import json
-from superset.utils.core import HeaderDataType, override_user, recipients_string_to_list
-from superset.utils.csv import get_chart_csv_data, get_chart_dataframe
+from superset.utils.core import (
+    create_zip,
+    HeaderDataType,
+    override_user,
+    recipients_string_to_list,
+)
+from superset.utils.csv import (
+    chart_data_to_dataframe,
+    get_chart_csv_data,
+    get_chart_dataframe,
+)
 from superset.utils.decorators import logs_context, transaction
+from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.pdf import build_pdf_from_screenshots
 from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
 from superset.utils.slack import get_channels_with_search, SlackChannelTypes
@@ -99,6 +118,7 @@ class BaseReportState:
         self._scheduled_dttm = scheduled_dttm
         self._start_dttm = datetime.utcnow()
         self._execution_id = execution_id
+        self._query_duration_ms: Optional[float] = None
 
     def update_report_schedule_and_log(
         self,
@@ -112,6 +132,18 @@ class BaseReportState:
         self.update_report_schedule(state)
         self.create_log(error_message)
 
+    def run_alert(self) -> bool:
+        """
+        Evaluate the alert, keeping the duration of its query for the execution log.
+
+        :return: bool, if the alert triggered or not
+        """
+        command = AlertCommand(self._report_schedule, self._execution_id)
+        try:
+            return command.run()
+        finally:
+            self._query_duration_ms = command.query_duration_ms
+
     def update_report_schedule(self, state: ReportState) -> None:
         """
         Update the report schedule state et al.
@@ -183,6 +215,7 @@ class BaseReportState:
             end_dttm=datetime.utcnow(),
             value=self._report_schedule.last_value,
             value_row_json=self._report_schedule.last_value_row_json,
+            query_duration_ms=self._query_duration_ms,
             state=self._report_schedule.last_state,
             error_message=error_message,
             report_schedule=self._report_schedule,
@@ -353,11 +386,14 @@ class BaseReportState:
                 )
                 for url in urls
             ]
+
+        cache_key = self._get_screenshots_cache_key(screenshots, username)
+        if cache_key and (imges := cache_manager.thumbnail_cache.get(cache_key)):
+            logger.info("Reusing screenshots taken by another report schedule")
+            return imges
+
         try:
-            imges = []
-            for screenshot in screenshots:
-                if imge := screenshot.get_screenshot(user=user):
-                    imges.append(imge)
+            imges = [imge for imge in self._take_screenshots(screenshots, user) if imge]
         except SoftTimeLimitExceeded as ex:
             logger.warning("A timeout occurred while taking a screenshot.")
             raise ReportScheduleScreenshotTimeout() from ex
@@ -367,8 +403,84 @@ class BaseReportState:
             ) from ex
         if not imges:
             raise ReportScheduleScreenshotFailedError()
+
+        if cache_key:
+            cache_manager.thumbnail_cache.set(
+                cache_key,
+                imges,
+                timeout=app.config["ALERT_REPORTS_SCREENSHOT_REUSE_TIMEOUT"],
+            )
         return imges
 
+    @staticmethod
+    def _take_screenshots(
+        screenshots: list[Union[ChartScreenshot, DashboardScreenshot]],
+        user: User,
+    ) -> list[Optional[bytes]]:
+        """
+        Take the screenshots as the executor, capturing up to
+        `ALERT_REPORTS_SCREENSHOT_CONCURRENCY` of them at the same time.
+        """
+        concurrency = min(
+            app.config["ALERT_REPORTS_SCREENSHOT_CONCURRENCY"],
+            len(screenshots),
+        )
+        if concurrency <= 1:
+            return [screenshot.get_screenshot(user=user) for screenshot in screenshots]
+
+        flask_app = app._get_current_object()  # pylint: disable=protected-access
+        username = user.username
+
+        def take_screenshot(
+            screenshot: Union[ChartScreenshot, DashboardScreenshot],
+        ) -> Optional[bytes]:
+            # Flask contexts and SQLAlchemy sessions are local to each thread, so the
+            # executor is loaded again in the thread
+            with flask_app.app_context():
+                return screenshot.get_screenshot(
+                    user=security_manager.find_user(username)
+                )
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            return list(executor.map(take_screenshot, screenshots))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_screenshots_cache_key(
+        self,
+        screenshots: list[Union[ChartScreenshot, DashboardScreenshot]],
+        username: Optional[str],
+    ) -> Optional[str]:
+        """
+        Return the key under which the screenshots are shared with other report
+        schedules, or `None` if they shouldn't be shared.
+
+        Screenshots depend on the chart or dashboard digest, the state of the dashboard
+        (eg, the selected tabs), the window size and the user taking them. They aren't
+        shared when a digest can't be computed.
+        """
+        if (
+            self._report_schedule.force_screenshot
+            or not app.config["ALERT_REPORTS_SCREENSHOT_REUSE_TIMEOUT"]
+        ):
+            return None
+
+        digests = [screenshot.digest for screenshot in screenshots]
+        if any(digest is None for digest in digests):
+            return None
+
+        return "report_screenshots_" + md5_sha_from_dict(
+            {
+                "chart_id": self._report_schedule.chart_id,
+                "dashboard_id": self._report_schedule.dashboard_id,
+                "dashboard_state": self._report_schedule.extra.get("dashboard"),
+                "digests": digests,
+                "window_size": list(screenshots[0].window_size),
+                "executor": username,
+            }
+        )
+
     def _get_pdf(self) -> bytes:
         """
         Get chart or dashboard pdf
@@ -379,22 +491,92 @@ class BaseReportState:
 
         return pdf
 
+    def _get_chart_data(self, result_format: ChartDataResultFormat) -> dict[str, Any]:
+        """
+        Run the query context saved with the chart, returning the same post-processed
+        payload as the chart data API. The report runs as the executor, so the
+        queries are subject to the same permissions.
+        """
+        chart = self._report_schedule.chart
+        form = json.loads(chart.query_context)
+        form["result_format"] = result_format.value
+        form["result_type"] = ChartDataResultType.POST_PROCESSED.value
+        form["force"] = self._report_schedule.force_screenshot
+
+        query_context = ChartDataQueryContextSchema().load(form)
+        command = ChartDataCommand(query_context)
+        command.validate()
+        result = command.run()
+
+        try:
+            form_data = json.loads(chart.params)
+        except (TypeError, json.JSONDecodeError):
+            form_data = {}
+
+        return apply_client_processing(result, form_data, query_context.datasource)
+
+    def _get_csv_data_from_worker(self) -> Optional[bytes]:
+        """
+        Return the chart data as CSV, or as a zip of CSV files for charts with
+        multiple queries.
+        """
+        if not security_manager.can_access("can_csv", "Superset"):
+            raise ReportScheduleCsvFailedError(
+                "The report executor is not allowed to export CSV data"
+            )
+
+        queries = self._get_chart_data(ChartDataResultFormat.CSV)["queries"]
+        encoding = app.config["CSV_EXPORT"].get("encoding", "utf-8")
+        if not queries:
+            return None
+        if len(queries) == 1:
+            return queries[0]["data"].encode(encoding)
+
+        files = {
+            f"query_{idx + 1}.{ChartDataResultFormat.CSV}": query["data"].encode(
+                encoding
+            )
+            for idx, query in enumerate(queries)
+        }
+        return create_zip(files).getvalue()
+
+    def _get_embedded_data_from_worker(self) -> Optional[pd.DataFrame]:
+        """
+        Return the data of the first query of the chart as a dataframe.
+        """
+        queries = self._get_chart_data(ChartDataResultFormat.JSON)["queries"]
+        if not queries:
+            return None
+
+        # serialize the data as the chart data API would, so that temporal values and
+        # hierarchical columns are converted in the same way
+        result = json.loads(
+            json.dumps(queries[0], default=json.json_int_dttm_ser, ignore_nan=True)
+        )
+        return chart_data_to_dataframe(result)
+
     def _get_csv_data(self) -> bytes:
-        url = self._get_url(result_format=ChartDataResultFormat.CSV)
         _, username = get_executor(
             executors=app.config["ALERT_REPORTS_EXECUTORS"],
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            csv_data = get_chart_csv_data(chart_url=url, auth_cookies=auth_cookies)
+            if app.config["ALERT_REPORTS_CHART_DATA_IN_WORKER"]:
+                logger.info("Running chart queries as user %s", user.username)
+                csv_data = self._get_csv_data_from_worker()
+            else:
+                url = self._get_url(result_format=ChartDataResultFormat.CSV)
+                auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(
+                    user
+                )
+                logger.info("Getting chart from %s as user %s", url, user.username)
+                csv_data = get_chart_csv_data(chart_url=url, auth_cookies=auth_cookies)
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleCsvTimeout() from ex
         except Exception as ex:
@@ -410,21 +592,27 @@ class BaseReportState:
         Return data as a Pandas dataframe, to embed in notifications as a table.
         """
 
-        url = self._get_url(result_format=ChartDataResultFormat.JSON)
         _, username = get_executor(
             executors=app.config["ALERT_REPORTS_EXECUTORS"],
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            dataframe = get_chart_dataframe(url, auth_cookies)
+            if app.config["ALERT_REPORTS_CHART_DATA_IN_WORKER"]:
+                logger.info("Running chart queries as user %s", user.username)
+                dataframe = self._get_embedded_data_from_worker()
+            else:
+                url = self._get_url(result_format=ChartDataResultFormat.JSON)
+                auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(
+                    user
+                )
+                logger.info("Getting chart from %s as user %s", url, user.username)
+                dataframe = get_chart_dataframe(url, auth_cookies)
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleDataFrameTimeout() from ex
         except Exception as ex:
@@ -723,7 +911,7 @@ class ReportNotTriggeredErrorState(BaseReportState):
         try:
             # If it's an alert check if the alert is triggered
             if self._report_schedule.type == ReportScheduleType.ALERT:
-                if not AlertCommand(self._report_schedule, self._execution_id).run():
+                if not self.run_alert():
                     self.update_report_schedule_and_log(ReportState.NOOP)
                     return
             self.send()
@@ -807,7 +995,7 @@ class ReportSuccessState(BaseReportState):
                 return
             self.update_report_schedule_and_log(ReportState.WORKING)
             try:
-                if not AlertCommand(self._report_schedule, self._execution_id).run():
+                if not self.run_alert():
                     self.update_report_schedule_and_log(ReportState.NOOP)
                     return
             except Exception as ex:
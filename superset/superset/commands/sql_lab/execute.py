@@ -25,6 +25,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from superset import db
 from superset.commands.base import BaseCommand
+from superset.commands.sql_lab.results import SqlExecutionResultsCommand
 from superset.common.db_query_status import QueryStatus
 from superset.errors import SupersetErrorType
 from superset.exceptions import (
@@ -41,6 +42,12 @@ from superset.sqllab.exceptions import (
 )
 from superset.sqllab.execution_context_convertor import ExecutionContextConvertor
 from superset.sqllab.limiting_factor import LimitingFactor
+from superset.sqllab.results_reuse import (
+    get_results_reuse_key,
+    get_reusable_query,
+    RESULTS_REUSE_KEY,
+    reuse_query_results,
+)
 from superset.utils.decorators import transaction
 
 if TYPE_CHECKING:
@@ -155,6 +162,8 @@ class ExecuteSqlCommand(BaseCommand):
             self._query_dao.update(
                 query, {"limit": self._execution_context.query.limit}
             )
+            if status := self._try_reuse_results(query, rendered_query):
+                return status
             return self._sql_json_executor.execute(
                 self._execution_context, rendered_query, self._log_params
             )
@@ -162,6 +171,61 @@ class ExecuteSqlCommand(BaseCommand):
             self._query_dao.update(query, {"status": QueryStatus.FAILED})
             raise
 
+    def _try_reuse_results(
+        self,
+        query: Query,
+        rendered_query: str,
+    ) -> SqlJsonExecutionStatus | None:
+        """
+        Serve the query with the stored results of an identical query, when the
+        database allows it.
+
+        The results reuse key is stored in the query even when the query is run, so
+        that its results can be reused once stored. This is committed because the
+        Celery task running the query needs to read it.
+        """
+        key = get_results_reuse_key(
+            query,
+            rendered_query,
+            self._execution_context.expand_data,
+        )
+        if not key:
+            return None
+
+        query.set_extra_json_key(RESULTS_REUSE_KEY, key)
+        db.session.commit()  # pylint: disable=consider-using-transaction
+        if self._execution_context.force:
+            return None
+
+        reused_query = get_reusable_query(key, query.database.results_reuse_max_age)
+        if not reused_query:
+            return None
+
+        payload = None
+        if not self._execution_context.is_run_asynchronous():
+            try:
+                payload = SqlExecutionResultsCommand(reused_query.results_key).run()
+            except SupersetErrorException:
+                logger.warning(
+                    "Query %i: Unable to read the results of query %i",
+                    query.id,
+                    reused_query.id,
+                    exc_info=True,
+                )
+                return None
+
+        logger.info(
+            "Query %i: Reusing the results of query %i", query.id, reused_query.id
+        )
+        reuse_query_results(query, reused_query)
+        if payload is None:
+            # the client fetches the results from the results backend
+            return SqlJsonExecutionStatus.QUERY_IS_RUNNING
+
+        payload.update({"query_id": query.id, "query": query.to_dict()})
+        self._execution_context.set_execution_result(payload)
+        return SqlJsonExecutionStatus.HAS_RESULTS
+
     def _get_the_query_db(self) -> Database:
         mydb: Any = self._database_dao.find_by_id(self._execution_context.database_id)
         self._validate_query_db(mydb)
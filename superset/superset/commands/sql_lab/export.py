@@ -29,8 +29,9 @@ from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
 from superset.models.sql_lab import Query
 from superset.sql.parse import SQLScript
+from superset.sqllab.compression import decompress_results
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.utils import core as utils, csv
+from superset.utils import csv
 from superset.views.utils import _deserialize_results_payload
 
 logger = logging.getLogger(__name__)
@@ -93,9 +94,7 @@ class SqlResultExportCommand(BaseCommand):
             blob = results_backend.get(self._query.results_key)
         if blob:
             logger.info("Decompressing")
-            payload = utils.zlib_decompress(
-                blob, decode=not results_backend_use_msgpack
-            )
+            payload = decompress_results(blob, decode=False)
             obj = _deserialize_results_payload(
                 payload, self._query, cast(bool, results_backend_use_msgpack)
             )
@@ -19,6 +19,7 @@ from __future__ import annotations
 import logging
 from typing import Any, cast
 
+import pyarrow as pa
 from flask import current_app as app
 from flask_babel import gettext as __
 
@@ -27,8 +28,13 @@ from superset.commands.base import BaseCommand
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SerializationError, SupersetErrorException
 from superset.models.sql_lab import Query
-from superset.sqllab.utils import apply_display_max_row_configuration_if_require
-from superset.utils import core as utils
+from superset.sqllab.compression import decompress_results
+from superset.sqllab.utils import (
+    apply_display_max_row_configuration_if_require,
+    is_arrow_payload,
+    read_arrow_payload,
+    write_ipc_buffer,
+)
 from superset.utils.dates import now_as_float
 from superset.views.utils import _deserialize_results_payload
 
@@ -79,8 +85,12 @@ class SqlExecutionResultsCommand(BaseCommand):
                 status=410,
             )
 
+        # queries reusing the results of an identical query share its results key
         self._query = (
-            db.session.query(Query).filter_by(results_key=self._key).one_or_none()
+            db.session.query(Query)
+            .filter_by(results_key=self._key)
+            .order_by(Query.id)
+            .first()
         )
         if self._query is None:
             raise SupersetErrorException(
@@ -95,33 +105,59 @@ class SqlExecutionResultsCommand(BaseCommand):
                 status=404,
             )
 
+    @staticmethod
+    def _deserialization_error() -> SupersetErrorException:
+        return SupersetErrorException(
+            SupersetError(
+                message=__(
+                    "Data could not be deserialized from the results backend. The "
+                    "storage format might have changed, rendering the old data "
+                    "stake. You need to re-run the original query."
+                ),
+                error_type=SupersetErrorType.RESULTS_BACKEND_ERROR,
+                level=ErrorLevel.ERROR,
+            ),
+            status=404,
+        )
+
     def run(
         self,
     ) -> dict[str, Any]:
         """Runs arbitrary sql and returns data as json"""
         self.validate()
-        payload = utils.zlib_decompress(
-            self._blob, decode=not results_backend_use_msgpack
-        )
         try:
+            # payloads are kept as bytes, since Arrow payloads are detected from
+            # their content rather than from the current config
+            payload = decompress_results(self._blob, decode=False)
             obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
+                payload,
+                self._query,
+                cast(bool, results_backend_use_msgpack),
+                rows=self._rows,
             )
         except SerializationError as ex:
-            raise SupersetErrorException(
-                SupersetError(
-                    message=__(
-                        "Data could not be deserialized from the results backend. The "
-                        "storage format might have changed, rendering the old data "
-                        "stake. You need to re-run the original query."
-                    ),
-                    error_type=SupersetErrorType.RESULTS_BACKEND_ERROR,
-                    level=ErrorLevel.ERROR,
-                ),
-                status=404,
-            ) from ex
+            raise self._deserialization_error() from ex
 
         if self._rows:
             obj = apply_display_max_row_configuration_if_require(obj, self._rows)
 
         return obj
+
+    def run_arrow(self) -> bytes | None:
+        """
+        Return the results as an Arrow IPC stream, limited to the requested number of
+        rows, without converting them to records. Returns `None` when the results
+        were not stored in the Arrow format.
+        """
+        self.validate()
+        try:
+            payload = decompress_results(self._blob, decode=False)
+            if not is_arrow_payload(payload):
+                return None
+            if self._rows is None:
+                return cast(bytes, payload)
+            table, _ = read_arrow_payload(cast(bytes, payload), self._rows)
+        except (SerializationError, pa.ArrowException) as ex:
+            raise self._deserialization_error() from ex
+
+        return write_ipc_buffer(table).to_pybytes()
@@ -31,6 +31,8 @@ from superset.models.slice import Slice
 from superset.utils.core import GenericDataType
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from superset.connectors.sqla.models import BaseDatasource
     from superset.models.helpers import QueryResult
 
@@ -58,6 +60,9 @@ class QueryContext:
 
     cache_values: dict[str, Any]
 
+    # raw results of the query objects fetched ahead of time, by raw cache key
+    prefetched_results: dict[str, QueryResult]
+
     _processor: QueryContextProcessor
 
     # TODO: Type datasource and query_object dictionary with TypedDict when it becomes
@@ -84,13 +89,14 @@ class QueryContext:
         self.force = force
         self.custom_cache_timeout = custom_cache_timeout
         self.cache_values = cache_values
+        self.prefetched_results = {}
         self._processor = QueryContextProcessor(self)
 
     def get_data(
         self,
         df: pd.DataFrame,
         coltypes: list[GenericDataType],
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | list[dict[str, Any]] | dict[str, list[Any]] | pa.Table:
         return self._processor.get_data(df, coltypes)
 
     def get_payload(
@@ -115,6 +121,12 @@ class QueryContext:
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         return self._processor.query_cache_key(query_obj, **kwargs)
 
+    def query_raw_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
+        return self._processor.query_raw_cache_key(query_obj, **kwargs)
+
+    def query_merge_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
+        return self._processor.query_merge_key(query_obj, **kwargs)
+
     def get_df_payload(
         self,
         query_obj: QueryObject,
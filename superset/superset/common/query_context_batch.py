@@ -0,0 +1,181 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Batching of the queries of many query contexts, e.g. of the charts of a dashboard.
+
+Query objects on the same datasource which only differ in their metrics (same columns,
+filters, ordering, limits, ...) are merged into a single query selecting all of their
+metrics. The result is then split back by metric into the raw result of each query
+object, so that the time offsets, post processing and caching of every chart are left
+unchanged.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+from collections import defaultdict
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, TYPE_CHECKING
+
+from flask import current_app as app
+
+from superset.common.chart_data import ChartDataResultType
+from superset.common.db_query_status import QueryStatus
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+from superset.models.helpers import QueryResult
+from superset.models.sql_lab import Query
+from superset.superset_typing import Metric
+from superset.utils.core import get_metric_name
+from superset.views.utils import override_form_data
+
+if TYPE_CHECKING:
+    from superset.common.query_context import QueryContext
+    from superset.common.query_object import QueryObject
+
+logger = logging.getLogger(__name__)
+
+# query objects with the same raw result, by raw cache key
+Members = dict[str, list[tuple["QueryContext", "QueryObject"]]]
+
+
+def prefetch_merged_query_results(
+    query_contexts: list[QueryContext],
+    form_data: list[dict[str, Any]] | None = None,
+) -> int:
+    """
+    Run the merged queries of the query objects of many query contexts, storing the
+    results in the `prefetched_results` of the query contexts.
+
+    Query objects that are already cached, or that can't be merged with any other, are
+    left to run on their own. The templates of the datasources are rendered with the
+    form data of the query context whose query is built.
+
+    :param query_contexts: The query contexts, already validated
+    :param form_data: The request form data of each query context, if any
+    :returns: The number of merged queries that were run
+    """
+    form_data_by_context = {
+        id(query_context): form_data_
+        for query_context, form_data_ in zip(
+            query_contexts, form_data or [], strict=False
+        )
+    }
+
+    def form_data_context(query_context: QueryContext) -> AbstractContextManager[Any]:
+        if (form_data_ := form_data_by_context.get(id(query_context))) is None:
+            return nullcontext()
+        return override_form_data(form_data_)
+
+    groups: dict[str, Members] = defaultdict(lambda: defaultdict(list))
+    for query_context in query_contexts:
+        if query_context.result_type != ChartDataResultType.FULL or isinstance(
+            query_context.datasource, Query
+        ):
+            continue
+
+        with form_data_context(query_context):
+            for query_obj in query_context.queries:
+                if raw_key := _get_mergeable_raw_cache_key(query_context, query_obj):
+                    merge_key = query_context.query_merge_key(query_obj)
+                    groups[merge_key][raw_key].append((query_context, query_obj))
+
+    merged = 0
+    for members in groups.values():
+        if len(members) > 1:
+            query_context = next(iter(members.values()))[0][0]
+            with form_data_context(query_context):
+                merged += _run_merged_query(members)
+    return merged
+
+
+def _get_mergeable_raw_cache_key(
+    query_context: QueryContext,
+    query_obj: QueryObject,
+) -> str | None:
+    """
+    Return the raw cache key of a query object, if its datasource query needs to run
+    and can be merged with others.
+    """
+    if not query_obj.metrics or query_obj.is_rowcount:
+        return None
+    if query_obj.validate(raise_exceptions=False):
+        return None
+
+    force = query_context.force
+    if not force and QueryCacheManager.has(
+        query_context.query_cache_key(query_obj),
+        region=CacheRegion.DATA,
+    ):
+        return None
+
+    raw_cache_key = query_context.query_raw_cache_key(query_obj)
+    if (
+        not force
+        and app.config["DATA_CACHE_RAW_RESULTS"]
+        and QueryCacheManager.has(raw_cache_key, region=CacheRegion.DATA)
+    ):
+        return None
+
+    return raw_cache_key
+
+
+def _run_merged_query(members: Members) -> bool:
+    """
+    Run a single query selecting the metrics of all the query objects of a group, and
+    split its result by query object.
+
+    :returns: Whether the merged query was run
+    """
+    metrics: dict[str, Metric] = {}
+    for entries in members.values():
+        _, query_obj = entries[0]
+        for metric in query_obj.metrics or []:
+            if metrics.setdefault(get_metric_name(metric), metric) != metric:
+                # different metrics sharing a label can't be told apart in the result
+                return False
+
+    query_context, query_obj = next(iter(members.values()))[0]
+    merged_query_obj = copy.copy(query_obj)
+    merged_query_obj.metrics = list(metrics.values())
+    try:
+        result = query_context.datasource.query(merged_query_obj.to_dict())
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to run merged query", exc_info=True)
+        return False
+    if result.status == QueryStatus.FAILED:
+        return False
+
+    columns = [column for column in result.df.columns if column not in metrics]
+    for raw_cache_key, entries in members.items():
+        # the metrics of each query object are returned in its own order
+        labels = [get_metric_name(metric) for metric in entries[0][1].metrics or []]
+        df = result.df[
+            [*columns, *(label for label in labels if label in result.df.columns)]
+        ]
+        for query_context, _ in entries:
+            query_context.prefetched_results[raw_cache_key] = QueryResult(
+                df=df,
+                query=result.query,
+                duration=result.duration,
+                applied_template_filters=result.applied_template_filters,
+                applied_filter_columns=result.applied_filter_columns,
+                rejected_filter_columns=result.rejected_filter_columns,
+            )
+
+    return True
@@ -53,10 +53,23 @@ class QueryContextFactory:  # pylint: disable=too-few-public-methods
         result_format: ChartDataResultFormat | None = None,
         force: bool = False,
         custom_cache_timeout: int | None = None,
+        datasources: dict[tuple[DatasourceType, int], BaseDatasource] | None = None,
     ) -> QueryContext:
+        """
+        Create a query context.
+
+        :param datasources: Datasources already loaded, e.g. by the other query
+            contexts of a batch, where the datasource of the query context is added
+        """
         datasource_model_instance = None
         if datasource:
-            datasource_model_instance = self._convert_to_model(datasource)
+            key = (DatasourceType(datasource["type"]), int(datasource["id"]))
+            if datasources is not None and key in datasources:
+                datasource_model_instance = datasources[key]
+            else:
+                datasource_model_instance = self._convert_to_model(datasource)
+                if datasources is not None:
+                    datasources[key] = datasource_model_instance
 
         slice_ = None
         if form_data and form_data.get("slice_id") is not None:
@@ -19,11 +19,12 @@ from __future__ import annotations
 import copy
 import logging
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, cast, ClassVar, TYPE_CHECKING, TypedDict
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from flask import current_app
 from flask_babel import gettext as _
 from pandas import DateOffset
@@ -32,6 +33,13 @@ from superset.common.chart_data import ChartDataResultFormat
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
 from superset.common.utils import dataframe_utils
+from superset.common.utils.incremental_refresh import (
+    get_cache_query_object,
+    get_incremental_axis,
+    get_time_window_query_object,
+    get_time_windows,
+    IncrementalAxis,
+)
 from superset.common.utils.query_cache_manager import QueryCacheManager
 from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
@@ -51,6 +59,7 @@ from superset.models.helpers import QueryResult
 from superset.models.sql_lab import Query
 from superset.superset_typing import AdhocColumn, AdhocMetric
 from superset.utils import csv, excel
+from superset.utils.arrow import df_to_arrow
 from superset.utils.cache import generate_cache_key, set_and_log_cache
 from superset.utils.core import (
     DatasourceType,
@@ -248,46 +257,59 @@ class QueryContextProcessor:
         """
         Returns a QueryObject cache key for objects in self.queries
         """
-        datasource = self._qc_datasource
-        extra_cache_keys = datasource.get_extra_cache_keys(query_obj.to_dict())
+        cache_key = (
+            query_obj.cache_key(**self._get_cache_key_extras(query_obj), **kwargs)
+            if query_obj
+            else None
+        )
+        return cache_key
 
+    def query_raw_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
+        """
+        Returns the cache key of the raw datasource result for a QueryObject, which
+        doesn't depend on time offsets and post processing
+        """
         cache_key = (
-            query_obj.cache_key(
-                datasource=datasource.uid,
-                extra_cache_keys=extra_cache_keys,
-                rls=security_manager.get_rls_cache_key(datasource),
-                changed_on=datasource.changed_on,
-                **kwargs,
-            )
+            query_obj.raw_cache_key(**self._get_cache_key_extras(query_obj), **kwargs)
             if query_obj
             else None
         )
         return cache_key
 
+    def query_merge_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
+        """
+        Returns the key of the query objects whose datasource queries can be merged
+        with the one of a QueryObject, as they only differ in their metrics
+        """
+        cache_key = (
+            query_obj.merge_key(**self._get_cache_key_extras(query_obj), **kwargs)
+            if query_obj
+            else None
+        )
+        return cache_key
+
+    def _get_cache_key_extras(self, query_obj: QueryObject) -> dict[str, Any]:
+        datasource = self._qc_datasource
+        return {
+            "datasource": datasource.uid,
+            "extra_cache_keys": datasource.get_extra_cache_keys(query_obj.to_dict()),
+            "rls": security_manager.get_rls_cache_key(datasource),
+            "changed_on": datasource.changed_on,
+        }
+
     def get_query_result(self, query_object: QueryObject) -> QueryResult:
         """Returns a pandas dataframe based on the query object"""
-        query_context = self._query_context
         # Here, we assume that all the queries will use the same datasource, which is
         # a valid assumption for current setting. In the long term, we may
         # support multiple queries from different data sources.
+        result = self.get_raw_query_result(query_object)
 
         query = ""
-        if isinstance(query_context.datasource, Query):
-            # todo(hugh): add logic to manage all sip68 models here
-            result = query_context.datasource.exc_query(query_object.to_dict())
-        else:
-            result = query_context.datasource.query(query_object.to_dict())
+        if not isinstance(self._query_context.datasource, Query):
             query = result.query + ";\n\n"
 
         df = result.df
-        # Transform the timestamp we received from database to pandas supported
-        # datetime format. If no python_date_format is specified, the pattern will
-        # be considered as the default ISO date format
-        # If the datetime format is unix, the parse will use the corresponding
-        # parsing logic
         if not df.empty:
-            df = self.normalize_df(df, query_object)
-
             if query_object.time_offsets:
                 time_offsets = self.processing_time_offsets(df, query_object)
                 df = time_offsets["df"]
@@ -308,6 +330,172 @@ class QueryContextProcessor:
         result.to_dttm = query_object.to_dttm
         return result
 
+    def get_raw_query_result(self, query_object: QueryObject) -> QueryResult:
+        """
+        Returns the normalized result of the datasource query, before time offsets
+        and post processing are applied. When `DATA_CACHE_RAW_RESULTS` is enabled
+        the raw result is cached on its own, so that query objects that only differ
+        in how the result is processed query the datasource once.
+        """
+        query_context = self._query_context
+        timeout = self.get_cache_timeout()
+        cache_key = (
+            self.query_raw_cache_key(query_object)
+            if current_app.config["DATA_CACHE_RAW_RESULTS"]
+            else None
+        )
+        cache = QueryCacheManager.get(
+            key=cache_key,
+            region=CacheRegion.DATA,
+            force_query=query_context.force or timeout == CACHE_DISABLED_TIMEOUT,
+        )
+        if cache.is_loaded:
+            return QueryResult(
+                df=cache.df,
+                query=cache.query,
+                duration=timedelta(0),
+                applied_template_filters=cache.applied_template_filters,
+                applied_filter_columns=cache.applied_filter_columns,
+                rejected_filter_columns=cache.rejected_filter_columns,
+            )
+
+        prefetched = (
+            query_context.prefetched_results.get(self.query_raw_cache_key(query_object))
+            if query_context.prefetched_results
+            else None
+        )
+        if prefetched:
+            # the result of a query merged with the queries of other charts, which can
+            # be shared by query objects with the same raw result
+            result = copy.copy(prefetched)
+            result.df = prefetched.df.copy()
+        elif isinstance(query_context.datasource, Query):
+            # todo(hugh): add logic to manage all sip68 models here
+            result = query_context.datasource.exc_query(query_object.to_dict())
+        else:
+            result = self._query_datasource(query_object)
+
+        # Transform the timestamp we received from database to pandas supported
+        # datetime format. If no python_date_format is specified, the pattern will
+        # be considered as the default ISO date format
+        # If the datetime format is unix, the parse will use the corresponding
+        # parsing logic
+        if not result.df.empty:
+            result.df = self.normalize_df(result.df, query_object)
+
+        if result.status != QueryStatus.FAILED:
+            cache.set(
+                key=cache_key,
+                value={
+                    "df": result.df,
+                    "query": result.query,
+                    "applied_template_filters": result.applied_template_filters,
+                    "applied_filter_columns": result.applied_filter_columns,
+                    "rejected_filter_columns": result.rejected_filter_columns,
+                },
+                timeout=timeout,
+                datasource_uid=query_context.datasource.uid,
+                region=CacheRegion.DATA,
+            )
+        return result
+
+    def _query_datasource(self, query_object: QueryObject) -> QueryResult:
+        """
+        Query the datasource. With incremental refresh, the previous result of a time
+        series is kept along with its time range, so that only the time windows which
+        changed since then are queried when the time range moves forward.
+        """
+        datasource = self._query_context.datasource
+        timeout = current_app.config["DATA_CACHE_INCREMENTAL_REFRESH_TIMEOUT"]
+        axis = get_incremental_axis(query_object) if timeout is not None else None
+        from_dttm, to_dttm = (
+            get_since_until_from_query_object(query_object) if axis else (None, None)
+        )
+        if not axis or not from_dttm or not to_dttm:
+            return datasource.query(query_object.to_dict())
+
+        cache_key = self.query_raw_cache_key(
+            get_cache_query_object(query_object),
+            incremental=True,
+        )
+        cache = QueryCacheManager.get(
+            key=cache_key,
+            region=CacheRegion.DATA,
+            force_query=self._query_context.force,
+        )
+        result = None
+        if cache.is_loaded and cache.cache_value:
+            result = self._query_time_windows(
+                query_object,
+                axis,
+                cache.df,
+                (cache.cache_value["from_dttm"], cache.cache_value["to_dttm"]),
+                (from_dttm, to_dttm),
+            )
+        if result is None:
+            result = datasource.query(query_object.to_dict())
+
+        row_limit = query_object.row_limit
+        if result.status != QueryStatus.FAILED and (
+            not row_limit or len(result.df.index) < row_limit
+        ):
+            cache.set(
+                key=cache_key,
+                value={
+                    "df": result.df,
+                    "query": result.query,
+                    "from_dttm": from_dttm,
+                    "to_dttm": to_dttm,
+                },
+                timeout=timeout,
+                datasource_uid=datasource.uid,
+                region=CacheRegion.DATA,
+            )
+        return result
+
+    def _query_time_windows(
+        self,
+        query_object: QueryObject,
+        axis: IncrementalAxis,
+        df: pd.DataFrame,
+        cached_range: tuple[datetime, datetime],
+        time_range: tuple[datetime, datetime],
+    ) -> QueryResult | None:
+        """
+        Query the time windows which changed since a previous result, and splice them
+        with the rows of the previous result which are still in range.
+        """
+        if not (time_windows := get_time_windows(df, axis, cached_range, time_range)):
+            return None
+
+        rows, windows = time_windows
+        results = []
+        for start, end in windows:
+            window_query_object = get_time_window_query_object(query_object, start, end)
+            result = self._query_context.datasource.query(window_query_object.to_dict())
+            if result.status == QueryStatus.FAILED:
+                return result
+            results.append(result)
+
+        frames = [result.df for result in results[:-1]] + [rows, results[-1].df]
+        df = pd.concat([frame for frame in frames if not frame.empty] or [rows])
+        df = df.reset_index(drop=True)
+        if query_object.row_limit and len(df.index) >= query_object.row_limit:
+            # the full result might be truncated
+            return None
+
+        logger.debug(
+            "Refreshed the time series incrementally, keeping %i rows", len(rows.index)
+        )
+        return QueryResult(
+            df=df,
+            query=";\n\n".join(result.query for result in results),
+            duration=sum((result.duration for result in results), timedelta()),
+            applied_template_filters=results[-1].applied_template_filters,
+            applied_filter_columns=results[-1].applied_filter_columns,
+            rejected_filter_columns=results[-1].rejected_filter_columns,
+        )
+
     def normalize_df(self, df: pd.DataFrame, query_object: QueryObject) -> pd.DataFrame:
         # todo: should support "python_date_format" and "get_column" in each datasource
         def _get_timestamp_format(
@@ -988,7 +1176,7 @@ class QueryContextProcessor:
 
     def get_data(
         self, df: pd.DataFrame, coltypes: list[GenericDataType]
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | list[dict[str, Any]] | dict[str, list[Any]] | pa.Table:
         if self._query_context.result_format in ChartDataResultFormat.table_like():
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -1006,6 +1194,13 @@ class QueryContextProcessor:
                 result = excel.df_to_excel(df, **current_app.config["EXCEL_EXPORT"])
             return result or ""
 
+        if self._query_context.result_format == ChartDataResultFormat.JSON_COLUMNAR:
+            # one array per column, the names and types being in the payload
+            return df.to_dict(orient="list")
+        if self._query_context.result_format == ChartDataResultFormat.ARROW:
+            # encoded along with the rest of the payload in the response
+            return df_to_arrow(df)
+
         return df.to_dict(orient="records")
 
     def ensure_totals_available(self) -> None:
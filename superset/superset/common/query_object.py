@@ -404,7 +404,7 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
             default=str,
         )
 
-    def cache_key(self, **extra: Any) -> str:  # noqa: C901
+    def cache_key(self, **extra: Any) -> str:
         """
         The cache key is made out of the key/values from to_dict(), plus any
         other key/values in `extra`
@@ -412,28 +412,18 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
         the use-provided inputs to bounds, which may be time-relative (as in
         "5 days ago" or "now").
         """
-        cache_dict = self.to_dict()
-        cache_dict.update(extra)
+        cache_dict = self._get_cache_dict(**extra)
 
         # TODO: the below KVs can all be cleaned up and moved to `to_dict()` at some
         #  predetermined point in time when orgs are aware that the previously
         #  cached results will be invalidated.
-        if not self.apply_fetch_values_predicate:
-            del cache_dict["apply_fetch_values_predicate"]
-        if self.datasource:
-            cache_dict["datasource"] = self.datasource.uid
         if self.result_type:
             cache_dict["result_type"] = self.result_type
-        if self.time_range:
-            cache_dict["time_range"] = self.time_range
         if self.post_processing:
             cache_dict["post_processing"] = self.post_processing
         if self.time_offsets:
             cache_dict["time_offsets"] = self.time_offsets
 
-        for k in ["from_dttm", "to_dttm"]:
-            del cache_dict[k]
-
         annotation_fields = [
             "annotationType",
             "descriptionColumns",
@@ -453,6 +443,49 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
         if annotation_layers:
             cache_dict["annotation_layers"] = annotation_layers
 
+        return md5_sha_from_dict(cache_dict, default=json_int_dttm_ser, ignore_nan=True)
+
+    def raw_cache_key(self, **extra: Any) -> str:
+        """
+        The raw cache key identifies the result of the datasource query alone. The
+        result type, time offsets, post processing and annotation layers are left
+        out, as they are applied on top of the raw result, so that query objects
+        which only differ in those share the same cached raw result.
+        """
+        cache_dict = self._get_cache_dict(**extra)
+        cache_dict["cache_tier"] = "raw"
+        return md5_sha_from_dict(cache_dict, default=json_int_dttm_ser, ignore_nan=True)
+
+    def merge_key(self, **extra: Any) -> str:
+        """
+        The merge key identifies the datasource query regardless of its metrics, except
+        for the first one which drives the default ordering and series limit, so that
+        query objects which only differ in their other metrics can be answered by a
+        single query selecting all of them.
+        """
+        cache_dict = self._get_cache_dict(**extra)
+        metrics = cache_dict.pop("metrics") or []
+        cache_dict["main_metric"] = metrics[0] if metrics else None
+        cache_dict["cache_tier"] = "merge"
+        return md5_sha_from_dict(cache_dict, default=json_int_dttm_ser, ignore_nan=True)
+
+    def _get_cache_dict(self, **extra: Any) -> dict[str, Any]:
+        """
+        Return the key/values that determine the query sent to the datasource.
+        """
+        cache_dict = self.to_dict()
+        cache_dict.update(extra)
+
+        if not self.apply_fetch_values_predicate:
+            del cache_dict["apply_fetch_values_predicate"]
+        if self.datasource:
+            cache_dict["datasource"] = self.datasource.uid
+        if self.time_range:
+            cache_dict["time_range"] = self.time_range
+
+        for k in ["from_dttm", "to_dttm"]:
+            del cache_dict[k]
+
         # Add an impersonation key to cache if impersonation is enabled on the db
         # or if the CACHE_QUERY_BY_USER flag is on
         try:
@@ -473,7 +506,7 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
             # datasource or database do not exist
             pass
 
-        return md5_sha_from_dict(cache_dict, default=json_int_dttm_ser, ignore_nan=True)
+        return cache_dict
 
     def exec_post_processing(self, df: DataFrame) -> DataFrame:
         """
@@ -0,0 +1,187 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Incremental refresh of time series over a rolling time range.
+
+The raw result of a time series query is kept along with the time range it covers.
+When the time range moves forward, e.g. for "Last week" on the next day, the buckets
+of the previous result that are still in range are kept, and only the time windows
+that changed are queried: the most recent bucket of the previous result, which may
+have been incomplete, up to the end of the new range, and the leading bucket when the
+new range starts in the middle of it. Every bucket is aggregated from all of its rows,
+so any metric can be refreshed this way, provided rows aren't added to past buckets.
+"""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass
+from datetime import datetime
+
+import pandas as pd
+
+from superset.common.query_object import QueryObject
+from superset.constants import TimeGrain
+from superset.utils.core import FilterOperator, get_base_axis_columns, get_column_name
+
+# time grains with a fixed duration, as pandas frequencies
+TIME_GRAIN_FREQUENCIES = {
+    TimeGrain.SECOND: "s",
+    TimeGrain.FIVE_SECONDS: "5s",
+    TimeGrain.THIRTY_SECONDS: "30s",
+    TimeGrain.MINUTE: "min",
+    TimeGrain.FIVE_MINUTES: "5min",
+    TimeGrain.TEN_MINUTES: "10min",
+    TimeGrain.FIFTEEN_MINUTES: "15min",
+    TimeGrain.THIRTY_MINUTES: "30min",
+    TimeGrain.HALF_HOUR: "30min",
+    TimeGrain.HOUR: "h",
+    TimeGrain.SIX_HOURS: "6h",
+    TimeGrain.DAY: "D",
+}
+
+
+@dataclass
+class IncrementalAxis:
+    """
+    The temporal x-axis of a query which can be refreshed incrementally.
+    """
+
+    label: str
+    freq: str
+
+
+def get_incremental_axis(query_object: QueryObject) -> IncrementalAxis | None:
+    """
+    Return the x-axis of a query object if it can be refreshed incrementally.
+
+    The query must group by a temporal x-axis with a fixed time grain, filtered by a
+    single time range, which must match the time range of the query object if any,
+    e.g. from a dashboard native filter. Its result must be pivoted by the x-axis so
+    that the order of the rows doesn't matter. Series limits and offsets, which depend
+    on the whole time range, aren't supported, nor are time shifts, which are applied
+    again to the time range filter of each window.
+    """
+    if (
+        query_object.is_rowcount
+        or query_object.series_limit
+        or query_object.row_offset
+        or query_object.granularity
+        or query_object.time_shift
+    ):
+        return None
+    if not any(
+        post_processing.get("operation") == "pivot"
+        for post_processing in query_object.post_processing
+    ):
+        return None
+
+    axes = get_base_axis_columns(query_object.columns)
+    if len(axes) != 1:
+        return None
+    axis = axes[0]
+    if not (freq := TIME_GRAIN_FREQUENCIES.get(axis.get("timeGrain"))):  # type: ignore
+        return None
+
+    time_filters = [
+        flt
+        for flt in query_object.filter
+        if flt.get("op") == FilterOperator.TEMPORAL_RANGE
+    ]
+    if (
+        len(time_filters) != 1
+        or time_filters[0].get("col") != axis["sqlExpression"]  # type: ignore
+        or not isinstance(time_filters[0].get("val"), str)
+        or query_object.time_range not in (None, time_filters[0]["val"])
+    ):
+        return None
+
+    return IncrementalAxis(label=get_column_name(axis), freq=freq)
+
+
+def get_time_windows(
+    df: pd.DataFrame,
+    axis: IncrementalAxis,
+    cached_range: tuple[datetime, datetime],
+    time_range: tuple[datetime, datetime],
+) -> tuple[pd.DataFrame, list[tuple[datetime, datetime]]] | None:
+    """
+    Return the rows of a previous result which are still valid for a new time range,
+    and the time windows left to query, or `None` if the result can't be reused.
+
+    :param df: The previous raw result
+    :param axis: The x-axis of the query
+    :param cached_range: The time range of the previous result
+    :param time_range: The new time range
+    """
+    (cached_start, cached_end), (start, end) = cached_range, time_range
+    timestamps = df.get(axis.label)
+    if (
+        df.empty
+        or not pd.api.types.is_datetime64_any_dtype(timestamps)
+        or timestamps.dt.tz is not None
+        or start < cached_start
+        or end < cached_end
+    ):
+        return None
+
+    first_bucket = pd.Timestamp(start).ceil(axis.freq).to_pydatetime()
+    last_bucket = timestamps.max().to_pydatetime()
+    if first_bucket > last_bucket:
+        return None
+
+    rows = df[(timestamps >= first_bucket) & (timestamps < last_bucket)]
+    windows = [(start, first_bucket)] if start < first_bucket else []
+    windows.append((last_bucket, end))
+    return rows, windows
+
+
+def get_time_window_query_object(
+    query_object: QueryObject,
+    start: datetime,
+    end: datetime,
+) -> QueryObject:
+    """
+    Return a copy of a query object filtered on a time window instead of its range.
+    """
+    return _replace_time_range(query_object, f"{start} : {end}", start, end)
+
+
+def get_cache_query_object(query_object: QueryObject) -> QueryObject:
+    """
+    Return a copy of a query object without its time range, which identifies the
+    previous results that can be refreshed incrementally whatever their time range.
+    """
+    return _replace_time_range(query_object, None, None, None)
+
+
+def _replace_time_range(
+    query_object: QueryObject,
+    val: str | None,
+    start: datetime | None,
+    end: datetime | None,
+) -> QueryObject:
+    query_object_clone = copy.copy(query_object)
+    query_object_clone.filter = [
+        ({**flt, "val": val} if flt.get("op") == FilterOperator.TEMPORAL_RANGE else flt)
+        for flt in query_object.filter
+    ]
+    if query_object.time_range:
+        query_object_clone.time_range = val
+    query_object_clone.from_dttm = query_object_clone.inner_from_dttm = start
+    query_object_clone.to_dttm = query_object_clone.inner_to_dttm = end
+    return query_object_clone
@@ -166,6 +166,26 @@ SAMPLES_ROW_LIMIT = 1000
 NATIVE_FILTER_DEFAULT_ROW_LIMIT = 1000
 # max rows retrieved by filter select auto complete
 FILTER_SELECT_ROW_LIMIT = 10000
+# Cache the distinct values of columns used in filters in the data cache for this many
+# seconds. Set to -1 to always query the database
+FILTER_VALUES_CACHE_TIMEOUT = int(timedelta(hours=1).total_seconds())
+# Cached filter values older than this many seconds are still used, but a Celery task
+# fetches them again in the background, unless Celery runs tasks eagerly. Set to None
+# to disable background refreshes
+FILTER_VALUES_CACHE_REFRESH_AFTER: int | None = int(
+    timedelta(minutes=10).total_seconds()
+)
+
+# Index the schema, table and view names of databases in the cache, to populate the
+# SQL Lab and dataset pickers without listing them in the database on every request.
+# Indexed names older than this many seconds are still used, but a Celery task fetches
+# them again in the background. Set to None to disable the name index
+DATABASE_NAME_INDEX_REFRESH_AFTER: int | None = None
+# How long (in seconds) indexed names are kept in the cache
+DATABASE_NAME_INDEX_TIMEOUT = int(timedelta(days=7).total_seconds())
+# Maximum number of stale index entries refreshed by each run of the scheduled
+# `refresh_name_indexes` Celery task
+DATABASE_NAME_INDEX_REFRESH_BATCH_SIZE = 100
 
 # SupersetClient HTTP retry configuration
 # Controls retry behavior for all HTTP requests made through SupersetClient
@@ -837,6 +857,12 @@ THUMBNAIL_CHART_DIGEST_FUNC: Callable[[Slice, ExecutorType, str], str | None] |
     None
 )
 
+# When listing charts and dashboards, thumbnail digests are computed for the whole
+# page at once and stored in the cache (CACHE_CONFIG) for this many seconds, keyed
+# by the last change of the chart or dashboard and of the RLS filters, including
+# the tables and roles they apply to. Set to -1 to always compute them.
+THUMBNAIL_DIGEST_CACHE_TIMEOUT = int(timedelta(hours=1).total_seconds())
+
 THUMBNAIL_CACHE_CONFIG: CacheConfig = {
     "CACHE_TYPE": "NullCache",
     "CACHE_DEFAULT_TIMEOUT": int(timedelta(days=7).total_seconds()),
@@ -930,6 +956,61 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
+# Cache the raw result of chart data queries in the data cache, keyed only by the
+# inputs that determine the SQL, in addition to the post-processed payload. Charts
+# that share a query but differ in their time comparisons, post processing or result
+# type then only hit the database once. This stores an additional entry per query in
+# the data cache, so it's opt-in.
+DATA_CACHE_RAW_RESULTS = False
+
+# Keep the raw result of time series queries over a rolling time range (e.g. "Last
+# week") in the data cache for this many seconds, along with the time range it covers.
+# When the cached payload expires and the time range has moved forward, only the
+# windows that changed are queried: from the most recent, possibly incomplete, bucket
+# of the previous result to the end of the range, plus the leading bucket. This
+# assumes that rows aren't added to past buckets. Only queries grouped by a temporal
+# x-axis with a time grain of a day or less and pivoted by it are refreshed this way.
+# Disabled when unset.
+DATA_CACHE_INCREMENTAL_REFRESH_TIMEOUT: int | None = None
+
+# Queries built for a dataset are memoized for the duration of a request, so that
+# computing the cache key and running the query share a single build. Set a timeout
+# to also cache the compiled SQL across requests in the default cache
+# (`CACHE_CONFIG`). Queries whose templates call `ExtraCache` macros (e.g.
+# `current_username` or `url_param`) are never cached across requests, nor are
+# queries whose templates call the `dataset` or `metric` macros, since the key only
+# covers the definition of the queried dataset and not of the datasets they read.
+# CACHE_DISABLED_TIMEOUT (-1) disables the cross-request cache.
+COMPILED_SQL_CACHE_TIMEOUT = -1
+
+# Cache the encoded responses of the chart data API which are built from cached data,
+# next to the data in the data cache and for as long as the data, so that identical
+# requests skip building and serializing the payload. Cached responses carry an ETag
+# and answer `If-None-Match` requests with a 304. Only full results in the JSON,
+# columnar JSON and Arrow formats are cached, and refreshing a chart with `force`
+# drops its cached response.
+CHART_DATA_RESPONSE_CACHE = False
+# Store the cached responses compressed with "gzip" or "br" (brotli). Compressed
+# bodies are sent as is to the clients accepting their encoding, and decompressed
+# for the others.
+CHART_DATA_RESPONSE_CACHE_ENCODING: Literal["gzip", "br"] | None = None
+
+# Maximum number of query contexts accepted by the `/api/v1/chart/data/batch`
+# endpoint, which returns the data of many charts at once. Within a batch, the queries
+# of charts on the same dataset which only differ in their metrics are merged into a
+# single query.
+CHART_DATA_BATCH_MAX_SIZE = 50
+
+# Fitted `prophet` forecasts are memoized in the data cache, keyed by a hash of the
+# input series and all the forecast parameters. Set the timeout to
+# CACHE_DISABLED_TIMEOUT (-1) to always refit the models. `None` falls back to
+# CACHE_DEFAULT_TIMEOUT.
+PROPHET_FORECAST_CACHE_TIMEOUT: int | None = None
+# Number of worker processes used to fit independent series in parallel. The pool is
+# created once per web or Celery worker process and shared by all of its requests. A
+# value of 1 fits the series sequentially in the current process.
+PROPHET_FORECAST_MAX_WORKERS = 1
+
 # CORS Options
 # NOTE: enabling this requires installing the cors-related python dependencies
 # `pip install .[cors]` or `pip install apache_superset[cors]`, depending
@@ -1101,6 +1182,13 @@ DEFAULT_SQLLAB_LIMIT = 1000
 # The limit for the Superset Meta DB when the feature flag ENABLE_SUPERSET_META_DB is on
 SUPERSET_META_DB_LIMIT: int | None = 1000
 
+# Number of rows fetched at a time by the Superset Meta DB from each database
+SUPERSET_META_DB_FETCH_SIZE = 10000
+
+# How long (in seconds) the Superset Meta DB reuses the reflected metadata of a table.
+# The cache is also invalidated when the database is edited; set to 0 to disable it.
+SUPERSET_META_DB_REFLECTION_CACHE_TIMEOUT = 300
+
 # Adds a warning message on sqllab save query and schedule query modals.
 SQLLAB_SAVE_WARNING_MESSAGE = None
 SQLLAB_SCHEDULE_WARNING_MESSAGE = None
@@ -1108,6 +1196,28 @@ SQLLAB_SCHEDULE_WARNING_MESSAGE = None
 # Max payload size (MB) for SQL Lab to prevent browser hangs with large results.
 SQLLAB_PAYLOAD_MAX_MB = None
 
+# When set, SQL Lab fetches results from the database in chunks of this many rows,
+# reporting the number of rows fetched so far in the query progress and allowing
+# queries to be stopped while their results are being fetched. Results are still
+# returned once all the rows are fetched.
+SQLLAB_FETCH_CHUNK_SIZE: int | None = None
+
+# How old (in seconds) the results of an identical SQL Lab query, run by the same user
+# with the same limit and RLS filters, can be to be served from the results backend
+# instead of running the query again. Databases can override it with the
+# `results_reuse_max_age` key in their extra, and queries can bypass it by passing
+# `force`. Disabled when unset.
+SQLLAB_RESULTS_REUSE_MAX_AGE: int | None = None
+
+# Maximum number of statements of a SQL Lab script run at the same time, each on its
+# own connection. Only scripts made exclusively of SELECT statements are run
+# concurrently, since they don't depend on each other; scripts with any other statement
+# run sequentially on a single connection, as do scripts on engines which poll the
+# cursor while the query runs or only know the query id after running it (e.g.
+# Presto, Trino, Hive and Impala). Note that SELECT statements calling functions with
+# side effects would also be run concurrently.
+SQLLAB_STATEMENTS_CONCURRENCY = 1
+
 # Force refresh while auto-refresh in dashboard
 DASHBOARD_AUTO_REFRESH_MODE: Literal["fetch", "force"] = "force"
 # Dashboard auto refresh intervals
@@ -1172,6 +1282,11 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         #     "schedule": crontab(minute="*", hour="*"),
         #     "kwargs": {"retention_period_days": 180},
         # },
+        # Uncomment to refresh stale database name indexes in the background
+        # "refresh_name_indexes": {
+        #     "task": "refresh_name_indexes",
+        #     "schedule": crontab(minute="*/5", hour="*"),
+        # },
         # Uncomment to enable Slack channel cache warm-up
         # "slack.cache_channels": {
         #     "task": "slack.cache_channels",
@@ -1285,6 +1400,24 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Store async query results as Arrow IPC streams, with the rest of the payload kept
+# in the schema metadata. Results are converted to JSON only when read, and only for
+# the rows that are requested; clients sending
+# `Accept: application/vnd.apache.arrow.stream` receive the Arrow stream as-is.
+# Takes precedence over RESULTS_BACKEND_USE_MSGPACK.
+RESULTS_BACKEND_USE_ARROW = False
+
+# Compression of the payloads stored in the results backend. Available codecs are
+# "zlib", "zstd", "lz4" (requires the `lz4` package) and "none"; `options` are passed
+# to the codec (e.g. `{"level": 3}`). The codec is recorded in each stored blob, so
+# changing it doesn't invalidate existing results. Payloads are compressed and
+# decompressed in chunks of `chunk_size` bytes.
+RESULTS_BACKEND_COMPRESSION: dict[str, Any] = {
+    "codec": "zlib",
+    "options": {},
+    "chunk_size": 1024 * 1024,
+}
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1331,6 +1464,24 @@ CSV_DEFAULT_NA_NAMES = list(STR_NA_VALUES)
 # Smaller values use less memory but may be slower for large files
 READ_CSV_CHUNK_SIZE = 1000
 
+# Upload CSV files chunk by chunk, with chunks of READ_CSV_CHUNK_SIZE rows, instead
+# of reading the whole file into memory first. The column types of the new table are
+# then inferred from the first chunk only, so columns whose type can't be inferred
+# from the first rows need explicit column data types. The chunks are written in a
+# single transaction; databases without transactional DDL (e.g. MySQL) keep the
+# table created by the first chunk if a later chunk fails. Databases that can't
+# append to a table (e.g. Hive, Google Sheets) still get the file in one piece.
+CSV_UPLOAD_STREAMING = False
+# With the CSV_UPLOAD_PYARROW_ENGINE feature flag, streamed CSV files are parsed by
+# the pyarrow streaming reader in blocks of this many bytes instead. Column types are
+# inferred from the first block.
+CSV_UPLOAD_STREAMING_BLOCK_SIZE = 8 * 1024 * 1024
+# Upload xlsx files chunk by chunk, with chunks of READ_CSV_CHUNK_SIZE rows read
+# by openpyxl in read-only mode, instead of reading the whole sheet into memory first.
+# Like streamed CSV files, the chunks are written in a single transaction, and
+# databases that can't append to a table get the sheet in one piece.
+EXCEL_UPLOAD_STREAMING = False
+
 # A dictionary of items that gets merged into the Jinja context for
 # SQL Lab. The existing context gets updated with this dictionary,
 # meaning values for existing keys get overwritten by the content of this
@@ -1341,6 +1492,10 @@ READ_CSV_CHUNK_SIZE = 1000
 # return native types.
 JINJA_CONTEXT_ADDONS: dict[str, Callable[..., Any]] = {}
 
+# Maximum number of compiled Jinja templates kept in memory by each template
+# processor environment (per engine). Set to 0 to compile templates on every render.
+JINJA_TEMPLATE_CACHE_SIZE = 1000
+
 # A dictionary of macro template processors (by engine) that gets merged into global
 # template processors. The existing template processors get updated with this
 # dictionary, which means the existing keys get overwritten by the content of this
@@ -1688,9 +1843,28 @@ ALERT_REPORTS_NOTIFICATION_DRY_RUN = False
 # Max tries to run queries to prevent false errors caused by transient errors
 # being returned to users. Set to a value >1 to enable retries.
 ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES = 1
+# Run alert queries over connections pooled per worker process, database and executor,
+# instead of opening a new connection for each evaluation. Pool sizes can be tuned
+# with the `engine_params` of each database. Pooled connections are checked before
+# being used (`pool_pre_ping`) and replaced after an hour (`pool_recycle`), unless the
+# `engine_params` set them. Databases using SSH tunnels or OAuth2 always use a new
+# connection.
+ALERT_REPORTS_QUERY_POOL_CONNECTIONS = True
 # Custom width for screenshots
 ALERT_REPORTS_MIN_CUSTOM_SCREENSHOT_WIDTH = 600
 ALERT_REPORTS_MAX_CUSTOM_SCREENSHOT_WIDTH = 2400
+# Run the chart queries for CSV and text reports directly in the worker, as the
+# executor, instead of requesting the chart data API from the web server
+ALERT_REPORTS_CHART_DATA_IN_WORKER = True
+# Maximum number of dashboard tabs captured at the same time by a report. Each tab is
+# captured with its own browser
+ALERT_REPORTS_SCREENSHOT_CONCURRENCY = 2
+# Screenshots taken by a report are reused for this many seconds by other reports
+# capturing the same chart or dashboard state (same digest, size and executor), eg,
+# reports scheduled at the same time. Screenshots are stored in the thumbnail cache
+# (THUMBNAIL_CACHE_CONFIG). Disabled by default; set it to eg,
+# int(timedelta(minutes=1).total_seconds()) to reuse screenshots for a minute
+ALERT_REPORTS_SCREENSHOT_REUSE_TIMEOUT: int | None = None
 # Set a minimum interval threshold between executions (for each Alert/Report)
 # Value should be an integer i.e. int(timedelta(minutes=5).total_seconds())
 # You can also assign a function to the config that returns the expected integer
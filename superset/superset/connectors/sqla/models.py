@@ -28,7 +28,7 @@ from typing import Any, Callable, cast, Optional, Union
 
 import pandas as pd
 import sqlalchemy as sa
-from flask import current_app
+from flask import current_app, g
 from flask_appbuilder import Model
 from flask_appbuilder.security.sqla.models import User
 from flask_babel import gettext as __, lazy_gettext as _
@@ -76,6 +76,7 @@ from superset.connectors.sqla.utils import (
     get_physical_table_metadata,
     get_virtual_table_metadata,
 )
+from superset.constants import CACHE_DISABLED_TIMEOUT
 from superset.db_engine_specs.base import BaseEngineSpec, TimestampExpression
 from superset.exceptions import (
     ColumnNotFoundException,
@@ -86,8 +87,10 @@ from superset.exceptions import (
     SupersetGenericDBErrorException,
     SupersetSecurityException,
 )
+from superset.extensions import cache_manager
 from superset.jinja_context import (
     BaseTemplateProcessor,
+    DATASET_MACROS_REGEX,
     ExtraCache,
     get_template_processor,
 )
@@ -99,6 +102,8 @@ from superset.models.helpers import (
     ExploreMixin,
     ImportExportMixin,
     QueryResult,
+    QueryStringExtended,
+    SqlaQuery,
 )
 from superset.models.slice import Slice
 from superset.sql.parse import Table
@@ -111,11 +116,14 @@ from superset.superset_typing import (
 )
 from superset.utils import core as utils, json
 from superset.utils.backports import StrEnum
+from superset.utils.hashing import md5_sha_from_dict
 
 config = current_app.config  # Backward compatibility for tests
 metadata = Model.metadata  # pylint: disable=no-member
 logger = logging.getLogger(__name__)
 VIRTUAL_TABLE_ALIAS = "virtual_table"
+# key in `flask.g` of the queries built during the current request
+SQLA_QUERY_MEMO_KEY = "sqla_query_memo"
 
 # a non-exhaustive set of additive metrics
 ADDITIVE_METRIC_TYPES = {
@@ -653,6 +661,7 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
     def get_sqla_row_level_filters(
         self,
         template_processor: Optional[BaseTemplateProcessor] = None,
+        rls_filters: Optional[list[Any]] = None,
     ) -> list[TextClause]:
         """
         Return the appropriate row level security filters for this table and the
@@ -660,14 +669,18 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
         Flask global namespace.
 
         :param template_processor: The template processor to apply to the filters.
+        :param rls_filters: The filters of the current user for this table, when they
+            were already fetched with `security_manager.get_rls_filters_by_table`.
         :returns: A list of SQL clauses to be ANDed together.
         """  # noqa: E501
         template_processor = template_processor or self.get_template_processor()
+        if rls_filters is None:
+            rls_filters = security_manager.get_rls_filters(self)
 
         all_filters: list[TextClause] = []
         filter_groups: dict[Union[int, str], list[TextClause]] = defaultdict(list)
         try:
-            for filter_ in security_manager.get_rls_filters(self):
+            for filter_ in rls_filters:
                 clause = self.text(
                     f"({template_processor.process_template(filter_.clause)})"
                 )
@@ -1797,7 +1810,7 @@ class SqlaTable(
     def default_query(qry: Query) -> Query:
         return qry.filter_by(is_sqllab_view=False)
 
-    def has_extra_cache_key_calls(self, query_obj: QueryObjectDict) -> bool:  # noqa: C901
+    def has_extra_cache_key_calls(self, query_obj: QueryObjectDict) -> bool:
         """
         Detects the presence of calls to `ExtraCache` methods in items in query_obj that
         can be templated. If any are present, the query must be evaluated to extract
@@ -1808,6 +1821,18 @@ class SqlaTable(
         :param query_obj: query object to analyze
         :return: True if there are call(s) to an `ExtraCache` method, False otherwise
         """
+        return any(
+            ExtraCache.regex.search(statement)
+            for statement in self._get_templatable_statements(query_obj)
+        )
+
+    def _get_templatable_statements(  # noqa: C901
+        self,
+        query_obj: QueryObjectDict,
+    ) -> list[str]:
+        """
+        Return the items of the dataset and of query_obj that can be templated.
+        """
         templatable_statements: list[str] = []
         if self.sql:
             templatable_statements.append(self.sql)
@@ -1842,10 +1867,7 @@ class SqlaTable(
             templatable_statements += [
                 f.clause for f in security_manager.get_rls_filters(self)
             ]
-        for statement in templatable_statements:
-            if ExtraCache.regex.search(statement):
-                return True
-        return False
+        return templatable_statements
 
     def get_extra_cache_keys(self, query_obj: QueryObjectDict) -> list[Hashable]:
         """
@@ -1857,10 +1879,104 @@ class SqlaTable(
         """
         extra_cache_keys = super().get_extra_cache_keys(query_obj)
         if self.has_extra_cache_key_calls(query_obj):
-            sqla_query = self.get_sqla_query(**query_obj)
+            sqla_query = self.build_sqla_query(query_obj)
             extra_cache_keys += sqla_query.extra_cache_keys
         return list(set(extra_cache_keys))
 
+    def get_sqla_query_key(self, query_obj: QueryObjectDict) -> str:
+        """
+        Return a key identifying the query built for a query object, made out of the
+        normalized query object, the dataset definition and the RLS filters that
+        apply to the current user.
+
+        :param query_obj: query object to build
+        :return: The query key
+        """
+        return md5_sha_from_dict(
+            {
+                "query_obj": query_obj,
+                "datasource": self.uid,
+                "changed_on": self.changed_on,
+                "definition": [
+                    self.catalog,
+                    self.schema,
+                    self.table_name,
+                    self.sql,
+                    self.fetch_values_predicate,
+                    self.template_params,
+                    self.main_dttm_col,
+                    self.always_filter_main_dttm,
+                    [
+                        [
+                            col.column_name,
+                            col.expression,
+                            col.type,
+                            col.is_dttm,
+                            col.python_date_format,
+                        ]
+                        for col in self.columns
+                    ],
+                    [
+                        [metric.metric_name, metric.expression]
+                        for metric in self.metrics
+                    ],
+                ],
+                "database": [self.database_id, self.database.sqlalchemy_uri],
+                "rls": security_manager.get_rls_cache_key(self),
+                "user_id": utils.get_user_id(),
+            },
+            default=json.json_int_dttm_ser,
+            ignore_nan=True,
+        )
+
+    def build_sqla_query(self, query_obj: QueryObjectDict) -> SqlaQuery:
+        """
+        Build the query for a query object, memoized for the lifetime of the app
+        context (i.e. the request or the Celery task), so that computing the cache key
+        and running the query share a single build.
+        """
+        memo: dict[str, SqlaQuery] = g.setdefault(SQLA_QUERY_MEMO_KEY, {})
+        key = self.get_sqla_query_key(query_obj)
+        if (sqlaq := memo.get(key)) is None:
+            sqlaq = memo[key] = self.get_sqla_query(**query_obj)
+        return sqlaq
+
+    def get_query_str_extended(
+        self,
+        query_obj: QueryObjectDict,
+        mutate: bool = True,
+    ) -> QueryStringExtended:
+        """
+        Return the compiled query for a query object. When `COMPILED_SQL_CACHE_TIMEOUT`
+        is set the compiled query is also cached across requests, unless the templates
+        call `ExtraCache` macros, or the `dataset` and `metric` macros reading other
+        datasets. `SQL_QUERY_MUTATOR` is applied after reading from the cache, as it
+        may depend on the current user.
+        """
+        timeout = current_app.config["COMPILED_SQL_CACHE_TIMEOUT"]
+        cache_key = None
+        query_str_ext = None
+        if timeout != CACHE_DISABLED_TIMEOUT and not any(
+            ExtraCache.regex.search(statement) or DATASET_MACROS_REGEX.search(statement)
+            for statement in self._get_templatable_statements(query_obj)
+        ):
+            cache_key = f"compiled_sql_{self.get_sqla_query_key(query_obj)}"
+            query_str_ext = cache_manager.cache.get(cache_key)
+            current_app.config["STATS_LOGGER"].incr(
+                f"compiled_sql_cache.{'hit' if query_str_ext else 'miss'}"
+            )
+
+        if query_str_ext is None:
+            query_str_ext = super().get_query_str_extended(query_obj, mutate=False)
+            if cache_key:
+                cache_manager.cache.set(cache_key, query_str_ext, timeout=timeout)
+
+        if mutate:
+            query_str_ext = query_str_ext._replace(
+                sql=self.database.mutate_sql_based_on_config(query_str_ext.sql)
+            )
+        return query_str_ext
+
     @property
     def quote_identifier(self) -> Callable[[str], str]:
         return self.database.quote_identifier
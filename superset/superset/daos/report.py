@@ -20,6 +20,8 @@ import logging
 from datetime import datetime
 from typing import Any
 
+from sqlalchemy import bindparam, or_, update
+
 from superset.daos.base import BaseDAO
 from superset.extensions import db
 from superset.reports.filters import ReportScheduleFilter
@@ -212,6 +214,63 @@ class ReportScheduleDAO(BaseDAO[ReportSchedule]):
             .all()
         )
 
+    @staticmethod
+    def find_due(before: datetime) -> list[ReportSchedule]:
+        """
+        Find all active reports scheduled to run before a given time, or whose next run
+        is unknown.
+
+        :param before: A naive UTC datetime
+        """
+        return (
+            db.session.query(ReportSchedule)
+            .filter(
+                ReportSchedule.active.is_(True),
+                or_(
+                    ReportSchedule.next_run.is_(None),
+                    ReportSchedule.next_run < before,
+                ),
+            )
+            .all()
+        )
+
+    @staticmethod
+    def bulk_update_next_run(next_runs: dict[ReportSchedule, datetime]) -> None:
+        """
+        Store the next run of multiple reports in a single statement, without touching
+        their audit columns.
+
+        A report whose crontab, timezone or active flag changed since it was loaded is
+        left untouched, so the next run reset by the edit is not overwritten with one
+        computed from the previous schedule.
+
+        :param next_runs: The next run of each report, keyed by the loaded report
+        """
+        if not next_runs:
+            return
+
+        table = ReportSchedule.__table__
+        db.session.execute(
+            update(table)
+            .where(
+                table.c.id == bindparam("_id"),
+                table.c.crontab == bindparam("_crontab"),
+                table.c.timezone == bindparam("_timezone"),
+                table.c.active == bindparam("_active"),
+            )
+            .values(next_run=bindparam("_next_run"), changed_on=table.c.changed_on),
+            [
+                {
+                    "_id": report.id,
+                    "_crontab": report.crontab,
+                    "_timezone": report.timezone,
+                    "_active": report.active,
+                    "_next_run": next_run,
+                }
+                for report, next_run in next_runs.items()
+            ],
+        )
+
     @staticmethod
     def find_last_success_log(
         report_schedule: ReportSchedule,
@@ -110,6 +110,7 @@ from superset.tasks.thumbnails import (
     cache_dashboard_thumbnail,
 )
 from superset.tasks.utils import get_current_user
+from superset.thumbnails.digest import batch_digests
 from superset.utils import json
 from superset.utils.core import parse_boolean_string
 from superset.utils.pdf import build_pdf_from_screenshots
@@ -334,6 +335,13 @@ class DashboardRestApi(BaseSupersetModelRestApi):
             self.appbuilder.app.config["VERSION_SHA"],
         )
 
+    def get_list_headless(self, **kwargs: Any) -> Response:
+        """
+        Compute the thumbnail digests of the listed dashboards at once, if requested.
+        """
+        with batch_digests(Dashboard):
+            return super().get_list_headless(**kwargs)
+
     @expose("/<id_or_slug>", methods=("GET",))
     @protect()
     @safe
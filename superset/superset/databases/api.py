@@ -83,6 +83,11 @@ from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP, RouteMethod
 from superset.daos.database import DatabaseDAO
 from superset.databases.decorators import check_table_access
 from superset.databases.filters import DatabaseFilter, DatabaseUploadEnabledFilter
+from superset.databases.name_index import (
+    get_names,
+    is_name_index_enabled,
+    search_names,
+)
 from superset.databases.schemas import (
     CatalogsResponseSchema,
     database_catalogs_query_schema,
@@ -111,7 +116,6 @@ from superset.databases.schemas import (
     ValidateSQLRequest,
     ValidateSQLResponse,
 )
-from superset.databases.utils import get_table_metadata
 from superset.db_engine_specs import get_available_engine_specs
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import (
@@ -785,17 +789,26 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         try:
             params = kwargs["rison"]
             catalog = params.get("catalog")
-            schemas = database.get_all_schema_names(
-                catalog=catalog,
-                cache=database.schema_cache_enabled,
-                cache_timeout=database.schema_cache_timeout or None,
-                force=params.get("force", False),
-            )
+            if is_name_index_enabled(database):
+                schemas = set(
+                    get_names(database, catalog, force=params.get("force", False))[
+                        "schemas"
+                    ]
+                )
+            else:
+                schemas = database.get_all_schema_names(
+                    catalog=catalog,
+                    cache=database.schema_cache_enabled,
+                    cache_timeout=database.schema_cache_timeout or None,
+                    force=params.get("force", False),
+                )
             schemas = security_manager.get_schemas_accessible_by_user(
                 database,
                 catalog,
                 schemas,
             )
+            if search := params.get("search"):
+                schemas = search_names(sorted(schemas), search)
             if params.get("upload_allowed"):
                 if not database.allow_file_upload:
                     return self.response(200, result=[])
@@ -879,7 +892,15 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         catalog_name = kwargs["rison"].get("catalog_name")
         schema_name = kwargs["rison"].get("schema_name", "")
 
-        command = TablesDatabaseCommand(pk, catalog_name, schema_name, force)
+        command = TablesDatabaseCommand(
+            pk,
+            catalog_name,
+            schema_name,
+            force,
+            search=kwargs["rison"].get("search"),
+            page=kwargs["rison"].get("page"),
+            page_size=kwargs["rison"].get("page_size"),
+        )
         payload = command.run()
         return self.response(200, **payload)
 
@@ -936,7 +957,11 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         """
         self.incr_stats("init", self.table_metadata_deprecated.__name__)
         try:
-            table_info = get_table_metadata(database, Table(table_name, schema_name))
+            table_info = database.get_table_metadata(
+                table=Table(table_name, schema_name),
+                cache=database.table_cache_enabled,
+                cache_timeout=database.table_cache_timeout,
+            )
         except SQLAlchemyError as ex:
             self.incr_stats("error", self.table_metadata_deprecated.__name__)
             return self.response_422(error_msg_from_exception(ex))
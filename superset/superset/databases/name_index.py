@@ -0,0 +1,253 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Per-database index of schema, table and view names, used to populate the pickers of
+SQL Lab and of the dataset editor.
+
+The names of each catalog and schema are stored sorted in the cache, and are served
+even when they're stale: entries older than `DATABASE_NAME_INDEX_REFRESH_AFTER` are
+refreshed by a Celery task, either when they're read or by the scheduled
+`refresh_name_indexes` task, which refreshes the stalest entries of all databases in
+batches. Names are searched with the same index as column values.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, TYPE_CHECKING
+
+from flask import current_app as app
+
+from superset.extensions import cache_manager, db
+from superset.utils.column_values import ColumnValuesIndex, get_index
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+
+logger = logging.getLogger(__name__)
+
+
+def is_name_index_enabled(database: Database) -> bool:
+    """
+    Return whether the names of a database are indexed.
+
+    Databases listing names as the current user, through impersonation or OAuth2,
+    are never indexed since their names can't be shared between users.
+    """
+    return (
+        app.config["DATABASE_NAME_INDEX_REFRESH_AFTER"] is not None
+        and not database.impersonate_user
+        and not database.is_oauth2_enabled()
+    )
+
+
+def get_cache_key(database_id: int, catalog: str | None, schema: str | None) -> str:
+    if schema is None:
+        return f"db:{database_id}:catalog:{catalog}:name_index"
+    return f"db:{database_id}:catalog:{catalog}:schema:{schema}:name_index"
+
+
+def _get_catalogs_cache_key(database_id: int) -> str:
+    return f"db:{database_id}:name_index_catalogs"
+
+
+def get_names(
+    database: Database,
+    catalog: str | None,
+    schema: str | None = None,
+    force: bool = False,
+) -> dict[str, Any]:
+    """
+    Return the indexed names of a catalog or schema, fetching them if needed.
+
+    :param database: The database
+    :param catalog: The catalog
+    :param schema: The schema, or `None` to get the schemas of the catalog
+    :param force: Fetch the names even if they're indexed
+    :returns: The `schemas` of a catalog, or the `tables` and `views` of a schema,
+        along with the time they were fetched in `dttm`
+    """
+    cache_key = get_cache_key(database.id, catalog, schema)
+    entry = None if force else cache_manager.cache.get(cache_key)
+    if not entry:
+        return fetch_names(database, catalog, schema)
+
+    refresh_after = app.config["DATABASE_NAME_INDEX_REFRESH_AFTER"]
+    if time.time() - entry["dttm"] > refresh_after:
+        refresh_in_background(database, catalog, schema)
+
+    return entry
+
+
+def fetch_names(
+    database: Database,
+    catalog: str | None,
+    schema: str | None = None,
+) -> dict[str, Any]:
+    """
+    Fetch the names of a catalog or schema from the database, and index them.
+    """
+    if schema is None:
+        schemas = database.get_all_schema_names(catalog=catalog, cache=False)
+        entry: dict[str, Any] = {"schemas": sorted(schemas)}
+    else:
+        entry = {
+            "tables": sorted(
+                name[0]
+                for name in database.get_all_table_names_in_schema(
+                    catalog=catalog,
+                    schema=schema,
+                    cache=False,
+                )
+            ),
+            "views": sorted(
+                name[0]
+                for name in database.get_all_view_names_in_schema(
+                    catalog=catalog,
+                    schema=schema,
+                    cache=False,
+                )
+            ),
+        }
+    entry["dttm"] = time.time()
+
+    timeout = app.config["DATABASE_NAME_INDEX_TIMEOUT"]
+    cache_manager.cache.set(
+        get_cache_key(database.id, catalog, schema),
+        entry,
+        timeout=timeout,
+    )
+
+    # keep track of the indexed catalogs, for the scheduled refresh
+    if schema is None:
+        catalogs_cache_key = _get_catalogs_cache_key(database.id)
+        catalogs = cache_manager.cache.get(catalogs_cache_key) or []
+        if catalog not in catalogs:
+            cache_manager.cache.set(
+                catalogs_cache_key,
+                [*catalogs, catalog],
+                timeout=timeout,
+            )
+
+    return entry
+
+
+def search_names(
+    names: list[str],
+    search: str,
+    cache_key: str | None = None,
+    dttm: float | None = None,
+) -> list[str]:
+    """
+    Return the names containing `search`, ignoring case, with the names starting with
+    `search` first. The search index is kept in memory when an index entry is given.
+    """
+    if cache_key is None or dttm is None:
+        return ColumnValuesIndex.build(names).search(search)
+    return get_index(cache_key, dttm, names).search(search)
+
+
+def refresh_in_background(
+    database: Database,
+    catalog: str | None,
+    schema: str | None,
+) -> None:
+    """
+    Trigger a Celery task to fetch the names of a stale entry again, unless one was
+    already triggered.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.tasks.cache import refresh_name_index
+
+    refreshing_key = f"{get_cache_key(database.id, catalog, schema)}_refreshing"
+    if not cache_manager.cache.add(
+        refreshing_key,
+        True,
+        timeout=app.config["DATABASE_NAME_INDEX_REFRESH_AFTER"],
+    ):
+        return
+
+    try:
+        refresh_name_index.delay(
+            database_id=database.id,
+            catalog=catalog,
+            schema=schema,
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to refresh the name index", exc_info=True)
+        cache_manager.cache.delete(refreshing_key)
+
+
+def refresh_stale_entries(batch_size: int) -> int:
+    """
+    Fetch the names of the stalest index entries of all databases again.
+
+    Only entries that were already indexed are refreshed, so that the schemas nobody
+    looks at are never listed.
+
+    :param batch_size: The maximum number of entries to refresh
+    :returns: The number of refreshed entries
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.models.core import Database
+
+    refresh_after = app.config["DATABASE_NAME_INDEX_REFRESH_AFTER"]
+    if refresh_after is None:
+        return 0
+
+    now = time.time()
+    stale: list[tuple[float, Database, str | None, str | None]] = []
+    for database in db.session.query(Database).all():
+        if not is_name_index_enabled(database):
+            continue
+
+        catalogs = cache_manager.cache.get(_get_catalogs_cache_key(database.id))
+        for catalog in catalogs or []:
+            schemas_entry = cache_manager.cache.get(
+                get_cache_key(database.id, catalog, None)
+            )
+            if not schemas_entry:
+                continue
+            if now - schemas_entry["dttm"] > refresh_after:
+                stale.append((schemas_entry["dttm"], database, catalog, None))
+
+            schemas = schemas_entry["schemas"]
+            entries = cache_manager.cache.get_many(
+                *[get_cache_key(database.id, catalog, schema) for schema in schemas]
+            )
+            stale.extend(
+                (entry["dttm"], database, catalog, schema)
+                for schema, entry in zip(schemas, entries, strict=True)
+                if entry and now - entry["dttm"] > refresh_after
+            )
+
+    stale.sort(key=lambda item: item[0])
+    refreshed = 0
+    for _, database, catalog, schema in stale[:batch_size]:
+        try:
+            fetch_names(database, catalog, schema)
+            refreshed += 1
+        except Exception:  # pylint: disable=broad-except
+            logger.warning(
+                "Unable to refresh the names of %s in database %i",
+                get_cache_key(database.id, catalog, schema),
+                database.id,
+                exc_info=True,
+            )
+
+    return refreshed
@@ -66,6 +66,7 @@ database_schemas_query_schema = {
         "force": {"type": "boolean"},
         "upload_allowed": {"type": "boolean"},
         "catalog": {"type": "string"},
+        "search": {"type": "string"},
     },
 }
 
@@ -80,6 +81,9 @@ database_tables_query_schema = {
         "force": {"type": "boolean"},
         "schema_name": {"type": "string"},
         "catalog_name": {"type": "string"},
+        "search": {"type": "string"},
+        "page": {"type": "integer", "minimum": 0},
+        "page_size": {"type": "integer", "minimum": 1},
     },
     "required": ["schema_name"],
 }
@@ -162,7 +166,10 @@ extra_description = markdown(
     "7. The ``disable_drill_to_detail`` field is a boolean specifying whether or not"
     "drill to detail is disabled for the database."
     "8. The ``allow_multi_catalog`` indicates if the database allows changing "
-    "the default catalog when running queries and creating datasets.",
+    "the default catalog when running queries and creating datasets.<br/>"
+    "9. The ``results_reuse_max_age`` is how old, in seconds, the stored results "
+    "of an identical SQL Lab query can be to be reused instead of running the query "
+    "again. Set it to 0 to disable results reuse for the database.",
     True,
 )
 get_export_ids_schema = {"type": "array", "items": {"type": "integer"}}
@@ -831,6 +838,7 @@ class ImportV1DatabaseExtraSchema(Schema):
     disable_data_preview = fields.Boolean(required=False)
     disable_drill_to_detail = fields.Boolean(required=False)
     allow_multi_catalog = fields.Boolean(required=False)
+    results_reuse_max_age = fields.Integer(required=False, allow_none=True)
     version = fields.String(required=False, allow_none=True)
     schema_options = fields.Dict(keys=fields.Str(), values=fields.Raw())
 
@@ -35,8 +35,10 @@ if TYPE_CHECKING:
 def get_foreign_keys_metadata(
     database: Any,
     table: Table,
+    foreign_keys: list[dict[str, Any]] | None = None,
 ) -> list[TableMetadataForeignKeysIndexesResponse]:
-    foreign_keys = database.get_foreign_keys(table)
+    if foreign_keys is None:
+        foreign_keys = database.get_foreign_keys(table)
     for fk in foreign_keys:
         fk["column_names"] = fk.pop("constrained_columns")
         fk["type"] = "fk"
@@ -46,8 +48,10 @@ def get_foreign_keys_metadata(
 def get_indexes_metadata(
     database: Any,
     table: Table,
+    indexes: list[dict[str, Any]] | None = None,
 ) -> list[TableMetadataForeignKeysIndexesResponse]:
-    indexes = database.get_indexes(table)
+    if indexes is None:
+        indexes = database.get_indexes(table)
     for idx in indexes:
         idx["type"] = "index"
     return indexes
@@ -67,22 +71,25 @@ def get_table_metadata(database: Any, table: Table) -> TableMetadataResponse:
     Get table metadata information, including type, pk, fks.
     This function raises SQLAlchemyError when a schema is not found.
 
+    The metadata is reflected over a single inspector, see
+    `Database.get_table_metadata_bundle`.
+
     :param database: The database model
     :param table: Table instance
     :return: Dict table metadata ready for API response
     """
+    bundle = database.get_table_metadata_bundle(table)
     keys = []
-    columns = database.get_columns(table)
-    primary_key = database.get_pk_constraint(table)
+    columns = bundle["columns"]
+    primary_key = bundle["primary_key"]
     if primary_key and primary_key.get("constrained_columns"):
         primary_key["column_names"] = primary_key.pop("constrained_columns")
         primary_key["type"] = "pk"
         keys += [primary_key]
-    foreign_keys = get_foreign_keys_metadata(database, table)
-    indexes = get_indexes_metadata(database, table)
+    foreign_keys = get_foreign_keys_metadata(database, table, bundle["foreign_keys"])
+    indexes = get_indexes_metadata(database, table, bundle["indexes"])
     keys += foreign_keys + indexes
     payload_columns: list[TableMetadataColumnsResponse] = []
-    table_comment = database.get_table_comment(table)
     for col in columns:
         dtype = get_col_type(col)
         payload_columns.append(
@@ -97,16 +104,11 @@ def get_table_metadata(database: Any, table: Table) -> TableMetadataResponse:
     return {
         "name": table.table,
         "columns": payload_columns,
-        "selectStar": database.select_star(
-            table,
-            indent=True,
-            cols=columns,
-            latest_partition=True,
-        ),
+        "selectStar": bundle["select_star"],
         "primaryKey": primary_key,
         "foreignKeys": foreign_keys,
         "indexes": keys,
-        "comment": table_comment,
+        "comment": bundle["comment"],
     }
 
 
@@ -72,6 +72,13 @@ class DatasourceRestApi(BaseSupersetApi):
               type: string
             name: column_name
             description: The name of the column to get values for
+          - in: query
+            schema:
+              type: string
+            name: search
+            description: >-
+              Only return values containing this string, ignoring case. Values
+              starting with it are returned first
           responses:
             200:
               description: A List of distinct values for the column
@@ -123,6 +130,7 @@ class DatasourceRestApi(BaseSupersetApi):
                 column_name=column_name,
                 limit=row_limit,
                 denormalize_column=denormalize_column,
+                search=request.args.get("search") or None,
             )
             return self.response(200, result=payload)
         except KeyError:
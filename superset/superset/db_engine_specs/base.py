@@ -21,6 +21,8 @@ from __future__ import annotations
 import logging
 import re
 import warnings
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import nullcontext
 from datetime import datetime
 from inspect import signature
 from re import Match, Pattern
@@ -39,6 +41,7 @@ from urllib.parse import urlencode, urljoin
 from uuid import uuid4
 
 import pandas as pd
+import pyarrow as pa
 import requests
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -60,7 +63,7 @@ from sqlalchemy.types import TypeEngine
 
 from superset import db
 from superset.constants import QUERY_CANCEL_KEY, TimeGrain as TimeGrainConstants
-from superset.databases.utils import get_table_metadata, make_url_safe
+from superset.databases.utils import make_url_safe
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import OAuth2Error, OAuth2RedirectError
 from superset.sql.parse import (
@@ -347,6 +350,9 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     time_groupby_inline = False
     limit_method = LimitMethod.FORCE_LIMIT
     supports_multivalues_insert = False
+    # Can uploaded files be written chunk by chunk, i.e. appended to the table
+    # created with the first chunk?
+    supports_chunked_upload = True
     allows_joins = True
     allows_subqueries = True
     allows_alias_in_select = True
@@ -386,6 +392,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
 
     force_column_alias_quotes = False
     arraysize = 0
+    # Whether the DB-API cursor may return results as Arrow record batches through
+    # `fetch_record_batch`, like the DuckDB and ADBC drivers do. The capability is
+    # still checked on the cursor, so drivers without it fall back to `fetch_data`.
+    supports_fetch_arrow = False
     max_column_name_length: int | None = None
     try_remove_schema_from_table_name = True  # pylint: disable=invalid-name
     run_multiple_statements_as_one = False
@@ -984,29 +994,165 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             if cls.limit_method == LimitMethod.FETCH_MANY and limit:
                 return cursor.fetchmany(limit)
             data = cursor.fetchall()
-            description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
-                    )
+            return cls._mutate_column_types(data, cursor.description or [])
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+    @classmethod
+    def _mutate_column_types(
+        cls,
+        data: list[tuple[Any, ...]],
+        description: Sequence[Sequence[Any]],
+    ) -> list[tuple[Any, ...]]:
+        """
+        Normalize the values of the columns that have a mutator in
+        `column_type_mutators`, in place.
+
+        :param data: Rows fetched from the cursor
+        :param description: The cursor description
+        :return: The normalized rows
+        """
+        # Create a mapping between column name and a mutator function to normalize
+        # values with. The first two items in the description row are
+        # the column name and type.
+        column_mutators = {
+            row[0]: func
+            for row in description
+            if (
+                func := cls.column_type_mutators.get(
+                    type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
                 )
-            }
-            if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
-                for row_idx, row in enumerate(data):
-                    new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
-                        new_row[col_idx] = func(row[col_idx])
-                    data[row_idx] = tuple(new_row)
-
-            return data
+            )
+        }
+        if column_mutators:
+            indexes = {row[0]: idx for idx, row in enumerate(description)}
+            for row_idx, row in enumerate(data):
+                new_row = list(row)
+                for col, func in column_mutators.items():
+                    col_idx = indexes[col]
+                    new_row[col_idx] = func(row[col_idx])
+                data[row_idx] = tuple(new_row)
+
+        return data
+
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        """
+        Fetch the results as an Arrow table, without materializing Python rows.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query, or `None` if the cursor can't return Arrow data
+        """
+        if (
+            not cls.supports_fetch_arrow
+            or not hasattr(cursor, "fetch_record_batch")
+            or not cursor.description
+        ):
+            return None
+
+        try:
+            reader = cursor.fetch_record_batch()
+            if not limit:
+                return reader.read_all()
+
+            batches: list[pa.RecordBatch] = []
+            num_rows = 0
+            for batch in reader:
+                batches.append(batch)
+                num_rows += batch.num_rows
+                if num_rows >= limit:
+                    break
+            return pa.Table.from_batches(batches, schema=reader.schema).slice(0, limit)
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+    @classmethod
+    def fetch_results(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> list[tuple[Any, ...]] | pa.Table:
+        """
+        Fetch the results as an Arrow table when the cursor supports it, falling back
+        to `fetch_data` otherwise. Both can be passed to `SupersetResultSet`.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query
+        """
+        table = cls.fetch_arrow(cursor, limit)
+        if table is not None:
+            return table
+        return cls.fetch_data(cursor, limit)
+
+    @classmethod
+    def fetch_data_chunks(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+        chunk_size: int = 10000,
+    ) -> Iterator[list[tuple[Any, ...]] | pa.Table]:
+        """
+        Fetch the results in chunks of up to `chunk_size` rows, so that callers can
+        report progress and use the first rows while the rest are still being fetched.
+
+        Cursors returning Arrow data yield Arrow tables, other cursors yield lists of
+        rows. Engine specs that override `fetch_data` get their results in a single
+        chunk, since the rows might need to be post-processed as a whole.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :param chunk_size: Maximum number of rows in each chunk
+        :return: Chunks of the result of query
+        """
+        if (
+            cls.supports_fetch_arrow
+            and hasattr(cursor, "fetch_record_batch")
+            and cursor.description
+        ):
+            yield from cls._fetch_arrow_chunks(cursor, limit, chunk_size)
+            return
+
+        if cls.fetch_data.__func__ is not BaseEngineSpec.fetch_data.__func__:  # type: ignore[attr-defined]
+            yield cls.fetch_data(cursor, limit)
+            return
+
+        if cls.arraysize:
+            cursor.arraysize = cls.arraysize
+        try:
+            num_rows = 0
+            while not limit or num_rows < limit:
+                size = min(chunk_size, limit - num_rows) if limit else chunk_size
+                data = list(cursor.fetchmany(size))
+                if not data:
+                    break
+                num_rows += len(data)
+                yield cls._mutate_column_types(data, cursor.description or [])
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+    @classmethod
+    def _fetch_arrow_chunks(
+        cls,
+        cursor: Any,
+        limit: int | None,
+        chunk_size: int,
+    ) -> Iterator[pa.Table]:
+        try:
+            reader = cursor.fetch_record_batch(chunk_size)
+            num_rows = 0
+            for batch in reader:
+                if limit and num_rows + batch.num_rows > limit:
+                    batch = batch.slice(0, limit - num_rows)
+                num_rows += batch.num_rows
+                yield pa.Table.from_batches([batch], schema=reader.schema)
+                if limit and num_rows >= limit:
+                    break
+            else:
+                if not num_rows:
+                    # keep the schema of empty results
+                    yield reader.schema.empty_table()
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
@@ -1094,7 +1240,11 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         :param table: A Table instance
         :return: Basic table metadata
         """
-        return get_table_metadata(database, table)
+        return database.get_table_metadata(
+            table=table,
+            cache=database.table_cache_enabled,
+            cache_timeout=database.table_cache_timeout,
+        )
 
     @classmethod
     def get_extra_table_metadata(
@@ -1182,17 +1332,86 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             # Only add schema when it is preset and non-empty.
             to_sql_kwargs["schema"] = table.schema
 
+        connection = to_sql_kwargs.pop("con", None)
+        with (
+            nullcontext(connection.engine)
+            if connection is not None
+            else cls.get_engine(
+                database,
+                catalog=table.catalog,
+                schema=table.schema,
+            )
+        ) as engine:
+            if method := cls.get_df_to_sql_method(engine):
+                to_sql_kwargs["method"] = method
+            df.to_sql(
+                con=engine if connection is None else connection,
+                **to_sql_kwargs,
+            )
+
+    @classmethod
+    def df_chunks_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        chunks: Iterable[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Upload a sequence of DataFrames, e.g. a file read chunk by chunk, to a table.
+
+        The first chunk creates or replaces the table according to `if_exists`, and
+        the others are appended to it. The chunks are written with the same
+        connection in a single transaction, so databases with transactional DDL don't
+        keep a partial table when the upload fails midway; other databases keep the
+        rows written so far. Engines that don't support chunked uploads get all the
+        chunks in a single DataFrame.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param chunks: The dataframes with the data to be uploaded
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        """
+        if not cls.supports_chunked_upload:
+            frames = list(chunks)
+            df = pd.concat(frames) if frames else pd.DataFrame()
+            cls.df_to_sql(database, table, df, to_sql_kwargs)
+            return
+
+        if_exists = to_sql_kwargs.get("if_exists", "fail")
         with cls.get_engine(
             database,
             catalog=table.catalog,
             schema=table.schema,
         ) as engine:
-            if (
-                engine.dialect.supports_multivalues_insert
-                or cls.supports_multivalues_insert
-            ):
-                to_sql_kwargs["method"] = "multi"
-            df.to_sql(con=engine, **to_sql_kwargs)
+            with engine.begin() as connection:
+                for chunk in chunks:
+                    cls.df_to_sql(
+                        database,
+                        table,
+                        chunk,
+                        {**to_sql_kwargs, "if_exists": if_exists, "con": connection},
+                    )
+                    if_exists = "append"
+
+    @classmethod
+    def get_df_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        """
+        Return the `method` used by `pandas.DataFrame.to_sql` to insert the rows.
+
+        Defaults to multi-row `INSERT` statements when they are supported, and to
+        `executemany` otherwise. Engines with a bulk loading protocol can return a
+        callable implementing it instead.
+
+        :param engine: The engine the data is uploaded with
+        :return: An insertion method supported by `pandas.DataFrame.to_sql`
+        """
+        if (
+            engine.dialect.supports_multivalues_insert
+            or cls.supports_multivalues_insert
+        ):
+            return "multi"
+        return None
 
     @classmethod
     def convert_dttm(  # pylint: disable=unused-argument
@@ -18,16 +18,20 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from datetime import datetime
 from re import Pattern
-from typing import Any, TYPE_CHECKING, TypedDict
+from typing import Any, Callable, TYPE_CHECKING, TypedDict
+from uuid import uuid4
 
+import pandas as pd
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from flask import current_app as app
 from flask_babel import gettext as __
 from marshmallow import fields, Schema
 from sqlalchemy import types
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 
@@ -47,6 +51,40 @@ DEFAULT_ACCESS_TOKEN_URL = (
 )
 
 
+def insert_from_dataframe(
+    table: Any,
+    conn: Connection,
+    keys: list[str],
+    data_iter: Iterable[tuple[Any, ...]],
+) -> int:
+    """
+    Insert rows by registering them with DuckDB as a DataFrame and selecting from
+    it, for use as the `method` of `pandas.DataFrame.to_sql`. DuckDB scans the
+    DataFrame natively instead of binding parameters for every value.
+
+    :param table: The `pandas.io.sql.SQLTable` being written to
+    :param conn: The connection to the database
+    :param keys: The names of the columns
+    :param data_iter: The rows to insert
+    :return: The number of rows inserted
+    """
+    df = pd.DataFrame(data_iter, columns=keys)
+    view_name = f"superset_upload_{uuid4().hex}"
+
+    preparer = conn.dialect.identifier_preparer
+    table_name = preparer.format_table(table.table)
+    columns = ", ".join(preparer.quote(key) for key in keys)
+    conn.connection.register(view_name, df)
+    try:
+        conn.exec_driver_sql(
+            f"INSERT INTO {table_name} ({columns}) "  # noqa: S608
+            f"SELECT {columns} FROM {view_name}"
+        )
+    finally:
+        conn.connection.unregister(view_name)
+    return len(df)
+
+
 # schema for adding a database by providing parameters instead of the
 # full SQLAlchemy URI
 class DuckDBParametersSchema(Schema):
@@ -197,6 +235,7 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
 
     sqlalchemy_uri_placeholder = "duckdb:////path/to/duck.db"
     supports_multivalues_insert = True
+    supports_fetch_arrow = True
 
     # DuckDB-specific column type mappings to ensure float/double types are recognized
     column_type_mappings = (
@@ -267,6 +306,10 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
     ) -> set[str]:
         return set(inspector.get_table_names(schema))
 
+    @classmethod
+    def get_df_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        return insert_from_dataframe
+
     @staticmethod
     def get_extra_params(
         database: Database, source: QuerySource | None = None
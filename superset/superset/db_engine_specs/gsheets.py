@@ -98,6 +98,8 @@ class GSheetsEngineSpec(ShillelaghEngineSpec):
     engine = "gsheets"
     allows_joins = True
     allows_subqueries = True
+    # uploads can't be appended to an existing sheet
+    supports_chunked_upload = False
 
     parameters_schema = GSheetsParametersSchema()
     default_driver = "apsw"
@@ -96,6 +96,8 @@ class HiveEngineSpec(PrestoEngineSpec):
 
     supports_dynamic_schema = True
     supports_cross_catalog_queries = False
+    # uploads can't be appended to an existing table
+    supports_chunked_upload = False
 
     # When running `SHOW FUNCTIONS`, what is the name of the column with the
     # function names?
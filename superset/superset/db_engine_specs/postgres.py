@@ -19,13 +19,16 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable
 from datetime import datetime
+from io import StringIO
 from re import Pattern
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
 
 from flask_babel import gettext as __
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.dialects.postgresql.base import PGInspector
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.types import Date, DateTime, String
@@ -45,6 +48,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger()
 
 
+# The representation of `NULL` in the rows loaded with `COPY`
+COPY_NULL = r"\N"
+
 # Regular expressions to catch custom errors
 CONNECTION_INVALID_USERNAME_REGEX = re.compile(
     'role "(?P<username>.*?)" does not exist'
@@ -94,6 +100,53 @@ def parse_options(connect_args: dict[str, Any]) -> dict[str, str]:
     return {token[0]: token[1] for token in tokens}
 
 
+def copy_from_stdin(
+    table: Any,
+    conn: Connection,
+    keys: list[str],
+    data_iter: Iterable[tuple[Any, ...]],
+) -> int:
+    """
+    Insert rows with `COPY ... FROM STDIN`, for use as the `method` of
+    `pandas.DataFrame.to_sql`. This is much faster than `INSERT` statements for
+    large uploads, since the rows are streamed to the server as CSV.
+
+    Every value is quoted and missing values are written as an unquoted `\\N`, so
+    that empty strings aren't loaded as `NULL`.
+
+    :param table: The `pandas.io.sql.SQLTable` being written to
+    :param conn: The connection to the database
+    :param keys: The names of the columns
+    :param data_iter: The rows to insert
+    :return: The number of rows inserted
+    """
+    buffer = StringIO()
+    num_rows = 0
+    for row in data_iter:
+        buffer.write(
+            ",".join(
+                COPY_NULL
+                if value is None
+                else '"{}"'.format(str(value).replace('"', '""'))
+                for value in row
+            )
+        )
+        buffer.write("\n")
+        num_rows += 1
+    buffer.seek(0)
+
+    preparer = conn.dialect.identifier_preparer
+    table_name = preparer.format_table(table.table)
+    columns = ", ".join(preparer.quote(key) for key in keys)
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN "
+            f"WITH (FORMAT csv, NULL '{COPY_NULL}')",
+            buffer,
+        )
+    return num_rows
+
+
 class PostgresBaseEngineSpec(BaseEngineSpec):
     """Abstract class for Postgres 'like' databases"""
 
@@ -320,6 +373,16 @@ class PostgresEngineSpec(BasicParametersMixin, PostgresBaseEngineSpec):
 
         return uri, connect_args
 
+    @classmethod
+    def get_df_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        """
+        Upload data with `COPY ... FROM STDIN` to PostgreSQL when using `psycopg2`.
+        Databases speaking the Postgres protocol don't all support it.
+        """
+        if cls.engine == "postgresql" and engine.dialect.driver == "psycopg2":
+            return copy_from_stdin
+        return super().get_df_to_sql_method(engine)
+
     @classmethod
     def get_default_catalog(cls, database: Database) -> str:
         """
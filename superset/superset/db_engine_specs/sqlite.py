@@ -20,10 +20,11 @@ from __future__ import annotations
 import re
 from datetime import datetime
 from re import Pattern
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 from flask_babel import gettext as __
 from sqlalchemy import types
+from sqlalchemy.engine.base import Engine
 from sqlalchemy.engine.reflection import Inspector
 
 from superset.constants import TimeGrain
@@ -43,6 +44,8 @@ class SqliteEngineSpec(BaseEngineSpec):
 
     disable_ssh_tunneling = True
     supports_multivalues_insert = True
+    # only used with the ADBC driver, the `sqlite3` cursor can't return Arrow data
+    supports_fetch_arrow = True
 
     _time_grain_expressions = {
         None: "{col}",
@@ -113,6 +116,14 @@ class SqliteEngineSpec(BaseEngineSpec):
     def epoch_to_dttm(cls) -> str:
         return "datetime({col}, 'unixepoch')"
 
+    @classmethod
+    def get_df_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        """
+        Upload data with `executemany`: SQLite limits the number of bound parameters
+        per statement, which makes multi-row `INSERT` statements slower.
+        """
+        return None
+
     @classmethod
     def convert_dttm(
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
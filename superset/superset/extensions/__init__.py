@@ -43,10 +43,12 @@ class ResultsBackendManager:
     def __init__(self) -> None:
         self._results_backend = None
         self._use_msgpack = False
+        self._use_arrow = False
 
     def init_app(self, app: Flask) -> None:
         self._results_backend = app.config["RESULTS_BACKEND"]
         self._use_msgpack = app.config["RESULTS_BACKEND_USE_MSGPACK"]
+        self._use_arrow = app.config["RESULTS_BACKEND_USE_ARROW"]
 
     @property
     def results_backend(self) -> Optional[BaseCache]:
@@ -56,6 +58,10 @@ class ResultsBackendManager:
     def should_use_msgpack(self) -> bool:
         return self._use_msgpack
 
+    @property
+    def should_use_arrow(self) -> bool:
+        return self._use_arrow
+
 
 class UIManifestProcessor:
     def __init__(self, app_dir: str) -> None:
@@ -31,8 +31,9 @@ and SQLAlchemy dialects based on SQLite. SQLite will parse the SQL, and pass the
 to the adapter. The adapter builds a SQLAlchemy query object reading data from the table
 and applying any filters (as well as sorting, limiting, and offsetting).
 
-Note that no aggregation is done on the database. Aggregations and other operations like
-joins and unions are done in memory, using the SQLite engine.
+Note that no aggregation is done on the database, since the SQLite virtual table
+interface doesn't expose aggregates to the adapter. Aggregations and other operations
+like joins and unions are done in memory, using the SQLite engine.
 """  # noqa: E501
 
 from __future__ import annotations
@@ -40,10 +41,13 @@ from __future__ import annotations
 import datetime
 import decimal
 import operator
+import threading
+import time
 import urllib.parse
+from collections import OrderedDict
 from collections.abc import Iterator
 from functools import partial, wraps
-from typing import Any, Callable, cast, TypeVar
+from typing import Any, Callable, cast, TYPE_CHECKING, TypeVar
 
 from flask import current_app
 from shillelagh.adapters.base import Adapter
@@ -68,8 +72,21 @@ from sqlalchemy.exc import NoSuchTableError
 from sqlalchemy.sql import Select, select
 
 from superset import db, feature_flag_manager, security_manager
+from superset.constants import LRU_CACHE_MAX_SIZE
 from superset.sql.parse import Table
 
+if TYPE_CHECKING:
+    from superset.models.core import Database
+
+# Reflected tables, keyed by database, table and the last time the database changed.
+# Adapters are created for every table in every query, and reflecting a table needs
+# one or more roundtrips to the database.
+ReflectionCacheKey = tuple[int, Any, str | None, str | None, str]
+_reflection_cache: OrderedDict[ReflectionCacheKey, tuple[float, SqlaTable]] = (
+    OrderedDict()
+)
+_reflection_cache_lock = threading.Lock()
+
 
 # pylint: disable=abstract-method
 class SupersetAPSWDialect(APSWDialect):
@@ -185,6 +202,49 @@ class FallbackField(Field[Any, str]):
         return value if value is None else str(value)
 
 
+def get_reflected_table(
+    database: Database,
+    table: str,
+    schema: str | None,
+    catalog: str | None,
+) -> SqlaTable:
+    """
+    Reflect a table, reusing the reflected metadata for up to
+    `SUPERSET_META_DB_REFLECTION_CACHE_TIMEOUT` seconds.
+
+    :raises ProgrammingError: if the table doesn't exist
+    """
+    timeout = current_app.config["SUPERSET_META_DB_REFLECTION_CACHE_TIMEOUT"]
+    key = (database.id, database.changed_on, catalog, schema, table)
+    now = time.monotonic()
+
+    with _reflection_cache_lock:
+        if (cached := _reflection_cache.get(key)) and now - cached[0] < timeout:
+            _reflection_cache.move_to_end(key)
+            return cached[1]
+
+    with database.get_sqla_engine(catalog=catalog, schema=schema) as engine:
+        try:
+            sqla_table = SqlaTable(
+                table,
+                MetaData(),
+                schema=schema,
+                autoload=True,
+                autoload_with=engine,
+            )
+        except NoSuchTableError as ex:
+            raise ProgrammingError(f"Table does not exist: {table}") from ex
+
+    if timeout:
+        with _reflection_cache_lock:
+            _reflection_cache[key] = (now, sqla_table)
+            _reflection_cache.move_to_end(key)
+            while len(_reflection_cache) > LRU_CACHE_MAX_SIZE:
+                _reflection_cache.popitem(last=False)
+
+    return sqla_table
+
+
 # pylint: disable=too-many-instance-attributes
 class SupersetShillelaghAdapter(Adapter):
     """
@@ -317,18 +377,12 @@ class SupersetShillelaghAdapter(Adapter):
         )
 
         # fetch column names and types
-        metadata = MetaData()
-        with self.engine_context() as engine:
-            try:
-                self._table = SqlaTable(
-                    self.table,
-                    metadata,
-                    schema=self.schema,
-                    autoload=True,
-                    autoload_with=engine,
-                )
-            except NoSuchTableError as ex:
-                raise ProgrammingError(f"Table does not exist: {self.table}") from ex
+        self._table = get_reflected_table(
+            database,
+            self.table,
+            self.schema,
+            self.catalog,
+        )
 
         # find row ID column; we can only update/delete data into a table with a
         # single integer primary key
@@ -400,6 +454,8 @@ class SupersetShillelaghAdapter(Adapter):
     ) -> Iterator[Row]:
         """
         Return data for a `SELECT` statement.
+
+        Rows are fetched from the database in batches of `SUPERSET_META_DB_FETCH_SIZE`.
         """
         app_limit: int | None = current_app.config["SUPERSET_META_DB_LIMIT"]
         if limit is None:
@@ -408,14 +464,20 @@ class SupersetShillelaghAdapter(Adapter):
             limit = min(limit, app_limit)
 
         query = self._build_sql(bounds, order, limit, offset)
+        fetch_size = current_app.config["SUPERSET_META_DB_FETCH_SIZE"]
 
         with self.engine_context() as engine:
-            connection = engine.connect()
-            rows = connection.execute(query)
-            for i, row in enumerate(rows):
-                data = dict(zip(self.columns, row, strict=False))
-                data["rowid"] = data[self._rowid] if self._rowid else i
-                yield data
+            with engine.connect() as connection:
+                result = connection.execution_options(stream_results=True).execute(
+                    query
+                )
+                i = 0
+                while rows := result.fetchmany(fetch_size):
+                    for row in rows:
+                        data = dict(zip(self.columns, row, strict=False))
+                        data["rowid"] = data[self._rowid] if self._rowid else i
+                        i += 1
+                        yield data
 
     @check_dml
     def insert_row(self, row: Row) -> int:
@@ -19,6 +19,8 @@
 from __future__ import annotations
 
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache, partial
@@ -27,7 +29,7 @@ from typing import Any, Callable, cast, TYPE_CHECKING, TypedDict, Union
 import dateutil
 from flask import current_app, g, has_request_context, request
 from flask_babel import gettext as _
-from jinja2 import DebugUndefined, Environment
+from jinja2 import DebugUndefined, Environment, Template
 from jinja2.sandbox import SandboxedEnvironment
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.sql.expression import bindparam
@@ -50,6 +52,7 @@ from superset.utils.core import (
     get_username,
     merge_extra_filters,
 )
+from superset.utils.hashing import md5_sha_from_str
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import SqlaTable
@@ -96,6 +99,13 @@ class TimeFilter:
     time_range: str | None
 
 
+# Regular expression for detecting calls to the `dataset` and `metric` macros, which
+# read the definition of other datasets.
+DATASET_MACROS_REGEX = re.compile(
+    r"(\{\{|\{%)[^{}]*?\b(dataset|metric)\([^()]*\)[^{}]*?(\}\}|\%\})"
+)
+
+
 class ExtraCache:
     """
     Dummy class that exposes a method used to store additional values used in
@@ -634,6 +644,108 @@ def to_datetime(
     return datetime.strptime(value, format)
 
 
+class CachingSandboxedEnvironment(SandboxedEnvironment):
+    """
+    A sandboxed environment that keeps a bounded LRU of the templates compiled by
+    `from_string`, keyed by a hash of their source.
+
+    Compiled templates hold no per-render state, so they can be shared by every
+    processor using the environment; the context is only passed at render time.
+    """
+
+    def __init__(self, *args: Any, template_cache_size: int, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.template_cache_size = template_cache_size
+        self.hits = 0
+        self.misses = 0
+        self._compiled: OrderedDict[str, Template] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def from_string(  # type: ignore[override]
+        self,
+        source: str,
+        globals: dict[str, Any] | None = None,  # pylint: disable=redefined-builtin
+        template_class: type[Template] | None = None,
+    ) -> Template:
+        if globals or template_class or self.template_cache_size <= 0:
+            return super().from_string(source, globals, template_class)
+
+        key = md5_sha_from_str(source)
+        stats_logger = current_app.config["STATS_LOGGER"]
+        with self._lock:
+            template = self._compiled.get(key)
+            if template is not None:
+                self._compiled.move_to_end(key)
+                self.hits += 1
+        if template is not None:
+            stats_logger.incr("jinja_template_cache.hit")
+            return template
+
+        template = super().from_string(source)
+        with self._lock:
+            self.misses += 1
+            self._compiled[key] = template
+            while len(self._compiled) > self.template_cache_size:
+                self._compiled.popitem(last=False)
+        stats_logger.incr("jinja_template_cache.miss")
+        return template
+
+    def cache_info(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._compiled),
+                "max_size": self.template_cache_size,
+            }
+
+
+NEWLINE_REGEX = re.compile(r"\r\n|\r|\n")
+
+
+def render_template_free(sql: str) -> str:
+    """
+    Return SQL without template syntax as the template engine would render it,
+    normalizing newlines and removing a single trailing newline.
+
+    >>> render_template_free("SELECT 1\\r\\nFROM t\\n")
+    'SELECT 1\\nFROM t'
+    """
+    lines = NEWLINE_REGEX.split(sql)
+    if lines[-1] == "":
+        del lines[-1]
+    return "\n".join(lines)
+
+
+_template_environments: dict[tuple[Any, ...], Environment] = {}
+_template_environments_lock = threading.Lock()
+
+
+def get_template_environment(
+    processor: type[BaseTemplateProcessor],
+    dialect: Dialect,
+) -> Environment:
+    """
+    Return the sandboxed environment shared by all instances of a template processor
+    class for a given dialect, creating it on first use.
+    """
+    key = (processor, dialect.name, dialect.driver)
+    with _template_environments_lock:
+        if env := _template_environments.get(key):
+            return env
+
+        env = CachingSandboxedEnvironment(
+            undefined=DebugUndefined,
+            template_cache_size=current_app.config["JINJA_TEMPLATE_CACHE_SIZE"],
+        )
+        env.filters["where_in"] = WhereInMacro(dialect)
+        env.filters["to_datetime"] = to_datetime
+        _template_environments[key] = env
+        return env
+
+
 class BaseTemplateProcessor:
     """
     Base class for database-specific jinja context
@@ -664,13 +776,14 @@ class BaseTemplateProcessor:
         self._applied_filters = applied_filters
         self._removed_filters = removed_filters
         self._context: dict[str, Any] = {}
-        self.env: Environment = SandboxedEnvironment(undefined=DebugUndefined)
+        # the environment (with its custom filters and compiled templates) is shared
+        # across processors, while the context is specific to this instance
+        self.env: Environment = get_template_environment(
+            type(self),
+            database.get_dialect(),
+        )
         self.set_context(**kwargs)
 
-        # custom filters
-        self.env.filters["where_in"] = WhereInMacro(database.get_dialect())
-        self.env.filters["to_datetime"] = to_datetime
-
     def set_context(self, **kwargs: Any) -> None:
         self._context.update(kwargs)
         self._context.update(context_addons())
@@ -681,6 +794,23 @@ class BaseTemplateProcessor:
         """
         return self._context.copy()
 
+    def is_template_free(self, sql: str) -> bool:
+        """
+        Check if the SQL has no template syntax, in which case rendering it is
+        equivalent to `render_template_free`.
+        """
+        env = self.env
+        if env.line_statement_prefix or env.line_comment_prefix:
+            return False
+        return not any(
+            token in sql
+            for token in (
+                env.variable_start_string,
+                env.block_start_string,
+                env.comment_start_string,
+            )
+        )
+
     def process_template(self, sql: str, **kwargs: Any) -> str:
         """Processes a sql template
 
@@ -688,6 +818,9 @@ class BaseTemplateProcessor:
         >>> process_template(sql)
         "SELECT '2017-01-01T00:00:00'"
         """
+        if self.is_template_free(sql):
+            return render_template_free(sql)
+
         template = self.env.from_string(sql)
         kwargs.update(self._context)
 
@@ -856,6 +989,9 @@ class SparkTemplateProcessor(HiveTemplateProcessor):
     engine = "spark"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
+        if self.is_template_free(sql):
+            return render_template_free(sql)
+
         template = self.env.from_string(sql)
         kwargs.update(self._context)
 
@@ -869,6 +1005,9 @@ class TrinoTemplateProcessor(PrestoTemplateProcessor):
     engine = "trino"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
+        if self.is_template_free(sql):
+            return render_template_free(sql)
+
         template = self.env.from_string(sql)
         kwargs.update(self._context)
 
@@ -0,0 +1,50 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""add next_run to report_schedule
+
+Revision ID: 7a3c6e1d9f42
+Revises: c233f5365c9e
+Create Date: 2025-08-20 10:12:31.418262
+
+"""
+
+import sqlalchemy as sa
+
+from superset.migrations.shared.utils import (
+    add_columns,
+    create_index,
+    drop_columns,
+    drop_index,
+)
+
+# revision identifiers, used by Alembic.
+revision = "7a3c6e1d9f42"
+down_revision = "c233f5365c9e"
+
+
+def upgrade():
+    # NULL means unknown, the scheduler computes it on its next tick
+    add_columns(
+        "report_schedule",
+        sa.Column("next_run", sa.DateTime(), nullable=True),
+    )
+    create_index("report_schedule", "ix_report_schedule_next_run", ["next_run"])
+
+
+def downgrade():
+    drop_index("report_schedule", "ix_report_schedule_next_run")
+    drop_columns("report_schedule", "next_run")
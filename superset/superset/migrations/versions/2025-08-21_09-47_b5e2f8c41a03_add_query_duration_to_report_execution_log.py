@@ -0,0 +1,42 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""add query_duration_ms to report_execution_log
+
+Revision ID: b5e2f8c41a03
+Revises: 7a3c6e1d9f42
+Create Date: 2025-08-21 09:47:12.530917
+
+"""
+
+import sqlalchemy as sa
+
+from superset.migrations.shared.utils import add_columns, drop_columns
+
+# revision identifiers, used by Alembic.
+revision = "b5e2f8c41a03"
+down_revision = "7a3c6e1d9f42"
+
+
+def upgrade():
+    add_columns(
+        "report_execution_log",
+        sa.Column("query_duration_ms", sa.Float(), nullable=True),
+    )
+
+
+def downgrade():
+    drop_columns("report_execution_log", "query_duration_ms")
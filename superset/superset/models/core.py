@@ -24,7 +24,9 @@ from __future__ import annotations
 import builtins
 import logging
 import textwrap
+import threading
 from ast import literal_eval
+from collections import OrderedDict
 from contextlib import closing, contextmanager, nullcontext, suppress
 from copy import deepcopy
 from datetime import datetime
@@ -34,6 +36,7 @@ from typing import Any, Callable, cast, Optional, TYPE_CHECKING
 
 import numpy
 import pandas as pd
+import pyarrow as pa
 import sqlalchemy as sqla
 import sshtunnel
 from flask import current_app as app, g, has_app_context
@@ -64,7 +67,7 @@ from sqlalchemy.sql import ColumnElement, expression, Select
 from superset import db, db_engine_specs, is_feature_enabled
 from superset.commands.database.exceptions import DatabaseInvalidError
 from superset.constants import LRU_CACHE_MAX_SIZE, PASSWORD_MASK
-from superset.databases.utils import make_url_safe
+from superset.databases.utils import get_table_metadata, make_url_safe
 from superset.db_engine_specs.base import MetricType, TimeGrain
 from superset.extensions import (
     cache_manager,
@@ -80,6 +83,7 @@ from superset.superset_typing import (
     DbapiDescription,
     OAuth2ClientConfig,
     ResultSetColumnType,
+    TableMetadataBundle,
 )
 from superset.utils import cache as cache_util, core as utils, json
 from superset.utils.backports import StrEnum
@@ -94,9 +98,19 @@ metadata = Model.metadata  # pylint: disable=no-member
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from superset.databases.schemas import TableMetadataResponse
     from superset.databases.ssh_tunnel.models import SSHTunnel
     from superset.models.sql_lab import Query
 
+# Engines with a connection pool, shared by the callers of `get_sqla_engine` in this
+# process passing `nullpool=False`
+_pooled_engines: OrderedDict[tuple[Any, ...], Engine] = OrderedDict()
+_pooled_engines_lock = threading.Lock()
+# The pooled engines live as long as the process, so their connections are checked
+# before being used and replaced after an hour, in case the server or a firewall
+# dropped them, unless the `engine_params` of the database say otherwise
+POOLED_ENGINE_PARAMS = {"pool_pre_ping": True, "pool_recycle": 3600}
+
 
 class KeyValue(Model):  # pylint: disable=too-few-public-methods
     """Used for any type of key-value store"""
@@ -364,6 +378,17 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     def table_cache_timeout(self) -> int | None:
         return self.metadata_cache_timeout.get("table_cache_timeout")
 
+    @property
+    def results_reuse_max_age(self) -> int | None:
+        """
+        How old (in seconds) the stored results of an identical SQL Lab query can be
+        to be reused instead of running the query again.
+        """
+        return self.get_extra().get(
+            "results_reuse_max_age",
+            app.config["SQLLAB_RESULTS_REUSE_MAX_AGE"],
+        )
+
     @property
     def default_schemas(self) -> list[str]:
         return self.get_extra().get("default_schemas", [])
@@ -469,13 +494,69 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
             engine_context_manager = app.config["ENGINE_CONTEXT_MANAGER"]
             with engine_context_manager(self, catalog, schema):
                 with check_for_oauth2(self):
-                    yield self._get_sqla_engine(
-                        catalog=catalog,
-                        schema=schema,
-                        nullpool=nullpool,
-                        source=source,
-                        sqlalchemy_uri=sqlalchemy_uri,
-                    )
+                    # SSH tunnels are closed when leaving the context, and OAuth2
+                    # tokens expire, so their engines can't be shared
+                    if (
+                        not nullpool
+                        and self.id is not None
+                        and not ssh_tunnel
+                        and not self.is_oauth2_enabled()
+                    ):
+                        yield self._get_pooled_sqla_engine(
+                            catalog=catalog,
+                            schema=schema,
+                            source=source,
+                        )
+                    else:
+                        yield self._get_sqla_engine(
+                            catalog=catalog,
+                            schema=schema,
+                            nullpool=nullpool,
+                            source=source,
+                            sqlalchemy_uri=sqlalchemy_uri,
+                        )
+
+    def _get_pooled_sqla_engine(
+        self,
+        catalog: str | None = None,
+        schema: str | None = None,
+        source: utils.QuerySource | None = None,
+    ) -> Engine:
+        """
+        Return an engine with a connection pool, shared by the callers in this process
+        using the same database, catalog, schema and user.
+        """
+        key = (
+            self.id,
+            self.changed_on,
+            self.sqlalchemy_uri_decrypted,
+            catalog,
+            schema,
+            source,
+            get_username(),
+        )
+        with _pooled_engines_lock:
+            if engine := _pooled_engines.get(key):
+                _pooled_engines.move_to_end(key)
+                return engine
+
+        engine = self._get_sqla_engine(
+            catalog=catalog,
+            schema=schema,
+            nullpool=False,
+            source=source,
+            pool_params=POOLED_ENGINE_PARAMS,
+        )
+        with _pooled_engines_lock:
+            if existing := _pooled_engines.get(key):
+                engine.dispose()
+                return existing
+            _pooled_engines[key] = engine
+            while len(_pooled_engines) > LRU_CACHE_MAX_SIZE:
+                _, evicted = _pooled_engines.popitem(last=False)
+                evicted.dispose()
+
+        return engine
 
     def _get_sqla_engine(  # pylint: disable=too-many-locals  # noqa: C901
         self,
@@ -484,6 +565,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         nullpool: bool = True,
         source: utils.QuerySource | None = None,
         sqlalchemy_uri: str | None = None,
+        pool_params: dict[str, Any] | None = None,
     ) -> Engine:
         sqlalchemy_url = make_url_safe(
             sqlalchemy_uri if sqlalchemy_uri else self.sqlalchemy_uri_decrypted
@@ -494,6 +576,8 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         engine_kwargs = extra.get("engine_params", {})
         if nullpool:
             engine_kwargs["poolclass"] = NullPool
+        for key, value in (pool_params or {}).items():
+            engine_kwargs.setdefault(key, value)
         connect_args = engine_kwargs.setdefault("connect_args", {})
 
         # modify URL/args for a specific catalog/schema
@@ -675,7 +759,9 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         catalog: str | None = None,
         schema: str | None = None,
         fetch_last_result: bool = False,
-    ) -> tuple[Any, list[tuple[Any, ...]] | None]:
+        fetch_arrow: bool = True,
+        nullpool: bool = True,
+    ) -> tuple[Any, list[tuple[Any, ...]] | pa.Table | None]:
         """
         Internal method to execute SQL with mutation and logging.
 
@@ -683,11 +769,17 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         :param catalog: Optional catalog name
         :param schema: Optional schema name
         :param fetch_last_result: Whether to fetch results from last statement
+        :param fetch_arrow: Whether results can be fetched as an Arrow table
+        :param nullpool: Whether to use a new connection instead of a pooled one
         :return: Tuple of (cursor, rows) where rows is None if not fetching
         """
         script = SQLScript(sql, self.db_engine_spec.engine)
 
-        with self.get_sqla_engine(catalog=catalog, schema=schema) as engine:
+        with self.get_sqla_engine(
+            catalog=catalog,
+            schema=schema,
+            nullpool=nullpool,
+        ) as engine:
             engine_url = engine.url
 
         log_query = app.config["QUERY_LOGGER"]
@@ -702,7 +794,11 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                     security_manager,
                 )
 
-        with self.get_raw_connection(catalog=catalog, schema=schema) as conn:
+        with self.get_raw_connection(
+            catalog=catalog,
+            schema=schema,
+            nullpool=nullpool,
+        ) as conn:
             cursor = conn.cursor()
             rows = None
 
@@ -722,7 +818,11 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
                 # Fetch results from last statement if requested
                 if fetch_last_result and i == len(script.statements) - 1:
-                    rows = self.db_engine_spec.fetch_data(cursor)
+                    rows = (
+                        self.db_engine_spec.fetch_results(cursor)
+                        if fetch_arrow
+                        else self.db_engine_spec.fetch_data(cursor)
+                    )
                 else:
                     # Consume results without storing
                     cursor.fetchall()
@@ -776,19 +876,48 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
         return self.post_process_df(df)
 
+    def get_rows(
+        self,
+        sql: str,
+        catalog: str | None = None,
+        schema: str | None = None,
+        nullpool: bool = True,
+    ) -> tuple[DbapiDescription | None, list[tuple[Any, ...]]]:
+        """
+        Run a query and return the rows of its last statement as tuples, without
+        loading them into a dataframe. Meant for queries returning a handful of rows.
+
+        :param sql: SQL query to execute
+        :param catalog: Optional catalog name
+        :param schema: Optional schema name
+        :param nullpool: Whether to use a new connection instead of a pooled one
+        :return: Tuple of (cursor description, rows)
+        """
+        cursor, rows = self._execute_sql_with_mutation_and_logging(
+            sql,
+            catalog,
+            schema,
+            fetch_last_result=True,
+            fetch_arrow=False,
+            nullpool=nullpool,
+        )
+        return cursor.description, cast(list[tuple[Any, ...]], rows or [])
+
     @event_logger.log_this
-    def fetch_rows(self, cursor: Any, last: bool) -> list[tuple[Any, ...]] | None:
+    def fetch_rows(
+        self, cursor: Any, last: bool
+    ) -> list[tuple[Any, ...]] | pa.Table | None:
         if not last:
             cursor.fetchall()
             return None
 
-        return self.db_engine_spec.fetch_data(cursor)
+        return self.db_engine_spec.fetch_results(cursor)
 
     @event_logger.log_this
     def load_into_dataframe(
         self,
         description: DbapiDescription,
-        data: list[tuple[Any, ...]],
+        data: list[tuple[Any, ...]] | pa.Table,
     ) -> pd.DataFrame:
         result_set = SupersetResultSet(
             data,
@@ -1094,15 +1223,19 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
             catalog=table.catalog,
             schema=table.schema,
         ) as inspector:
-            pk_constraint = inspector.get_pk_constraint(table.table, table.schema) or {}
+            return self._get_pk_constraint(inspector, table)
 
-            def _convert(value: Any) -> Any:
-                try:
-                    return json.base_json_conv(value)
-                except TypeError:
-                    return None
+    @staticmethod
+    def _get_pk_constraint(inspector: Inspector, table: Table) -> dict[str, Any]:
+        pk_constraint = inspector.get_pk_constraint(table.table, table.schema) or {}
 
-            return {key: _convert(value) for key, value in pk_constraint.items()}
+        def _convert(value: Any) -> Any:
+            try:
+                return json.base_json_conv(value)
+            except TypeError:
+                return None
+
+        return {key: _convert(value) for key, value in pk_constraint.items()}
 
     def get_foreign_keys(self, table: Table) -> list[dict[str, Any]]:
         with self.get_inspector(
@@ -1111,6 +1244,58 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         ) as inspector:
             return inspector.get_foreign_keys(table.table, table.schema)
 
+    @cache_util.memoized_func(
+        key=(
+            "db:{self.id}:catalog:{table.catalog}:schema:{table.schema}"
+            ":table:{table.table}:metadata"
+        ),
+        cache=cache_manager.cache,
+    )
+    def get_table_metadata(self, table: Table) -> TableMetadataResponse:
+        """Parameters need to be passed as keyword arguments.
+
+        For unused parameters, they are referenced in
+        cache_util.memoized_func decorator.
+
+        :param table: The table
+        :param cache: whether cache is enabled for the function
+        :param cache_timeout: timeout in seconds for the cache
+        :param force: whether to force refresh the cache
+        :return: Dict table metadata ready for API response
+        """
+        return get_table_metadata(self, table)
+
+    def get_table_metadata_bundle(self, table: Table) -> TableMetadataBundle:
+        """
+        Reflect the columns, keys, indexes and comment of a table and build its
+        ``select *`` statement, over a single engine and inspector.
+
+        :param table: The table to reflect
+        :return: The metadata of the table
+        """
+        with self.get_sqla_engine(catalog=table.catalog, schema=table.schema) as engine:
+            inspector = sqla.inspect(engine)
+            columns = self.db_engine_spec.get_columns(
+                inspector, table, self.schema_options
+            )
+            return {
+                "columns": columns,
+                "primary_key": self._get_pk_constraint(inspector, table),
+                "foreign_keys": inspector.get_foreign_keys(table.table, table.schema),
+                "indexes": self.db_engine_spec.get_indexes(self, inspector, table),
+                "comment": self.db_engine_spec.get_table_comment(inspector, table),
+                "select_star": self.db_engine_spec.select_star(
+                    self,
+                    table,
+                    engine=engine,
+                    limit=100,
+                    show_cols=False,
+                    indent=True,
+                    latest_partition=True,
+                    cols=columns,
+                ),
+            }
+
     def get_schema_access_for_file_upload(  # pylint: disable=invalid-name
         self,
     ) -> set[str]:
@@ -50,7 +50,7 @@ from superset.models.slice import Slice
 from superset.models.user_attributes import UserAttribute
 from superset.tasks.thumbnails import cache_dashboard_thumbnail
 from superset.tasks.utils import get_current_user
-from superset.thumbnails.digest import get_dashboard_digest
+from superset.thumbnails.digest import add_to_digest_batch, get_dashboard_digest
 from superset.utils import core as utils, json
 
 metadata = Model.metadata  # pylint: disable=no-member
@@ -471,6 +471,8 @@ def id_or_slug_filter(id_or_slug: int | str) -> BinaryExpression:
 
 OnDashboardChange = Callable[[Mapper, Connection, Dashboard], Any]
 
+sqla.event.listen(Dashboard, "load", add_to_digest_batch)
+
 if is_feature_enabled("THUMBNAILS_SQLA_LISTENERS"):
     update_thumbnail: OnDashboardChange = lambda _, __, dash: dash.update_thumbnail()  # noqa: E731
     sqla.event.listen(Dashboard, "after_insert", update_thumbnail)
@@ -905,7 +905,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         query_obj: QueryObjectDict,
         mutate: bool = True,
     ) -> QueryStringExtended:
-        sqlaq = self.get_sqla_query(**query_obj)
+        sqlaq = self.build_sqla_query(query_obj)
         sql = self.database.compile_sqla_query(
             sqlaq.sqla_query,
             catalog=self.catalog,
@@ -925,6 +925,13 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             sql=sql,
         )
 
+    def build_sqla_query(self, query_obj: QueryObjectDict) -> SqlaQuery:
+        """
+        Build the query for a query object. Datasources can override this to reuse a
+        query that was already built, e.g. while computing the cache key.
+        """
+        return self.get_sqla_query(**query_obj)
+
     def _normalize_prequery_result_type(
         self,
         row: pd.Series,
@@ -1417,12 +1424,51 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             )
         return and_(*l)
 
-    def values_for_column(  # pylint: disable=too-many-locals
+    def values_for_column(
         self,
         column_name: str,
         limit: int = 10000,
         denormalize_column: bool = False,
+        search: str | None = None,
+        force: bool = False,
     ) -> list[Any]:
+        """
+        Return the distinct values of a column, cached for `FILTER_VALUES_CACHE_TIMEOUT`
+        seconds.
+
+        :param column_name: The name of the column
+        :param limit: The maximum number of values fetched from the database
+        :param denormalize_column: Denormalize the column name before querying
+        :param search: Only return values containing this string, ignoring case
+        :param force: Fetch the values even if they're cached
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.utils.column_values import get_column_values
+
+        sql = self.get_values_for_column_sql(column_name, limit, denormalize_column)
+        return get_column_values(
+            self,
+            column_name,
+            sql,
+            fetch_values=lambda: self.fetch_values_for_column(sql),
+            refresh_kwargs={
+                "column_name": column_name,
+                "limit": limit,
+                "denormalize_column": denormalize_column,
+            },
+            search=search,
+            force=force,
+        )
+
+    def get_values_for_column_sql(
+        self,
+        column_name: str,
+        limit: int = 10000,
+        denormalize_column: bool = False,
+    ) -> str:
+        """
+        Return the SQL fetching the distinct values of a column.
+        """
         # denormalize column name before querying for values
         # unless disabled in the dataset configuration
         db_dialect = self.database.get_dialect()
@@ -1465,8 +1511,13 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             if engine.dialect.identifier_preparer._double_percents:
                 sql = sql.replace("%%", "%")
 
-            sql = self.database.mutate_sql_based_on_config(sql)
+        return self.database.mutate_sql_based_on_config(sql)
 
+    def fetch_values_for_column(self, sql: str) -> list[Any]:
+        """
+        Run the SQL returned by `get_values_for_column_sql`.
+        """
+        with self.database.get_sqla_engine() as engine:
             with engine.connect() as con:
                 df = pd.read_sql_query(sql=self.text(sql), con=con)
                 # replace NaN with None to ensure it can be serialized to JSON
@@ -44,7 +44,7 @@ from superset.legacy import update_time_range
 from superset.models.helpers import AuditMixinNullable, ImportExportMixin
 from superset.tasks.thumbnails import cache_chart_thumbnail
 from superset.tasks.utils import get_current_user
-from superset.thumbnails.digest import get_chart_digest
+from superset.thumbnails.digest import add_to_digest_batch, get_chart_digest
 from superset.utils import core as utils, json
 from superset.viz import BaseViz, viz_types
 
@@ -393,6 +393,7 @@ def event_after_chart_changed(
 
 sqla.event.listen(Slice, "before_insert", set_related_perm)
 sqla.event.listen(Slice, "before_update", set_related_perm)
+sqla.event.listen(Slice, "load", add_to_digest_batch)
 
 if is_feature_enabled("THUMBNAILS_SQLA_LISTENERS"):
     sqla.event.listen(Slice, "after_insert", event_after_chart_changed)
@@ -23,15 +23,18 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    event,
     Float,
     ForeignKey,
     Index,
+    inspect,
     Integer,
     String,
     Table,
     Text,
 )
-from sqlalchemy.orm import backref, relationship
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import backref, Mapper, relationship
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy_utils import UUIDType
 
@@ -149,6 +152,10 @@ class ReportSchedule(AuditMixinNullable, ExtraJSONMixin, Model):
         passive_deletes=True,
     )
 
+    # (Alerts/Reports) Next time the cron schedule fires, maintained by the scheduler.
+    # NULL when unknown, e.g. for new schedules or after the crontab was edited
+    next_run = Column(DateTime, nullable=True, index=True)
+
     # (Alerts) Stamped last observations
     last_eval_dttm = Column(DateTime)
     last_state = Column(String(50), default=ReportState.NOOP)
@@ -225,6 +232,7 @@ class ReportExecutionLog(Model):  # pylint: disable=too-few-public-methods
     # (Alerts) Observed values
     value = Column(Float)
     value_row_json = Column(MediumText())
+    query_duration_ms = Column(Float)
 
     state = Column(String(50), nullable=False)
     error_message = Column(Text)
@@ -242,3 +250,20 @@ class ReportExecutionLog(Model):  # pylint: disable=too-few-public-methods
         Index("ix_report_execution_log_report_schedule_id", report_schedule_id),
         Index("ix_report_execution_log_start_dttm", start_dttm),
     )
+
+
+def reset_next_run(
+    _mapper: Mapper, _connection: Connection, target: ReportSchedule
+) -> None:
+    """
+    Invalidate the next run computed by the scheduler when the schedule changes.
+    """
+    state = inspect(target)
+    if any(
+        state.attrs[attr].history.has_changes()
+        for attr in ("active", "crontab", "timezone")
+    ):
+        target.next_run = None
+
+
+event.listen(ReportSchedule, "before_update", reset_next_run)
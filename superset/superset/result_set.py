@@ -100,19 +100,17 @@ def convert_to_string(value: Any) -> str:
 
 
 class SupersetResultSet:
-    def __init__(  # pylint: disable=too-many-locals  # noqa: C901
+    def __init__(
         self,
-        data: DbapiResult,
+        data: DbapiResult | pa.Table,
         cursor_description: DbapiDescription,
         db_engine_spec: type[BaseEngineSpec],
     ):
         self.db_engine_spec = db_engine_spec
-        data = data or []
+        data = [] if data is None else data
         column_names: list[str] = []
-        pa_data: list[pa.Array] = []
+        pa_data: list[pa.Array | pa.ChunkedArray] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
-        numpy_dtype: list[tuple[str, ...]] = []
-        stringified_arr: NDArray[Any]
 
         if cursor_description:
             # get deduped list of column names
@@ -128,8 +126,41 @@ class SupersetResultSet:
                 )
             ]
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
+        if isinstance(data, pa.Table):
+            # drivers returning Arrow data don't need the row to column conversion
+            if not column_names:
+                column_names = dedup(data.column_names)
+            pa_data = [self.convert_arrow_column(column) for column in data.columns]
+        else:
+            pa_data = self.convert_rows(data, column_names)
+
+        if not pa_data:
+            column_names = []
+
+        self.table = pa.Table.from_arrays(pa_data, names=column_names)
+        self._type_dict: dict[str, Any] = {}
+        try:
+            # The driver may not be passing a cursor.description
+            self._type_dict = {
+                col: db_engine_spec.get_datatype(deduped_cursor_desc[i][1])
+                for i, col in enumerate(column_names)
+                if deduped_cursor_desc
+            }
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.exception(ex)
+
+    @classmethod
+    def convert_rows(  # noqa: C901
+        cls,
+        data: DbapiResult,
+        column_names: list[str],
+    ) -> list[pa.Array]:
+        """Convert rows returned by a DB-API cursor to a list of Arrow arrays"""
+        pa_data: list[pa.Array] = []
+        stringified_arr: NDArray[Any]
+
+        # generate numpy structured array dtype
+        numpy_dtype = [(column_name, "object") for column_name in column_names]
 
         # only do expensive recasting if datatype is not standard list of tuples
         if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
@@ -164,7 +195,7 @@ class SupersetResultSet:
                     # workaround for bug converting
                     # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
                     # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
+                    sample = cls.first_nonempty(array[column])
                     if sample and isinstance(sample, datetime.datetime):
                         try:
                             if sample.tzinfo:
@@ -178,20 +209,25 @@ class SupersetResultSet:
                         except Exception as ex:  # pylint: disable=broad-except
                             logger.exception(ex)
 
-        if not pa_data:
-            column_names = []
+        return pa_data
 
-        self.table = pa.Table.from_arrays(pa_data, names=column_names)
-        self._type_dict: dict[str, Any] = {}
-        try:
-            # The driver may not be passing a cursor.description
-            self._type_dict = {
-                col: db_engine_spec.get_datatype(deduped_cursor_desc[i][1])
-                for i, col in enumerate(column_names)
-                if deduped_cursor_desc
-            }
-        except Exception as ex:  # pylint: disable=broad-except
-            logger.exception(ex)
+    @staticmethod
+    def convert_arrow_column(column: pa.ChunkedArray) -> pa.ChunkedArray:
+        """
+        Normalize a column returned by a driver as Arrow data, so that it matches the
+        types produced when converting rows.
+        """
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(column.type.value_type)
+        if pa.types.is_large_string(column.type):
+            column = column.cast(pa.string())
+        if pa.types.is_nested(column.type):
+            # nested values are serialized as strings, like when converting rows
+            column = pa.chunked_array(
+                [stringify_values(np.array(column.to_pylist(), dtype=object))],
+                type=pa.string(),
+            )
+        return column
 
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
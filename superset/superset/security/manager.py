@@ -2592,13 +2592,63 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        # pylint: disable=import-outside-toplevel
+        from superset.connectors.sqla.models import RLSFilterTables
+
+        filter_tables = self.get_session.query(RLSFilterTables.c.rls_filter_id).filter(
+            RLSFilterTables.c.table_id == table.id
+        )
+        return self._get_rls_filters_query(filter_tables).all()
+
+    def get_rls_filters_by_table(
+        self,
+        tables: list["BaseDatasource"],
+    ) -> dict[int, list[SqlaQuery]]:
+        """
+        Retrieves the appropriate row level security filters for the current user and
+        each of the passed tables, in a single query.
+
+        :param tables: The tables to check against
+        :returns: The filters of each table, keyed by table id
+        """
+        filters: dict[int, list[SqlaQuery]] = defaultdict(list)
+        if not tables or not (hasattr(g, "user") and g.user is not None):
+            return filters
+
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
-            RLSFilterRoles,
             RLSFilterTables,
             RowLevelSecurityFilter,
         )
 
+        table_ids = {table.id for table in tables}
+        filter_tables = self.get_session.query(RLSFilterTables.c.rls_filter_id).filter(
+            RLSFilterTables.c.table_id.in_(table_ids)
+        )
+        query = (
+            self._get_rls_filters_query(filter_tables)
+            .join(
+                RLSFilterTables,
+                RLSFilterTables.c.rls_filter_id == RowLevelSecurityFilter.id,
+            )
+            .filter(RLSFilterTables.c.table_id.in_(table_ids))
+            .add_columns(RLSFilterTables.c.table_id)
+        )
+        for row in query.all():
+            filters[row.table_id].append(row)
+        return filters
+
+    def _get_rls_filters_query(self, filter_tables: SqlaQuery) -> SqlaQuery:
+        """
+        Build the query returning the row level security filters of the current user,
+        among the filters returned by `filter_tables`.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.connectors.sqla.models import (
+            RLSFilterRoles,
+            RowLevelSecurityFilter,
+        )
+
         user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.get_session.query(RLSFilterRoles.c.rls_filter_id)
@@ -2616,10 +2666,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             )
             .filter(RLSFilterRoles.c.role_id.in_(user_roles))
         )
-        filter_tables = self.get_session.query(RLSFilterTables.c.rls_filter_id).filter(
-            RLSFilterTables.c.table_id == table.id
-        )
-        query = (
+        return (
             self.get_session.query(
                 RowLevelSecurityFilter.id,
                 RowLevelSecurityFilter.group_key,
@@ -2641,7 +2688,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                 )
             )
         )
-        return query.all()
 
     def get_rls_sorted(self, table: "BaseDatasource") -> list["RowLevelSecurityFilter"]:
         """
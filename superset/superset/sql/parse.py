@@ -1432,38 +1432,46 @@ def process_jinja_sql(
     )
 
     processor = get_template_processor(database)
-    ast = processor.env.parse(sql)
-
     tables = set()
 
-    for node in ast.find_all(nodes.Call):
-        if isinstance(node.node, nodes.Getattr) and node.node.attr in (
-            "latest_partition",
-            "latest_sub_partition",
-        ):
-            # Try to extract the table referenced in the macro.
-            try:
-                tables.add(
-                    Table(
-                        *[
-                            remove_quotes(part.strip())
-                            for part in node.args[0].as_const().split(".")[::-1]
-                            if len(node.args) == 1
-                        ]
+    # SQL without template syntax goes through the processor unchanged
+    if processor.is_template_free(sql):
+        rendered_sql = sql
+    else:
+        ast = processor.env.parse(sql)
+
+        for node in ast.find_all(nodes.Call):
+            if isinstance(node.node, nodes.Getattr) and node.node.attr in (
+                "latest_partition",
+                "latest_sub_partition",
+            ):
+                # Try to extract the table referenced in the macro.
+                try:
+                    tables.add(
+                        Table(
+                            *[
+                                remove_quotes(part.strip())
+                                for part in node.args[0].as_const().split(".")[::-1]
+                                if len(node.args) == 1
+                            ]
+                        )
                     )
-                )
-            except nodes.Impossible:
-                pass
-
-            # Replace the potentially problematic Jinja macro with some benign SQL.
-            node.__class__ = nodes.TemplateData
-            node.fields = nodes.TemplateData.fields
-            node.data = "NULL"
-
-    # re-render template back into a string
-    code = processor.env.compile(ast)
-    template = Template.from_code(processor.env, code, globals=processor.env.globals)
-    rendered_sql = template.render(processor.get_context(), **(template_params or {}))
+                except nodes.Impossible:
+                    pass
+
+                # Replace the potentially problematic Jinja macro with some benign SQL.
+                node.__class__ = nodes.TemplateData
+                node.fields = nodes.TemplateData.fields
+                node.data = "NULL"
+
+        # re-render template back into a string
+        code = processor.env.compile(ast)
+        template = Template.from_code(
+            processor.env, code, globals=processor.env.globals
+        )
+        rendered_sql = template.render(
+            processor.get_context(), **(template_params or {})
+        )
 
     parsed_script = SQLScript(
         processor.process_template(rendered_sql),
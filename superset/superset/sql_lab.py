@@ -18,14 +18,30 @@
 import dataclasses
 import logging
 import sys
+import threading
+import time
 import uuid
-from contextlib import closing
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+)
+from contextlib import closing, contextmanager
 from datetime import datetime
 from sys import getsizeof
-from typing import Any, cast, Optional, TYPE_CHECKING, TypeVar, Union
+from typing import (
+    Any,
+    cast,
+    Iterator,
+    Optional,
+    TYPE_CHECKING,
+    TypeVar,
+    Union,
+)
 
 import backoff
 import msgpack
+import pyarrow as pa
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app as app, has_app_context
 from flask_babel import gettext as __
@@ -34,6 +50,7 @@ from superset import (
     db,
     is_feature_enabled,
     results_backend,
+    results_backend_use_arrow,
     results_backend_use_msgpack,
     security_manager,
 )
@@ -56,13 +73,15 @@ from superset.extensions import celery_app, event_logger
 from superset.models.sql_lab import Query
 from superset.result_set import SupersetResultSet
 from superset.sql.parse import BaseSQLStatement, CTASMethod, SQLScript, Table
+from superset.sqllab.compression import compress_results
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.sqllab.utils import write_ipc_buffer
+from superset.sqllab.results_reuse import store_reusable_query
+from superset.sqllab.utils import write_arrow_payload, write_ipc_buffer
 from superset.utils import json
 from superset.utils.core import (
+    get_username,
     override_user,
     QuerySource,
-    zlib_compress,
 )
 from superset.utils.dates import now_as_float
 from superset.utils.decorators import stats_timing
@@ -73,6 +92,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 BYTES_IN_MB = 1024 * 1024
+# Minimum number of seconds between two updates of the progress of a query fetching
+# its results in chunks
+FETCH_PROGRESS_INTERVAL = 1
 
 
 class SqlLabException(Exception):  # noqa: N818
@@ -281,7 +303,15 @@ def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # no
                     str(query.to_dict()),
                 )
                 increased_limit = None if query.limit is None else query.limit + 1
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
+                if chunk_size := app.config["SQLLAB_FETCH_CHUNK_SIZE"]:
+                    data = fetch_results_in_chunks(
+                        query,
+                        cursor,
+                        increased_limit,
+                        chunk_size,
+                    )
+                else:
+                    data = db_engine_spec.fetch_results(cursor, increased_limit)
                 if query.limit is None or len(data) <= query.limit:
                     query.limiting_factor = LimitingFactor.NOT_LIMITED
                 else:
@@ -321,6 +351,61 @@ def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # no
     return SupersetResultSet(data, cursor_description, db_engine_spec)
 
 
+def fetch_results_in_chunks(
+    query: Query,
+    cursor: Any,
+    limit: Optional[int],
+    chunk_size: int,
+) -> Union[list[Any], pa.Table]:
+    """
+    Fetch the results of a query in chunks, reporting the number of rows fetched so far
+    in the query progress at most every `FETCH_PROGRESS_INTERVAL` seconds, and stopping
+    if the query is stopped. The rows are only returned once all of them are fetched.
+    """
+    db_engine_spec = query.database.db_engine_spec
+    chunks: list[Union[list[Any], pa.Table]] = []
+    rows = 0
+    last_progress = time.monotonic()
+    for chunk in db_engine_spec.fetch_data_chunks(cursor, limit, chunk_size):
+        chunks.append(chunk)
+        rows += len(chunk)
+        if time.monotonic() - last_progress < FETCH_PROGRESS_INTERVAL:
+            continue
+
+        _set_fetch_progress(query, rows)
+        db.session.commit()
+        last_progress = time.monotonic()
+
+        # stop fetching if the query was stopped in another thread/worker
+        db.session.refresh(query)
+        if query.status == QueryStatus.STOPPED:
+            raise SqlLabQueryStoppedException()
+
+    _set_fetch_progress(query, rows)
+    return _concat_chunks(chunks)
+
+
+def _set_fetch_progress(query: Query, rows: int) -> None:
+    msg = __("Fetched %(rows)s rows", rows=rows)
+    logger.debug("Query %d: %s", query.id, msg)
+    query.rows = rows
+    query.set_extra_json_key("progress", msg)
+
+
+def _concat_chunks(
+    chunks: list[Union[list[Any], pa.Table]],
+) -> Union[list[Any], pa.Table]:
+    if chunks and isinstance(chunks[0], pa.Table):
+        return pa.concat_tables(chunks)
+    return [row for chunk in chunks for row in chunk]
+
+
+def _get_results_cache_timeout(database: "Database") -> int:
+    if database.cache_timeout is None:
+        return app.config["CACHE_DEFAULT_TIMEOUT"]
+    return database.cache_timeout
+
+
 def _serialize_payload(
     payload: dict[Any, Any], use_msgpack: Optional[bool] = False
 ) -> Union[bytes, str]:
@@ -369,6 +454,217 @@ def _serialize_and_expand_data(
     return (data, selected_columns, all_columns, expanded_columns)
 
 
+def _get_statements_concurrency(query: Query, parsed_script: SQLScript) -> int:
+    """
+    Return how many statements of a script can run at the same time.
+
+    Only scripts made exclusively of SELECT statements run concurrently, since their
+    statements don't depend on each other; any other script runs sequentially on a
+    single connection.
+
+    Statements run concurrently are executed directly and their cancel id is read
+    before running them, so engines which handle the cursor while the query runs
+    (e.g. to poll its progress or its query id, like Presto and Trino), or which only
+    know the query id after running it, run sequentially too.
+    """
+    concurrency = app.config["SQLLAB_STATEMENTS_CONCURRENCY"]
+    statement_count = len(parsed_script.statements)
+    db_engine_spec = query.database.db_engine_spec
+    if (
+        concurrency <= 1
+        or statement_count <= 1
+        or query.select_as_cta
+        or db_engine_spec.run_multiple_statements_as_one
+        or not db_engine_spec.has_query_id_before_execute
+        or _overrides(db_engine_spec, "handle_cursor")
+        or _overrides(db_engine_spec, "execute_with_cursor")
+        or not all(
+            statement.is_select() and not statement.is_mutating()
+            for statement in parsed_script.statements
+        )
+    ):
+        return 1
+
+    return min(concurrency, statement_count)
+
+
+def _overrides(db_engine_spec: type[BaseEngineSpec], name: str) -> bool:
+    """
+    Return whether an engine spec overrides a class method of `BaseEngineSpec`.
+    """
+    return (
+        getattr(db_engine_spec, name).__func__
+        is not getattr(BaseEngineSpec, name).__func__
+    )
+
+
+def _execute_block_concurrently(  # pylint: disable=too-many-arguments
+    flask_app: Any,
+    query_id: int,
+    username: Optional[str],
+    sql: str,
+    log_params: Optional[dict[str, Any]],
+    stopped: threading.Event,
+    cancel_query_ids: dict[int, str],
+    block_index: int,
+) -> int:
+    """
+    Execute a block of a query on its own connection, returning the number of rows.
+
+    Runs in a thread, so the app context and the user are set up again. The cancel id
+    of the connection is recorded in `cancel_query_ids`, and the block stops fetching
+    rows once `stopped` is set or the query is stopped.
+    """
+    with flask_app.app_context():
+        user = security_manager.find_user(username) if username else None
+        with override_user(user):
+            query = get_query(query_id)
+            database: Database = query.database
+            db_engine_spec = database.db_engine_spec
+
+            if log_query := app.config["QUERY_LOGGER"]:
+                log_query(
+                    database.sqlalchemy_uri,
+                    sql,
+                    query.schema,
+                    __name__,
+                    security_manager,
+                    log_params,
+                )
+
+            try:
+                with database.get_raw_connection(
+                    catalog=query.catalog,
+                    schema=query.schema,
+                    source=QuerySource.SQL_LAB,
+                ) as conn:
+                    cursor = conn.cursor()
+                    cancel_query_id = db_engine_spec.get_cancel_query_id(cursor, query)
+                    if cancel_query_id is not None:
+                        cancel_query_ids[block_index] = cancel_query_id
+                    db_engine_spec.execute(cursor, sql, database)
+                    # only the number of rows is kept, so the rows are counted chunk
+                    # by chunk rather than loaded all at once
+                    rows = 0
+                    for chunk in db_engine_spec.fetch_data_chunks(
+                        cursor,
+                        query.limit,
+                        app.config["SQLLAB_FETCH_CHUNK_SIZE"] or 10000,
+                    ):
+                        rows += len(chunk)
+                        db.session.refresh(query)
+                        if stopped.is_set() or query.status == QueryStatus.STOPPED:
+                            raise SqlLabQueryStoppedException()
+            except (OAuth2RedirectError, SqlLabQueryStoppedException):
+                raise
+            except Exception as ex:
+                # the block is cancelled when the script is stopped or fails
+                if stopped.is_set():
+                    raise SqlLabQueryStoppedException() from ex
+                db.session.refresh(query)
+                if query.status == QueryStatus.STOPPED:
+                    raise SqlLabQueryStoppedException() from ex
+
+                logger.debug("Query %d: %s", query_id, ex)
+                raise SqlLabException(db_engine_spec.extract_error_message(ex)) from ex
+
+            return rows if query.limit is None else min(rows, query.limit)
+
+
+@contextmanager
+def _execute_blocks_concurrently(
+    query: Query,
+    blocks: list[str],
+    concurrency: int,
+    log_params: Optional[dict[str, Any]],
+) -> Iterator[list[Future[int]]]:
+    """
+    Execute all the blocks but the last one in a thread pool, yielding their futures.
+
+    The last block is run by the caller, on the connection used to cancel the query.
+    On exit, blocks that didn't start yet are cancelled, and the queries of the blocks
+    still running are cancelled in the database.
+    """
+    if concurrency <= 1:
+        yield []
+        return
+
+    flask_app = app._get_current_object()  # pylint: disable=protected-access
+    username = get_username()
+    stopped = threading.Event()
+    cancel_query_ids: dict[int, str] = {}
+    executor = ThreadPoolExecutor(max_workers=concurrency - 1)
+    futures: list[Future[int]] = []
+    try:
+        futures = [
+            executor.submit(
+                _execute_block_concurrently,
+                flask_app,
+                query.id,
+                username,
+                query.database.mutate_sql_based_on_config(block),
+                log_params,
+                stopped,
+                cancel_query_ids,
+                i,
+            )
+            for i, block in enumerate(blocks[:-1])
+        ]
+        yield futures
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        _cancel_queries(
+            query,
+            [
+                cancel_query_id
+                for i, cancel_query_id in list(cancel_query_ids.items())
+                if i >= len(futures) or not futures[i].done()
+            ],
+        )
+
+
+def _cancel_queries(query: Query, cancel_query_ids: list[str]) -> None:
+    """
+    Cancel the queries of the blocks of a script still running in the database.
+    """
+    if not cancel_query_ids:
+        return
+
+    db_engine_spec = query.database.db_engine_spec
+    try:
+        with query.database.get_sqla_engine(
+            catalog=query.catalog,
+            schema=query.schema,
+            source=QuerySource.SQL_LAB,
+        ) as engine:
+            with closing(engine.raw_connection()) as conn:
+                with closing(conn.cursor()) as cursor:
+                    for cancel_query_id in cancel_query_ids:
+                        db_engine_spec.cancel_query(cursor, query, cancel_query_id)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning(
+            "Query %d: Unable to cancel the blocks still running",
+            query.id,
+            exc_info=True,
+        )
+
+
+def _get_block_rows(query: Query, future: Future[int]) -> int:
+    """
+    Wait for a block run in a thread, returning its number of rows.
+
+    Raises `SqlLabQueryStoppedException` if the query is stopped while waiting.
+    """
+    while True:
+        try:
+            return future.result(timeout=1)
+        except FutureTimeoutError:
+            db.session.refresh(query)
+            if query.status == QueryStatus.STOPPED:
+                raise SqlLabQueryStoppedException() from None
+
+
 def execute_sql_statements(  # noqa: C901
     # pylint: disable=too-many-arguments, too-many-locals, too-many-statements, too-many-branches
     query_id: int,
@@ -452,11 +748,18 @@ def execute_sql_statements(  # noqa: C901
             for statement in parsed_script.statements
         ]
 
-    with database.get_raw_connection(
-        catalog=query.catalog,
-        schema=query.schema,
-        source=QuerySource.SQL_LAB,
-    ) as conn:
+    # independent statements run concurrently on their own connections, except for the
+    # last one
+    concurrency = _get_statements_concurrency(query, parsed_script)
+
+    with (
+        database.get_raw_connection(
+            catalog=query.catalog,
+            schema=query.schema,
+            source=QuerySource.SQL_LAB,
+        ) as conn,
+        _execute_blocks_concurrently(query, blocks, concurrency, log_params) as futures,
+    ):
         # Sharing a single connection and cursor across the
         # execution of all statements (if many)
         cursor = conn.cursor()
@@ -467,7 +770,7 @@ def execute_sql_statements(  # noqa: C901
             db.session.commit()
 
         block_count = len(blocks)
-        for i, block in enumerate(blocks):
+        for i, block in enumerate(blocks[len(futures) :], start=len(futures)):
             # Check if stopped
             db.session.refresh(query)
             if query.status == QueryStatus.STOPPED:
@@ -506,6 +809,22 @@ def execute_sql_statements(  # noqa: C901
                 payload = handle_query_error(ex, query, payload, prefix_message)
                 return payload
 
+        statement_rows = []
+        for i, future in enumerate(futures):
+            try:
+                statement_rows.append(_get_block_rows(query, future))
+            except SqlLabQueryStoppedException:
+                payload.update({"status": QueryStatus.STOPPED})
+                return payload
+            except Exception as ex:  # pylint: disable=broad-except
+                prefix_message = __(
+                    "Block %(block_num)s out of %(block_count)s",
+                    block_num=i + 1,
+                    block_count=block_count,
+                )
+                payload = handle_query_error(ex, query, payload, prefix_message)
+                return payload
+
         # Commit the connection so CTA queries will create the table and any DML.
         if parsed_script.has_mutation() or query.select_as_cta:
             conn.commit()
@@ -515,6 +834,9 @@ def execute_sql_statements(  # noqa: C901
     query.progress = 100
     query.set_extra_json_key("progress", None)
     query.set_extra_json_key("columns", result_set.columns)
+    if futures:
+        # only the results of the last block are returned, keep track of the others
+        query.set_extra_json_key("statement_rows", [*statement_rows, result_set.size])
     if query.select_as_cta:
         query.select_sql = database.select_star(
             Table(query.tmp_table_name, query.tmp_schema_name),
@@ -524,10 +846,25 @@ def execute_sql_statements(  # noqa: C901
         )
     query.end_time = now_as_float()
 
-    use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
-    data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
-        result_set, db_engine_spec, use_arrow_data, expand_data
+    use_arrow_results = store_results and cast(bool, results_backend_use_arrow)
+    use_arrow_data = use_arrow_results or (
+        store_results and cast(bool, results_backend_use_msgpack)
     )
+    if use_arrow_results:
+        # the Arrow table is stored as-is, and expanded when loading data from the
+        # results backend
+        data: Union[bytes, str, list[Any]] = []
+        selected_columns = all_columns = result_set.columns
+        expanded_columns = []
+    else:
+        (
+            data,
+            selected_columns,
+            all_columns,
+            expanded_columns,
+        ) = _serialize_and_expand_data(
+            result_set, db_engine_spec, use_arrow_data, expand_data
+        )
 
     # TODO: data should be saved separately from metadata (likely in Parquet)
     payload.update(
@@ -553,9 +890,16 @@ def execute_sql_statements(  # noqa: C901
             with stats_timing(
                 "sqllab.query.results_backend_write_serialization", stats_logger
             ):
-                serialized_payload = _serialize_payload(
-                    payload, cast(bool, results_backend_use_msgpack)
-                )
+                if use_arrow_results:
+                    # nested data is expanded when loading the results, if asked
+                    serialized_payload = write_arrow_payload(
+                        result_set.pa_table,
+                        {**payload, "expand_data": expand_data},
+                    )
+                else:
+                    serialized_payload = _serialize_payload(
+                        payload, cast(bool, results_backend_use_msgpack)
+                    )
 
                 # Check the size of the serialized payload
                 if sql_lab_payload_max_mb := app.config.get("SQLLAB_PAYLOAD_MAX_MB"):
@@ -572,17 +916,15 @@ def execute_sql_statements(  # noqa: C901
                             )
                         )
 
-            cache_timeout = database.cache_timeout
-            if cache_timeout is None:
-                cache_timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
-
-            compressed = zlib_compress(serialized_payload)
+            cache_timeout = _get_results_cache_timeout(database)
+            compressed = compress_results(serialized_payload)
             logger.debug(
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
             )
             logger.debug("*** compressed payload size: %i", getsizeof(compressed))
             results_backend.set(key, compressed, cache_timeout)
         query.results_key = key
+        store_reusable_query(query, cache_timeout)
 
     query.status = QueryStatus.SUCCESS
     db.session.commit()
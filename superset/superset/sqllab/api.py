@@ -58,7 +58,7 @@ from superset.sqllab.sql_json_executer import (
     SynchronousSqlJsonExecutor,
 )
 from superset.sqllab.sqllab_execution_context import SqlJsonExecutionContext
-from superset.sqllab.utils import bootstrap_sqllab_data
+from superset.sqllab.utils import ARROW_STREAM_MIMETYPE, bootstrap_sqllab_data
 from superset.sqllab.validators import CanAccessQueryValidatorImpl
 from superset.superset_typing import FlaskResponse
 from superset.utils import core as utils, json
@@ -321,6 +321,10 @@ class SqlLabRestApi(BaseSupersetApi):
                 application/json:
                   schema:
                     $ref: '#/components/schemas/QueryExecutionResponseSchema'
+                application/vnd.apache.arrow.stream:
+                  schema:
+                    type: string
+                    format: binary
             400:
               $ref: '#/components/responses/400'
             401:
@@ -337,7 +341,20 @@ class SqlLabRestApi(BaseSupersetApi):
         params = kwargs["rison"]
         key = params.get("key")
         rows = params.get("rows")
-        result = SqlExecutionResultsCommand(key=key, rows=rows).run()
+        command = SqlExecutionResultsCommand(key=key, rows=rows)
+
+        # clients that accept Arrow get the stored IPC stream (with the payload in
+        # the schema metadata), skipping the conversion to JSON
+        if (
+            request.accept_mimetypes.best_match(
+                ["application/json", ARROW_STREAM_MIMETYPE]
+            )
+            == ARROW_STREAM_MIMETYPE
+        ):
+            if (buffer := command.run_arrow()) is not None:
+                return Response(buffer, status=200, mimetype=ARROW_STREAM_MIMETYPE)
+
+        result = command.run()
 
         # Using pessimistic json serialization since some database drivers can return
         # unserializeable types at times
@@ -0,0 +1,272 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compression codecs for payloads stored in the SQL Lab results backend.
+
+Blobs written by `compress_results` start with a small header identifying the codec
+that was used, so the codec can be changed in the config without invalidating entries
+that are already stored. Blobs without a header are legacy zlib payloads.
+"""
+
+from __future__ import annotations
+
+import logging
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from typing import Any, Protocol
+
+from flask import current_app as app
+
+from superset.exceptions import SerializationError
+from superset.utils.decorators import stats_timing
+
+logger = logging.getLogger(__name__)
+
+# The magic prefix can't be confused with a legacy zlib stream, which always starts
+# with a CMF byte whose lower nibble is 8 (e.g. 0x78).
+HEADER_MAGIC = b"\x00SRB"
+HEADER_SIZE = len(HEADER_MAGIC) + 1
+
+
+class StreamCompressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class StreamDecompressor(Protocol):
+    def decompress(self, data: bytes) -> bytes: ...
+
+
+class ResultsCodec(ABC):
+    """
+    A compression codec for results backend payloads.
+
+    Codecs compress and decompress in chunks, so that large payloads don't need to be
+    copied in full by the compression library.
+    """
+
+    name: str
+    codec_id: int
+
+    @abstractmethod
+    def compressor(self) -> StreamCompressor: ...
+
+    @abstractmethod
+    def decompressor(self) -> StreamDecompressor: ...
+
+    def compress(self, data: bytes, chunk_size: int) -> Iterator[bytes]:
+        compressor = self.compressor()
+        view = memoryview(data)
+        for offset in range(0, len(view), chunk_size):
+            if chunk := compressor.compress(view[offset : offset + chunk_size]):
+                yield chunk
+        if chunk := compressor.flush():
+            yield chunk
+
+    def decompress(self, data: bytes | memoryview, chunk_size: int) -> Iterator[bytes]:
+        decompressor = self.decompressor()
+        view = memoryview(data)
+        for offset in range(0, len(view), chunk_size):
+            if chunk := decompressor.decompress(view[offset : offset + chunk_size]):
+                yield chunk
+        if hasattr(decompressor, "flush") and (chunk := decompressor.flush()):
+            yield chunk
+
+
+class _NoopCompressor:
+    def compress(self, data: bytes) -> bytes:
+        return bytes(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+    def decompress(self, data: bytes) -> bytes:
+        return bytes(data)
+
+
+class NoneCodec(ResultsCodec):
+    name = "none"
+    codec_id = 0
+
+    def compressor(self) -> StreamCompressor:
+        return _NoopCompressor()
+
+    def decompressor(self) -> StreamDecompressor:
+        return _NoopCompressor()
+
+
+class ZlibCodec(ResultsCodec):
+    name = "zlib"
+    codec_id = 1
+
+    def __init__(self, level: int = zlib.Z_DEFAULT_COMPRESSION) -> None:
+        self.level = level
+
+    def compressor(self) -> StreamCompressor:
+        return zlib.compressobj(self.level)
+
+    def decompressor(self) -> StreamDecompressor:
+        return zlib.decompressobj()
+
+
+class ZstdCodec(ResultsCodec):
+    name = "zstd"
+    codec_id = 2
+
+    def __init__(self, level: int = 3) -> None:
+        # pylint: disable=import-outside-toplevel
+        import zstandard
+
+        self._zstandard = zstandard
+        self.level = level
+
+    def compressor(self) -> StreamCompressor:
+        return self._zstandard.ZstdCompressor(level=self.level).compressobj()
+
+    def decompressor(self) -> StreamDecompressor:
+        return self._zstandard.ZstdDecompressor().decompressobj()
+
+
+class _LZ4Compressor:
+    def __init__(self, compressor: Any) -> None:
+        self._compressor = compressor
+        self._header = compressor.begin()
+
+    def compress(self, data: bytes) -> bytes:
+        header, self._header = self._header, b""
+        return header + self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        header, self._header = self._header, b""
+        return header + self._compressor.flush()
+
+
+class LZ4Codec(ResultsCodec):
+    name = "lz4"
+    codec_id = 3
+
+    def __init__(self, level: int = 0) -> None:
+        # pylint: disable=import-outside-toplevel
+        import lz4.frame
+
+        self._lz4_frame = lz4.frame
+        self.level = level
+
+    def compressor(self) -> StreamCompressor:
+        return _LZ4Compressor(
+            self._lz4_frame.LZ4FrameCompressor(compression_level=self.level)
+        )
+
+    def decompressor(self) -> StreamDecompressor:
+        return self._lz4_frame.LZ4FrameDecompressor()
+
+
+RESULTS_CODECS: dict[str, type[ResultsCodec]] = {
+    codec.name: codec for codec in (NoneCodec, ZlibCodec, ZstdCodec, LZ4Codec)
+}
+RESULTS_CODECS_BY_ID: dict[int, type[ResultsCodec]] = {
+    codec.codec_id: codec for codec in RESULTS_CODECS.values()
+}
+
+
+def get_results_codec(name: str, **kwargs: Any) -> ResultsCodec:
+    """
+    Return an instance of the codec registered under `name`.
+
+    :raises SerializationError: if the codec is unknown or its library is missing
+    """
+    try:
+        codec_class = RESULTS_CODECS[name]
+    except KeyError as ex:
+        raise SerializationError(f"Unknown results backend codec: {name}") from ex
+    try:
+        return codec_class(**kwargs)
+    except ImportError as ex:
+        raise SerializationError(
+            f"The `{name}` results backend codec requires a package that is not "
+            "installed"
+        ) from ex
+
+
+def compress_results(data: bytes | str) -> bytes:
+    """
+    Compress a serialized results payload with the codec configured in
+    `RESULTS_BACKEND_COMPRESSION`, prefixing it with the codec header.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    config = app.config["RESULTS_BACKEND_COMPRESSION"]
+    codec = get_results_codec(config["codec"], **config.get("options", {}))
+    stats_logger = app.config["STATS_LOGGER"]
+
+    with stats_timing(f"sqllab.results_backend.compress.{codec.name}", stats_logger):
+        blob = b"".join(
+            [
+                HEADER_MAGIC,
+                bytes([codec.codec_id]),
+                *codec.compress(data, config["chunk_size"]),
+            ]
+        )
+
+    if data:
+        stats_logger.gauge(
+            f"sqllab.results_backend.compression_ratio.{codec.name}",
+            len(data) / len(blob),
+        )
+    logger.debug(
+        "Compressed results payload with %s: %i -> %i bytes",
+        codec.name,
+        len(data),
+        len(blob),
+    )
+    return blob
+
+
+def decompress_results(blob: bytes, decode: bool = True) -> bytes | str:
+    """
+    Decompress a blob read from the results backend. Blobs without a codec header
+    are assumed to be legacy zlib payloads.
+
+    :raises SerializationError: if the blob was written with an unknown codec
+    """
+    if isinstance(blob, str):
+        blob = blob.encode("utf-8")
+
+    if blob[: len(HEADER_MAGIC)] == HEADER_MAGIC:
+        codec_id = blob[len(HEADER_MAGIC)]
+        if codec_id not in RESULTS_CODECS_BY_ID:
+            raise SerializationError(f"Unknown results backend codec id: {codec_id}")
+        codec = get_results_codec(RESULTS_CODECS_BY_ID[codec_id].name)
+        body: bytes | memoryview = memoryview(blob)[HEADER_SIZE:]
+    else:
+        codec = ZlibCodec()
+        body = blob
+
+    stats_logger = app.config["STATS_LOGGER"]
+    chunk_size = app.config["RESULTS_BACKEND_COMPRESSION"]["chunk_size"]
+    with stats_timing(f"sqllab.results_backend.decompress.{codec.name}", stats_logger):
+        try:
+            decompressed = b"".join(codec.decompress(body, chunk_size))
+        except Exception as ex:
+            raise SerializationError(
+                f"Could not decompress results with the {codec.name} codec"
+            ) from ex
+
+    return decompressed.decode("utf-8") if decode else decompressed
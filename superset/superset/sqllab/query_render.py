@@ -73,7 +73,9 @@ class SqlQueryRenderImpl(SqlQueryRender):
         rendered_query: str,
         sql_template_processor: BaseTemplateProcessor,
     ) -> None:
-        if is_feature_enabled("ENABLE_TEMPLATE_PROCESSING"):
+        if is_feature_enabled(
+            "ENABLE_TEMPLATE_PROCESSING"
+        ) and not sql_template_processor.is_template_free(rendered_query):
             syntax_tree = sql_template_processor.env.parse(rendered_query)
             undefined_parameters = find_undeclared_variables(syntax_tree)
             if undefined_parameters:
@@ -0,0 +1,180 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Reuse of the results of identical SQL Lab queries.
+
+When a database has a results reuse max age, queries storing their results in the
+results backend also store a small entry pointing to them, keyed by everything that can
+change the results: the database, catalog and schema, the normalized rendered SQL, the
+user running the query (who is impersonated and whose RLS filters apply), the RLS
+predicates and the limit. Identical queries run within the max age are then served from
+the results backend instead of the database.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, TYPE_CHECKING
+
+from superset import db, is_feature_enabled, results_backend
+from superset.common.db_query_status import QueryStatus
+from superset.exceptions import SupersetParseError
+from superset.models.sql_lab import Query
+from superset.sql.parse import SQLScript, Table
+from superset.utils.core import get_username
+from superset.utils.dates import now_as_float
+from superset.utils.hashing import md5_sha_from_dict
+from superset.utils.rls import get_predicates_for_table
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+
+logger = logging.getLogger(__name__)
+
+# key in the query extra storing the results reuse key of the query
+RESULTS_REUSE_KEY = "results_reuse_key"
+
+
+def get_results_reuse_key(
+    query: Query,
+    rendered_query: str,
+    expand_data: bool = False,
+) -> str | None:
+    """
+    Return the key identifying the results of a query, or `None` if the results of
+    the query can't be reused.
+
+    :param query: The SQL Lab query, with its limit already set
+    :param rendered_query: The SQL of the query, with templates rendered
+    :param expand_data: Whether nested fields are expanded in the results
+    """
+    database: Database = query.database
+    if not results_backend or not database.results_reuse_max_age:
+        return None
+    if query.select_as_cta:
+        return None
+
+    try:
+        script = SQLScript(rendered_query, engine=database.db_engine_spec.engine)
+        if script.has_mutation():
+            return None
+        sql = script.format(comments=False)
+    except SupersetParseError:
+        return None
+
+    return "sqllab_results_" + md5_sha_from_dict(
+        {
+            "database_id": database.id,
+            "catalog": query.catalog,
+            "schema": query.schema,
+            "sql": sql,
+            "username": get_username(),
+            "rls": _get_rls_predicates(query, script),
+            "limit": query.limit,
+            "expand_data": expand_data,
+        }
+    )
+
+
+def _get_rls_predicates(query: Query, script: SQLScript) -> list[str]:
+    """
+    Return the RLS predicates applied to the tables of the query in SQL Lab.
+    """
+    if not is_feature_enabled("RLS_IN_SQLLAB"):
+        return []
+
+    database: Database = query.database
+    default_schema = database.get_default_schema_for_query(query)
+    default_catalog = database.get_default_catalog()
+    predicates = set()
+    for statement in script.statements:
+        for table in statement.tables:
+            table = Table(
+                table.table,
+                table.schema or default_schema,
+                table.catalog or query.catalog,
+            )
+            predicates.update(
+                f"{table}: {predicate}"
+                for predicate in get_predicates_for_table(
+                    table,
+                    database,
+                    default_catalog,
+                )
+            )
+
+    return sorted(predicates)
+
+
+def get_reusable_query(key: str, max_age: int) -> Query | None:
+    """
+    Return the last successful query with the results reuse key, if it finished
+    less than `max_age` seconds ago and its results are still stored.
+    """
+    entry: dict[str, Any] | None = results_backend.get(key)
+    if not entry or now_as_float() - entry["dttm"] > max_age * 1000:
+        return None
+
+    query = (
+        db.session.query(Query)
+        .filter_by(
+            id=entry["query_id"],
+            results_key=entry["results_key"],
+            status=QueryStatus.SUCCESS,
+        )
+        .one_or_none()
+    )
+    if not query or not results_backend.has(query.results_key):
+        return None
+
+    return query
+
+
+def store_reusable_query(query: Query, timeout: int) -> None:
+    """
+    Point the results reuse key of a successful query to its results.
+
+    :param query: The query, with its results stored in the results backend
+    :param timeout: The timeout of the results in the results backend
+    """
+    if not results_backend or not (key := query.extra.get(RESULTS_REUSE_KEY)):
+        return
+
+    results_backend.set(
+        key,
+        {
+            "query_id": query.id,
+            "results_key": query.results_key,
+            "dttm": query.end_time,
+        },
+        timeout,
+    )
+
+
+def reuse_query_results(query: Query, reused_query: Query) -> None:
+    """
+    Mark a query as successful, with the stored results of an identical query.
+    """
+    query.status = QueryStatus.SUCCESS
+    query.results_key = reused_query.results_key
+    query.rows = reused_query.rows
+    query.limiting_factor = reused_query.limiting_factor
+    query.executed_sql = reused_query.executed_sql
+    query.progress = 100
+    query.start_running_time = query.end_time = now_as_float()
+    query.set_extra_json_key("columns", reused_query.extra.get("columns"))
+    query.set_extra_json_key("reused_query_id", reused_query.id)
@@ -66,6 +66,7 @@ class ExecutePayloadSchema(Schema):
     json = fields.Boolean(allow_none=True)
     runAsync = fields.Boolean(allow_none=True)  # noqa: N815
     expand_data = fields.Boolean(allow_none=True)
+    force = fields.Boolean(allow_none=True)
 
 
 class QueryResultSchema(Schema):
@@ -56,6 +56,7 @@ class SqlJsonExecutionContext:  # pylint: disable=too-many-instance-attributes
     tab_name: str
     user_id: int | None
     expand_data: bool
+    force: bool
     create_table_as_select: CreateTableAsSelect | None
     database: Database | None
     query: Query
@@ -92,6 +93,7 @@ class SqlJsonExecutionContext:  # pylint: disable=too-many-instance-attributes
             is_feature_enabled("PRESTO_EXPAND_DATA")
             and query_params.get("expand_data"),
         )
+        self.force = cast(bool, query_params.get("force"))
 
     @staticmethod
     def _get_template_params(query_params: dict[str, Any]) -> dict[str, Any]:
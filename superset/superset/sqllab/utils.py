@@ -24,6 +24,13 @@ from superset import db, is_feature_enabled
 from superset.common.db_query_status import QueryStatus
 from superset.daos.database import DatabaseDAO
 from superset.models.sql_lab import TabState
+from superset.utils import json
+
+ARROW_STREAM_MIMETYPE = "application/vnd.apache.arrow.stream"
+# key of the schema metadata holding the results payload, minus the data
+ARROW_PAYLOAD_METADATA_KEY = b"superset_payload"
+# every Arrow IPC stream starts with a continuation marker
+ARROW_STREAM_PREFIX = b"\xff\xff\xff\xff"
 
 DATABASE_KEYS = [
     "allow_file_upload",
@@ -80,6 +87,42 @@ def write_ipc_buffer(table: pa.Table) -> pa.Buffer:
     return sink.getvalue()
 
 
+def write_arrow_payload(table: pa.Table, payload: dict[str, Any]) -> bytes:
+    """
+    Serialize a results payload as an Arrow IPC stream. The data is stored as the
+    table itself, while the remaining keys of the payload are stored as JSON in the
+    schema metadata.
+    """
+    metadata = {
+        ARROW_PAYLOAD_METADATA_KEY: json.dumps(
+            {key: value for key, value in payload.items() if key != "data"},
+            default=json.json_iso_dttm_ser,
+            ignore_nan=True,
+        )
+    }
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), **metadata})
+    return write_ipc_buffer(table).to_pybytes()
+
+
+def is_arrow_payload(payload: bytes | str) -> bool:
+    return isinstance(payload, bytes) and payload.startswith(ARROW_STREAM_PREFIX)
+
+
+def read_arrow_payload(
+    payload: bytes,
+    rows: int | None = None,
+) -> tuple[pa.Table, dict[str, Any]]:
+    """
+    Read a payload written by `write_arrow_payload`, returning the table (limited to
+    the first `rows` rows, if set) and the payload metadata.
+    """
+    table = pa.ipc.open_stream(pa.BufferReader(payload)).read_all()
+    metadata = json.loads(table.schema.metadata[ARROW_PAYLOAD_METADATA_KEY])
+    if rows is not None:
+        table = table.slice(0, rows)
+    return table, metadata
+
+
 def bootstrap_sqllab_data(user_id: int | None) -> dict[str, Any]:
     tabs_state: list[Any] = []
     active_tab: Any = None
@@ -90,6 +90,19 @@ class ResultSetColumnType(TypedDict):
     query_as: NotRequired[Any]
 
 
+class TableMetadataBundle(TypedDict):
+    """
+    Metadata of a table reflected over a single inspector
+    """
+
+    columns: list[ResultSetColumnType]
+    primary_key: dict[str, Any]
+    foreign_keys: list[dict[str, Any]]
+    indexes: list[dict[str, Any]]
+    comment: Optional[str]
+    select_star: str
+
+
 CacheConfig = dict[str, Any]
 DbapiDescriptionRow = tuple[
     Union[str, bytes],
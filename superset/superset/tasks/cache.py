@@ -329,3 +329,81 @@ def cache_warmup(
             logger.warn("Executor not found for %s", payload)
 
     return results
+
+
+@celery_app.task(name="refresh_column_values", soft_time_limit=300)
+def refresh_column_values(  # pylint: disable=too-many-arguments
+    datasource_type: str,
+    datasource_id: int,
+    column_name: str,
+    limit: int,
+    denormalize_column: bool,
+    username: str,
+) -> None:
+    """
+    Fetch the distinct values of a column again, updating the cached values.
+
+    The values are fetched as the user who read the stale entry, so that the same row
+    level security filters apply.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.daos.datasource import DatasourceDAO
+    from superset.daos.exceptions import DatasourceNotFound
+    from superset.utils.core import DatasourceType, override_user
+
+    user = security_manager.find_user(username)
+    if not user:
+        logger.warning("User %s not found, skip refreshing column values", username)
+        return
+
+    try:
+        datasource = DatasourceDAO.get_datasource(
+            DatasourceType(datasource_type),
+            datasource_id,
+        )
+    except DatasourceNotFound:
+        logger.warning("Datasource not found, skip refreshing column values")
+        return
+
+    with override_user(user):
+        datasource.values_for_column(
+            column_name=column_name,
+            limit=limit,
+            denormalize_column=denormalize_column,
+            force=True,
+        )
+
+
+@celery_app.task(name="refresh_name_index", soft_time_limit=300)
+def refresh_name_index(
+    database_id: int,
+    catalog: str | None,
+    schema: str | None,
+) -> None:
+    """
+    Fetch the names of a catalog or schema again, updating the name index.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.daos.database import DatabaseDAO
+    from superset.databases.name_index import fetch_names, is_name_index_enabled
+
+    database = DatabaseDAO.find_by_id(database_id)
+    if not database or not is_name_index_enabled(database):
+        logger.warning("Database %i is not indexed, skip refreshing", database_id)
+        return
+
+    fetch_names(database, catalog, schema)
+
+
+@celery_app.task(name="refresh_name_indexes", soft_time_limit=600)
+def refresh_name_indexes() -> None:
+    """
+    Refresh the stalest entries of the name indexes of all databases.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.databases.name_index import refresh_stale_entries
+
+    refreshed = refresh_stale_entries(
+        current_app.config["DATABASE_NAME_INDEX_REFRESH_BATCH_SIZE"]
+    )
+    logger.info("Refreshed %i name index entries", refreshed)
@@ -21,21 +21,34 @@ from datetime import datetime, timedelta
 
 from croniter import croniter
 from flask import current_app
-from pytz import timezone as pytz_timezone, UnknownTimeZoneError
+from pytz import BaseTzInfo, timezone as pytz_timezone, UnknownTimeZoneError
 
 logger = logging.getLogger(__name__)
 
 
-def cron_schedule_window(
-    triggered_at: datetime, cron: str, timezone: str
-) -> Iterator[datetime]:
-    window_size = current_app.config["ALERT_REPORTS_CRON_WINDOW_SIZE"]
+def _get_timezone(timezone: str) -> BaseTzInfo:
     try:
-        tz = pytz_timezone(timezone)
+        return pytz_timezone(timezone)
     except UnknownTimeZoneError:
         # fallback to default timezone
-        tz = pytz_timezone("UTC")
         logger.warning("Timezone %s was invalid. Falling back to 'UTC'", timezone)
+        return pytz_timezone("UTC")
+
+
+def cron_schedule_window_end(triggered_at: datetime) -> datetime:
+    """
+    Return the end of the cron window around `triggered_at`, as a naive UTC datetime.
+    """
+    window_size = current_app.config["ALERT_REPORTS_CRON_WINDOW_SIZE"]
+    time_now = triggered_at.astimezone(pytz_timezone("UTC")).replace(tzinfo=None)
+    return time_now + timedelta(seconds=window_size / 2)
+
+
+def cron_schedule_window(
+    triggered_at: datetime, cron: str, timezone: str
+) -> Iterator[datetime]:
+    window_size = current_app.config["ALERT_REPORTS_CRON_WINDOW_SIZE"]
+    tz = _get_timezone(timezone)
     utc = pytz_timezone("UTC")
     # convert the current time to the user's local time for comparison
     time_now = triggered_at.astimezone(tz)
@@ -47,3 +60,18 @@ def cron_schedule_window(
             break
         # convert schedule back to utc
         yield schedule.astimezone(utc).replace(tzinfo=None)
+
+
+def next_cron_schedule(after: datetime, cron: str, timezone: str) -> datetime:
+    """
+    Return the first time `cron` fires at or after `after`, a naive UTC datetime, as
+    a naive UTC datetime.
+    """
+    tz = _get_timezone(timezone)
+    utc = pytz_timezone("UTC")
+    start_at = utc.localize(after).astimezone(tz) - timedelta(seconds=1)
+    crons = croniter(cron, start_at)
+    while True:
+        schedule = crons.get_next(datetime).astimezone(utc).replace(tzinfo=None)
+        if schedule >= after:
+            return schedule
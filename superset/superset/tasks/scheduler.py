@@ -32,9 +32,14 @@ from superset.commands.report.execute import AsyncExecuteReportScheduleCommand
 from superset.commands.report.log_prune import AsyncPruneReportScheduleLogCommand
 from superset.commands.sql_lab.query import QueryPruneCommand
 from superset.daos.report import ReportScheduleDAO
-from superset.extensions import celery_app
+from superset.extensions import celery_app, db
+from superset.reports.models import ReportSchedule
 from superset.stats_logger import BaseStatsLogger
-from superset.tasks.cron_util import cron_schedule_window
+from superset.tasks.cron_util import (
+    cron_schedule_window,
+    cron_schedule_window_end,
+    next_cron_schedule,
+)
 from superset.utils.core import LoggerLevel
 from superset.utils.log import get_logger_from_status
 
@@ -51,32 +56,54 @@ def scheduler() -> None:
 
     if not is_feature_enabled("ALERT_REPORTS"):
         return
-    active_schedules = ReportScheduleDAO.find_active()
     triggered_at = (
         datetime.fromisoformat(scheduler.request.expires)
         - current_app.config["CELERY_BEAT_SCHEDULER_EXPIRES"]
         if scheduler.request.expires
         else datetime.now(tz=timezone.utc)
     )
-    for active_schedule in active_schedules:
-        for schedule in cron_schedule_window(
-            triggered_at, active_schedule.crontab, active_schedule.timezone
-        ):
-            logger.info("Scheduling alert %s eta: %s", active_schedule.name, schedule)
-            async_options = {"eta": schedule}
-            if (
-                active_schedule.working_timeout is not None
-                and current_app.config["ALERT_REPORTS_WORKING_TIME_OUT_KILL"]
+    stop_at = cron_schedule_window_end(triggered_at)
+
+    # Only schedules whose next run falls before the end of the window (or is unknown)
+    # can fire, the others are skipped using the index on `next_run`
+    due_schedules = ReportScheduleDAO.find_due(stop_at)
+    stats_logger.gauge("reports.scheduler.due", len(due_schedules))
+
+    next_runs: dict[ReportSchedule, datetime] = {}
+    with celery_app.producer_or_acquire() as producer:
+        for active_schedule in due_schedules:
+            for schedule in cron_schedule_window(
+                triggered_at, active_schedule.crontab, active_schedule.timezone
             ):
-                async_options["time_limit"] = (
-                    active_schedule.working_timeout
-                    + current_app.config["ALERT_REPORTS_WORKING_TIME_OUT_LAG"]
+                logger.info(
+                    "Scheduling alert %s eta: %s", active_schedule.name, schedule
                 )
-                async_options["soft_time_limit"] = (
-                    active_schedule.working_timeout
-                    + current_app.config["ALERT_REPORTS_WORKING_SOFT_TIME_OUT_LAG"]
+                async_options: dict[str, Any] = {"eta": schedule, "producer": producer}
+                if (
+                    active_schedule.working_timeout is not None
+                    and current_app.config["ALERT_REPORTS_WORKING_TIME_OUT_KILL"]
+                ):
+                    async_options["time_limit"] = (
+                        active_schedule.working_timeout
+                        + current_app.config["ALERT_REPORTS_WORKING_TIME_OUT_LAG"]
+                    )
+                    async_options["soft_time_limit"] = (
+                        active_schedule.working_timeout
+                        + current_app.config["ALERT_REPORTS_WORKING_SOFT_TIME_OUT_LAG"]
+                    )
+                execute.apply_async((active_schedule.id,), **async_options)
+
+            try:
+                next_runs[active_schedule] = next_cron_schedule(
+                    stop_at, active_schedule.crontab, active_schedule.timezone
                 )
-            execute.apply_async((active_schedule.id,), **async_options)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception(
+                    "Unable to compute the next run of alert %s", active_schedule.name
+                )
+
+    ReportScheduleDAO.bulk_update_next_run(next_runs)
+    db.session.commit()
 
 
 @celery_app.task(name="reports.execute", bind=True)
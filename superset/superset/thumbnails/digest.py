@@ -18,11 +18,19 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, TYPE_CHECKING, TypeVar
 
-from flask import current_app as app
+import sqlalchemy as sa
+from flask import current_app as app, g, has_request_context
+from sqlalchemy.orm import selectinload
 
-from superset import security_manager
+from superset import db, security_manager
+from superset.constants import CACHE_DISABLED_TIMEOUT
+from superset.extensions import cache_manager
 from superset.tasks.exceptions import ExecutorNotFoundError
 from superset.tasks.types import ExecutorType
 from superset.tasks.utils import get_current_user, get_executor
@@ -30,10 +38,14 @@ from superset.utils.core import override_user
 from superset.utils.hashing import md5_sha_from_str
 
 if TYPE_CHECKING:
+    from flask_appbuilder.security.sqla.models import User
+
     from superset.connectors.sqla.models import BaseDatasource, SqlaTable
     from superset.models.dashboard import Dashboard
     from superset.models.slice import Slice
 
+    Model = TypeVar("Model", Dashboard, Slice)
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,22 +79,8 @@ def _adjust_string_with_rls(
     )
 
     if user:
-        stringified_rls = ""
         with override_user(user):
-            for datasource in datasources:
-                if (
-                    datasource
-                    and hasattr(datasource, "is_rls_supported")
-                    and datasource.is_rls_supported
-                ):
-                    rls_filters = datasource.get_sqla_row_level_filters()
-
-                    if len(rls_filters) > 0:
-                        stringified_rls += (
-                            f"{str(datasource.id)}\t"
-                            + "\t".join([str(f) for f in rls_filters])
-                            + "\n"
-                        )
+            stringified_rls = _stringify_rls(datasources)
 
         if stringified_rls:
             unique_string = f"{unique_string}\n{stringified_rls}"
@@ -90,7 +88,43 @@ def _adjust_string_with_rls(
     return unique_string
 
 
+def _stringify_rls(
+    datasources: Iterable[SqlaTable | BaseDatasource | None],
+    rls_filters: dict[int, list[Any]] | None = None,
+) -> str:
+    """
+    Stringify the RLS filters of the current user on the datasources, optionally
+    using filters already fetched with `security_manager.get_rls_filters_by_table`.
+    """
+    stringified_rls = ""
+    for datasource in datasources:
+        if (
+            datasource
+            and hasattr(datasource, "is_rls_supported")
+            and datasource.is_rls_supported
+        ):
+            filters = (
+                datasource.get_sqla_row_level_filters()
+                if rls_filters is None
+                else datasource.get_sqla_row_level_filters(
+                    rls_filters=rls_filters.get(datasource.id, [])
+                )
+            )
+
+            if len(filters) > 0:
+                stringified_rls += (
+                    f"{str(datasource.id)}\t"
+                    + "\t".join([str(f) for f in filters])
+                    + "\n"
+                )
+
+    return stringified_rls
+
+
 def get_dashboard_digest(dashboard: Dashboard) -> str | None:
+    if (digests := _get_batch_digests(dashboard)) is not None:
+        return digests.get(dashboard.id)
+
     try:
         executor_type, executor = get_executor(
             executors=app.config["THUMBNAIL_EXECUTORS"],
@@ -103,10 +137,7 @@ def get_dashboard_digest(dashboard: Dashboard) -> str | None:
     if func := app.config["THUMBNAIL_DASHBOARD_DIGEST_FUNC"]:
         return func(dashboard, executor_type, executor)
 
-    unique_string = (
-        f"{dashboard.id}\n{dashboard.charts}\n{dashboard.position_json}\n"
-        f"{dashboard.css}\n{dashboard.json_metadata}"
-    )
+    unique_string = _get_dashboard_unique_string(dashboard)
 
     unique_string = _adjust_string_for_executor(unique_string, executor_type, executor)
     unique_string = _adjust_string_with_rls(
@@ -117,6 +148,9 @@ def get_dashboard_digest(dashboard: Dashboard) -> str | None:
 
 
 def get_chart_digest(chart: Slice) -> str | None:
+    if (digests := _get_batch_digests(chart)) is not None:
+        return digests.get(chart.id)
+
     try:
         executor_type, executor = get_executor(
             executors=app.config["THUMBNAIL_EXECUTORS"],
@@ -129,8 +163,404 @@ def get_chart_digest(chart: Slice) -> str | None:
     if func := app.config["THUMBNAIL_CHART_DIGEST_FUNC"]:
         return func(chart, executor_type, executor)
 
-    unique_string = f"{chart.params or ''}.{executor}"
+    unique_string = _get_chart_unique_string(chart, executor)
     unique_string = _adjust_string_for_executor(unique_string, executor_type, executor)
     unique_string = _adjust_string_with_rls(unique_string, [chart.datasource], executor)
 
     return md5_sha_from_str(unique_string)
+
+
+def _get_dashboard_unique_string(dashboard: Dashboard) -> str:
+    return (
+        f"{dashboard.id}\n{dashboard.charts}\n{dashboard.position_json}\n"
+        f"{dashboard.css}\n{dashboard.json_metadata}"
+    )
+
+
+def _get_chart_unique_string(chart: Slice, executor: str) -> str:
+    return f"{chart.params or ''}.{executor}"
+
+
+@dataclass
+class DigestBatch:
+    """
+    Charts or dashboards loaded while listing them, whose digests are computed together
+    the first time one of them is requested.
+    """
+
+    model_cls: type[Dashboard | Slice]
+    models: dict[int, Dashboard | Slice] = field(default_factory=dict)
+    digests: dict[int, str | None] | None = None
+
+
+@contextmanager
+def batch_digests(model_cls: type[Dashboard | Slice]) -> Iterator[None]:
+    """
+    Compute the digests of all the charts or dashboards of `model_cls` loaded in the
+    context at once, instead of one at a time.
+    """
+    g.thumbnail_digest_batch = DigestBatch(model_cls)
+    try:
+        yield
+    finally:
+        g.pop("thumbnail_digest_batch", None)
+
+
+def add_to_digest_batch(target: Dashboard | Slice, _context: Any) -> None:
+    """
+    SQLAlchemy `load` listener adding charts and dashboards to the digest batch.
+    """
+    if (
+        has_request_context()
+        and (batch := g.get("thumbnail_digest_batch"))
+        and isinstance(target, batch.model_cls)
+    ):
+        batch.models[target.id] = target
+
+
+def _get_batch_digests(model: Dashboard | Slice) -> dict[int, str | None] | None:
+    if not (
+        has_request_context()
+        and (batch := g.get("thumbnail_digest_batch"))
+        and batch.models.get(model.id) is model
+    ):
+        return None
+
+    if batch.digests is None:
+        models = list(batch.models.values())
+        # pylint: disable=import-outside-toplevel
+        from superset.models.dashboard import Dashboard
+
+        batch.digests = (
+            get_dashboard_digests(models)
+            if issubclass(batch.model_cls, Dashboard)
+            else get_chart_digests(models)
+        )
+
+    return batch.digests
+
+
+def get_dashboard_digests(dashboards: list[Dashboard]) -> dict[int, str | None]:
+    """
+    Compute the digests of dashboards, loading their charts and datasources and the RLS
+    filters of each executor in bulk.
+    """
+
+    def get_datasources(
+        dashboards: list[Dashboard],
+    ) -> dict[int, list[SqlaTable | None]]:
+        # pylint: disable=import-outside-toplevel
+        from superset.models.dashboard import Dashboard
+
+        # populate the charts of all the dashboards in a single query
+        db.session.query(Dashboard).options(selectinload(Dashboard.slices)).filter(
+            Dashboard.id.in_([dashboard.id for dashboard in dashboards])
+        ).all()
+        datasources = _get_datasources(
+            (chart.datasource_type, chart.datasource_id)
+            for dashboard in dashboards
+            for chart in dashboard.slices
+        )
+        return {
+            dashboard.id: list(
+                {
+                    datasource
+                    for chart in dashboard.slices
+                    if (
+                        datasource := datasources.get(
+                            (chart.datasource_type, chart.datasource_id)
+                        )
+                    )
+                }
+            )
+            for dashboard in dashboards
+        }
+
+    return _get_digests(
+        dashboards,
+        custom_func=app.config["THUMBNAIL_DASHBOARD_DIGEST_FUNC"],
+        get_unique_string=lambda dashboard, _: _get_dashboard_unique_string(dashboard),
+        get_datasources=get_datasources,
+    )
+
+
+def get_chart_digests(charts: list[Slice]) -> dict[int, str | None]:
+    """
+    Compute the digests of charts, loading their datasources and the RLS filters of
+    each executor in bulk.
+    """
+
+    def get_datasources(charts: list[Slice]) -> dict[int, list[SqlaTable | None]]:
+        datasources = _get_datasources(
+            (chart.datasource_type, chart.datasource_id) for chart in charts
+        )
+        return {
+            chart.id: [datasources.get((chart.datasource_type, chart.datasource_id))]
+            for chart in charts
+        }
+
+    return _get_digests(
+        charts,
+        custom_func=app.config["THUMBNAIL_CHART_DIGEST_FUNC"],
+        get_unique_string=_get_chart_unique_string,
+        get_datasources=get_datasources,
+    )
+
+
+def _get_datasources(
+    keys: Iterable[tuple[str | None, int | None]],
+) -> dict[tuple[str, int], SqlaTable]:
+    """
+    Load datasources by type and id, with one query per datasource type.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.daos.datasource import DatasourceDAO
+
+    ids_by_type: dict[str, set[int]] = defaultdict(set)
+    for datasource_type, datasource_id in keys:
+        if datasource_type in DatasourceDAO.sources and datasource_id is not None:
+            ids_by_type[datasource_type].add(datasource_id)
+
+    return {
+        (datasource_type, datasource.id): datasource
+        for datasource_type, ids in ids_by_type.items()
+        for datasource in db.session.query(DatasourceDAO.sources[datasource_type])
+        .filter(DatasourceDAO.sources[datasource_type].id.in_(ids))
+        .all()
+    }
+
+
+def _get_digests(
+    models: list[Model],
+    custom_func: Callable[[Model, ExecutorType, str], str | None] | None,
+    get_unique_string: Callable[[Model, str], str],
+    get_datasources: Callable[[list[Model]], dict[int, list[SqlaTable | None]]],
+) -> dict[int, str | None]:
+    """
+    Compute the same digests as `get_chart_digest` and `get_dashboard_digest` for many
+    charts or dashboards, reading them from the cache when possible.
+    """
+    digests: dict[int, str | None] = {}
+    executors: dict[int, tuple[ExecutorType, str]] = {}
+    current_user = get_current_user()
+    for model in models:
+        try:
+            executors[model.id] = get_executor(
+                executors=app.config["THUMBNAIL_EXECUTORS"],
+                model=model,
+                current_user=current_user,
+            )
+        except ExecutorNotFoundError:
+            digests[model.id] = None
+
+    pending = [model for model in models if model.id in executors]
+    if custom_func:
+        for model in pending:
+            digests[model.id] = custom_func(model, *executors[model.id])
+        return digests
+
+    users = _find_users({executor for _, executor in executors.values()})
+    cache_keys = _get_cache_keys(pending, executors, users)
+    if cache_keys:
+        cached = cache_manager.cache.get_many(*cache_keys.values())
+        for model_id, digest in zip(list(cache_keys), cached, strict=True):
+            if digest is not None:
+                digests[model_id] = digest
+        pending = [model for model in pending if model.id not in digests]
+    if not pending:
+        return digests
+
+    computed = _compute_digests(
+        pending,
+        executors,
+        users,
+        get_unique_string,
+        get_datasources,
+    )
+    digests.update(computed)
+    if cache_keys:
+        cache_manager.cache.set_many(
+            {
+                cache_keys[model_id]: digest
+                for model_id, digest in computed.items()
+                if model_id in cache_keys
+            },
+            timeout=app.config["THUMBNAIL_DIGEST_CACHE_TIMEOUT"],
+        )
+
+    return digests
+
+
+def _compute_digests(
+    models: list[Model],
+    executors: dict[int, tuple[ExecutorType, str]],
+    users: dict[str, User],
+    get_unique_string: Callable[[Model, str], str],
+    get_datasources: Callable[[list[Model]], dict[int, list[SqlaTable | None]]],
+) -> dict[int, str]:
+    """
+    Compute digests, fetching the RLS filters of each executor with a single query.
+    """
+    digests: dict[int, str] = {}
+    datasources = get_datasources(models)
+    guest_user = security_manager.get_current_guest_user_if_guest()
+    models_by_executor: dict[str, list[Model]] = defaultdict(list)
+    for model in models:
+        models_by_executor[executors[model.id][1]].append(model)
+
+    for executor, executor_models in models_by_executor.items():
+        user = users.get(executor) or guest_user
+        with override_user(user):
+            rls_filters = (
+                security_manager.get_rls_filters_by_table(
+                    [
+                        datasource
+                        for model in executor_models
+                        for datasource in datasources[model.id]
+                        if datasource and datasource.is_rls_supported
+                    ]
+                )
+                if user
+                else {}
+            )
+            for model in executor_models:
+                unique_string = _adjust_string_for_executor(
+                    get_unique_string(model, executor),
+                    executors[model.id][0],
+                    executor,
+                )
+                if user and (
+                    stringified_rls := _stringify_rls(
+                        datasources[model.id], rls_filters
+                    )
+                ):
+                    unique_string = f"{unique_string}\n{stringified_rls}"
+                digests[model.id] = md5_sha_from_str(unique_string)
+
+    return digests
+
+
+def _get_cache_keys(
+    models: list[Model],
+    executors: dict[int, tuple[ExecutorType, str]],
+    users: dict[str, User],
+) -> dict[int, str]:
+    """
+    Return the cache keys of digests, based on the last change of each model, of the
+    charts of dashboards, on the version of the RLS filters and on the roles of the
+    executor. Digests
+    of guest users aren't cached, since their RLS rules come from their token.
+    """
+    if (
+        not models
+        or app.config["THUMBNAIL_DIGEST_CACHE_TIMEOUT"] == CACHE_DISABLED_TIMEOUT
+        or security_manager.is_guest_user()
+    ):
+        return {}
+
+    rls_version = _get_rls_version()
+    charts_versions = _get_charts_versions(models)
+    roles = {
+        username: sorted(role.id for role in security_manager.get_user_roles(user))
+        for username, user in users.items()
+    }
+
+    return {
+        model.id: "thumbnail_digest_"
+        + md5_sha_from_str(
+            "\n".join(
+                [
+                    model.__tablename__,
+                    str(model.id),
+                    str(model.changed_on),
+                    str(charts_versions.get(model.id)),
+                    str(executors[model.id][0]),
+                    executors[model.id][1],
+                    str(roles.get(executors[model.id][1])),
+                    rls_version,
+                ]
+            )
+        )
+        for model in models
+        if model.changed_on
+    }
+
+
+def _get_rls_version() -> str:
+    """
+    Return the version of the RLS filters: their last change and number, and a hash of
+    the tables and roles they apply to. Editing the tables or roles of a filter only
+    changes the rows of the association tables, not the filter itself.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.connectors.sqla.models import (
+        RLSFilterRoles,
+        RLSFilterTables,
+        RowLevelSecurityFilter,
+    )
+
+    changed_on, count = db.session.query(
+        sa.func.max(RowLevelSecurityFilter.changed_on),
+        sa.func.count(RowLevelSecurityFilter.id),
+    ).one()
+    tables = db.session.query(
+        RLSFilterTables.c.rls_filter_id,
+        RLSFilterTables.c.table_id,
+    ).order_by(RLSFilterTables.c.rls_filter_id, RLSFilterTables.c.table_id)
+    roles = db.session.query(
+        RLSFilterRoles.c.rls_filter_id,
+        RLSFilterRoles.c.role_id,
+    ).order_by(RLSFilterRoles.c.rls_filter_id, RLSFilterRoles.c.role_id)
+
+    return "\n".join(
+        [
+            str(changed_on),
+            str(count),
+            md5_sha_from_str(str([tuple(row) for row in tables.all()])),
+            md5_sha_from_str(str([tuple(row) for row in roles.all()])),
+        ]
+    )
+
+
+def _get_charts_versions(models: list[Model]) -> dict[int, tuple[Any, ...]]:
+    """
+    Return the last change and the number of the charts of dashboards, since the names
+    of their charts are part of their digests.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.models.dashboard import Dashboard, dashboard_slices
+    from superset.models.slice import Slice
+
+    if not isinstance(models[0], Dashboard):
+        return {}
+
+    return {
+        dashboard_id: (changed_on, count)
+        for dashboard_id, changed_on, count in db.session.query(
+            dashboard_slices.c.dashboard_id,
+            sa.func.max(Slice.changed_on),
+            sa.func.count(Slice.id),
+        )
+        .join(Slice, Slice.id == dashboard_slices.c.slice_id)
+        .filter(dashboard_slices.c.dashboard_id.in_([model.id for model in models]))
+        .group_by(dashboard_slices.c.dashboard_id)
+        .all()
+    }
+
+
+def _find_users(usernames: set[str]) -> dict[str, User]:
+    """
+    Find the users with the given usernames, in a single query when possible.
+    """
+    user_model = security_manager.user_model
+    users = {
+        user.username: user
+        for user in db.session.query(user_model)
+        .filter(user_model.username.in_(usernames))
+        .all()
+    }
+    # fall back to `find_user` for usernames matched case insensitively
+    for username in usernames - users.keys():
+        if user := security_manager.find_user(username):
+            users[username] = user
+    return users
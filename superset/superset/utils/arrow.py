@@ -0,0 +1,34 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pandas as pd
+import pyarrow as pa
+
+
+def df_to_arrow(df: pd.DataFrame) -> pa.Table:
+    """
+    Convert a dataframe to an Arrow table, keeping its index unless it's the default
+    one. Columns which Arrow can't type, e.g. mixing numbers and strings, are
+    converted to strings.
+    """
+    preserve_index = not isinstance(df.index, pd.RangeIndex)
+    try:
+        return pa.Table.from_pandas(df, preserve_index=preserve_index)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        df = df.copy()
+        for column in df.select_dtypes(include="object").columns:
+            df[column] = df[column].astype(str).where(df[column].notna(), None)
+        return pa.Table.from_pandas(df, preserve_index=preserve_index)
@@ -0,0 +1,232 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Caching and searching of the distinct values of dataset columns, used to populate
+filters.
+
+Values are stored in the data cache, keyed by the datasource and the SQL used to fetch
+them, which includes the row level security filters and the fetch values predicate,
+and by user when queries are cached per user or run as the user.
+Entries older than `FILTER_VALUES_CACHE_REFRESH_AFTER` are still served while a Celery
+task fetches the values again.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, TYPE_CHECKING
+
+from flask import current_app as app, g
+
+from superset.constants import CACHE_DISABLED_TIMEOUT, LRU_CACHE_MAX_SIZE
+from superset.extensions import cache_manager, celery_app, feature_flag_manager
+from superset.utils.hashing import md5_sha_from_dict
+
+if TYPE_CHECKING:
+    from superset.models.helpers import ExploreMixin
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ColumnValuesIndex:
+    """
+    Column values sorted by their lowercase string representation, for searching.
+    """
+
+    values: list[Any]
+    keys: list[str]
+    positions: list[int]
+
+    @classmethod
+    def build(cls, values: list[Any]) -> ColumnValuesIndex:
+        entries = sorted(
+            (str(value).lower(), position)
+            for position, value in enumerate(values)
+            if value is not None
+        )
+        return cls(
+            values=values,
+            keys=[key for key, _ in entries],
+            positions=[position for _, position in entries],
+        )
+
+    def search(self, search: str) -> list[Any]:
+        """
+        Return the values containing `search`, ignoring case. Values starting with
+        `search` come first.
+        """
+        search = search.lower()
+
+        start = bisect_left(self.keys, search)
+        end = start
+        while end < len(self.keys) and self.keys[end].startswith(search):
+            end += 1
+
+        matches = self.positions[start:end]
+        matches.extend(
+            position
+            for i, (key, position) in enumerate(
+                zip(self.keys, self.positions, strict=True)
+            )
+            if (i < start or i >= end) and search in key
+        )
+
+        return [self.values[position] for position in matches]
+
+
+# Search indexes of recently used cache entries, keyed by cache key and entry time
+_indexes: OrderedDict[tuple[str, float], ColumnValuesIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_index(cache_key: str, dttm: float, values: list[Any]) -> ColumnValuesIndex:
+    """
+    Return the search index for a cache entry, building it if needed.
+    """
+    key = (cache_key, dttm)
+    with _indexes_lock:
+        if index := _indexes.get(key):
+            _indexes.move_to_end(key)
+            return index
+
+    index = ColumnValuesIndex.build(values)
+    with _indexes_lock:
+        _indexes[key] = index
+        while len(_indexes) > LRU_CACHE_MAX_SIZE:
+            _indexes.popitem(last=False)
+
+    return index
+
+
+def get_cache_key(datasource: ExploreMixin, column_name: str, sql: str) -> str:
+    cache_dict = {
+        "datasource": f"{datasource.id}__{datasource.type}",
+        "column_name": column_name,
+        "sql": sql,
+    }
+
+    # Add an impersonation key, like the chart data cache, if impersonation is
+    # enabled on the db or if the CACHE_QUERY_BY_USER flag is on
+    database = datasource.database
+    if (
+        feature_flag_manager.is_feature_enabled("CACHE_IMPERSONATION")
+        and database.impersonate_user
+    ) or feature_flag_manager.is_feature_enabled("CACHE_QUERY_BY_USER"):
+        if key := database.db_engine_spec.get_impersonation_key(
+            getattr(g, "user", None)
+        ):
+            cache_dict["impersonation_key"] = key
+
+    return "column_values_" + md5_sha_from_dict(cache_dict)
+
+
+def get_column_values(  # pylint: disable=too-many-arguments
+    datasource: ExploreMixin,
+    column_name: str,
+    sql: str,
+    fetch_values: Callable[[], list[Any]],
+    refresh_kwargs: dict[str, Any],
+    search: str | None = None,
+    force: bool = False,
+) -> list[Any]:
+    """
+    Return the distinct values of a column, reading them from the cache when possible.
+
+    :param datasource: The datasource the column belongs to
+    :param column_name: The name of the column
+    :param sql: The SQL used to fetch the values
+    :param fetch_values: Callable running the SQL
+    :param refresh_kwargs: Arguments passed to `values_for_column` by the Celery task
+        refreshing stale entries
+    :param search: Only return values containing this string, ignoring case
+    :param force: Fetch the values even if they're cached
+    :returns: The distinct values of the column
+    """
+    timeout = app.config["FILTER_VALUES_CACHE_TIMEOUT"]
+    if timeout == CACHE_DISABLED_TIMEOUT:
+        values = fetch_values()
+        return ColumnValuesIndex.build(values).search(search) if search else values
+
+    stats_logger = app.config["STATS_LOGGER"]
+    cache_key = get_cache_key(datasource, column_name, sql)
+    cache_value = None if force else cache_manager.data_cache.get(cache_key)
+
+    if cache_value:
+        stats_logger.incr("column_values_cache.hit")
+        refresh_after = app.config["FILTER_VALUES_CACHE_REFRESH_AFTER"]
+        if refresh_after is not None and time.time() - cache_value["dttm"] > (
+            refresh_after
+        ):
+            refresh_in_background(datasource, cache_key, refresh_kwargs)
+    else:
+        stats_logger.incr("column_values_cache.miss")
+        cache_value = {"values": fetch_values(), "dttm": time.time()}
+        cache_manager.data_cache.set(cache_key, cache_value, timeout=timeout)
+
+    if not search:
+        return cache_value["values"]
+
+    index = get_index(cache_key, cache_value["dttm"], cache_value["values"])
+    return index.search(search)
+
+
+def refresh_in_background(
+    datasource: ExploreMixin,
+    cache_key: str,
+    refresh_kwargs: dict[str, Any],
+) -> None:
+    """
+    Trigger a Celery task to fetch the values of a stale cache entry again, unless one
+    was already triggered. Nothing is triggered when Celery runs tasks eagerly, since
+    the task would then run the query in the request and still return stale values.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset import security_manager
+    from superset.tasks.cache import refresh_column_values
+
+    if celery_app.conf.task_always_eager:
+        return
+
+    # anonymous and guest users can't be impersonated by the worker
+    user = getattr(g, "user", None)
+    if not user or user.is_anonymous or security_manager.is_guest_user(user):
+        return
+
+    refresh_after = app.config["FILTER_VALUES_CACHE_REFRESH_AFTER"]
+    if not cache_manager.data_cache.add(
+        f"{cache_key}_refreshing",
+        True,
+        timeout=refresh_after,
+    ):
+        return
+
+    try:
+        refresh_column_values.delay(
+            datasource_type=datasource.type,
+            datasource_id=datasource.id,
+            username=user.username,
+            **refresh_kwargs,
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to refresh column values", exc_info=True)
+        cache_manager.data_cache.delete(f"{cache_key}_refreshing")
@@ -101,16 +101,23 @@ def get_chart_csv_data(
 def get_chart_dataframe(
     chart_url: str, auth_cookies: Optional[dict[str, str]] = None
 ) -> Optional[pd.DataFrame]:
-    # Disable all the unnecessary-lambda violations in this function
-    # pylint: disable=unnecessary-lambda
     content = get_chart_csv_data(chart_url, auth_cookies)
     if content is None:
         return None
 
     result = json.loads(content.decode("utf-8"))
+    return chart_data_to_dataframe(result["result"][0])
+
+
+def chart_data_to_dataframe(query: dict[str, Any]) -> Optional[pd.DataFrame]:
+    """
+    Build a dataframe from a query of a JSON chart data API response.
+    """
+    # Disable all the unnecessary-lambda violations in this function
+    # pylint: disable=unnecessary-lambda
     # need to convert float value to string to show full long number
     pd.set_option("display.float_format", lambda x: str(x))
-    df = pd.DataFrame.from_dict(result["result"][0]["data"])
+    df = pd.DataFrame.from_dict(query["data"])
 
     if df.empty:
         return None
@@ -118,22 +125,22 @@ def get_chart_dataframe(
     try:
         # if any column type is equal to 2, need to convert data into
         # datetime timestamp for that column.
-        if GenericDataType.TEMPORAL in result["result"][0]["coltypes"]:
-            for i in range(len(result["result"][0]["coltypes"])):
-                if result["result"][0]["coltypes"][i] == GenericDataType.TEMPORAL:
-                    df[result["result"][0]["colnames"][i]] = df[
-                        result["result"][0]["colnames"][i]
-                    ].astype("datetime64[ms]")
+        if GenericDataType.TEMPORAL in query["coltypes"]:
+            for i in range(len(query["coltypes"])):
+                if query["coltypes"][i] == GenericDataType.TEMPORAL:
+                    df[query["colnames"][i]] = df[query["colnames"][i]].astype(
+                        "datetime64[ms]"
+                    )
     except BaseException as err:
         logger.error(err)
 
     # rebuild hierarchical columns and index
     df.columns = pd.MultiIndex.from_tuples(
         tuple(colname) if isinstance(colname, list) else (colname,)
-        for colname in result["result"][0]["colnames"]
+        for colname in query["colnames"]
     )
     df.index = pd.MultiIndex.from_tuples(
         tuple(indexname) if isinstance(indexname, list) else (indexname,)
-        for indexname in result["result"][0]["indexnames"]
+        for indexname in query["indexnames"]
     )
     return df
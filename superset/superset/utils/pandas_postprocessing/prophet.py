@@ -15,17 +15,61 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from typing import Optional, Union
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, cast, Optional, Union
 
 import pandas as pd
+from flask import current_app as app
 from flask_babel import gettext as _
 from pandas import DataFrame
 
+from superset.constants import CACHE_DISABLED_TIMEOUT
 from superset.exceptions import InvalidPostProcessingError
+from superset.extensions import cache_manager
 from superset.utils.core import DTTM_ALIAS
 from superset.utils.decorators import suppress_logging
+from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.pandas_postprocessing.utils import PROPHET_TIME_GRAIN_MAP
 
+logger = logging.getLogger(__name__)
+
+PROPHET_CACHE_KEY_PREFIX = "prophet_"
+
+# process pool fitting forecasts, shared by all the calls of a process along with the
+# pid and size it was created with
+_executor: Optional[tuple[int, int, ProcessPoolExecutor]] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Return the process pool fitting forecasts, creating it on first use in each
+    process (pools can't be shared with forked processes) or when its size changed.
+    """
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None or _executor[:2] != (os.getpid(), max_workers):
+            _executor = (
+                os.getpid(),
+                max_workers,
+                ProcessPoolExecutor(max_workers=max_workers),
+            )
+        return _executor[2]
+
+
+def _reset_executor() -> None:
+    """
+    Drop the process pool, e.g. when one of its processes died.
+    """
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is not None:
+            _executor[2].shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
 
 def _prophet_parse_seasonality(
     input_value: Optional[Union[bool, int]],
@@ -77,6 +121,90 @@ def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
     return forecast.join(df.set_index("ds"), on="ds").set_index(["ds"])
 
 
+def _prophet_cache_key(df: DataFrame, params: dict[str, Any]) -> str:
+    """
+    Build the data cache key of a forecast from the input series and all the
+    parameters that affect the fitted model.
+    """
+    series_hash = pd.util.hash_pandas_object(df, index=False).values.tobytes().hex()
+    return PROPHET_CACHE_KEY_PREFIX + md5_sha_from_dict(
+        {
+            "series": series_hash,
+            "columns": [str(dtype) for dtype in df.dtypes],
+            **params,
+        }
+    )
+
+
+def _prophet_fit_and_predict_in_pool(
+    series: list[DataFrame],
+    params: dict[str, Any],
+    max_workers: int,
+) -> list[DataFrame]:
+    """
+    Forecast a list of independent series on the shared process pool, which bounds
+    the number of processes fitting models at once.
+    """
+    executor = _get_executor(max_workers)
+    futures = [
+        executor.submit(_prophet_fit_and_predict, df=fit_df, **params)
+        for fit_df in series
+    ]
+    try:
+        return [future.result() for future in futures]
+    except BrokenProcessPool:
+        _reset_executor()
+        raise
+
+
+def _prophet_fit_and_predict_many(
+    series: list[DataFrame],
+    params: dict[str, Any],
+) -> list[DataFrame]:
+    """
+    Forecast a list of independent series, reusing cached forecasts when the same
+    series was fitted with the same parameters before. Cache misses are fitted in
+    parallel when `PROPHET_FORECAST_MAX_WORKERS` is greater than 1.
+    """
+    cache_timeout = app.config["PROPHET_FORECAST_CACHE_TIMEOUT"]
+    use_cache = cache_timeout != CACHE_DISABLED_TIMEOUT
+    cache_keys = [_prophet_cache_key(fit_df, params) for fit_df in series]
+
+    results: list[Optional[DataFrame]] = [None] * len(series)
+    if use_cache:
+        for idx, cache_key in enumerate(cache_keys):
+            try:
+                results[idx] = cache_manager.data_cache.get(cache_key)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Could not read forecast from cache", exc_info=True)
+
+    misses = [idx for idx, result in enumerate(results) if result is None]
+    max_workers = app.config["PROPHET_FORECAST_MAX_WORKERS"]
+    if max_workers > 1 and len(misses) > 1:
+        fitted = _prophet_fit_and_predict_in_pool(
+            [series[idx] for idx in misses],
+            params,
+            max_workers,
+        )
+    else:
+        fitted = [_prophet_fit_and_predict(df=series[idx], **params) for idx in misses]
+    for idx, fit_df in zip(misses, fitted, strict=True):
+        results[idx] = fit_df
+
+    if use_cache:
+        for idx in misses:
+            try:
+                cache_manager.data_cache.set(
+                    cache_keys[idx],
+                    results[idx],
+                    timeout=cache_timeout,
+                )
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Could not cache forecast", exc_info=True)
+
+    return cast(list[DataFrame], results)
+
+
 def prophet(  # pylint: disable=too-many-arguments
     df: DataFrame,
     time_grain: str,
@@ -139,21 +267,27 @@ def prophet(  # pylint: disable=too-many-arguments
 
     target_df = DataFrame()
 
-    for column in [
+    columns = [
         column
         for column in df.columns
         if column != index
         and pd.to_numeric(df[column], errors="coerce").notnull().all()
-    ]:
-        fit_df = _prophet_fit_and_predict(
-            df=df[[index, column]].rename(columns={index: "ds", column: "y"}),
-            confidence_interval=confidence_interval,
-            yearly_seasonality=_prophet_parse_seasonality(yearly_seasonality),
-            weekly_seasonality=_prophet_parse_seasonality(weekly_seasonality),
-            daily_seasonality=_prophet_parse_seasonality(daily_seasonality),
-            periods=periods,
-            freq=freq,
-        )
+    ]
+    forecasts = _prophet_fit_and_predict_many(
+        series=[
+            df[[index, column]].rename(columns={index: "ds", column: "y"})
+            for column in columns
+        ],
+        params={
+            "confidence_interval": confidence_interval,
+            "yearly_seasonality": _prophet_parse_seasonality(yearly_seasonality),
+            "weekly_seasonality": _prophet_parse_seasonality(weekly_seasonality),
+            "daily_seasonality": _prophet_parse_seasonality(daily_seasonality),
+            "periods": periods,
+            "freq": freq,
+        },
+    )
+    for column, fit_df in zip(columns, forecasts, strict=True):
         new_columns = [
             f"{column}__yhat",
             f"{column}__yhat_lower",
@@ -18,7 +18,7 @@ import contextlib
 import logging
 from collections import defaultdict
 from functools import wraps
-from typing import Any, Callable, DefaultDict, Optional, Union
+from typing import Any, Callable, cast, DefaultDict, Iterator, Optional, Union
 
 import msgpack
 import pyarrow as pa
@@ -45,6 +45,7 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab.utils import is_arrow_payload, read_arrow_payload
 from superset.superset_typing import FormData
 from superset.utils import json
 from superset.utils.core import DatasourceType
@@ -215,6 +216,23 @@ def get_form_data(
     return form_data, slc
 
 
+@contextlib.contextmanager
+def override_form_data(form_data: dict[str, Any]) -> Iterator[None]:
+    """
+    Set the form data read by `get_form_data` when the request doesn't carry it, eg,
+    for each query context of a chart data batch, restoring the previous one on exit.
+    """
+    previous = g.pop("form_data", None)
+    # `get_form_data` updates the fallback form data in place
+    g.form_data = dict(form_data)
+    try:
+        yield
+    finally:
+        g.pop("form_data", None)
+        if previous is not None:
+            g.form_data = previous
+
+
 def add_sqllab_custom_filters(form_data: dict[Any, Any]) -> Any:
     """
     SQLLab can include a "filters" attribute in the templateParams.
@@ -505,8 +523,14 @@ def check_datasource_perms(
 
 
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    rows: Optional[int] = None,
 ) -> dict[str, Any]:
+    if is_arrow_payload(payload):
+        return _deserialize_arrow_results_payload(cast(bytes, payload), query, rows)
+
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
         with stats_timing(
@@ -521,6 +545,9 @@ def _deserialize_results_payload(
             except pa.ArrowSerializationError as ex:
                 raise SerializationError("Unable to deserialize table") from ex
 
+        if rows is not None:
+            pa_table = pa_table.slice(0, rows)
+
         df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
         ds_payload["data"] = dataframe.df_to_records(df) or []
 
@@ -542,6 +569,45 @@ def _deserialize_results_payload(
         return json.loads(payload)
 
 
+def _deserialize_arrow_results_payload(
+    payload: bytes, query: Query, rows: Optional[int] = None
+) -> dict[str, Any]:
+    """
+    Deserialize a payload stored as an Arrow IPC stream, converting only the first
+    `rows` rows (if set) to records. Nested data is only expanded if the query asked
+    for it.
+    """
+    with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
+        try:
+            pa_table, ds_payload = read_arrow_payload(payload, rows)
+        except (pa.ArrowException, KeyError) as ex:
+            raise SerializationError("Unable to deserialize table") from ex
+
+    df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
+    records = dataframe.df_to_records(df) or []
+
+    for column in ds_payload["selected_columns"]:
+        if "name" in column:
+            column["column_name"] = column.get("name")
+
+    if ds_payload.pop("expand_data", False):
+        db_engine_spec = query.database.db_engine_spec
+        all_columns, data, expanded_columns = db_engine_spec.expand_data(
+            ds_payload["selected_columns"], records
+        )
+    else:
+        all_columns, data, expanded_columns = (
+            ds_payload["selected_columns"],
+            records,
+            [],
+        )
+    ds_payload.update(
+        {"data": data, "columns": all_columns, "expanded_columns": expanded_columns}
+    )
+
+    return ds_payload
+
+
 def get_cta_schema_name(
     database: Database, user: ab_models.User, schema: str, sql: str
 ) -> Optional[str]:
@@ -39,6 +39,7 @@ from superset.extensions import async_query_manager_factory, db
 from superset.models.annotations import AnnotationLayer
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab.utils import ARROW_STREAM_MIMETYPE, read_arrow_payload
 from superset.superset_typing import AdhocColumn
 from superset.utils import json
 from superset.utils.core import (
@@ -249,6 +250,127 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         # check that global logs decorator is capturing from form_data
         assert isinstance(mock_g.logs_context.get("dataset_id"), int)
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_chart_data_batch(self):
+        """
+        Chart data API: Test the data of many charts in a single request
+        """
+        expected_row_count = self.get_expected_row_count("client_id_1")
+        with_count = copy.deepcopy(self.query_context_payload)
+        with_count["queries"][0]["metrics"].append("count")
+        missing = copy.deepcopy(self.query_context_payload)
+        missing["datasource"]["id"] = 0
+
+        rv = self.post_assert_metric(
+            f"{CHART_DATA_URI}/batch",
+            {"query_contexts": [self.query_context_payload, with_count, missing]},
+            "data_batch",
+        )
+
+        assert rv.status_code == 200
+        results = rv.json["results"]
+        assert [result["status"] for result in results] == [200, 200, 404]
+        assert results[0]["result"][0]["rowcount"] == expected_row_count
+        assert results[1]["result"][0]["rowcount"] == expected_row_count
+        assert "count" in results[1]["result"][0]["colnames"]
+        assert "count" not in results[0]["result"][0]["colnames"]
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_chart_data_batch_templated(self):
+        """
+        Chart data API: Test that the templates of a batch are rendered with the form
+        data of each chart, like in `/chart/data`
+        """
+        query_contexts = []
+        for gender in ("boy", "girl"):
+            for metrics in (["sum__num"], ["sum__num", "count"]):
+                query_context = copy.deepcopy(self.query_context_payload)
+                query_context["force"] = True
+                query = query_context["queries"][0]
+                query["metrics"] = metrics
+                query["filters"] = [{"col": "gender", "op": "==", "val": gender}]
+                query["extras"]["where"] = (
+                    "(gender = '{{ filter_values('gender', 'xyz')[0] }}')"
+                )
+                query_contexts.append(query_context)
+
+        rv = self.post_assert_metric(
+            f"{CHART_DATA_URI}/batch",
+            {"query_contexts": query_contexts},
+            "data_batch",
+        )
+
+        assert rv.status_code == 200
+        results = rv.json["results"]
+        for query_context, result in zip(query_contexts, results, strict=True):
+            rv = self.post_assert_metric(CHART_DATA_URI, query_context, "data")
+            expected = rv.json["result"][0]
+            assert result["status"] == 200
+            assert result["result"][0]["rowcount"] > 0
+            assert result["result"][0]["data"] == expected["data"]
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_chart_data_json_columnar(self):
+        """
+        Chart data API: Test the columnar JSON result format
+        """
+        expected_row_count = self.get_expected_row_count("client_id_1")
+        self.query_context_payload["result_format"] = "json_columnar"
+
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+
+        assert rv.status_code == 200
+        result = rv.json["result"][0]
+        assert list(result["data"]) == result["colnames"]
+        assert len(result["data"][result["colnames"][0]]) == expected_row_count
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_chart_data_arrow(self):
+        """
+        Chart data API: Test the Arrow result format, negotiated with `Accept`
+        """
+        expected_row_count = self.get_expected_row_count("client_id_1")
+
+        rv = self.client.post(
+            CHART_DATA_URI,
+            json=self.query_context_payload,
+            headers={"Accept": ARROW_STREAM_MIMETYPE},
+        )
+
+        assert rv.status_code == 200
+        assert rv.mimetype == ARROW_STREAM_MIMETYPE
+        table, payload = read_arrow_payload(rv.data)
+        assert table.num_rows == expected_row_count
+        assert table.column_names == payload["colnames"]
+        assert payload["rowcount"] == expected_row_count
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @with_config({"CHART_DATA_RESPONSE_CACHE": True})
+    def test_chart_data_response_cache(self):
+        """
+        Chart data API: Test that responses built from cached data are cached
+        """
+        self.query_context_payload["force"] = True
+        rv = self.client.post(CHART_DATA_URI, json=self.query_context_payload)
+        assert rv.status_code == 200
+        assert "ETag" not in rv.headers
+
+        self.query_context_payload["force"] = False
+        rv = self.client.post(CHART_DATA_URI, json=self.query_context_payload)
+        assert rv.status_code == 200
+        assert rv.json["result"][0]["is_cached"]
+        etag = rv.headers["ETag"]
+
+        rv = self.client.post(CHART_DATA_URI, json=self.query_context_payload)
+        assert rv.headers["ETag"] == etag
+
+        rv = self.client.post(
+            CHART_DATA_URI,
+            json=self.query_context_payload,
+            headers={"If-None-Match": etag},
+        )
+        assert rv.status_code == 304
+
     @staticmethod
     def assert_row_count(rv: Response, expected_row_count: int):
         assert rv.json["result"][0]["rowcount"] == expected_row_count
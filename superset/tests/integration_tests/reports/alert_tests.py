@@ -17,14 +17,19 @@
 # pylint: disable=invalid-name, unused-argument, import-outside-toplevel
 import uuid
 from contextlib import nullcontext, suppress
-from typing import Optional, Union
+from decimal import Decimal
+from typing import Any, Optional, Union
 
-import pandas as pd
 import pytest
 from flask.ctx import AppContext
 from pytest_mock import MockerFixture
 
-from superset.commands.report.exceptions import AlertQueryError
+from superset.commands.report.exceptions import (
+    AlertQueryError,
+    AlertQueryInvalidTypeError,
+    AlertQueryMultipleColumnsError,
+    AlertQueryMultipleRowsError,
+)
 from superset.reports.models import ReportCreationMethod, ReportScheduleType
 from superset.tasks.types import ExecutorType, FixedExecutor
 from superset.utils.database import get_example_database
@@ -111,10 +116,10 @@ def test_execute_query_mutate_query_enabled(
 
     app.config["MUTATE_ALERT_QUERY"] = True
     mocker.patch("superset.commands.report.alert.override_user")
-    mock_df = mocker.MagicMock(spec=pd.DataFrame)
-    mock_df.empty = True
     mock_database = get_example_database()
-    mock_get_df = mocker.patch.object(mock_database, "get_df", return_value=mock_df)
+    mock_get_rows = mocker.patch.object(
+        mock_database, "get_rows", return_value=(None, [])
+    )
     mock_limited_sql = mocker.patch.object(mock_database, "apply_limit_to_sql")
     mock_mutate_call = mocker.patch.object(mock_database, "mutate_sql_based_on_config")
 
@@ -134,7 +139,9 @@ def test_execute_query_mutate_query_enabled(
     AlertCommand(report_schedule=report_schedule, execution_id=uuid.uuid4()).run()
 
     mock_mutate_call.assert_called_once_with(mock_limited_sql.return_value)
-    mock_get_df.assert_called_once_with(sql=mock_mutate_call.return_value)
+    mock_get_rows.assert_called_once_with(
+        sql=mock_mutate_call.return_value, nullpool=False
+    )
 
     app.config["MUTATE_ALERT_QUERY"] = default_alert_mutate_ff
 
@@ -152,6 +159,7 @@ def test_execute_query_mutate_query_disabled(
     app.config["MUTATE_ALERT_QUERY"] = False
     mocker.patch("superset.commands.report.alert.override_user")
     mock_database = mocker.MagicMock()
+    mock_database.get_rows.return_value = (None, [])
 
     report_schedule = ReportSchedule(
         created_by=get_user("admin"),
@@ -169,13 +177,53 @@ def test_execute_query_mutate_query_disabled(
     AlertCommand(report_schedule=report_schedule, execution_id=uuid.uuid4()).run()
 
     mock_database.mutate_sql_based_on_config.assert_not_called()
-    mock_database.get_df.assert_called_once_with(
-        sql=mock_database.apply_limit_to_sql.return_value
+    mock_database.get_rows.assert_called_once_with(
+        sql=mock_database.apply_limit_to_sql.return_value,
+        nullpool=False,
     )
 
     app.config["MUTATE_ALERT_QUERY"] = default_alert_mutate_ff
 
 
+@pytest.mark.parametrize(
+    "validator_type,rows,expected_result",
+    [
+        ("not null", [], None),
+        ("not null", [("a",)], "a"),
+        ("operator", [], 0.0),
+        ("operator", [(None,)], 0.0),
+        ("operator", [(Decimal("1.5"),)], 1.5),
+        ("operator", [("x",)], AlertQueryInvalidTypeError()),
+        ("operator", [(1,), (2,)], AlertQueryMultipleRowsError()),
+        ("operator", [(1, 2)], AlertQueryMultipleColumnsError()),
+    ],
+)
+def test_validate_rows(
+    validator_type: str,
+    rows: list[tuple[Any, ...]],
+    expected_result: Any,
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    from superset.commands.report.alert import AlertCommand
+
+    mocker.patch(
+        "superset.commands.report.alert.AlertCommand._execute_query",
+        return_value=rows,
+    ).__name__ = "mocked_execute_query"
+    report_schedule = mocker.Mock(validator_type=validator_type)
+    command = AlertCommand(report_schedule=report_schedule, execution_id=uuid.uuid4())
+
+    cm = (
+        pytest.raises(type(expected_result))
+        if isinstance(expected_result, Exception)
+        else nullcontext()
+    )
+    with cm:
+        command.validate()
+        assert command._result == expected_result
+
+
 def test_execute_query_succeeded_no_retry(
     mocker: MockerFixture, app_context: None
 ) -> None:
@@ -183,7 +231,7 @@ def test_execute_query_succeeded_no_retry(
 
     execute_query_mock = mocker.patch(
         "superset.commands.report.alert.AlertCommand._execute_query",
-        side_effect=lambda: pd.DataFrame([{"sample_col": 0}]),
+        side_effect=lambda: [(0,)],
     )
 
     command = AlertCommand(report_schedule=mocker.Mock(), execution_id=uuid.uuid4())
@@ -206,14 +254,14 @@ def test_execute_query_succeeded_with_retries(
     # Should match the value defined in superset_test_config.py
     expected_max_retries = 3
 
-    def _mocked_execute_query() -> pd.DataFrame:
+    def _mocked_execute_query() -> list[tuple[int]]:
         nonlocal query_executed_count
         query_executed_count += 1
 
         if query_executed_count < expected_max_retries:
             raise AlertQueryError()
         else:
-            return pd.DataFrame([{"sample_col": 0}])
+            return [(0,)]
 
     execute_query_mock.side_effect = _mocked_execute_query
     execute_query_mock.__name__ = "mocked_execute_query"
@@ -79,6 +79,7 @@ from superset.reports.notifications.exceptions import (
 from superset.tasks.types import ExecutorType
 from superset.utils import json
 from superset.utils.database import get_example_database
+from tests.conftest import with_config
 from tests.integration_tests.fixtures.birth_names_dashboard import (
     load_birth_names_dashboard_with_slices,  # noqa: F401
     load_birth_names_data,  # noqa: F401
@@ -935,6 +936,7 @@ def test_email_chart_report_dry_run(
 @patch("superset.utils.csv.urllib.request.OpenerDirector.open")
 @patch("superset.reports.notifications.email.send_email_smtp")
 @patch("superset.utils.csv.get_chart_csv_data")
+@with_config({"ALERT_REPORTS_CHART_DATA_IN_WORKER": False})
 def test_email_chart_report_schedule_with_csv(
     csv_mock,
     email_mock,
@@ -984,6 +986,7 @@ def test_email_chart_report_schedule_with_csv(
 @patch("superset.reports.notifications.email.send_email_smtp")
 @patch("superset.utils.csv.get_chart_csv_data")
 @patch("superset.utils.screenshots.ChartScreenshot.get_screenshot")
+@with_config({"ALERT_REPORTS_CHART_DATA_IN_WORKER": False})
 def test_email_chart_report_schedule_with_csv_no_query_context(
     screenshot_mock,
     csv_mock,
@@ -1024,6 +1027,7 @@ def test_email_chart_report_schedule_with_csv_no_query_context(
 @patch("superset.utils.csv.urllib.request.OpenerDirector.open")
 @patch("superset.reports.notifications.email.send_email_smtp")
 @patch("superset.utils.csv.get_chart_dataframe")
+@with_config({"ALERT_REPORTS_CHART_DATA_IN_WORKER": False})
 def test_email_chart_report_schedule_with_text(
     dataframe_mock,
     email_mock,
@@ -1585,6 +1589,7 @@ def test_slack_chart_report_schedule_with_errors(
 @patch("superset.utils.csv.urllib.request.urlopen")
 @patch("superset.utils.csv.urllib.request.OpenerDirector.open")
 @patch("superset.utils.csv.get_chart_csv_data")
+@with_config({"ALERT_REPORTS_CHART_DATA_IN_WORKER": False})
 def test_slack_chart_report_schedule_with_csv(
     csv_mock,
     mock_open,
@@ -1635,6 +1640,7 @@ def test_slack_chart_report_schedule_with_csv(
 @patch("superset.utils.csv.urllib.request.OpenerDirector.open")
 @patch("superset.reports.notifications.slack.get_slack_client")
 @patch("superset.utils.csv.get_chart_dataframe")
+@with_config({"ALERT_REPORTS_CHART_DATA_IN_WORKER": False})
 def test_slack_chart_report_schedule_with_text(
     dataframe_mock,
     slack_client_mock_class,
@@ -2086,6 +2092,7 @@ def test_soft_timeout_screenshot(screenshot_mock, email_mock, create_alert_email
 @patch("superset.utils.csv.urllib.request.OpenerDirector.open")
 @patch("superset.reports.notifications.email.send_email_smtp")
 @patch("superset.utils.csv.get_chart_csv_data")
+@with_config({"ALERT_REPORTS_CHART_DATA_IN_WORKER": False})
 def test_soft_timeout_csv(
     csv_mock,
     email_mock,
@@ -2125,6 +2132,7 @@ def test_soft_timeout_csv(
 @patch("superset.utils.csv.urllib.request.OpenerDirector.open")
 @patch("superset.reports.notifications.email.send_email_smtp")
 @patch("superset.utils.csv.get_chart_csv_data")
+@with_config({"ALERT_REPORTS_CHART_DATA_IN_WORKER": False})
 def test_generate_no_csv(
     csv_mock,
     email_mock,
@@ -2191,6 +2199,7 @@ def test_fail_screenshot(screenshot_mock, email_mock, create_report_email_chart)
 @patch("superset.utils.csv.urllib.request.urlopen")
 @patch("superset.utils.csv.urllib.request.OpenerDirector.open")
 @patch("superset.utils.csv.get_chart_csv_data")
+@with_config({"ALERT_REPORTS_CHART_DATA_IN_WORKER": False})
 def test_fail_csv(
     csv_mock, mock_open, mock_urlopen, email_mock, create_report_email_chart_with_csv
 ):
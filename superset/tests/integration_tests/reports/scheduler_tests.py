@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from datetime import datetime
 from random import randint
 from unittest.mock import patch
 
@@ -74,7 +75,9 @@ def test_scheduler_celery_no_timeout_ny(execute_mock, owners):
 
     with freeze_time("2020-01-01T09:00:00Z"):
         scheduler()
-        assert execute_mock.call_args[1] == {"eta": FakeDatetime(2020, 1, 1, 9, 0)}
+        assert execute_mock.call_args[1]["eta"] == FakeDatetime(2020, 1, 1, 9, 0)
+        assert "soft_time_limit" not in execute_mock.call_args[1]
+        assert "time_limit" not in execute_mock.call_args[1]
     db.session.delete(report_schedule)
     db.session.commit()
     app.config["ALERT_REPORTS_WORKING_TIME_OUT_KILL"] = True
@@ -119,12 +122,70 @@ def test_scheduler_celery_no_timeout_utc(execute_mock, owners):
 
     with freeze_time("2020-01-01T09:00:00Z"):
         scheduler()
-        assert execute_mock.call_args[1] == {"eta": FakeDatetime(2020, 1, 1, 9, 0)}
+        assert execute_mock.call_args[1]["eta"] == FakeDatetime(2020, 1, 1, 9, 0)
+        assert "soft_time_limit" not in execute_mock.call_args[1]
+        assert "time_limit" not in execute_mock.call_args[1]
     db.session.delete(report_schedule)
     db.session.commit()
     app.config["ALERT_REPORTS_WORKING_TIME_OUT_KILL"] = True
 
 
+@pytest.mark.usefixtures("app_context")
+@patch("superset.tasks.scheduler.execute.apply_async")
+def test_scheduler_next_run(execute_mock, owners):
+    """
+    Reports scheduler: Test scheduler skipping reports that are not due
+    """
+    daily = insert_report_schedule(
+        type=ReportScheduleType.ALERT,
+        name="daily",
+        crontab="0 9 * * *",
+        timezone="UTC",
+        owners=owners,
+    )
+    hourly = insert_report_schedule(
+        type=ReportScheduleType.ALERT,
+        name="hourly",
+        crontab="0 * * * *",
+        timezone="UTC",
+        owners=owners,
+    )
+    assert daily.next_run is None
+
+    with freeze_time("2020-01-01T09:00:00Z"):
+        scheduler()
+        assert {call.args for call in execute_mock.call_args_list} == {
+            (daily.id,),
+            (hourly.id,),
+        }
+    assert daily.next_run == datetime(2020, 1, 2, 9, 0)
+    assert hourly.next_run == datetime(2020, 1, 1, 10, 0)
+
+    # only the hourly report is due
+    execute_mock.reset_mock()
+    with freeze_time("2020-01-01T10:00:00Z"):
+        scheduler()
+        assert [call.args for call in execute_mock.call_args_list] == [(hourly.id,)]
+
+    # editing the crontab invalidates the next run
+    daily.crontab = "0 11 * * *"
+    db.session.commit()
+    assert daily.next_run is None
+
+    execute_mock.reset_mock()
+    with freeze_time("2020-01-01T11:00:00Z"):
+        scheduler()
+        assert {call.args for call in execute_mock.call_args_list} == {
+            (daily.id,),
+            (hourly.id,),
+        }
+    assert daily.next_run == datetime(2020, 1, 2, 11, 0)
+
+    db.session.delete(daily)
+    db.session.delete(hourly)
+    db.session.commit()
+
+
 @pytest.mark.usefixtures("app_context")
 @patch("superset.tasks.scheduler.is_feature_enabled")
 @patch("superset.tasks.scheduler.execute.apply_async")
@@ -426,6 +426,53 @@ class TestSqlLabApi(SupersetTestCase):
 
         app.config["RESULTS_BACKEND_USE_MSGPACK"] = use_msgpack
 
+    def test_get_results_arrow(self):
+        import pyarrow as pa
+
+        from superset.commands.sql_lab import results as command
+        from superset.sqllab.compression import compress_results
+        from superset.sqllab.utils import (
+            ARROW_STREAM_MIMETYPE,
+            read_arrow_payload,
+            write_arrow_payload,
+        )
+
+        command.results_backend = mock.Mock()
+        self.login(ADMIN_USERNAME)
+
+        table = pa.table({"col_0": list(range(100))})
+        columns = [{"name": "col_0", "type": "INT", "is_dttm": False}]
+        payload = {
+            "status": QueryStatus.SUCCESS,
+            "query": {"rows": 100},
+            "selected_columns": columns,
+            "columns": columns,
+        }
+        command.results_backend.get.return_value = compress_results(
+            write_arrow_payload(table, payload)
+        )
+
+        query_mock = mock.Mock()
+        query_mock.database.db_engine_spec = get_example_database().db_engine_spec
+
+        with mock.patch("superset.commands.sql_lab.results.db") as mock_superset_db:
+            mock_superset_db.session.query().filter_by().one_or_none.return_value = (
+                query_mock
+            )
+            arguments = {"key": "key", "rows": 2}
+            url = f"/api/v1/sqllab/results/?q={prison.dumps(arguments)}"
+
+            rv = self.client.get(url, headers={"Accept": ARROW_STREAM_MIMETYPE})
+            assert rv.status_code == 200
+            assert rv.mimetype == ARROW_STREAM_MIMETYPE
+            got_table, metadata = read_arrow_payload(rv.data)
+            assert got_table.to_pydict() == {"col_0": [0, 1]}
+            assert metadata["query"] == {"rows": 100}
+
+            result = json.loads(self.get_resp(url))
+            assert result["data"] == [{"col_0": 0}, {"col_0": 1}]
+            assert result["displayLimitReached"] is True
+
     @mock.patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)  # noqa: PT008
     @mock.patch("superset.models.core.Database.get_df")
     def test_export_results(self, get_df_mock: mock.Mock) -> None:
@@ -0,0 +1,64 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.charts.data.api import ChartDataRestApi
+from superset.common.chart_data import ChartDataResultType
+
+
+@pytest.mark.parametrize(
+    "result_type, post_processed",
+    [
+        (ChartDataResultType.FULL, False),
+        (ChartDataResultType.POST_PROCESSED, True),
+    ],
+)
+def test_get_batch_data_result(
+    mocker: MockerFixture,
+    result_type: ChartDataResultType,
+    post_processed: bool,
+) -> None:
+    """
+    Test that the charts of a batch are post-processed like single charts.
+    """
+    mocker.patch(
+        "superset.charts.data.api.security_manager",
+        is_guest_user=MagicMock(return_value=False),
+    )
+    apply_client_processing = mocker.patch(
+        "superset.charts.data.api.apply_client_processing",
+        return_value={"queries": [{"data": "processed"}]},
+    )
+    command = MagicMock()
+    command.query_context.result_type = result_type
+    command.run.return_value = {"queries": [{"data": "raw"}]}
+
+    result = ChartDataRestApi._get_batch_data_result(MagicMock(), command)
+
+    if post_processed:
+        apply_client_processing.assert_called_once_with(
+            command.run.return_value,
+            command.query_context.form_data,
+            command.query_context.datasource,
+        )
+        assert result == {"status": 200, "result": [{"data": "processed"}]}
+    else:
+        apply_client_processing.assert_not_called()
+        assert result == {"status": 200, "result": [{"data": "raw"}]}
@@ -0,0 +1,148 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import gzip
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from cachelib import SimpleCache
+from flask import current_app, request, Response
+from pytest_mock import MockerFixture
+
+from superset.charts.data import response_cache
+from superset.charts.data.response_cache import (
+    get_response_cache_key,
+    load_response,
+    store_response,
+)
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.db_query_status import QueryStatus
+
+
+@pytest.fixture
+def data_cache(mocker: MockerFixture) -> SimpleCache:
+    store = SimpleCache()
+    mocker.patch.object(
+        response_cache,
+        "cache_manager",
+        data_cache=MagicMock(
+            cache=store,
+            get=store.get,
+            set=store.set,
+            delete=store.delete,
+        ),
+    )
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "CHART_DATA_RESPONSE_CACHE": True,
+            "CHART_DATA_RESPONSE_CACHE_ENCODING": None,
+        },
+    )
+    return store
+
+
+def get_query(**kwargs: Any) -> dict[str, Any]:
+    return {
+        "is_cached": True,
+        "status": QueryStatus.SUCCESS,
+        "cached_dttm": (datetime.utcnow() - timedelta(seconds=10)).isoformat(),
+        "cache_timeout": 60,
+        **kwargs,
+    }
+
+
+def test_get_response_cache_key(mocker: MockerFixture, data_cache: SimpleCache) -> None:
+    """
+    Test that the response cache key depends on the data cache keys and format.
+    """
+    mocker.patch.object(
+        response_cache,
+        "security_manager",
+        is_guest_user=MagicMock(return_value=False),
+    )
+    query_context = MagicMock(
+        queries=[MagicMock()],
+        result_type=ChartDataResultType.FULL,
+        result_format=ChartDataResultFormat.JSON,
+    )
+    query_context.query_cache_key.return_value = "abc"
+
+    json_key = get_response_cache_key(query_context)
+    assert json_key
+    query_context.result_format = ChartDataResultFormat.ARROW
+    assert get_response_cache_key(query_context) not in {None, json_key}
+
+    query_context.result_format = ChartDataResultFormat.CSV
+    assert get_response_cache_key(query_context) is None
+
+    query_context.result_format = ChartDataResultFormat.JSON
+    query_context.result_type = ChartDataResultType.POST_PROCESSED
+    assert get_response_cache_key(query_context) is None
+
+    query_context.result_type = ChartDataResultType.FULL
+    current_app.config["CHART_DATA_RESPONSE_CACHE"] = False
+    assert get_response_cache_key(query_context) is None
+
+
+def test_store_response(data_cache: SimpleCache) -> None:
+    """
+    Test that responses built from cached data are cached until the data expires.
+    """
+    with current_app.test_request_context():
+        response = Response('{"result": []}', content_type="application/json")
+        store_response("key", response, [get_query()])
+        etag = response.get_etag()[0]
+        assert etag
+
+        cached_response = load_response("key")
+        assert cached_response.get_data() == b'{"result": []}'
+        assert cached_response.get_etag()[0] == etag
+        assert cached_response.content_type == "application/json"
+
+    with current_app.test_request_context(headers={"If-None-Match": f'"{etag}"'}):
+        assert load_response("key").make_conditional(request).status_code == 304
+
+
+def test_store_response_not_cached(data_cache: SimpleCache) -> None:
+    """
+    Test that responses built from fresh or expired data aren't cached.
+    """
+    with current_app.test_request_context():
+        for query in [
+            get_query(is_cached=False),
+            get_query(status=QueryStatus.FAILED),
+            get_query(cache_timeout=5),
+        ]:
+            store_response("key", Response("{}"), [get_query(), query])
+            assert load_response("key") is None
+
+
+def test_store_response_compressed(data_cache: SimpleCache) -> None:
+    """
+    Test that compressed responses are only sent to clients accepting them.
+    """
+    current_app.config["CHART_DATA_RESPONSE_CACHE_ENCODING"] = "gzip"
+    with current_app.test_request_context():
+        store_response("key", Response('{"result": []}'), [get_query()])
+        assert load_response("key").get_data() == b'{"result": []}'
+
+    with current_app.test_request_context(headers={"Accept-Encoding": "gzip, br"}):
+        response = load_response("key")
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.get_data()) == b'{"result": []}'
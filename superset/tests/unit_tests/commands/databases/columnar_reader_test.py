@@ -21,6 +21,7 @@ from zipfile import ZipFile
 
 import numpy as np
 import pytest
+from pytest_mock import MockerFixture
 from werkzeug.datastructures import FileStorage
 
 from superset.commands.database.exceptions import DatabaseUploadFailed
@@ -203,6 +204,27 @@ def test_columnar_reader_zip():
     ]
 
 
+def test_columnar_reader_read_chunks_not_supported(mocker: MockerFixture) -> None:
+    """
+    Test that columnar files are uploaded in one piece to databases that can't
+    append to a table.
+    """
+    from superset.db_engine_specs.gsheets import GSheetsEngineSpec
+
+    df_to_sql = mocker.patch.object(GSheetsEngineSpec, "df_to_sql")
+    database = mocker.MagicMock(db_engine_spec=GSheetsEngineSpec)
+
+    ColumnarReader(options=ColumnarReaderOptions()).read(
+        create_columnar_file(COLUMNAR_DATA, "test.parquet"),
+        database,
+        "my_table",
+        None,
+    )
+
+    df_to_sql.assert_called_once()
+    assert df_to_sql.call_args.args[2]["Name"].tolist() == COLUMNAR_DATA["Name"]
+
+
 def test_columnar_reader_bad_parquet_in_zip():
     reader = ColumnarReader(
         options=ColumnarReaderOptions(),
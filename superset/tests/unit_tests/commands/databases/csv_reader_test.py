@@ -20,6 +20,8 @@ from datetime import datetime
 import numpy as np
 import pandas as pd
 import pytest
+from flask import current_app
+from pytest_mock import MockerFixture
 from werkzeug.datastructures import FileStorage
 
 from superset.commands.database.exceptions import DatabaseUploadFailed
@@ -770,3 +772,143 @@ def test_csv_reader_progressive_encoding_detection():
 
     # Test that the method handles the sample sizes properly
     assert all(size > 0 for size in read_sizes), "All sample sizes should be positive"
+
+
+def test_csv_reader_file_to_dataframe_chunks(mocker: MockerFixture) -> None:
+    """
+    Test that the file is read in chunks when `CSV_UPLOAD_STREAMING` is enabled.
+    """
+    mocker.patch.dict(
+        current_app.config,
+        {"CSV_UPLOAD_STREAMING": True, "READ_CSV_CHUNK_SIZE": 2},
+    )
+    data = [["id", "name"]] + [[str(i), f"name{i}"] for i in range(5)]
+
+    chunks = list(CSVReader().file_to_dataframe_chunks(create_csv_file(data)))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert pd.concat(chunks)["id"].tolist() == [0, 1, 2, 3, 4]
+
+    chunks = list(
+        CSVReader(
+            options=CSVReaderOptions(rows_to_read=3),
+        ).file_to_dataframe_chunks(create_csv_file(data))
+    )
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+
+    mocker.patch.dict(current_app.config, {"CSV_UPLOAD_STREAMING": False})
+    chunks = list(CSVReader().file_to_dataframe_chunks(create_csv_file(data)))
+    assert [len(chunk) for chunk in chunks] == [5]
+
+
+def test_csv_reader_read_uploads_chunks(mocker: MockerFixture) -> None:
+    """
+    Test that streamed files are uploaded chunk by chunk.
+    """
+    mocker.patch.dict(
+        current_app.config,
+        {"CSV_UPLOAD_STREAMING": True, "READ_CSV_CHUNK_SIZE": 2},
+    )
+    database = mocker.MagicMock()
+    data = [["id"]] + [[str(i)] for i in range(5)]
+
+    CSVReader(
+        options=CSVReaderOptions(already_exists="replace"),
+    ).read(create_csv_file(data), database, "my_table", None)
+
+    database.db_engine_spec.df_to_sql.assert_not_called()
+    call = database.db_engine_spec.df_chunks_to_sql.call_args
+    assert call.kwargs["to_sql_kwargs"]["if_exists"] == "replace"
+    assert [len(chunk) for chunk in call.args[2]] == [2, 2, 1]
+
+
+@pytest.mark.parametrize(
+    "data, options",
+    [
+        (CSV_DATA, CSVReaderOptions()),
+        (CSV_DATA, CSVReaderOptions(columns_read=["Name", "Age"])),
+        (CSV_DATA, CSVReaderOptions(rows_to_read=1)),
+        (CSV_DATA, CSVReaderOptions(column_dates=["Birth"])),
+        (CSV_DATA, CSVReaderOptions(index_column="Name")),
+        (CSV_DATA, CSVReaderOptions(column_data_types={"Age": "float64"})),
+        (CSV_DATA_CHANGED_HEADER, CSVReaderOptions(header_row=1)),
+        (CSV_DATA_CHANGED_HEADER, CSVReaderOptions(skip_rows=1)),
+        (CSV_DATA_WITH_NULLS, CSVReaderOptions(null_values=["N/A", "None"])),
+        (CSV_DATA_DAY_FIRST, CSVReaderOptions(day_first=True, column_dates=["Birth"])),
+        (CSV_DATA_DECIMAL_CHAR, CSVReaderOptions(decimal_character=",")),
+    ],
+)
+def test_csv_reader_file_to_dataframe_chunks_pyarrow(
+    mocker: MockerFixture,
+    data: list[list[str]],
+    options: CSVReaderOptions,
+) -> None:
+    """
+    Test that CSV files streamed with pyarrow are read like pandas reads them.
+    """
+    mocker.patch.dict(current_app.config, {"CSV_UPLOAD_STREAMING": True})
+    mocker.patch(
+        "superset.commands.database.uploaders.csv_reader.is_feature_enabled",
+        return_value=True,
+    )
+    read_csv_chunks = mocker.spy(CSVReader, "_read_csv_chunks")
+    csv_reader = CSVReader(options=options)
+
+    chunks = list(csv_reader.file_to_dataframe_chunks(create_csv_file(data)))
+    mocker.patch.dict(current_app.config, {"CSV_UPLOAD_STREAMING": False})
+    expected = csv_reader.file_to_dataframe(create_csv_file(data))
+
+    read_csv_chunks.assert_not_called()
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks),
+        expected,
+        check_index_type=False,
+        check_dtype=False,
+    )
+
+
+def test_csv_reader_file_to_dataframe_chunks_pyarrow_batches(
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test that small blocks are read as consecutive chunks.
+    """
+    mocker.patch.dict(
+        current_app.config,
+        {"CSV_UPLOAD_STREAMING": True, "CSV_UPLOAD_STREAMING_BLOCK_SIZE": 64},
+    )
+    mocker.patch(
+        "superset.commands.database.uploaders.csv_reader.is_feature_enabled",
+        return_value=True,
+    )
+    data = [["id", "name", "value"]] + [
+        [str(i), f"name_{i}", "" if i < 5 else str(i / 2)] for i in range(50)
+    ]
+
+    chunks = list(CSVReader().file_to_dataframe_chunks(create_csv_file(data)))
+
+    assert len(chunks) > 1
+    df = pd.concat(chunks)
+    assert df.index.tolist() == list(range(50))
+    assert df["id"].tolist() == list(range(50))
+    assert df["value"].tolist() == [""] * 5 + [str(i / 2) for i in range(5, 50)]
+
+
+def test_csv_reader_file_to_dataframe_chunks_pyarrow_type_error(
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test that rows that don't match the types inferred from the first block fail.
+    """
+    mocker.patch.dict(
+        current_app.config,
+        {"CSV_UPLOAD_STREAMING": True, "CSV_UPLOAD_STREAMING_BLOCK_SIZE": 16},
+    )
+    mocker.patch(
+        "superset.commands.database.uploaders.csv_reader.is_feature_enabled",
+        return_value=True,
+    )
+    data = [["id"]] + [[str(i)] for i in range(10)] + [["abc"]]
+
+    with pytest.raises(DatabaseUploadFailed) as ex:
+        list(CSVReader().file_to_dataframe_chunks(create_csv_file(data)))
+    assert "Parsing error" in str(ex.value)
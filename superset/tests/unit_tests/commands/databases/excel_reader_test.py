@@ -19,8 +19,11 @@ from datetime import datetime
 from typing import Any
 
 import numpy as np
+import pandas as pd
 import pytest
 import xlsxwriter
+from flask import current_app
+from pytest_mock import MockerFixture
 from werkzeug.datastructures import FileStorage
 from xlsxwriter.workbook import Worksheet
 
@@ -292,3 +295,86 @@ def test_excel_reader_file_metadata_invalid_file():
     with pytest.raises(DatabaseUploadFailed) as ex:
         excel_reader.file_metadata(FileStorage(io.BytesIO(b"1")))
     assert str(ex.value) == ("Excel file format cannot be determined")
+
+
+@pytest.mark.parametrize(
+    "data, options",
+    [
+        (EXCEL_DATA, ExcelReaderOptions()),
+        (EXCEL_DATA, ExcelReaderOptions(columns_read=["Name", "Age"])),
+        (EXCEL_DATA, ExcelReaderOptions(rows_to_read=1)),
+        (EXCEL_DATA, ExcelReaderOptions(skip_rows=1)),
+        (EXCEL_DATA, ExcelReaderOptions(column_dates=["Birth"])),
+        (EXCEL_DATA, ExcelReaderOptions(index_column="Name")),
+        (EXCEL_WITH_NULLS, ExcelReaderOptions(null_values=["N/A", "None"])),
+        (EXCEL_DATA_DECIMAL_CHAR, ExcelReaderOptions(decimal_character=",")),
+    ],
+)
+def test_excel_reader_file_to_dataframe_chunks(
+    mocker: MockerFixture,
+    data: dict[str, list[Any]],
+    options: ExcelReaderOptions,
+) -> None:
+    """
+    Test that streamed xlsx files are read like `pd.read_excel` reads them.
+    """
+    mocker.patch.dict(
+        current_app.config,
+        {"EXCEL_UPLOAD_STREAMING": True, "READ_CSV_CHUNK_SIZE": 2},
+    )
+    excel_reader = ExcelReader(options=options)
+
+    chunks = list(
+        excel_reader.file_to_dataframe_chunks(create_excel_file(data, "test.xlsx"))
+    )
+    expected = excel_reader.file_to_dataframe(create_excel_file(data, "test.xlsx"))
+
+    assert [len(chunk) for chunk in chunks] == [
+        min(2, len(expected) - i) for i in range(0, len(expected), 2)
+    ]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks),
+        expected,
+        check_index_type=False,
+        check_dtype=False,
+    )
+
+
+def test_excel_reader_read_chunks_not_supported(mocker: MockerFixture) -> None:
+    """
+    Test that streamed xlsx files are uploaded in one piece to databases that can't
+    append to a table.
+    """
+    from superset.db_engine_specs.hive import HiveEngineSpec
+
+    mocker.patch.dict(
+        current_app.config,
+        {"EXCEL_UPLOAD_STREAMING": True, "READ_CSV_CHUNK_SIZE": 2},
+    )
+    df_to_sql = mocker.patch.object(HiveEngineSpec, "df_to_sql")
+    database = mocker.MagicMock(db_engine_spec=HiveEngineSpec)
+
+    ExcelReader(
+        options=ExcelReaderOptions(already_exists="replace"),
+    ).read(create_excel_file(EXCEL_DATA, "test.xlsx"), database, "my_table", None)
+
+    df_to_sql.assert_called_once()
+    assert df_to_sql.call_args.args[2]["Name"].tolist() == EXCEL_DATA["Name"]
+    assert df_to_sql.call_args.args[3]["if_exists"] == "replace"
+
+
+def test_excel_reader_file_to_dataframe_chunks_xls(mocker: MockerFixture) -> None:
+    """
+    Test that only xlsx files are streamed.
+    """
+    mocker.patch.dict(
+        current_app.config,
+        {"EXCEL_UPLOAD_STREAMING": True, "READ_CSV_CHUNK_SIZE": 2},
+    )
+    file_to_dataframe = mocker.patch.object(ExcelReader, "file_to_dataframe")
+
+    chunks = list(
+        ExcelReader().file_to_dataframe_chunks(create_excel_file(EXCEL_DATA, "a.xls"))
+    )
+
+    assert chunks == [file_to_dataframe.return_value]
@@ -203,3 +203,68 @@ def test_tables_without_catalog(
         cache=database_without_catalog.table_cache_enabled,
         cache_timeout=database_without_catalog.table_cache_timeout,
     )
+
+
+def test_tables_search_and_paging(
+    mocker: MockerFixture,
+    database_with_catalog: MockerFixture,
+) -> None:
+    """
+    Test that tables are searched and paged, loading only the datasets of the page.
+    """
+    mocker.patch.object(
+        security_manager,
+        "get_datasources_accessible_by_user",
+        side_effect=lambda datasource_names, **kwargs: datasource_names,
+    )
+    database_with_catalog.get_all_table_names_in_schema.return_value = {
+        ("my_table", "schema1", "catalog1"),
+        ("table1", "schema1", "catalog1"),
+        ("table2", "schema1", "catalog1"),
+        ("other", "schema1", "catalog1"),
+    }
+
+    db = mocker.patch("superset.commands.database.tables.db")
+    db.session.query().filter().options().all.return_value = []
+
+    payload = TablesDatabaseCommand(
+        1,
+        "catalog1",
+        "schema1",
+        False,
+        search="TABLE",
+        page=0,
+        page_size=2,
+    ).run()
+    assert payload == {
+        "count": 3,
+        "result": [
+            {"value": "table1", "type": "table", "extra": None},
+            {"value": "table2", "type": "table", "extra": None},
+        ],
+    }
+
+    payload = TablesDatabaseCommand(
+        1,
+        "catalog1",
+        "schema1",
+        False,
+        search="TABLE",
+        page=1,
+        page_size=2,
+    ).run()
+    assert payload == {
+        "count": 3,
+        "result": [{"value": "my_table", "type": "table", "extra": None}],
+    }
+
+    payload = TablesDatabaseCommand(
+        1,
+        "catalog1",
+        "schema1",
+        False,
+        search="view",
+        page=0,
+        page_size=2,
+    ).run()
+    assert payload == {"count": 1, "result": [{"value": "view1", "type": "view"}]}
@@ -17,10 +17,15 @@
 
 import json  # noqa: TID251
 from datetime import datetime
+from io import BytesIO
+from typing import Any
 from unittest.mock import patch
 from uuid import UUID
+from zipfile import ZipFile
 
+import pandas as pd
 import pytest
+from flask import current_app
 from pytest_mock import MockerFixture
 
 from superset.app import SupersetApp
@@ -34,7 +39,7 @@ from superset.reports.models import (
     ReportScheduleType,
     ReportSourceFormat,
 )
-from superset.utils.core import HeaderDataType
+from superset.utils.core import GenericDataType, HeaderDataType
 from superset.utils.screenshots import ChartScreenshot
 from tests.integration_tests.conftest import with_feature_flags
 
@@ -453,6 +458,7 @@ def test_screenshot_width_calculation(
                 "dashboard": (window_width, 600),
             },
             "ALERT_REPORTS_EXECUTORS": {},
+            "ALERT_REPORTS_SCREENSHOT_REUSE_TIMEOUT": None,
         }
     )
 
@@ -576,3 +582,185 @@ def test_update_recipient_to_slack_v2_missing_channels(mocker: MockerFixture):
     )
     with pytest.raises(UpdateFailedError):
         mock_cmmd.update_report_schedule_slack_v2()
+
+
+def create_chart_data_report_state(
+    mocker: MockerFixture,
+    queries: list[dict[str, Any]],
+) -> BaseReportState:
+    """
+    Helper function to create a report state for a chart whose data is queried
+    in the worker.
+    """
+    report_schedule = mocker.Mock(spec=ReportSchedule)
+    report_schedule.chart.query_context = json.dumps({"queries": [{}]})
+    report_schedule.chart.params = json.dumps({"viz_type": "line"})
+    report_schedule.force_screenshot = False
+
+    mocker.patch(
+        "superset.commands.report.execute.get_executor",
+        return_value=("executor", "admin"),
+    )
+    mocker.patch(
+        "superset.commands.report.execute.security_manager",
+        find_user=mocker.MagicMock(return_value=mocker.MagicMock(username="admin")),
+        can_access=mocker.MagicMock(return_value=True),
+    )
+    mocker.patch("superset.commands.report.execute.machine_auth_provider_factory")
+    mocker.patch("superset.commands.report.execute.ChartDataQueryContextSchema")
+    command = mocker.patch("superset.commands.report.execute.ChartDataCommand")
+    command.return_value.run.return_value = {"queries": queries}
+
+    return BaseReportState(
+        report_schedule, datetime.now(), UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524")
+    )
+
+
+def test_get_csv_data_in_worker(mocker: MockerFixture) -> None:
+    """
+    Test that the CSV is generated by running the chart query context directly.
+    """
+    get_chart_csv_data = mocker.patch(
+        "superset.commands.report.execute.get_chart_csv_data"
+    )
+    report_state = create_chart_data_report_state(
+        mocker,
+        [{"result_format": "csv", "data": "a,b\n1,2\n"}],
+    )
+
+    encoding = current_app.config["CSV_EXPORT"].get("encoding", "utf-8")
+    assert report_state._get_csv_data() == "a,b\n1,2\n".encode(encoding)
+    get_chart_csv_data.assert_not_called()
+
+    from superset.commands.report.execute import ChartDataQueryContextSchema
+
+    form = ChartDataQueryContextSchema.return_value.load.call_args[0][0]
+    assert form["result_format"] == "csv"
+    assert form["result_type"] == "post_processed"
+    assert form["force"] is False
+
+
+def test_get_csv_data_in_worker_multiple_queries(mocker: MockerFixture) -> None:
+    """
+    Test that charts with multiple queries produce a zip of CSV files.
+    """
+    report_state = create_chart_data_report_state(
+        mocker,
+        [
+            {"result_format": "csv", "data": "a\n1\n"},
+            {"result_format": "csv", "data": "b\n2\n"},
+        ],
+    )
+
+    with ZipFile(BytesIO(report_state._get_csv_data())) as bundle:
+        assert bundle.namelist() == ["query_1.csv", "query_2.csv"]
+        assert bundle.read("query_2.csv").decode("utf-8-sig") == "b\n2\n"
+
+
+def test_get_embedded_data_in_worker(mocker: MockerFixture) -> None:
+    """
+    Test that the dataframe is built from the chart query results.
+    """
+    report_state = create_chart_data_report_state(
+        mocker,
+        [
+            {
+                "result_format": "json",
+                "data": [{"ds": pd.Timestamp("2024-01-01"), "count": 1}],
+                "colnames": ["ds", "count"],
+                "indexnames": [0],
+                "coltypes": [GenericDataType.TEMPORAL, GenericDataType.NUMERIC],
+            }
+        ],
+    )
+
+    df = report_state._get_embedded_data()
+    assert df[("ds",)].tolist() == [pd.Timestamp("2024-01-01")]
+    assert df[("count",)].tolist() == [1]
+
+
+def test_get_screenshots_concurrently_and_reused(
+    app: SupersetApp,
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test that dashboard tabs are captured concurrently, and that the screenshots are
+    reused by reports capturing the same dashboard state.
+    """
+    mocker.patch.dict(
+        app.config,
+        {
+            "ALERT_REPORTS_SCREENSHOT_CONCURRENCY": 2,
+            "ALERT_REPORTS_SCREENSHOT_REUSE_TIMEOUT": 60,
+        },
+    )
+    mocker.patch(
+        "superset.commands.report.execute.get_executor",
+        return_value=("executor", "admin"),
+    )
+    mocker.patch(
+        "superset.commands.report.execute.security_manager",
+        find_user=mocker.MagicMock(return_value=mocker.MagicMock(username="admin")),
+    )
+    cache: dict[str, Any] = {}
+    mocker.patch(
+        "superset.commands.report.execute.cache_manager",
+        thumbnail_cache=mocker.MagicMock(
+            get=cache.get,
+            set=lambda key, value, timeout: cache.__setitem__(key, value),
+        ),
+    )
+    get_screenshot = mocker.patch(
+        "superset.utils.screenshots.DashboardScreenshot.get_screenshot",
+        side_effect=lambda user: b"tab",
+    )
+
+    def run_report() -> list[bytes]:
+        report_schedule = mocker.Mock(spec=ReportSchedule)
+        report_schedule.chart = None
+        report_schedule.chart_id = None
+        report_schedule.dashboard_id = 1
+        report_schedule.dashboard.digest = "digest"
+        report_schedule.extra = {}
+        report_schedule.custom_width = None
+        report_schedule.custom_height = None
+        report_schedule.force_screenshot = False
+        report_state = BaseReportState(
+            report_schedule,
+            datetime.now(),
+            UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+        )
+        report_state.get_dashboard_urls = mocker.MagicMock(  # type: ignore
+            return_value=["http://tab1", "http://tab2"],
+        )
+        return report_state._get_screenshots()
+
+    assert run_report() == [b"tab", b"tab"]
+    assert get_screenshot.call_count == 2
+
+    assert run_report() == [b"tab", b"tab"]
+    assert get_screenshot.call_count == 2
+
+
+def test_get_screenshots_cache_key(app: SupersetApp, mocker: MockerFixture) -> None:
+    """
+    Test that screenshots are only shared when enabled, and when their digests are
+    known.
+    """
+    report_schedule = create_report_schedule(mocker)
+    report_schedule.chart_id = 1
+    report_state = BaseReportState(
+        report_schedule,
+        datetime.now(),
+        UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+    )
+    screenshot = mocker.MagicMock(digest="digest", window_size=(800, 600))
+
+    mocker.patch.dict(app.config, {"ALERT_REPORTS_SCREENSHOT_REUSE_TIMEOUT": None})
+    assert report_state._get_screenshots_cache_key([screenshot], "admin") is None
+
+    mocker.patch.dict(app.config, {"ALERT_REPORTS_SCREENSHOT_REUSE_TIMEOUT": 60})
+    assert report_state._get_screenshots_cache_key([screenshot], "admin")
+
+    screenshot.digest = None
+    assert report_state._get_screenshots_cache_key([screenshot], "admin") is None
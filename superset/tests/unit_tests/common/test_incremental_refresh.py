@@ -0,0 +1,246 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from cachelib import SimpleCache
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.query_context import QueryContext
+from superset.common.query_context_processor import QueryContextProcessor
+from superset.common.query_object import QueryObject
+from superset.common.utils import query_cache_manager
+from superset.common.utils.incremental_refresh import (
+    get_cache_query_object,
+    get_incremental_axis,
+    get_time_window_query_object,
+    get_time_windows,
+    IncrementalAxis,
+)
+from superset.constants import CacheRegion
+from superset.models.helpers import QueryResult
+
+AXIS = {
+    "label": "ds",
+    "sqlExpression": "ds",
+    "columnType": "BASE_AXIS",
+    "timeGrain": "P1D",
+}
+PIVOT = {"operation": "pivot", "options": {"index": ["ds"]}}
+
+
+def create_query_object(
+    datasource: Any = None,
+    time_range: str = "2024-01-01T06:00:00 : 2024-01-05T06:00:00",
+    native_filter: bool = False,
+    **kwargs: Any,
+) -> QueryObject:
+    return QueryObject(
+        **{
+            "datasource": datasource,
+            "columns": [AXIS],
+            "metrics": ["count"],
+            "filters": [{"col": "ds", "op": "TEMPORAL_RANGE", "val": time_range}],
+            "post_processing": [PIVOT],
+            # the time range of a dashboard native filter is also set on the filter
+            "time_range": time_range if native_filter else None,
+            **kwargs,
+        }
+    )
+
+
+def test_get_incremental_axis() -> None:
+    """
+    Test which query objects can be refreshed incrementally.
+    """
+    assert get_incremental_axis(create_query_object()) == IncrementalAxis("ds", "D")
+    assert get_incremental_axis(
+        create_query_object(native_filter=True)
+    ) == IncrementalAxis("ds", "D")
+
+    assert get_incremental_axis(create_query_object(post_processing=[])) is None
+    assert get_incremental_axis(create_query_object(series_limit=5)) is None
+    assert get_incremental_axis(create_query_object(columns=["ds"])) is None
+    assert (
+        get_incremental_axis(
+            create_query_object(columns=[{**AXIS, "timeGrain": "P1M"}])
+        )
+        is None
+    )
+    assert get_incremental_axis(create_query_object(filters=[])) is None
+    # the shifted bounds of a window would be shifted again when querying it
+    assert get_incremental_axis(create_query_object(time_shift="1 week ago")) is None
+
+    # the time range of the query object must match its time range filter
+    query_object = create_query_object(native_filter=True)
+    query_object.time_range = "Last week"
+    assert get_incremental_axis(query_object) is None
+
+
+def test_get_time_windows() -> None:
+    """
+    Test that the buckets still in range are kept and the others are queried again.
+    """
+    df = pd.DataFrame(
+        {
+            "ds": pd.date_range("2024-01-01", "2024-01-05", freq="D"),
+            "count": [18, 24, 24, 24, 6],
+        }
+    )
+    axis = IncrementalAxis("ds", "D")
+    cached_range = (datetime(2024, 1, 1, 6), datetime(2024, 1, 5, 6))
+
+    rows, windows = get_time_windows(
+        df,
+        axis,
+        cached_range,
+        (datetime(2024, 1, 2, 12), datetime(2024, 1, 6, 12)),
+    )
+    assert rows["ds"].tolist() == [
+        pd.Timestamp("2024-01-03"),
+        pd.Timestamp("2024-01-04"),
+    ]
+    assert windows == [
+        (datetime(2024, 1, 2, 12), datetime(2024, 1, 3)),
+        (datetime(2024, 1, 5), datetime(2024, 1, 6, 12)),
+    ]
+
+    # ranges moving backward, or past the previous result, can't be refreshed
+    assert not get_time_windows(
+        df,
+        axis,
+        cached_range,
+        (datetime(2024, 1, 1), datetime(2024, 1, 6)),
+    )
+    assert not get_time_windows(
+        df,
+        axis,
+        cached_range,
+        (datetime(2024, 1, 5, 12), datetime(2024, 1, 9)),
+    )
+
+
+def test_get_time_window_query_object() -> None:
+    """
+    Test that the time range filter of a query object is replaced by a time window.
+    """
+    query_object = create_query_object()
+    window_query_object = get_time_window_query_object(
+        query_object,
+        datetime(2024, 1, 5),
+        datetime(2024, 1, 6, 12),
+    )
+    assert window_query_object.filter == [
+        {
+            "col": "ds",
+            "op": "TEMPORAL_RANGE",
+            "val": "2024-01-05 00:00:00 : 2024-01-06 12:00:00",
+        }
+    ]
+    assert window_query_object.from_dttm == datetime(2024, 1, 5)
+    assert window_query_object.time_range is None
+    assert query_object.filter[0]["val"] == "2024-01-01T06:00:00 : 2024-01-05T06:00:00"
+
+    query_object = create_query_object(native_filter=True)
+    window_query_object = get_time_window_query_object(
+        query_object,
+        datetime(2024, 1, 5),
+        datetime(2024, 1, 6, 12),
+    )
+    assert window_query_object.time_range == "2024-01-05 00:00:00 : 2024-01-06 12:00:00"
+    assert get_cache_query_object(query_object).time_range is None
+    assert query_object.time_range == "2024-01-01T06:00:00 : 2024-01-05T06:00:00"
+
+
+@pytest.fixture
+def datasource(mocker: MockerFixture) -> MagicMock:
+    store = SimpleCache()
+    data_cache = MagicMock(cache=store, get=store.get, set=store.set)
+    mocker.patch.dict(query_cache_manager._cache, {CacheRegion.DATA: data_cache})
+    mocker.patch.dict(
+        current_app.config,
+        {"DATA_CACHE_RAW_RESULTS": False, "DATA_CACHE_INCREMENTAL_REFRESH_TIMEOUT": 60},
+    )
+    mocker.patch(
+        "superset.common.query_context_processor.security_manager",
+        get_rls_cache_key=MagicMock(return_value=[]),
+    )
+
+    datasource = MagicMock(
+        uid="1__table",
+        changed_on=None,
+        database=None,
+        cache_timeout=60,
+        verbose_map={},
+    )
+    datasource.get_extra_cache_keys.return_value = []
+
+    # one row per hour, aggregated by day
+    def query(query_obj: dict[str, Any]) -> QueryResult:
+        start, end = query_obj["filter"][0]["val"].split(" : ")
+        timestamps = pd.date_range(start, end, freq="h", inclusive="left")
+        df = timestamps.floor("D").value_counts().sort_index()
+        return QueryResult(
+            df=pd.DataFrame({"ds": df.index, "count": df.values}),
+            query=f"SELECT ... WHERE ds >= '{start}' AND ds < '{end}'",
+            duration=timedelta(0),
+        )
+
+    datasource.query.side_effect = query
+    return datasource
+
+
+@pytest.mark.parametrize("native_filter", [False, True])
+def test_query_datasource_incremental(
+    datasource: MagicMock,
+    native_filter: bool,
+) -> None:
+    """
+    Test that only the changed time windows are queried when the time range moves.
+    """
+    query_context = QueryContext(
+        datasource=datasource,
+        queries=[],
+        slice_=None,
+        form_data=None,
+        result_type=ChartDataResultType.FULL,
+        result_format=ChartDataResultFormat.JSON,
+        cache_values={},
+    )
+    processor = QueryContextProcessor(query_context)
+
+    processor._query_datasource(
+        create_query_object(datasource, native_filter=native_filter)
+    )
+    assert datasource.query.call_count == 1
+
+    time_range = "2024-01-02T12:00:00 : 2024-01-06T12:00:00"
+    result = processor._query_datasource(
+        create_query_object(datasource, time_range, native_filter=native_filter)
+    )
+    assert datasource.query.call_count == 3
+    assert "'2024-01-05 00:00:00'" in result.query
+
+    expected = datasource.query.side_effect(
+        create_query_object(datasource, time_range).to_dict()
+    )
+    pd.testing.assert_frame_equal(result.df, expected.df, check_dtype=False)
@@ -0,0 +1,190 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from cachelib import SimpleCache
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.query_context import QueryContext
+from superset.common.query_context_batch import prefetch_merged_query_results
+from superset.common.query_object import QueryObject
+from superset.common.utils import query_cache_manager
+from superset.constants import CacheRegion
+from superset.models.helpers import QueryResult
+
+
+@pytest.fixture
+def datasource(mocker: MockerFixture) -> MagicMock:
+    store = SimpleCache()
+    data_cache = MagicMock(cache=store, get=store.get, set=store.set)
+    mocker.patch.dict(query_cache_manager._cache, {CacheRegion.DATA: data_cache})
+    mocker.patch.dict(current_app.config, {"DATA_CACHE_RAW_RESULTS": True})
+    mocker.patch(
+        "superset.common.query_context_processor.security_manager",
+        get_rls_cache_key=MagicMock(return_value=[]),
+    )
+
+    datasource = MagicMock(
+        uid="1__table",
+        changed_on=None,
+        database=None,
+        cache_timeout=60,
+        column_names=["a", "b"],
+        verbose_map={},
+    )
+    datasource.get_extra_cache_keys.return_value = []
+
+    def query(query_obj: dict[str, Any]) -> QueryResult:
+        data = {column: ["x", "y"] for column in query_obj["columns"]}
+        data.update({metric: [1, 2] for metric in query_obj["metrics"]})
+        return QueryResult(
+            df=pd.DataFrame(data),
+            query="SELECT ...",
+            duration=0,
+        )
+
+    datasource.query.side_effect = query
+    return datasource
+
+
+def create_query_context(datasource: MagicMock, **kwargs: Any) -> QueryContext:
+    return QueryContext(
+        datasource=datasource,
+        queries=[QueryObject(datasource=datasource, **kwargs)],
+        slice_=None,
+        form_data=None,
+        result_type=ChartDataResultType.FULL,
+        result_format=ChartDataResultFormat.JSON,
+        cache_values={},
+    )
+
+
+def test_prefetch_merged_query_results(datasource: MagicMock) -> None:
+    """
+    Test that the queries which only differ in their metrics run as a single query.
+    """
+    count = create_query_context(datasource, columns=["a"], metrics=["count"])
+    count_sum = create_query_context(
+        datasource,
+        columns=["a"],
+        metrics=["count", "sum__b"],
+    )
+    by_b = create_query_context(datasource, columns=["b"], metrics=["count"])
+
+    assert prefetch_merged_query_results([count, count_sum, by_b]) == 1
+    datasource.query.assert_called_once()
+    assert datasource.query.call_args[0][0]["metrics"] == ["count", "sum__b"]
+    assert not by_b.prefetched_results
+
+    result = count.get_query_result(count.queries[0])
+    assert result.df.columns.tolist() == ["a", "count"]
+    result = count_sum.get_query_result(count_sum.queries[0])
+    assert result.df.columns.tolist() == ["a", "count", "sum__b"]
+    assert datasource.query.call_count == 1
+
+    by_b.get_query_result(by_b.queries[0])
+    assert datasource.query.call_count == 2
+
+    # the results are now cached, so there's nothing left to merge
+    assert prefetch_merged_query_results([count, count_sum]) == 0
+
+
+def test_prefetch_merged_query_results_metrics_order(datasource: MagicMock) -> None:
+    """
+    Test that each query object gets its metrics back in its own order.
+    """
+    count_max_sum = create_query_context(
+        datasource,
+        columns=["a"],
+        metrics=["count", "max__b", "sum__b"],
+    )
+    count_sum_max = create_query_context(
+        datasource,
+        columns=["a"],
+        metrics=["count", "sum__b", "max__b"],
+    )
+    count_sum = create_query_context(
+        datasource,
+        columns=["a"],
+        metrics=["count", "sum__b"],
+    )
+
+    assert prefetch_merged_query_results([count_max_sum, count_sum_max, count_sum]) == 1
+    assert datasource.query.call_count == 1
+    for query_context in [count_max_sum, count_sum_max, count_sum]:
+        result = query_context.get_query_result(query_context.queries[0])
+        assert result.df.columns.tolist() == ["a", *query_context.queries[0].metrics]
+    assert datasource.query.call_count == 1
+
+
+def test_prefetch_merged_query_results_not_mergeable(datasource: MagicMock) -> None:
+    """
+    Test that queries with a different main metric or conflicting labels don't merge.
+    """
+    count = create_query_context(datasource, columns=["a"], metrics=["count"])
+    sum_ = create_query_context(datasource, columns=["a"], metrics=["sum__b"])
+    assert prefetch_merged_query_results([count, sum_]) == 0
+
+    max_b = create_query_context(
+        datasource,
+        columns=["a"],
+        metrics=[
+            "count",
+            {"expressionType": "SQL", "sqlExpression": "MAX(b)", "label": "b"},
+        ],
+    )
+    min_b = create_query_context(
+        datasource,
+        columns=["a"],
+        metrics=[
+            "count",
+            {"expressionType": "SQL", "sqlExpression": "MIN(b)", "label": "b"},
+        ],
+    )
+    assert prefetch_merged_query_results([max_b, min_b]) == 0
+    datasource.query.assert_not_called()
+
+
+def test_query_context_schema_shares_datasources(mocker: MockerFixture) -> None:
+    """
+    Test that the datasources are only shared by the query contexts loaded with the
+    same memo, and not by the query contexts created by a long-lived factory.
+    """
+    from superset.charts.schemas import ChartDataQueryContextSchema
+    from superset.common.query_context_factory import QueryContextFactory
+
+    get_datasource = mocker.patch(
+        "superset.common.query_context_factory.DatasourceDAO.get_datasource",
+        side_effect=lambda datasource_type, datasource_id: MagicMock(id=datasource_id),
+    )
+    body = {"datasource": {"type": "table", "id": 1}, "queries": []}
+
+    schema = ChartDataQueryContextSchema(datasources={})
+    first, second = schema.load(body), schema.load(body)
+    assert first.datasource is second.datasource
+    assert get_datasource.call_count == 1
+
+    factory = QueryContextFactory()
+    first = factory.create(datasource=body["datasource"], queries=[])
+    second = factory.create(datasource=body["datasource"], queries=[])
+    assert first.datasource is not second.datasource
+    assert get_datasource.call_count == 3
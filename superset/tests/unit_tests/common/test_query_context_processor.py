@@ -102,6 +102,25 @@ def test_get_data_json(processor, mock_query_context):
     assert result == expected
 
 
+def test_get_data_json_columnar(processor, mock_query_context):
+    df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    coltypes = [GenericDataType.NUMERIC, GenericDataType.STRING]
+    mock_query_context.result_format = ChartDataResultFormat.JSON_COLUMNAR
+
+    result = processor.get_data(df, coltypes)
+    assert result == {"col1": [1, 2, 3], "col2": ["a", "b", "c"]}
+
+
+def test_get_data_arrow(processor, mock_query_context):
+    df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    coltypes = [GenericDataType.NUMERIC, GenericDataType.STRING]
+    mock_query_context.result_format = ChartDataResultFormat.ARROW
+
+    result = processor.get_data(df, coltypes)
+    assert result.column_names == ["col1", "col2"]
+    assert result.to_pydict() == {"col1": [1, 2, 3], "col2": ["a", "b", "c"]}
+
+
 def test_get_data_invalid_dataframe(processor, mock_query_context):
     df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
     coltypes = [GenericDataType.NUMERIC, GenericDataType.STRING]
@@ -624,3 +643,61 @@ def test_processing_time_offsets_date_range_enabled(processor):
                                 assert isinstance(result["df"], pd.DataFrame)
                                 assert isinstance(result["queries"], list)
                                 assert isinstance(result["cache_keys"], list)
+
+
+def test_raw_query_result_cache(processor, mock_query_context, mocker):
+    """Query objects that only differ in their post processing share the raw result"""
+    from cachelib import SimpleCache
+    from flask import current_app
+
+    from superset.common.query_object import QueryObject
+    from superset.common.utils import query_cache_manager
+    from superset.constants import CacheRegion
+    from superset.models.helpers import QueryResult
+
+    store = SimpleCache()
+    data_cache = MagicMock(cache=store, get=store.get, set=store.set)
+    mocker.patch.dict(query_cache_manager._cache, {CacheRegion.DATA: data_cache})
+    mocker.patch.dict(current_app.config, {"DATA_CACHE_RAW_RESULTS": True})
+    mocker.patch.object(processor, "get_cache_timeout", return_value=60)
+    mocker.patch(
+        "superset.common.query_context_processor.security_manager",
+        get_rls_cache_key=MagicMock(return_value=[]),
+    )
+
+    datasource = MagicMock(uid="1__table", changed_on=None, database=None)
+    datasource.get_extra_cache_keys.return_value = []
+    datasource.query.side_effect = lambda _: QueryResult(
+        df=pd.DataFrame({"a": [3, 1, 2]}),
+        query="SELECT a FROM tbl",
+        duration=0,
+    )
+    mock_query_context.datasource = datasource
+    mock_query_context.force = False
+    mock_query_context.prefetched_results = {}
+    processor._qc_datasource = datasource
+
+    sorted_query = QueryObject(
+        datasource=datasource,
+        columns=["a"],
+        post_processing=[{"operation": "sort", "options": {"by": "a"}}],
+    )
+    plain_query = QueryObject(datasource=datasource, columns=["a"])
+    assert processor.query_raw_cache_key(sorted_query) == (
+        processor.query_raw_cache_key(plain_query)
+    )
+    assert processor.query_cache_key(sorted_query) != (
+        processor.query_cache_key(plain_query)
+    )
+
+    sorted_result = processor.get_query_result(sorted_query)
+    plain_result = processor.get_query_result(plain_query)
+
+    datasource.query.assert_called_once()
+    assert sorted_result.df["a"].tolist() == [1, 2, 3]
+    assert plain_result.df["a"].tolist() == [3, 1, 2]
+    assert plain_result.query == "SELECT a FROM tbl;\n\n"
+
+    mocker.patch.dict(current_app.config, {"DATA_CACHE_RAW_RESULTS": False})
+    processor.get_query_result(plain_query)
+    assert datasource.query.call_count == 2
@@ -696,3 +696,133 @@ def test_get_sqla_table_with_catalog(
     # Verify expected table name and schema
     assert sqla_table.name == expected_name
     assert sqla_table.schema == expected_schema
+
+
+@pytest.fixture
+def sqlite_table(mocker: MockerFixture) -> SqlaTable:
+    mocker.patch(
+        "superset.connectors.sqla.models.security_manager",
+        get_rls_cache_key=mocker.MagicMock(return_value=[]),
+        get_rls_filters=mocker.MagicMock(return_value=[]),
+    )
+    mocker.patch.object(SqlaTable, "get_sqla_row_level_filters", return_value=[])
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    return SqlaTable(
+        table_name="my_table",
+        columns=[TableColumn(column_name="a", type="INTEGER")],
+        metrics=[],
+        database=database,
+    )
+
+
+def test_build_sqla_query_memoized(
+    mocker: MockerFixture,
+    sqlite_table: SqlaTable,
+) -> None:
+    """
+    Test that the cache key path and the execution path share a single build.
+    """
+    mocker.patch.object(sqlite_table, "has_extra_cache_key_calls", return_value=True)
+    get_sqla_query = mocker.spy(sqlite_table, "get_sqla_query")
+    query_obj: QueryObjectDict = {
+        "columns": ["a"],
+        "metrics": [],
+        "is_timeseries": False,
+        "filter": [],
+        "row_limit": 10,
+    }
+
+    sqlite_table.get_extra_cache_keys(query_obj)
+    sql = sqlite_table.get_query_str_extended(query_obj).sql
+    assert get_sqla_query.call_count == 1
+    assert "my_table" in sql
+
+    sqlite_table.get_query_str_extended({**query_obj, "row_limit": 5})
+    assert get_sqla_query.call_count == 2
+
+
+def test_compiled_sql_cache(mocker: MockerFixture, sqlite_table: SqlaTable) -> None:
+    """
+    Test that compiled queries are cached across requests and mutated after reading.
+    """
+    from cachelib import SimpleCache
+    from flask import current_app, g
+
+    from superset.connectors.sqla import models
+
+    mocker.patch.object(models, "cache_manager", cache=SimpleCache())
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "COMPILED_SQL_CACHE_TIMEOUT": 60,
+            "MUTATE_AFTER_SPLIT": False,
+            "SQL_QUERY_MUTATOR": lambda sql, **kwargs: f"-- mutated\n{sql}",
+        },
+    )
+    get_sqla_query = mocker.spy(sqlite_table, "get_sqla_query")
+    query_obj: QueryObjectDict = {
+        "columns": ["a"],
+        "metrics": [],
+        "is_timeseries": False,
+        "filter": [],
+    }
+
+    first = sqlite_table.get_query_str_extended(query_obj)
+    g.pop(models.SQLA_QUERY_MEMO_KEY)
+    second = sqlite_table.get_query_str_extended(query_obj)
+
+    assert get_sqla_query.call_count == 1
+    assert first == second
+    assert second.sql.startswith("-- mutated\n")
+    assert not second.sql.startswith("-- mutated\n-- mutated")
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT * FROM {{ dataset(42) }}",
+        "SELECT {{ metric('count', 42) }} FROM my_table",
+    ],
+)
+def test_compiled_sql_cache_dataset_macros(
+    mocker: MockerFixture,
+    sqlite_table: SqlaTable,
+    sql: str,
+) -> None:
+    """
+    Test that queries reading other datasets aren't cached across requests, since the
+    key doesn't cover the definition of these datasets.
+    """
+    from cachelib import SimpleCache
+    from flask import current_app
+
+    from superset.connectors.sqla import models
+    from superset.models.helpers import ExploreMixin
+
+    cache = mocker.patch.object(models, "cache_manager", cache=SimpleCache()).cache
+    mocker.patch.dict(current_app.config, {"COMPILED_SQL_CACHE_TIMEOUT": 60})
+    get_query_str_extended = mocker.patch.object(
+        ExploreMixin,
+        "get_query_str_extended",
+        return_value=models.QueryStringExtended(
+            applied_template_filters=[],
+            applied_filter_columns=[],
+            rejected_filter_columns=[],
+            labels_expected=[],
+            prequeries=[],
+            sql="SELECT 1",
+        ),
+    )
+    sqlite_table.sql = sql
+    query_obj: QueryObjectDict = {
+        "columns": ["a"],
+        "metrics": [],
+        "is_timeseries": False,
+        "filter": [],
+    }
+
+    sqlite_table.get_query_str_extended(query_obj)
+    sqlite_table.get_query_str_extended(query_obj)
+
+    assert get_query_str_extended.call_count == 2
+    assert not cache.has(f"compiled_sql_{sqlite_table.get_sqla_query_key(query_obj)}")
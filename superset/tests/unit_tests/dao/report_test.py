@@ -0,0 +1,69 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlalchemy.orm.session import Session
+
+
+def test_report_dao_bulk_update_next_run(session: Session) -> None:
+    from superset import db
+    from superset.daos.report import ReportScheduleDAO
+    from superset.reports.models import ReportSchedule, ReportScheduleType
+
+    engine = db.session.get_bind()
+    ReportSchedule.metadata.create_all(engine)  # pylint: disable=no-member
+
+    daily = ReportSchedule(
+        type=ReportScheduleType.ALERT,
+        name="daily",
+        crontab="0 9 * * *",
+        timezone="UTC",
+    )
+    hourly = ReportSchedule(
+        type=ReportScheduleType.ALERT,
+        name="hourly",
+        crontab="0 * * * *",
+        timezone="UTC",
+    )
+    db.session.add_all([daily, hourly])
+    db.session.flush()
+
+    due = ReportScheduleDAO.find_due(datetime(2020, 1, 1, 9, 1))
+    assert set(due) == {daily, hourly}
+
+    # the daily schedule is edited while the scheduler computes the next runs
+    table = ReportSchedule.__table__
+    db.session.execute(
+        update(table)
+        .where(table.c.id == daily.id)
+        .values(crontab="0 11 * * *", next_run=None)
+    )
+
+    ReportScheduleDAO.bulk_update_next_run(
+        {
+            daily: datetime(2020, 1, 2, 9, 0),
+            hourly: datetime(2020, 1, 1, 10, 0),
+        }
+    )
+
+    next_runs = dict(
+        db.session.execute(
+            table.select().with_only_columns(table.c.name, table.c.next_run)
+        ).all()
+    )
+    assert next_runs == {"daily": None, "hourly": datetime(2020, 1, 1, 10, 0)}
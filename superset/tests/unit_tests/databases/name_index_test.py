@@ -0,0 +1,147 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from unittest.mock import MagicMock
+
+import pytest
+from cachelib import SimpleCache
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from superset.databases.name_index import (
+    get_cache_key,
+    get_names,
+    refresh_stale_entries,
+    search_names,
+)
+from tests.conftest import with_config
+
+
+@pytest.fixture
+def cache(mocker: MockerFixture) -> SimpleCache:
+    cache = SimpleCache()
+    cache_manager = mocker.patch("superset.databases.name_index.cache_manager")
+    cache_manager.cache = cache
+    return cache
+
+
+@pytest.fixture
+def database(mocker: MockerFixture) -> MagicMock:
+    database = mocker.MagicMock(id=1, impersonate_user=False)
+    database.is_oauth2_enabled.return_value = False
+    database.get_all_schema_names.return_value = {"public", "information_schema"}
+    database.get_all_table_names_in_schema.return_value = {
+        ("orders", "public", None),
+        ("customers", "public", None),
+    }
+    database.get_all_view_names_in_schema.return_value = {
+        ("order_totals", "public", None),
+    }
+    return database
+
+
+@with_config({"DATABASE_NAME_INDEX_REFRESH_AFTER": 60})
+def test_get_names(
+    mocker: MockerFixture,
+    cache: SimpleCache,
+    database: MagicMock,
+) -> None:
+    """
+    Test that names are fetched once, and refreshed in the background when stale.
+    """
+    refresh_name_index = mocker.patch("superset.tasks.cache.refresh_name_index")
+
+    with freeze_time("2024-01-01 00:00:00"):
+        assert get_names(database, None)["schemas"] == ["information_schema", "public"]
+        entry = get_names(database, None, "public")
+        assert entry["tables"] == ["customers", "orders"]
+        assert entry["views"] == ["order_totals"]
+
+    database.get_all_table_names_in_schema.assert_called_once_with(
+        catalog=None,
+        schema="public",
+        cache=False,
+    )
+
+    database.get_all_table_names_in_schema.return_value = set()
+    with freeze_time("2024-01-01 00:00:30"):
+        assert get_names(database, None, "public") == entry
+    refresh_name_index.delay.assert_not_called()
+
+    with freeze_time("2024-01-01 00:02:00"):
+        assert get_names(database, None, "public") == entry
+        assert get_names(database, None, "public") == entry
+    refresh_name_index.delay.assert_called_once_with(
+        database_id=1,
+        catalog=None,
+        schema="public",
+    )
+
+    assert get_names(database, None, "public", force=True)["tables"] == []
+
+
+@with_config({"DATABASE_NAME_INDEX_REFRESH_AFTER": 60})
+def test_refresh_stale_entries(
+    mocker: MockerFixture,
+    cache: SimpleCache,
+    database: MagicMock,
+) -> None:
+    """
+    Test that the stalest entries are refreshed first, up to the batch size.
+    """
+    db = mocker.patch("superset.databases.name_index.db")
+    db.session.query().all.return_value = [database]
+
+    with freeze_time("2024-01-01 00:00:00"):
+        get_names(database, None)
+    with freeze_time("2024-01-01 00:00:30"):
+        get_names(database, None, "public")
+
+    with freeze_time("2024-01-01 00:01:10"):
+        assert refresh_stale_entries(10) == 1
+        schemas_entry = cache.get(get_cache_key(1, None, None))
+        tables_entry = cache.get(get_cache_key(1, None, "public"))
+        assert schemas_entry["dttm"] - tables_entry["dttm"] == 40
+
+    with freeze_time("2024-01-01 01:00:00"):
+        assert refresh_stale_entries(1) == 1
+        schemas_entry = cache.get(get_cache_key(1, None, None))
+        tables_entry = cache.get(get_cache_key(1, None, "public"))
+        assert tables_entry["dttm"] - schemas_entry["dttm"] == 3600 - 70
+
+        assert refresh_stale_entries(10) == 1
+        assert refresh_stale_entries(10) == 0
+
+        # the tables of information_schema were never listed, so they're not indexed
+        assert cache.get(get_cache_key(1, None, "information_schema")) is None
+
+
+def test_search_names() -> None:
+    """
+    Test that names are searched ignoring case, with prefix matches first.
+    """
+    names = ["customer_orders", "Orders", "orders_2024", "products"]
+    assert search_names(names, "ORDERS") == [
+        "Orders",
+        "orders_2024",
+        "customer_orders",
+    ]
+    assert search_names(names, "ord", "key", 1.0) == [
+        "Orders",
+        "orders_2024",
+        "customer_orders",
+    ]
@@ -539,3 +539,161 @@ def test_use_equality_for_boolean_filters_property() -> None:
 
     # Default should be False (use IS operators)
     assert BaseEngineSpec.use_equality_for_boolean_filters is False
+
+
+def test_fetch_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that cursors returning record batches are fetched as Arrow tables.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class ArrowEngineSpec(BaseEngineSpec):
+        supports_fetch_arrow = True
+
+    batch = pa.record_batch({"a": [1, 2, 3]})
+    cursor = mocker.MagicMock(description=[("a", "INTEGER")])
+    cursor.fetch_record_batch.side_effect = lambda: pa.RecordBatchReader.from_batches(
+        batch.schema, [batch, batch]
+    )
+
+    assert BaseEngineSpec.fetch_arrow(cursor) is None
+    assert ArrowEngineSpec.fetch_arrow(cursor).num_rows == 6
+    assert ArrowEngineSpec.fetch_arrow(cursor, 2).column("a").to_pylist() == [1, 2]
+    assert ArrowEngineSpec.fetch_results(cursor, 4).num_rows == 4
+
+    cursor = mocker.MagicMock(spec=["description", "fetchall"])
+    cursor.description = [("a", "INTEGER")]
+    cursor.fetchall.return_value = [(1,), (2,)]
+    assert ArrowEngineSpec.fetch_arrow(cursor) is None
+    assert ArrowEngineSpec.fetch_results(cursor) == [(1,), (2,)]
+
+
+def test_fetch_data_chunks(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched in chunks, up to the limit.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    rows = [(i,) for i in range(7)]
+    cursor = mocker.MagicMock(spec=["description", "fetchmany", "arraysize"])
+    cursor.description = [("a", "INTEGER")]
+    cursor.fetchmany.side_effect = lambda size: [rows.pop(0) for _ in rows[:size]]
+
+    assert list(BaseEngineSpec.fetch_data_chunks(cursor, 6, 4)) == [
+        [(0,), (1,), (2,), (3,)],
+        [(4,), (5,)],
+    ]
+    assert list(BaseEngineSpec.fetch_data_chunks(cursor, None, 4)) == [[(6,)]]
+
+
+def test_fetch_data_chunks_arrow(mocker: MockerFixture) -> None:
+    """
+    Test that cursors returning record batches are fetched in Arrow chunks.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class ArrowEngineSpec(BaseEngineSpec):
+        supports_fetch_arrow = True
+
+    batch = pa.record_batch({"a": [1, 2, 3]})
+    cursor = mocker.MagicMock(description=[("a", "INTEGER")])
+    cursor.fetch_record_batch.side_effect = lambda size: (
+        pa.RecordBatchReader.from_batches(batch.schema, [batch, batch])
+    )
+
+    chunks = list(ArrowEngineSpec.fetch_data_chunks(cursor, 4, 3))
+    assert [chunk.column("a").to_pylist() for chunk in chunks] == [[1, 2, 3], [1]]
+    cursor.fetch_record_batch.assert_called_with(3)
+
+    cursor.fetch_record_batch.side_effect = lambda size: (
+        pa.RecordBatchReader.from_batches(batch.schema, [])
+    )
+    (chunk,) = ArrowEngineSpec.fetch_data_chunks(cursor, None, 3)
+    assert chunk.num_rows == 0
+    assert chunk.schema == batch.schema
+
+
+def test_fetch_data_chunks_custom_fetch_data(mocker: MockerFixture) -> None:
+    """
+    Test that engine specs overriding `fetch_data` return a single chunk.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class CustomEngineSpec(BaseEngineSpec):
+        @classmethod
+        def fetch_data(cls, cursor: Any, limit: int | None = None) -> list[Any]:
+            return [("custom",)]
+
+    cursor = mocker.MagicMock()
+    assert list(CustomEngineSpec.fetch_data_chunks(cursor, 10, 1)) == [[("custom",)]]
+    cursor.fetchmany.assert_not_called()
+
+
+def test_df_chunks_to_sql(mocker: MockerFixture, tmp_path: Any) -> None:
+    """
+    Test that chunks are appended to the table created by the first one, with a
+    single connection, and that the rows of a failed upload are rolled back.
+    """
+    import pandas as pd
+    from sqlalchemy import create_engine
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'upload.db'}")
+    get_engine = mocker.patch.object(BaseEngineSpec, "get_engine")
+    get_engine.return_value.__enter__.return_value = engine
+    table = Table("my_table")
+    to_sql_kwargs = {"if_exists": "replace", "index": False}
+
+    BaseEngineSpec.df_chunks_to_sql(
+        mocker.MagicMock(),
+        table,
+        [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})],
+        to_sql_kwargs,
+    )
+    assert get_engine.call_count == 1
+    assert pd.read_sql("SELECT a FROM my_table", engine)["a"].tolist() == [1, 2, 3]
+
+    def chunks() -> Any:
+        yield pd.DataFrame({"a": [4]})
+        raise ValueError("Invalid row")
+
+    with pytest.raises(ValueError, match="Invalid row"):
+        BaseEngineSpec.df_chunks_to_sql(
+            mocker.MagicMock(),
+            table,
+            chunks(),
+            {**to_sql_kwargs, "if_exists": "append"},
+        )
+    assert pd.read_sql("SELECT a FROM my_table", engine)["a"].tolist() == [1, 2, 3]
+
+
+def test_df_chunks_to_sql_not_supported(mocker: MockerFixture) -> None:
+    """
+    Test that engines not supporting chunked uploads get a single DataFrame.
+    """
+    import pandas as pd
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class NoChunksEngineSpec(BaseEngineSpec):
+        supports_chunked_upload = False
+
+    df_to_sql = mocker.patch.object(NoChunksEngineSpec, "df_to_sql")
+    database = mocker.MagicMock()
+    table = Table("my_table")
+
+    NoChunksEngineSpec.df_chunks_to_sql(
+        database,
+        table,
+        iter([pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})]),
+        {"if_exists": "replace"},
+    )
+    df_to_sql.assert_called_once_with(
+        database, table, mocker.ANY, {"if_exists": "replace"}
+    )
+    assert df_to_sql.call_args.args[2]["a"].tolist() == [1, 2, 3]
@@ -280,3 +280,57 @@ SELECT * \nFROM my_schema.my_table
  LIMIT :param_1
     """.strip()
     )
+
+
+def test_get_df_to_sql_method(mocker: MockerFixture) -> None:
+    """
+    Test that uploads use `COPY` only with PostgreSQL and `psycopg2`.
+    """
+    from superset.db_engine_specs.cockroachdb import CockroachDbEngineSpec
+    from superset.db_engine_specs.postgres import copy_from_stdin
+
+    engine = mocker.MagicMock()
+    engine.dialect.driver = "psycopg2"
+    assert spec.get_df_to_sql_method(engine) is copy_from_stdin
+
+    engine.dialect.driver = "psycopg"
+    engine.dialect.supports_multivalues_insert = True
+    assert spec.get_df_to_sql_method(engine) == "multi"
+
+    # other databases speaking the Postgres protocol don't all support `COPY`
+    engine.dialect.driver = "psycopg2"
+    assert CockroachDbEngineSpec.get_df_to_sql_method(engine) == "multi"
+
+
+def test_copy_from_stdin(mocker: MockerFixture) -> None:
+    """
+    Test that rows are streamed as CSV to `COPY ... FROM STDIN`, with empty strings
+    kept apart from `NULL`.
+    """
+    from sqlalchemy import Column, Integer, MetaData, String, Table as SqlaTable
+    from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+
+    from superset.db_engine_specs.postgres import copy_from_stdin
+
+    conn = mocker.MagicMock()
+    conn.dialect = PGDialect_psycopg2()
+    cursor = conn.connection.cursor.return_value.__enter__.return_value
+    cursor.copy_expert.side_effect = lambda sql, buffer: setattr(
+        cursor, "data", buffer.read()
+    )
+    table = mocker.MagicMock()
+    table.table = SqlaTable(
+        "my table",
+        MetaData(),
+        Column("id", Integer),
+        Column("name", String),
+        schema="public",
+    )
+
+    rows = [(1, "a"), (2, 'b,"c"'), (3, ""), (None, None)]
+    assert copy_from_stdin(table, conn, ["id", "name"], rows) == 4
+    cursor.copy_expert.assert_called_once_with(
+        "COPY public.\"my table\" (id, name) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+        mocker.ANY,
+    )
+    assert cursor.data == '"1","a"\n"2","b,""c"""\n"3",""\n\\N,\\N\n'
@@ -129,3 +129,12 @@ def test_time_grain_expressions(dttm: str, grain: str, expected: str) -> None:
     sql = f"SELECT {expression} FROM t"  # noqa: S608
     result = connection.execute(sql).scalar()
     assert result == expected
+
+
+def test_get_df_to_sql_method() -> None:
+    """
+    Test that uploads to SQLite use `executemany` instead of multi-row inserts.
+    """
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+
+    assert SqliteEngineSpec.get_df_to_sql_method(create_engine("sqlite://")) is None
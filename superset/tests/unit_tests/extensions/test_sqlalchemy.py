@@ -365,3 +365,52 @@ def test_allowed_dbs(mocker: MockerFixture, app_context: None, table1: None) ->
 (Background on this error at: https://sqlalche.me/e/14/f405)
         """.strip()
     )
+
+
+@with_config(
+    {
+        "DB_SQLA_URI_VALIDATOR": None,
+        "SUPERSET_META_DB_FETCH_SIZE": 1,
+        "SUPERSET_META_DB_REFLECTION_CACHE_TIMEOUT": 300,
+        "DATABASE_OAUTH2_CLIENTS": {},
+        "SQLALCHEMY_CUSTOM_PASSWORD_STORE": None,
+    }
+)
+@with_feature_flags(ENABLE_SUPERSET_META_DB=True)
+def test_reflection_cache(
+    mocker: MockerFixture,
+    app_context: None,
+    table1: None,
+) -> None:
+    """
+    Test that tables are reflected once, and that rows are fetched in batches.
+    """
+    from superset.extensions import metadb
+
+    mocker.patch(
+        "superset.extensions.metadb.security_manager.raise_for_access",
+        return_value=None,
+    )
+    mocker.patch.object(metadb, "_reflection_cache", metadb.OrderedDict())
+    SqlaTable = mocker.patch(  # noqa: N806
+        "superset.extensions.metadb.SqlaTable",
+        wraps=metadb.SqlaTable,
+    )
+
+    from flask import g
+
+    g.user = mocker.MagicMock()
+    g.user.is_anonymous = False
+
+    engine = create_engine("superset://")
+    conn = engine.connect()
+    for _ in range(3):
+        results = conn.execute('SELECT * FROM "database1.table1"')
+        assert list(results) == [(1, 10), (2, 20)]
+    results = conn.execute(
+        'SELECT t1.b, t2.b FROM "database1.table1" t1 '
+        'JOIN "database1.table1" t2 ON t1.a = t2.a'
+    )
+    assert list(results) == [(10, 10), (20, 20)]
+
+    SqlaTable.assert_called_once()
@@ -39,6 +39,7 @@ from superset.connectors.sqla.models import (
 )
 from superset.exceptions import SupersetTemplateException
 from superset.jinja_context import (
+    CachingSandboxedEnvironment,
     dataset_macro,
     ExtraCache,
     get_template_processor,
@@ -1435,3 +1436,108 @@ def test_get_time_filter(
         assert cache.get_time_filter(*args, **kwargs) == time_filter, description
         assert cache.removed_filters == removed_filters
         assert cache.applied_filters == applied_filters
+
+
+def test_template_cache(mocker: MockerFixture) -> None:
+    """
+    Test that processors share their environment and compiled templates, while
+    rendering each template with their own context.
+    """
+    database = Database(id=1, database_name="my_database", sqlalchemy_uri="sqlite://")
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(current_app.config, {"STATS_LOGGER": stats_logger})
+    sql = "SELECT {{ value }} AS value -- template cache test"
+
+    processor = get_template_processor(database=database, value=1)
+    other_processor = get_template_processor(database=database, value=2)
+    assert processor.env is other_processor.env
+    env = processor.env
+    assert isinstance(env, CachingSandboxedEnvironment)
+
+    info = env.cache_info()
+    assert processor.process_template(sql) == "SELECT 1 AS value -- template cache test"
+    assert (
+        other_processor.process_template(sql)
+        == "SELECT 2 AS value -- template cache test"
+    )
+    assert env.cache_info()["misses"] == info["misses"] + 1
+    assert env.cache_info()["hits"] == info["hits"] + 1
+    stats_logger.incr.assert_any_call("jinja_template_cache.miss")
+    stats_logger.incr.assert_any_call("jinja_template_cache.hit")
+
+
+def test_template_cache_eviction(mocker: MockerFixture) -> None:
+    """
+    Test that the compiled templates are kept in a bounded LRU.
+    """
+    mocker.patch.dict(current_app.config, {"STATS_LOGGER": mocker.MagicMock()})
+    env = CachingSandboxedEnvironment(template_cache_size=2)
+
+    first = env.from_string("{{ 1 }}")
+    env.from_string("{{ 2 }}")
+    assert env.from_string("{{ 1 }}") is first
+    env.from_string("{{ 3 }}")
+    assert env.cache_info()["size"] == 2
+    assert env.from_string("{{ 1 }}") is first
+    assert env.cache_info()["hits"] == 2
+    # "{{ 2 }}" was the least recently used template
+    env.from_string("{{ 2 }}")
+    assert env.cache_info()["misses"] == 4
+
+    env = CachingSandboxedEnvironment(template_cache_size=0)
+    assert env.from_string("{{ 1 }}") is not env.from_string("{{ 1 }}")
+    assert env.cache_info()["size"] == 0
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT 1",
+        "SELECT 1\n",
+        "SELECT 1\n\n",
+        "SELECT '{' AS a, '}' AS b\r\nFROM t\r",
+        "SELECT 1 -- # comment",
+        "",
+    ],
+)
+def test_process_template_without_template_syntax(
+    mocker: MockerFixture,
+    sql: str,
+) -> None:
+    """
+    Test that SQL without template syntax bypasses the template engine, while
+    producing the same output.
+    """
+    database = Database(id=1, database_name="my_database", sqlalchemy_uri="sqlite://")
+    extra_cache_keys: list[Any] = []
+    processor = get_template_processor(
+        database=database,
+        extra_cache_keys=extra_cache_keys,
+    )
+    expected = SandboxedEnvironment(undefined=DebugUndefined).from_string(sql).render()
+    from_string = mocker.spy(processor.env, "from_string")
+    validate_template_context = mocker.patch(
+        "superset.jinja_context.validate_template_context"
+    )
+
+    assert processor.is_template_free(sql)
+    assert processor.process_template(sql) == expected
+    from_string.assert_not_called()
+    validate_template_context.assert_not_called()
+    assert extra_cache_keys == []
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT {{ 1 }}",
+        "SELECT 1{% if true %}{% endif %}",
+        "SELECT 1{# comment #}",
+    ],
+)
+def test_process_template_with_template_syntax(sql: str) -> None:
+    database = Database(id=1, database_name="my_database", sqlalchemy_uri="sqlite://")
+    processor = get_template_processor(database=database)
+
+    assert not processor.is_template_free(sql)
+    assert processor.process_template(sql) == "SELECT 1"
@@ -17,12 +17,15 @@
 
 # pylint: disable=import-outside-toplevel
 from datetime import datetime
+from pathlib import Path
+from typing import Any
 
 import pytest
 from flask import current_app
 from pytest_mock import MockerFixture
 from sqlalchemy import (
     Column,
+    create_engine,
     Integer,
     MetaData,
     select,
@@ -712,6 +715,84 @@ def test_engine_context_manager(mocker: MockerFixture, app_context: None) -> Non
     )
 
 
+def test_get_sqla_engine_pooled(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that engines requested with `nullpool=False` are shared.
+    """
+    from collections import OrderedDict
+
+    mocker.patch("superset.models.core._pooled_engines", OrderedDict())
+    mocker.patch(
+        "superset.daos.database.DatabaseDAO.get_ssh_tunnel",
+        return_value=None,
+    )
+    mocker.patch("superset.models.core.get_username", return_value="alice")
+
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="sqlite://")
+    with database.get_sqla_engine(nullpool=False) as engine:
+        with database.get_sqla_engine(nullpool=False) as other_engine:
+            assert other_engine is engine
+        with database.get_sqla_engine(schema="main", nullpool=False) as other_engine:
+            assert other_engine is not engine
+        with database.get_sqla_engine() as other_engine:
+            assert other_engine is not engine
+
+    # engines are not shared between users, or after the database is edited
+    mocker.patch("superset.models.core.get_username", return_value="bob")
+    with database.get_sqla_engine(nullpool=False) as other_engine:
+        assert other_engine is not engine
+
+    database.changed_on = datetime(2024, 1, 1)
+    mocker.patch("superset.models.core.get_username", return_value="alice")
+    with database.get_sqla_engine(nullpool=False) as other_engine:
+        assert other_engine is not engine
+
+
+def test_get_sqla_engine_pooled_pre_ping(
+    mocker: MockerFixture,
+    app_context: None,
+) -> None:
+    """
+    Test that the connections of pooled engines are checked and recycled, unless the
+    database overrides it.
+    """
+    from collections import OrderedDict
+
+    mocker.patch("superset.models.core._pooled_engines", OrderedDict())
+    create_engine = mocker.patch("superset.models.core.create_engine")
+
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="sqlite://")
+    database._get_pooled_sqla_engine()
+    assert create_engine.call_args.kwargs["pool_pre_ping"] is True
+    assert create_engine.call_args.kwargs["pool_recycle"] == 3600
+
+    database = Database(
+        id=2,
+        database_name="my_other_db",
+        sqlalchemy_uri="sqlite://",
+        extra=json.dumps({"engine_params": {"pool_recycle": 60}}),
+    )
+    database._get_pooled_sqla_engine()
+    assert create_engine.call_args.kwargs["pool_pre_ping"] is True
+    assert create_engine.call_args.kwargs["pool_recycle"] == 60
+
+
+def test_get_rows(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that `get_rows` returns the rows of the last statement as tuples.
+    """
+    mocker.patch(
+        "superset.daos.database.DatabaseDAO.get_ssh_tunnel",
+        return_value=None,
+    )
+
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    description, rows = database.get_rows("SELECT 0; SELECT 1 AS a, 'x' AS b")
+
+    assert [column[0] for column in description] == ["a", "b"]
+    assert rows == [(1, "x")]
+
+
 def test_engine_oauth2(mocker: MockerFixture) -> None:
     """
     Test that we handle OAuth2 when `create_engine` fails.
@@ -1060,3 +1141,83 @@ def test_apply_limit_to_sql(
 
     limited = db.apply_limit_to_sql(sql, limit, force)
     assert limited == expected
+
+
+def test_get_table_metadata_bundle(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    app_context: None,
+) -> None:
+    """
+    Test that the metadata of a table is reflected over a single inspector.
+    """
+    import sqlalchemy
+
+    mocker.patch(
+        "superset.daos.database.DatabaseDAO.get_ssh_tunnel",
+        return_value=None,
+    )
+    uri = f"sqlite:///{tmp_path / 'test.db'}"
+    engine = create_engine(uri)
+    with engine.begin() as connection:
+        connection.execute("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+        connection.execute(
+            "CREATE TABLE child (id INTEGER PRIMARY KEY, "
+            "parent_id INTEGER REFERENCES parent (id), name TEXT)"
+        )
+        connection.execute("CREATE INDEX child_name ON child (name)")
+
+    database = Database(database_name="my_db", sqlalchemy_uri=uri)
+    get_inspector = mocker.spy(database, "get_inspector")
+    inspect = mocker.spy(sqlalchemy, "inspect")
+
+    bundle = database.get_table_metadata_bundle(Table("child"))
+
+    get_inspector.assert_not_called()
+    inspect.assert_called_once()
+    assert [column["column_name"] for column in bundle["columns"]] == [
+        "id",
+        "parent_id",
+        "name",
+    ]
+    assert [fk["referred_table"] for fk in bundle["foreign_keys"]] == ["parent"]
+    assert [index["name"] for index in bundle["indexes"]] == ["child_name"]
+    assert bundle["comment"] is None
+    assert bundle["select_star"].startswith("SELECT")
+
+
+def test_get_table_metadata_cache(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the table metadata is cached with the table cache timeout.
+    """
+    from superset.extensions import cache_manager
+
+    cache: dict[str, Any] = {}
+    mocker.patch.object(cache_manager.cache, "get", side_effect=cache.get)
+    set_ = mocker.patch.object(
+        cache_manager.cache,
+        "set",
+        side_effect=lambda key, value, timeout: cache.update({key: value}),
+    )
+    get_table_metadata = mocker.patch(
+        "superset.models.core.get_table_metadata",
+        return_value={"name": "t"},
+    )
+    database = Database(
+        id=1,
+        database_name="my_db",
+        sqlalchemy_uri="sqlite://",
+        extra=json.dumps({"metadata_cache_timeout": {"table_cache_timeout": 60}}),
+    )
+
+    for _ in range(2):
+        assert database.db_engine_spec.get_table_metadata(
+            database, Table("t", "s")
+        ) == {"name": "t"}
+
+    get_table_metadata.assert_called_once_with(database, Table("t", "s"))
+    set_.assert_called_once_with(
+        "db:1:catalog:None:schema:s:table:t:metadata",
+        {"name": "t"},
+        timeout=60,
+    )
@@ -20,7 +20,7 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
@@ -556,3 +556,164 @@ def test_apply_series_others_grouping_no_label_in_groupby(database: Database) ->
         assert "category" in result_groupby_columns
         # The GROUP BY expression should be different from the SELECT expression
         # because only SELECT gets make_sqla_column_compatible applied
+
+
+def test_values_for_column_cached(mocker: MockerFixture, database: Database) -> None:
+    """
+    Test that column values are cached, searched in memory, and refreshed in the
+    background when stale.
+    """
+    import pandas as pd
+    from flask import g
+
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+
+    cache: dict[str, Any] = {}
+    mocker.patch(
+        "superset.utils.column_values.cache_manager",
+        data_cache=mocker.MagicMock(
+            get=cache.get,
+            set=lambda key, value, timeout: cache.__setitem__(key, value),
+            add=lambda key, value, timeout: key not in cache
+            and cache.setdefault(key, value),
+        ),
+    )
+    mocker.patch(
+        "superset.security_manager",
+        is_guest_user=mocker.MagicMock(return_value=False),
+    )
+    refresh_column_values = mocker.patch("superset.tasks.cache.refresh_column_values")
+    read_sql_query = mocker.patch(
+        "pandas.read_sql_query",
+        return_value=pd.DataFrame({"column_values": ["Bob", "alice", "Carol", None]}),
+    )
+    g.user = mocker.MagicMock(username="admin", is_anonymous=False)
+
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[TableColumn(column_name="b")],
+    )
+
+    assert table.values_for_column("b") == ["Bob", "alice", "Carol", None]
+    assert table.values_for_column("b", search="o") == ["Bob", "Carol"]
+    assert table.values_for_column("b", search="AL") == ["alice"]
+    read_sql_query.assert_called_once()
+    refresh_column_values.delay.assert_not_called()
+
+    # stale entries are still used, but refreshed once in the background
+    for key, value in cache.items():
+        cache[key] = {**value, "dttm": value["dttm"] - 3600}
+    assert table.values_for_column("b") == ["Bob", "alice", "Carol", None]
+    assert table.values_for_column("b") == ["Bob", "alice", "Carol", None]
+    read_sql_query.assert_called_once()
+    refresh_column_values.delay.assert_called_once_with(
+        datasource_type="table",
+        datasource_id=table.id,
+        username="admin",
+        column_name="b",
+        limit=10000,
+        denormalize_column=False,
+    )
+
+    # forcing fetches the values again
+    assert table.values_for_column("b", force=True)
+    assert read_sql_query.call_count == 2
+
+
+def test_values_for_column_cached_eager_celery(
+    mocker: MockerFixture,
+    database: Database,
+) -> None:
+    """
+    Test that stale column values aren't refreshed when Celery runs tasks eagerly,
+    since the task would run in the request.
+    """
+    import pandas as pd
+    from flask import g
+
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+
+    cache: dict[str, Any] = {}
+    mocker.patch(
+        "superset.utils.column_values.cache_manager",
+        data_cache=mocker.MagicMock(
+            get=cache.get,
+            set=lambda key, value, timeout: cache.__setitem__(key, value),
+            add=lambda key, value, timeout: key not in cache
+            and cache.setdefault(key, value),
+        ),
+    )
+    mocker.patch(
+        "superset.utils.column_values.celery_app",
+        conf=mocker.MagicMock(task_always_eager=True),
+    )
+    refresh_column_values = mocker.patch("superset.tasks.cache.refresh_column_values")
+    read_sql_query = mocker.patch(
+        "pandas.read_sql_query",
+        return_value=pd.DataFrame({"column_values": ["Bob"]}),
+    )
+    g.user = mocker.MagicMock(username="admin", is_anonymous=False)
+
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[TableColumn(column_name="b")],
+    )
+
+    assert table.values_for_column("b") == ["Bob"]
+    for key, value in cache.items():
+        cache[key] = {**value, "dttm": value["dttm"] - 3600}
+    assert table.values_for_column("b") == ["Bob"]
+    read_sql_query.assert_called_once()
+    refresh_column_values.delay.assert_not_called()
+
+
+def test_values_for_column_cached_per_user(
+    mocker: MockerFixture,
+    database: Database,
+) -> None:
+    """
+    Test that column values are cached per user when queries run as the user.
+    """
+    import pandas as pd
+    from flask import g
+
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+
+    cache: dict[str, Any] = {}
+    mocker.patch(
+        "superset.utils.column_values.cache_manager",
+        data_cache=mocker.MagicMock(
+            get=cache.get,
+            set=lambda key, value, timeout: cache.__setitem__(key, value),
+        ),
+    )
+    mocker.patch(
+        "superset.utils.column_values.feature_flag_manager.is_feature_enabled",
+        side_effect=lambda feature: feature == "CACHE_IMPERSONATION",
+    )
+    read_sql_query = mocker.patch(
+        "pandas.read_sql_query",
+        return_value=pd.DataFrame({"column_values": ["Bob"]}),
+    )
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[TableColumn(column_name="b")],
+    )
+
+    g.user = mocker.MagicMock(username="admin", is_anonymous=False)
+    table.values_for_column("b")
+    table.values_for_column("b")
+    assert read_sql_query.call_count == 1
+
+    database.impersonate_user = True
+    table.values_for_column("b")
+    g.user = mocker.MagicMock(username="alice", is_anonymous=False)
+    table.values_for_column("b")
+    table.values_for_column("b")
+    assert read_sql_query.call_count == 3
@@ -15,10 +15,13 @@
 # specific language governing permissions and limitations
 # under the License.
 from datetime import datetime
+from importlib import import_module
 from importlib.util import find_spec
 
 import pandas as pd
 import pytest
+from flask import current_app
+from pytest_mock import MockerFixture
 
 from superset.exceptions import InvalidPostProcessingError
 from superset.utils.core import DTTM_ALIAS
@@ -184,3 +187,71 @@ def test_prophet_incorrect_time_grain():
             periods=10,
             confidence_interval=0.8,
         )
+
+
+def _fake_fit_and_predict(df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+    forecast = df.rename(columns={"y": "yhat"})
+    forecast["yhat_lower"] = forecast["yhat"]
+    forecast["yhat_upper"] = forecast["yhat"]
+    forecast["y"] = df["y"]
+    return forecast.set_index(["ds"])
+
+
+def test_prophet_forecast_cache(mocker: MockerFixture) -> None:
+    from cachelib import SimpleCache
+
+    prophet_module = import_module("superset.utils.pandas_postprocessing.prophet")
+
+    mocker.patch.object(prophet_module, "cache_manager", data_cache=SimpleCache())
+    fit = mocker.patch.object(
+        prophet_module,
+        "_prophet_fit_and_predict",
+        side_effect=_fake_fit_and_predict,
+    )
+
+    first = prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9)
+    assert fit.call_count == 2
+
+    second = prophet(
+        df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9
+    )
+    assert fit.call_count == 2
+    pd.testing.assert_frame_equal(first, second)
+
+    # any parameter change results in a refit
+    prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.8)
+    assert fit.call_count == 4
+
+
+def test_prophet_forecast_parallel(mocker: MockerFixture) -> None:
+    from concurrent.futures import Future
+
+    prophet_module = import_module("superset.utils.pandas_postprocessing.prophet")
+
+    mocker.patch.dict(
+        current_app.config,
+        {"PROPHET_FORECAST_MAX_WORKERS": 4, "PROPHET_FORECAST_CACHE_TIMEOUT": -1},
+    )
+    mocker.patch.object(
+        prophet_module,
+        "_prophet_fit_and_predict",
+        side_effect=_fake_fit_and_predict,
+    )
+
+    def submit(fn, **kwargs):
+        future: Future = Future()
+        future.set_result(fn(**kwargs))
+        return future
+
+    mocker.patch.object(prophet_module, "_executor", None)
+    executor = mocker.patch.object(prophet_module, "ProcessPoolExecutor")
+    executor.return_value.submit.side_effect = submit
+
+    df = prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9)
+    executor.assert_called_once_with(max_workers=4)
+    assert {"a__yhat", "b__yhat"} <= set(df.columns)
+
+    # the pool is reused by the next calls
+    prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9)
+    executor.assert_called_once()
+    assert executor.return_value.submit.call_count == 4
@@ -185,3 +185,41 @@ def test_get_column_description_from_empty_data_using_cursor_description(
     )
     assert any(col.get("column_name") == "__time" for col in result_set.columns)
     logger.exception.assert_not_called()
+
+
+def test_arrow_table() -> None:
+    """
+    Test that Arrow tables returned by the driver are used without conversion.
+    """
+    import pyarrow as pa
+
+    table = pa.table(
+        {
+            "a": pa.array([1, 2], type=pa.int64()),
+            "a2": pa.array(["x", "y"]).dictionary_encode(),
+            "b": pa.array([[1], [2, 3]]),
+        }
+    )
+    description = [
+        ("a", "INTEGER", None, None, None, None, True),
+        ("a", "VARCHAR", None, None, None, None, True),
+        ("b", "ARRAY", None, None, None, None, True),
+    ]
+    result_set = SupersetResultSet(
+        table,
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+
+    assert result_set.pa_table.column_names == ["a", "a__1", "b"]
+    assert result_set.pa_table.column("a__1").type == pa.string()
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "a": [1, 2],
+        "a__1": ["x", "y"],
+        "b": ["[1]", "[2, 3]"],
+    }
+    assert [col["type"] for col in result_set.columns] == [
+        "INTEGER",
+        "VARCHAR",
+        "ARRAY",
+    ]
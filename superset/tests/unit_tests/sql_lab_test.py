@@ -17,23 +17,33 @@
 # pylint: disable=import-outside-toplevel, invalid-name, unused-argument, too-many-locals
 
 import json  # noqa: TID251
+import threading
 from unittest.mock import MagicMock
 from uuid import UUID
 
 import pytest
+from flask import Flask
 from freezegun import freeze_time
 from pytest_mock import MockerFixture
 
 from superset.common.db_query_status import QueryStatus
+from superset.db_engine_specs.impala import ImpalaEngineSpec
 from superset.db_engine_specs.postgres import PostgresEngineSpec
+from superset.db_engine_specs.presto import PrestoEngineSpec
+from superset.db_engine_specs.sqlite import SqliteEngineSpec
+from superset.db_engine_specs.trino import TrinoEngineSpec
 from superset.errors import ErrorLevel, SupersetErrorType
 from superset.exceptions import OAuth2Error, SupersetErrorException
 from superset.models.core import Database
-from superset.sql.parse import SQLStatement, Table
+from superset.sql.parse import SQLScript, SQLStatement, Table
 from superset.sql_lab import (
+    _execute_blocks_concurrently,
+    _get_statements_concurrency,
     execute_query,
     execute_sql_statements,
     get_sql_results,
+    SqlLabException,
+    SqlLabQueryStoppedException,
 )
 from superset.utils.rls import apply_rls, get_predicates_for_table
 from tests.conftest import with_config
@@ -51,7 +61,7 @@ def test_execute_query(mocker: MockerFixture, app: None) -> None:
     database = query.database
     database.allow_dml = False
     db_engine_spec = database.db_engine_spec
-    db_engine_spec.fetch_data.return_value = [(42,)]
+    db_engine_spec.fetch_results.return_value = [(42,)]
 
     cursor = mocker.MagicMock()
     SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")  # noqa: N806
@@ -66,6 +76,231 @@ def test_execute_query(mocker: MockerFixture, app: None) -> None:
     SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
 
 
+@with_config({"SQLLAB_FETCH_CHUNK_SIZE": 2})
+def test_execute_query_in_chunks(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that `execute_query` reports progress when fetching results in chunks.
+    """
+    mocker.patch("superset.sql_lab.db")
+    mocker.patch("superset.sql_lab.FETCH_PROGRESS_INTERVAL", 0)
+    query = mocker.MagicMock()
+    query.executed_sql = "SELECT a FROM t"
+    query.limit = 4
+    db_engine_spec = query.database.db_engine_spec
+    db_engine_spec.fetch_data_chunks.return_value = iter(
+        [[(1,), (2,)], [(3,), (4,)], [(5,)]]
+    )
+
+    cursor = mocker.MagicMock()
+    SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")  # noqa: N806
+
+    execute_query(query, cursor=cursor)
+
+    db_engine_spec.fetch_data_chunks.assert_called_with(cursor, 5, 2)
+    db_engine_spec.fetch_results.assert_not_called()
+    query.set_extra_json_key.assert_called_with("progress", "Fetched 5 rows")
+    SupersetResultSet.assert_called_with(
+        [(1,), (2,), (3,), (4,)],
+        cursor.description,
+        db_engine_spec,
+    )
+
+
+@with_config({"SQLLAB_FETCH_CHUNK_SIZE": 2})
+def test_execute_query_in_chunks_stopped(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that queries stopped while their results are being fetched stop fetching.
+    """
+    mocker.patch("superset.sql_lab.FETCH_PROGRESS_INTERVAL", 0)
+    query = mocker.MagicMock()
+    query.limit = None
+    db_engine_spec = query.database.db_engine_spec
+    db_engine_spec.fetch_data_chunks.return_value = iter([[(1,), (2,)], [(3,)]])
+
+    def stop(instance: MagicMock) -> None:
+        instance.status = QueryStatus.STOPPED
+
+    db = mocker.patch("superset.sql_lab.db")
+    db.session.refresh.side_effect = stop
+
+    with pytest.raises(SqlLabQueryStoppedException):
+        execute_query(query, cursor=mocker.MagicMock())
+
+    assert query.rows == 2
+
+
+@with_config({"SQLLAB_FETCH_CHUNK_SIZE": 2})
+def test_execute_query_in_chunks_progress_interval(
+    mocker: MockerFixture,
+    app: None,
+) -> None:
+    """
+    Test that the progress of a query isn't updated for each chunk fetched within the
+    progress interval, but once all the rows are fetched.
+    """
+    db = mocker.patch("superset.sql_lab.db")
+    query = mocker.MagicMock()
+    query.limit = None
+    db_engine_spec = query.database.db_engine_spec
+    db_engine_spec.fetch_data_chunks.return_value = iter([[(1,), (2,)], [(3,)]])
+    mocker.patch("superset.sql_lab.SupersetResultSet")
+
+    execute_query(query, cursor=mocker.MagicMock())
+
+    db.session.refresh.assert_not_called()
+    query.set_extra_json_key.assert_called_once_with("progress", "Fetched 3 rows")
+    assert query.rows == 3
+
+
+@with_config({"SQLLAB_STATEMENTS_CONCURRENCY": 2})
+def test_get_statements_concurrency(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that only scripts made of SELECT statements run concurrently.
+    """
+    query = mocker.MagicMock(select_as_cta=False)
+    query.database.db_engine_spec = SqliteEngineSpec
+
+    def get_concurrency(sql: str) -> int:
+        return _get_statements_concurrency(query, SQLScript(sql, "sqlite"))
+
+    assert get_concurrency("SELECT 1; SELECT 2; SELECT 3") == 2
+    assert get_concurrency("SELECT 1") == 1
+    assert get_concurrency("SELECT 1; DELETE FROM t") == 1
+    assert get_concurrency("CREATE TABLE t AS SELECT 1; SELECT * FROM t") == 1
+
+    query.select_as_cta = True
+    assert get_concurrency("SELECT 1; SELECT 2") == 1
+    query.select_as_cta = False
+
+    # engines handling the cursor or only knowing the query id after running it
+    for db_engine_spec in (TrinoEngineSpec, PrestoEngineSpec, ImpalaEngineSpec):
+        query.database.db_engine_spec = db_engine_spec
+        assert get_concurrency("SELECT 1; SELECT 2") == 1
+
+
+def test_execute_blocks_concurrently(mocker: MockerFixture, app: Flask) -> None:
+    """
+    Test that all the blocks but the last one run in threads, on their own connection.
+    """
+    mocker.patch("superset.sql_lab.get_username", return_value="admin")
+    mocker.patch("superset.sql_lab.db")
+    security_manager = mocker.patch("superset.sql_lab.security_manager")
+    query = mocker.MagicMock(id=42, limit=2)
+    query.database.mutate_sql_based_on_config.side_effect = lambda sql: sql
+    mocker.patch("superset.sql_lab.get_query", return_value=query)
+    db_engine_spec = query.database.db_engine_spec
+    db_engine_spec.fetch_data_chunks.side_effect = [
+        iter([[(1,)], [(2,)]]),
+        iter([[(1,)]]),
+    ]
+    get_raw_connection = query.database.get_raw_connection
+
+    with _execute_blocks_concurrently(
+        query,
+        ["SELECT 1", "SELECT 2", "SELECT 3"],
+        3,
+        None,
+    ) as futures:
+        assert sorted(future.result() for future in futures) == [1, 2]
+
+    security_manager.find_user.assert_called_with("admin")
+    assert get_raw_connection.call_count == 2
+    cursor = get_raw_connection().__enter__().cursor()
+    executed = {call.args[1] for call in db_engine_spec.execute.call_args_list}
+    assert executed == {"SELECT 1", "SELECT 2"}
+    db_engine_spec.execute.assert_called_with(cursor, mocker.ANY, query.database)
+    db_engine_spec.fetch_data_chunks.assert_called_with(cursor, 2, 10000)
+    db_engine_spec.fetch_data.assert_not_called()
+    # all the blocks are done, nothing is cancelled
+    query.database.get_sqla_engine.assert_not_called()
+
+    with _execute_blocks_concurrently(query, ["SELECT 1"], 1, None) as futures:
+        assert futures == []
+
+
+def test_execute_blocks_concurrently_error(mocker: MockerFixture, app: Flask) -> None:
+    """
+    Test that errors of the blocks run in threads are extracted from the database.
+    """
+    mocker.patch("superset.sql_lab.get_username", return_value=None)
+    mocker.patch("superset.sql_lab.db")
+    query = mocker.MagicMock(id=42, limit=None)
+    mocker.patch("superset.sql_lab.get_query", return_value=query)
+    db_engine_spec = query.database.db_engine_spec
+    db_engine_spec.execute.side_effect = Exception("syntax error")
+    db_engine_spec.extract_error_message.return_value = "Syntax error"
+
+    with _execute_blocks_concurrently(query, ["SELEC 1", "SELECT 2"], 2, None) as (
+        futures
+    ):
+        with pytest.raises(SqlLabException, match="Syntax error"):
+            futures[0].result()
+
+
+def test_execute_blocks_concurrently_stopped(
+    mocker: MockerFixture,
+    app: Flask,
+) -> None:
+    """
+    Test that the blocks run in threads stop fetching rows once the query is stopped.
+    """
+    mocker.patch("superset.sql_lab.get_username", return_value=None)
+    mocker.patch("superset.sql_lab.db")
+    query = mocker.MagicMock(id=42, limit=None, status=QueryStatus.RUNNING)
+    mocker.patch("superset.sql_lab.get_query", return_value=query)
+    db_engine_spec = query.database.db_engine_spec
+    db_engine_spec.get_cancel_query_id.return_value = None
+
+    def fetch_data_chunks(cursor: MagicMock, limit: int, chunk_size: int):
+        yield [(1,)]
+        query.status = QueryStatus.STOPPED
+        yield [(2,)]
+        yield [(3,)]
+
+    db_engine_spec.fetch_data_chunks.side_effect = fetch_data_chunks
+
+    with _execute_blocks_concurrently(query, ["SELECT 1", "SELECT 2"], 2, None) as (
+        futures
+    ):
+        with pytest.raises(SqlLabQueryStoppedException):
+            futures[0].result()
+
+
+def test_execute_blocks_concurrently_cancel(
+    mocker: MockerFixture,
+    app: Flask,
+) -> None:
+    """
+    Test that the queries of the blocks still running are cancelled on exit.
+    """
+    mocker.patch("superset.sql_lab.get_username", return_value=None)
+    mocker.patch("superset.sql_lab.db")
+    query = mocker.MagicMock(id=42, limit=None, status=QueryStatus.RUNNING)
+    mocker.patch("superset.sql_lab.get_query", return_value=query)
+    db_engine_spec = query.database.db_engine_spec
+    db_engine_spec.get_cancel_query_id.return_value = "123"
+    started = threading.Event()
+    cancelled = threading.Event()
+
+    def execute(cursor: MagicMock, sql: str, database: MagicMock) -> None:
+        started.set()
+        cancelled.wait(timeout=10)
+        raise Exception("query cancelled")
+
+    db_engine_spec.execute.side_effect = execute
+    db_engine_spec.cancel_query.side_effect = lambda *args: cancelled.set()
+
+    with _execute_blocks_concurrently(query, ["SELECT 1", "SELECT 2"], 2, None) as (
+        futures
+    ):
+        assert started.wait(timeout=10)
+
+    cursor = query.database.get_sqla_engine().__enter__().raw_connection().cursor()
+    db_engine_spec.cancel_query.assert_called_once_with(cursor, query, "123")
+    with pytest.raises(SqlLabQueryStoppedException):
+        futures[0].result(timeout=10)
+
+
 @with_config(
     {
         "SQLLAB_PAYLOAD_MAX_MB": 50,
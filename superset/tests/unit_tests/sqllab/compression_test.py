@@ -0,0 +1,107 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import zlib
+from importlib.util import find_spec
+
+import pytest
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.exceptions import SerializationError
+from superset.sqllab.compression import (
+    compress_results,
+    decompress_results,
+    HEADER_MAGIC,
+)
+from superset.utils.core import zlib_compress
+
+PAYLOAD = (
+    '{"data": [' + ", ".join(f'{{"a": {i}, "b": "x"}}' for i in range(1000)) + "]}"
+)
+
+
+@pytest.mark.parametrize(
+    "codec",
+    [
+        "none",
+        "zlib",
+        "zstd",
+        pytest.param(
+            "lz4",
+            marks=pytest.mark.skipif(
+                find_spec("lz4") is None, reason="lz4 is not installed"
+            ),
+        ),
+    ],
+)
+def test_roundtrip(mocker: MockerFixture, codec: str) -> None:
+    """
+    Test that payloads are compressed with the configured codec in chunks, and can
+    be read back regardless of the current configuration.
+    """
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "RESULTS_BACKEND_COMPRESSION": {
+                "codec": codec,
+                "options": {},
+                "chunk_size": 1000,
+            },
+        },
+    )
+    blob = compress_results(PAYLOAD)
+    assert blob.startswith(HEADER_MAGIC)
+
+    assert decompress_results(blob) == PAYLOAD
+    assert decompress_results(blob, decode=False) == PAYLOAD.encode()
+
+    # the codec is read from the header, not from the config
+    current_app.config["RESULTS_BACKEND_COMPRESSION"]["codec"] = "none"
+    assert decompress_results(blob) == PAYLOAD
+
+
+def test_legacy_zlib_blob() -> None:
+    """
+    Test that blobs written before codecs were introduced are still readable.
+    """
+    assert decompress_results(zlib_compress(PAYLOAD)) == PAYLOAD
+
+
+def test_stats(mocker: MockerFixture) -> None:
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(current_app.config, {"STATS_LOGGER": stats_logger})
+
+    blob = compress_results(PAYLOAD)
+
+    stats_logger.timing.assert_called_once()
+    assert stats_logger.timing.call_args[0][0] == "sqllab.results_backend.compress.zlib"
+    stats_logger.gauge.assert_called_once_with(
+        "sqllab.results_backend.compression_ratio.zlib",
+        len(PAYLOAD) / len(blob),
+    )
+
+
+def test_invalid_codec(mocker: MockerFixture) -> None:
+    mocker.patch.dict(
+        current_app.config,
+        {"RESULTS_BACKEND_COMPRESSION": {"codec": "rar", "chunk_size": 1000}},
+    )
+    with pytest.raises(SerializationError):
+        compress_results(PAYLOAD)
+
+    with pytest.raises(SerializationError):
+        decompress_results(HEADER_MAGIC + bytes([42]) + zlib.compress(b"{}"))
@@ -0,0 +1,127 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+
+from typing import Any
+
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from superset.common.db_query_status import QueryStatus
+from superset.db_engine_specs.sqlite import SqliteEngineSpec
+from superset.sqllab.results_reuse import (
+    get_results_reuse_key,
+    get_reusable_query,
+    RESULTS_REUSE_KEY,
+    reuse_query_results,
+    store_reusable_query,
+)
+
+
+def test_get_results_reuse_key(mocker: MockerFixture) -> None:
+    """
+    Test that the key ignores formatting, and changes with the user and limit.
+    """
+    mocker.patch("superset.sqllab.results_reuse.results_backend")
+    get_username = mocker.patch(
+        "superset.sqllab.results_reuse.get_username",
+        return_value="admin",
+    )
+    query = mocker.MagicMock(catalog=None, schema="main", limit=100)
+    query.select_as_cta = False
+    query.database.id = 1
+    query.database.results_reuse_max_age = 60
+    query.database.db_engine_spec = SqliteEngineSpec
+
+    key = get_results_reuse_key(query, "SELECT a FROM t")
+    assert key
+    assert get_results_reuse_key(query, "select a\n  from t -- comment") == key
+
+    query.limit = 10
+    assert get_results_reuse_key(query, "SELECT a FROM t") != key
+    query.limit = 100
+
+    get_username.return_value = "alpha"
+    assert get_results_reuse_key(query, "SELECT a FROM t") != key
+
+    assert get_results_reuse_key(query, "DELETE FROM t") is None
+
+    query.database.results_reuse_max_age = None
+    assert get_results_reuse_key(query, "SELECT a FROM t") is None
+
+
+def test_reuse_query_results(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test that the results of a successful query are reused within the max age.
+    """
+    from superset import db
+    from superset.models.core import Database
+    from superset.models.sql_lab import Query
+
+    Query.metadata.create_all(db.session.get_bind())  # pylint: disable=no-member
+
+    stored: dict[str, Any] = {"abc": b"results"}
+    results_backend = mocker.patch(
+        "superset.sqllab.results_reuse.results_backend",
+        new=mocker.MagicMock(),
+    )
+    results_backend.get.side_effect = stored.get
+    results_backend.has.side_effect = stored.__contains__
+    results_backend.set.side_effect = lambda key, value, timeout: stored.update(
+        {key: value}
+    )
+
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    query = Query(
+        client_id="foo",
+        database=database,
+        sql="SELECT a FROM t",
+        executed_sql="SELECT a FROM t LIMIT 101",
+        rows=42,
+        status=QueryStatus.SUCCESS,
+        results_key="abc",
+        end_time=1_000_000.0,
+    )
+    query.set_extra_json_key(RESULTS_REUSE_KEY, "reuse_key")
+    query.set_extra_json_key("columns", [{"column_name": "a"}])
+    db.session.add(query)
+    db.session.flush()
+
+    store_reusable_query(query, 300)
+    assert stored["reuse_key"] == {
+        "query_id": query.id,
+        "results_key": "abc",
+        "dttm": 1_000_000.0,
+    }
+
+    with freeze_time("1970-01-01 00:17:30"):
+        assert get_reusable_query("reuse_key", 60) == query
+        assert get_reusable_query("reuse_key", 10) is None
+        assert get_reusable_query("other_key", 60) is None
+
+        del stored["abc"]
+        assert get_reusable_query("reuse_key", 60) is None
+
+    new_query = Query(client_id="bar", database=database, sql="SELECT a FROM t")
+    reuse_query_results(new_query, query)
+    assert new_query.status == QueryStatus.SUCCESS
+    assert new_query.results_key == "abc"
+    assert new_query.rows == 42
+    assert new_query.executed_sql == "SELECT a FROM t LIMIT 101"
+    assert new_query.extra["columns"] == [{"column_name": "a"}]
+    assert new_query.extra["reused_query_id"] == query.id
@@ -0,0 +1,84 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pyarrow as pa
+from pytest_mock import MockerFixture
+
+from superset.db_engine_specs.base import BaseEngineSpec
+from superset.sqllab.utils import (
+    is_arrow_payload,
+    read_arrow_payload,
+    write_arrow_payload,
+)
+from superset.views.utils import _deserialize_results_payload
+
+
+def test_arrow_payload_roundtrip() -> None:
+    table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    payload = {"status": "success", "data": [], "query": {"rows": 3}}
+
+    buffer = write_arrow_payload(table, payload)
+    assert is_arrow_payload(buffer)
+    assert not is_arrow_payload(b'{"data": []}')
+    assert not is_arrow_payload('{"data": []}')
+
+    got_table, metadata = read_arrow_payload(buffer)
+    assert got_table.to_pydict() == table.to_pydict()
+    assert metadata == {"status": "success", "query": {"rows": 3}}
+
+    got_table, _ = read_arrow_payload(buffer, rows=2)
+    assert got_table.to_pydict() == {"a": [1, 2], "b": ["x", "y"]}
+
+
+def test_deserialize_arrow_results_payload(mocker: MockerFixture) -> None:
+    """
+    Test that Arrow payloads are detected regardless of the msgpack setting, and
+    that only the requested rows are converted to records.
+    """
+    query = mocker.MagicMock()
+    query.database.db_engine_spec = BaseEngineSpec
+    table = pa.table({"a": [1, 2, 3]})
+    columns = [{"name": "a", "type": "INT", "is_dttm": False}]
+    buffer = write_arrow_payload(
+        table,
+        {"status": "success", "selected_columns": columns, "columns": columns},
+    )
+
+    for use_msgpack in (False, True):
+        payload = _deserialize_results_payload(buffer, query, use_msgpack, rows=2)
+        assert payload["data"] == [{"a": 1}, {"a": 2}]
+        assert payload["columns"] == [{**columns[0], "column_name": "a"}]
+        assert payload["expanded_columns"] == []
+
+
+def test_deserialize_arrow_results_payload_expand_data(mocker: MockerFixture) -> None:
+    """
+    Test that nested data is only expanded when the query asked for it.
+    """
+    query = mocker.MagicMock()
+    expand_data = query.database.db_engine_spec.expand_data
+    expand_data.return_value = ([], [], ["a.b"])
+    table = pa.table({"a": [1, 2, 3]})
+    columns = [{"name": "a", "type": "ROW", "is_dttm": False}]
+    payload = {"status": "success", "selected_columns": columns, "columns": columns}
+
+    buffer = write_arrow_payload(table, {**payload, "expand_data": False})
+    assert _deserialize_results_payload(buffer, query)["expanded_columns"] == []
+    expand_data.assert_not_called()
+
+    buffer = write_arrow_payload(table, {**payload, "expand_data": True})
+    assert _deserialize_results_payload(buffer, query)["expanded_columns"] == ["a.b"]
+    expand_data.assert_called_once()
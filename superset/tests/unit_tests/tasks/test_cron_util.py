@@ -19,7 +19,7 @@ from datetime import datetime
 import pytest
 from freezegun.api import FakeDatetime
 
-from superset.tasks.cron_util import cron_schedule_window
+from superset.tasks.cron_util import cron_schedule_window, next_cron_schedule
 
 
 @pytest.mark.parametrize(
@@ -235,3 +235,50 @@ def test_cron_schedule_window_chicago_daylight(
     assert (
         list(cron.strftime("%A, %d %B %Y, %H:%M:%S") for cron in datetimes) == expected  # noqa: C400
     )
+
+
+@pytest.mark.parametrize(
+    "after, cron, timezone, expected",
+    [
+        (
+            "2020-01-01T09:00:29.500",
+            "0 1 * * *",
+            "America/Los_Angeles",
+            "2020-01-02T09:00:00",
+        ),
+        (
+            "2020-01-01T08:59:00",
+            "0 1 * * *",
+            "America/Los_Angeles",
+            "2020-01-01T09:00:00",
+        ),
+        (
+            "2020-01-01T09:00:00",
+            "0 1 * * *",
+            "America/Los_Angeles",
+            "2020-01-01T09:00:00",
+        ),
+        (
+            "2020-07-01T09:00:00",
+            "0 1 * * *",
+            "America/Los_Angeles",
+            "2020-07-02T08:00:00",
+        ),
+        ("2020-01-01T09:00:29.500", "*/5 * * * *", "UTC", "2020-01-01T09:05:00"),
+        (
+            "2020-01-01T09:00:29.500",
+            "0 9 * * *",
+            "Invalid/Timezone",
+            "2020-01-02T09:00:00",
+        ),
+    ],
+)
+def test_next_cron_schedule(
+    after: str, cron: str, timezone: str, expected: str
+) -> None:
+    """
+    Reports scheduler: Test the next run of a cron schedule, in UTC
+    """
+    assert next_cron_schedule(
+        datetime.fromisoformat(after), cron, timezone
+    ) == datetime.fromisoformat(expected)
@@ -16,6 +16,7 @@
 # under the License.
 from __future__ import annotations
 
+from collections.abc import Iterator
 from contextlib import nullcontext
 from typing import Any, TYPE_CHECKING
 from unittest.mock import MagicMock, patch, PropertyMock
@@ -23,6 +24,8 @@ from unittest.mock import MagicMock, patch, PropertyMock
 import pytest
 from flask import current_app
 from flask_appbuilder.security.sqla.models import User
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
 
 from superset.connectors.sqla.models import BaseDatasource, SqlaTable
 from superset.tasks.exceptions import InvalidExecutorError
@@ -422,3 +425,262 @@ def test_chart_digest(
         )
         with cm:
             assert get_chart_digest(chart=chart) == expected_result
+
+
+@pytest.fixture
+def charts_with_rls(session: Session) -> Iterator[list[Slice]]:
+    """
+    Charts owned by a user with an RLS filter on the datasource of the first one.
+    """
+    from flask_appbuilder.security.sqla.models import Role
+
+    from superset.connectors.sqla.models import RowLevelSecurityFilter, SqlaTable
+    from superset.models.core import Database
+    from superset.models.slice import Slice
+    from superset.utils.core import RowLevelSecurityFilterType
+
+    Slice.metadata.create_all(session.get_bind())
+
+    role = Role(name="role")
+    user = User(
+        username="alice",
+        first_name="Alice",
+        last_name="Doe",
+        email="alice@example.com",
+        roles=[role],
+    )
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    tables = [SqlaTable(table_name=f"t{i}", database=database) for i in range(2)]
+    session.add_all([user, *tables])
+    session.flush()
+    session.add(
+        RowLevelSecurityFilter(
+            name="rls",
+            filter_type=RowLevelSecurityFilterType.REGULAR,
+            clause="a = 1",
+            tables=[tables[0]],
+            roles=[role],
+        )
+    )
+    charts = [
+        Slice(
+            slice_name=f"chart{i}",
+            datasource_type=DatasourceType.TABLE,
+            datasource_id=tables[i % 2].id,
+            params=f'{{"i": {i}}}',
+            owners=[user],
+        )
+        for i in range(4)
+    ]
+    session.add_all(charts)
+    session.flush()
+
+    with override_user(user):
+        yield charts
+
+
+def test_get_chart_digests(charts_with_rls: list[Slice]) -> None:
+    """
+    Test that batch digests match the digests computed one chart at a time.
+    """
+    from superset import security_manager
+    from superset.thumbnails.digest import get_chart_digest, get_chart_digests
+
+    rls_filters = security_manager.get_rls_filters_by_table(
+        [chart.datasource for chart in charts_with_rls]
+    )
+    assert {
+        table_id: [rls_filter.clause for rls_filter in filters]
+        for table_id, filters in rls_filters.items()
+    } == {charts_with_rls[0].datasource_id: ["a = 1"]}
+
+    expected = {chart.id: get_chart_digest(chart) for chart in charts_with_rls}
+
+    assert get_chart_digests(charts_with_rls) == expected
+    assert len(set(expected.values())) == 4
+
+
+def test_get_chart_digests_queries(
+    mocker: MockerFixture,
+    charts_with_rls: list[Slice],
+) -> None:
+    """
+    Test that the RLS filters are fetched once per executor and cached digests are
+    reused.
+    """
+    from superset import security_manager
+    from superset.extensions import cache_manager
+    from superset.thumbnails.digest import get_chart_digests
+
+    get_rls_filters = mocker.spy(security_manager, "get_rls_filters")
+    get_rls_filters_by_table = mocker.spy(security_manager, "get_rls_filters_by_table")
+    cache: dict[str, Any] = {}
+    mocker.patch.object(
+        cache_manager.cache,
+        "get_many",
+        side_effect=lambda *keys: [cache.get(key) for key in keys],
+    )
+    mocker.patch.object(
+        cache_manager.cache,
+        "set_many",
+        side_effect=lambda mapping, timeout: cache.update(mapping),
+    )
+
+    digests = get_chart_digests(charts_with_rls)
+
+    get_rls_filters.assert_not_called()
+    get_rls_filters_by_table.assert_called_once()
+    assert len(cache) == 4
+
+    get_rls_filters_by_table.reset_mock()
+    assert get_chart_digests(charts_with_rls) == digests
+    get_rls_filters_by_table.assert_not_called()
+
+
+def test_batch_digests(
+    mocker: MockerFixture,
+    session: Session,
+    charts_with_rls: list[Slice],
+) -> None:
+    """
+    Test that the digests of charts loaded in a batch are computed together, and only
+    when requested.
+    """
+    from superset.models.slice import Slice
+    from superset.thumbnails import digest
+
+    get_chart_digests = mocker.spy(digest, "get_chart_digests")
+    session.expunge_all()
+
+    with current_app.test_request_context(), digest.batch_digests(Slice):
+        charts = session.query(Slice).all()
+        get_chart_digests.assert_not_called()
+
+        thumbnail_urls = [chart.thumbnail_url for chart in charts]
+
+    get_chart_digests.assert_called_once_with(charts)
+    assert thumbnail_urls == [
+        f"/api/v1/chart/{chart.id}/thumbnail/{digest.get_chart_digest(chart)}/"
+        for chart in charts
+    ]
+
+
+def test_get_dashboard_digests(
+    session: Session,
+    charts_with_rls: list[Slice],
+) -> None:
+    """
+    Test that batch dashboard digests match the digests computed one at a time.
+    """
+    from superset.models.dashboard import Dashboard
+    from superset.thumbnails.digest import get_dashboard_digest, get_dashboard_digests
+
+    owner = charts_with_rls[0].owners[0]
+    dashboards = [
+        Dashboard(dashboard_title="with rls", slices=charts_with_rls, owners=[owner]),
+        Dashboard(
+            dashboard_title="without rls",
+            slices=charts_with_rls[1:2],
+            owners=[owner],
+        ),
+    ]
+    session.add_all(dashboards)
+    session.flush()
+    session.expire_all()
+
+    expected = {
+        dashboard.id: get_dashboard_digest(dashboard) for dashboard in dashboards
+    }
+
+    assert get_dashboard_digests(dashboards) == expected
+
+
+def test_get_dashboard_digests_cache_keys(
+    mocker: MockerFixture,
+    session: Session,
+    charts_with_rls: list[Slice],
+) -> None:
+    """
+    Test that cached dashboard digests aren't reused once a chart of the dashboard
+    changes, or once the roles of the executor change.
+    """
+    from flask_appbuilder.security.sqla.models import Role
+
+    from superset import security_manager
+    from superset.extensions import cache_manager
+    from superset.models.dashboard import Dashboard
+    from superset.thumbnails.digest import get_dashboard_digests
+
+    cache: dict[str, Any] = {}
+    mocker.patch.object(
+        cache_manager.cache,
+        "get_many",
+        side_effect=lambda *keys: [cache.get(key) for key in keys],
+    )
+    mocker.patch.object(
+        cache_manager.cache,
+        "set_many",
+        side_effect=lambda mapping, timeout: cache.update(mapping),
+    )
+    get_rls_filters_by_table = mocker.spy(security_manager, "get_rls_filters_by_table")
+    owner = charts_with_rls[0].owners[0]
+    dashboard = Dashboard(
+        dashboard_title="dashboard",
+        slices=charts_with_rls,
+        owners=[owner],
+    )
+    session.add(dashboard)
+    session.flush()
+
+    digests = get_dashboard_digests([dashboard])
+    assert get_dashboard_digests([dashboard]) == digests
+    assert get_rls_filters_by_table.call_count == 1
+
+    charts_with_rls[0].slice_name = "renamed"
+    session.flush()
+    assert get_dashboard_digests([dashboard]) != digests
+    assert get_rls_filters_by_table.call_count == 2
+
+    owner.roles.append(Role(name="other"))
+    session.flush()
+    get_dashboard_digests([dashboard])
+    assert get_rls_filters_by_table.call_count == 3
+
+
+def test_get_chart_digests_cache_keys_rls_tables(
+    mocker: MockerFixture,
+    session: Session,
+    charts_with_rls: list[Slice],
+) -> None:
+    """
+    Test that cached chart digests aren't reused once an RLS filter moves to another
+    table, which only changes the association table.
+    """
+    from superset.connectors.sqla.models import RowLevelSecurityFilter, SqlaTable
+    from superset.extensions import cache_manager
+    from superset.thumbnails.digest import get_chart_digest, get_chart_digests
+
+    cache: dict[str, Any] = {}
+    mocker.patch.object(
+        cache_manager.cache,
+        "get_many",
+        side_effect=lambda *keys: [cache.get(key) for key in keys],
+    )
+    mocker.patch.object(
+        cache_manager.cache,
+        "set_many",
+        side_effect=lambda mapping, timeout: cache.update(mapping),
+    )
+
+    digests = get_chart_digests(charts_with_rls)
+    rls_filter = session.query(RowLevelSecurityFilter).one()
+    changed_on = rls_filter.changed_on
+    rls_filter.tables = [session.get(SqlaTable, charts_with_rls[1].datasource_id)]
+    session.flush()
+    assert rls_filter.changed_on == changed_on
+
+    new_digests = get_chart_digests(charts_with_rls)
+    assert new_digests != digests
+    assert new_digests == {
+        chart.id: get_chart_digest(chart) for chart in charts_with_rls
+    }
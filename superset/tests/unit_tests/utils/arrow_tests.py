@@ -0,0 +1,42 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pandas as pd
+import pyarrow as pa
+
+from superset.utils.arrow import df_to_arrow
+
+
+def test_df_to_arrow() -> None:
+    """
+    Test that the default index of a dataframe is dropped, and others are kept.
+    """
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    assert df_to_arrow(df).column_names == ["a", "b"]
+
+    table = df_to_arrow(df.set_index("b"))
+    assert table.column_names == ["a", "b"]
+    assert table.to_pandas().index.tolist() == ["x", "y"]
+
+
+def test_df_to_arrow_mixed_types() -> None:
+    """
+    Test that columns mixing types are converted to strings, keeping nulls.
+    """
+    df = pd.DataFrame({"a": [1, "x", None], "b": [1.5, 2.5, 3.5]})
+    table = df_to_arrow(df)
+    assert table.schema.field("a").type == pa.string()
+    assert table.to_pydict() == {"a": ["1", "x", None], "b": [1.5, 2.5, 3.5]}